@@ -0,0 +1,86 @@
+"""
+FixedTimestepLoop - Simulazione a passo fisso disaccoppiata dal rendering.
+
+Il main loop misura il tempo reale di ogni frame e lo versa nell'accumulatore;
+la simulazione (GameController.process_frame) avanza a passi di 1/sim_hz finché
+l'accumulatore lo consente. Il resto frazionario diventa l'alpha di interpolazione
+usato dal RenderController per disegnare tra lo stato precedente e quello corrente.
+
+Frame-skip: se il gioco resta indietro si eseguono al massimo max_steps passi per
+frame renderizzato (saltando i render intermedi); il tempo oltre quel limite viene
+scartato, così un frame lento non innesca la "spirale della morte".
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIM_HZ = 60
+DEFAULT_MAX_STEPS = 5
+
+# Un singolo frame non può versare più di così nell'accumulatore (es. finestra trascinata, breakpoint)
+MAX_FRAME_TIME = 0.25
+
+
+class FixedTimestepLoop:
+    """
+    Accumulatore per la simulazione a passo fisso.
+
+    Uso tipico (vedi src/main.py):
+        steps = loop.advance(frame_dt)
+        for _ in range(steps):
+            controller.process_frame(loop.step_dt)
+        render_ctrl.set_interpolation(loop.alpha)
+    """
+
+    def __init__(self, sim_hz: int = DEFAULT_SIM_HZ, max_steps: int = DEFAULT_MAX_STEPS,
+                 max_frame_time: float = MAX_FRAME_TIME):
+        self.sim_hz = 0
+        self.step_dt = 0.0
+        self.max_steps = 1
+        self.max_frame_time = max_frame_time
+        self.accumulator = 0.0
+
+        # Statistiche (debug overlay / benchmark)
+        self.total_steps = 0
+        self.skipped_frames = 0
+        self.dropped_time = 0.0
+
+        self.configure(sim_hz, max_steps)
+
+    def configure(self, sim_hz: int, max_steps: int) -> None:
+        """Cambia frequenza e limite di catch-up (es. dopo aver modificato le impostazioni)."""
+        self.sim_hz = max(1, int(sim_hz))
+        self.step_dt = 1.0 / self.sim_hz
+        self.max_steps = max(1, int(max_steps))
+        self.accumulator = min(self.accumulator, self.step_dt)
+
+    def advance(self, frame_dt: float) -> int:
+        """
+        Versa frame_dt (secondi reali) nell'accumulatore e ritorna quanti passi
+        di simulazione eseguire prima del prossimo render.
+        """
+        self.accumulator += min(max(0.0, frame_dt), self.max_frame_time)
+
+        steps = int(self.accumulator / self.step_dt)
+        if steps > self.max_steps:
+            # Troppo indietro: recuperiamo max_steps passi e scartiamo il resto
+            excess = (steps - self.max_steps) * self.step_dt
+            self.dropped_time += excess
+            self.accumulator -= excess
+            steps = self.max_steps
+            logger.debug(f"FixedTimestepLoop behind: dropped {excess * 1000:.1f} ms of simulation")
+        if steps > 1:
+            self.skipped_frames += steps - 1
+
+        self.accumulator -= steps * self.step_dt
+        self.total_steps += steps
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """Frazione del prossimo passo già trascorsa: 0 = stato precedente, 1 = stato corrente."""
+        return max(0.0, min(1.0, self.accumulator / self.step_dt))
+
+    def reset(self) -> None:
+        """Svuota l'accumulatore (es. dopo un caricamento lungo che non va recuperato)."""
+        self.accumulator = 0.0
@@ -2,11 +2,15 @@
 Game Controller - Main controller coordinating game logic.
 Integration of Epic 1-28. 
 Updated: FIX FADE/WAIT BLOCKING BUG.
+Updated: save_game_async (AsyncSaveService): snapshot here, file I/O on a worker thread.
+Updated: AutosaveJournal: session started on new game/load, load_autosave replays snapshot + journal.
+Updated: save_dir passed in (tests and headless runs must not touch the player's ./saves).
 """
 from src.model.game import Game
 from src.model.save import (
     SaveManager, SaveStateChecker, GameSerializer, 
-    SlotInfo, SaveResult, LoadResult, SlotStatus
+    SlotInfo, SaveResult, LoadResult, SlotStatus,
+    AsyncSaveService, SaveJob, AutosaveJournal, SAVE_DIR
 )
 from src.controller.input_manager import InputManager
 from src.controller.render_controller import RenderController
@@ -16,16 +20,24 @@ from src.controller.action_runner import ActionRunner
 from src.model.script_actions import ActionType
 from src.model.input_actions import Action
 from src.model.ui.handoff_overlay import HandoffModel
+from src.model.utils.frame_profiler import frame_profiler, PHASE_STATE_UPDATE
 
 class GameController:
-    def __init__(self):
+    def __init__(self, save_dir: str = SAVE_DIR):
         # 1. Model & Persistence
         self.game = Game()
-        self.save_manager = SaveManager()
+        # Salvataggi e autosave vivono tutti in save_dir
+        self.save_manager = SaveManager(save_dir=save_dir, save_format=self.game.settings.save_format,
+                                        compress=self.game.settings.save_compress)
+        self.save_service = AsyncSaveService(self.save_manager)
+        # Autosave incrementale: delta nel journal, snapshot completi sul worker del save_service
+        self.autosave = AutosaveJournal(self.save_service)
+        self.autosave.attach(self.game)
         
         # 2. Sub-Controllers
         self.input_manager = InputManager()
         self.render_controller = RenderController()
+        self.render_controller.asset_manager.set_cache_budget(self.game.settings.asset_cache_mb * 1024 * 1024)
         
         # 3. Action Runner
         self.action_runner = ActionRunner()
@@ -38,6 +50,7 @@ class GameController:
         self.state_machine = StateMachine(input_manager=self.input_manager)
         self.state_machine.controller = self
         self.state_machine.register_all_states()
+        self.render_controller.declare_state_assets(self.state_machine.get_registered_states())
         self.current_state = "MainMenu"
 
         # Link Prompt Manager to State Machine
@@ -163,6 +176,7 @@ class GameController:
 
     def start_new_game(self, num_players: int):
         self.game.start_new_game(num_players)
+        self.autosave.start_session()
         self.current_state = "CutsceneState"
         self.handoff_model.awaiting_confirm = False
         
@@ -170,13 +184,18 @@ class GameController:
         self.state_machine.change_state(StateID.CUTSCENE, script_id="intro_sequence")
 
     def process_frame(self, dt: float):
+        """Un passo di simulazione (dt fisso, vedi FixedTimestepLoop in main.py)."""
+        # 0. Snapshot per l'interpolazione del render tra questo passo e il precedente
+        self.render_controller.store_previous_state(self.game)
+
         # 1. Update Timer Prompts (Fondamentale per vedere i messaggi)
         import pygame
         current_time_ms = pygame.time.get_ticks()
         self.game.prompts.update(current_time_ms)
 
         # 2. Update State Machine
-        self.state_machine.update(dt)
+        with frame_profiler.measure(PHASE_STATE_UPDATE):
+            self.state_machine.update(dt)
         
         # 3. Check Handoff Overlay (Opzionale se usiamo hotseat fluido)
         if self.handoff_model.awaiting_confirm:
@@ -184,7 +203,13 @@ class GameController:
                 self.handoff_model.awaiting_confirm = False
                 self.game.gamestate.exploration_turn_manager.confirm_handoff()
 
-        # 4. Flush Inputs
+        # 4. Stanze vicine in prefetch (una regione per passo)
+        self.game.content.pump()
+
+        # 4b. Callback dei salvataggi conclusi sul worker
+        self.save_service.pump()
+
+        # 5. Flush Inputs
         self.input_manager.begin_frame()
 
     def trigger_next_turn(self):
@@ -218,24 +243,47 @@ class GameController:
             
         return self.save_manager.save_to_slot(slot_index, self.game, custom_name=custom_name)
 
+    def save_game_async(self, slot_index: int, custom_name: str = "", on_complete=None) -> SaveJob:
+        """
+        Come save_game (con sovrascrittura già confermata), ma la scrittura avviene sul worker
+        dell'AsyncSaveService: on_complete(SaveResult) viene chiamato dal main thread.
+        """
+        can_save, message = self.can_save_game()
+        if not can_save:
+            return self.save_service.reject(SaveJob(slot_index, custom_name, on_complete=on_complete),
+                                            SaveResult(ok=False, message=message))
+        return self.save_service.save(slot_index, self.game, custom_name=custom_name, on_complete=on_complete)
+
     def load_game(self, slot_index: int) -> LoadResult:
         result = self.save_manager.load_from_slot(slot_index)
         if result.ok and result.save_data:
             save_dict = result.save_data.to_dict()
             success = GameSerializer.from_dict(save_dict, self.game)
             if success:
-                room_id = result.save_data.data.world.room_id
-                self.game.gamestate.current_room_id = room_id
-                self.current_state = 'HubState' if room_id == 'hub' else 'RoomState'
-                state_id = StateID.HUB if room_id == 'hub' else StateID.ROOM
-                self.state_machine.change_state(state_id, room_id=room_id)
+                self._enter_loaded_game(result.save_data.data.world.room_id)
                 return LoadResult(ok=True, message="Game loaded", save_data=result.save_data)
         return result
 
+    def load_autosave(self) -> LoadResult:
+        """Riprende dall'autosave: ultimo snapshot + delta del journal."""
+        self.autosave.end_session()
+        result = self.autosave.restore(self.game)
+        if result.ok:
+            self._enter_loaded_game(self.game.gamestate.current_room_id)
+        return result
+
+    def _enter_loaded_game(self, room_id: str):
+        self.game.gamestate.current_room_id = room_id
+        self.autosave.start_session()
+        self.current_state = 'HubState' if room_id == 'hub' else 'RoomState'
+        state_id = StateID.HUB if room_id == 'hub' else StateID.ROOM
+        self.state_machine.change_state(state_id, room_id=room_id)
+
     def is_slot_empty(self, slot_index: int) -> bool: return not self.save_manager.is_slot_occupied(slot_index)
     def get_slot_info(self, slot_index: int) -> SlotInfo:
-        slots = self.save_manager.list_slots()
-        return slots[slot_index-1] if 0 < slot_index <= len(slots) else SlotInfo(slot_index, SlotStatus.EMPTY)
+        if not self.save_manager.is_valid_slot(slot_index):
+            return SlotInfo(slot_index, SlotStatus.EMPTY)
+        return self.save_manager.slot_info(slot_index)
 
     def get_player_inventory(self, idx): return self.game.get_player_inventory(idx)
     def get_player_abilities(self, idx): return self.game.get_player_abilities(idx)
@@ -0,0 +1,350 @@
+"""
+Headless Driver - Fa girare GameController + StateMachine + ActionRunner senza finestra.
+
+Stesso ordine del main loop (eventi -> process_frame -> render opzionale), ma a passo
+fisso e alla massima velocità: niente clock.tick, niente finestra (driver video SDL
+"dummy"), rendering disattivabile. L'input arriva da uno script (InputScript) o da una
+policy (es. RandomInputPolicy) che genera eventi tastiera come farebbe un giocatore.
+
+Uso da riga di comando (dalla root del repository):
+    python -m src.controller.headless_driver --new-game 2 --steps 20000 --runs 50 --policy random
+    python -m src.controller.headless_driver --script run.json --render --out report.json --trace frames.csv
+
+Salvataggi e autosave vanno in una cartella temporanea (o in --save-dir), mai nei ./saves
+del giocatore.
+
+Formato dello script JSON: lista di {"at": passo, "key": "RETURN" | "d" | "MOVE_RIGHT", "hold": passi}.
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, Iterable, List, Optional
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from src.model.input_actions import Action, get_default_keymap
+from src.model.utils.frame_profiler import (
+    frame_profiler, PHASE_EVENTS, PHASE_PROCESS, PHASE_RENDER, PHASE_PRESENT, COUNT_SIM_STEPS
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIM_HZ = 60
+SCREEN_SIZE = (800, 600)
+
+
+def resolve_key(name) -> int:
+    """
+    Codice tasto da: int (già un keycode), nome di Action ("CONFIRM") o nome pygame ("return", "d").
+    Per le Action si usa il tasto con codice più basso tra quelli associati (deterministico).
+    """
+    if isinstance(name, int):
+        return name
+    if isinstance(name, Action):
+        return min(get_default_keymap()[name])
+    if name.upper() in Action.__members__:
+        return min(get_default_keymap()[Action[name.upper()]])
+    try:
+        return pygame.key.key_code(name.lower())
+    except ValueError:
+        raise ValueError(f"Unknown key in input script: {name!r}")
+
+
+# ============== SCRIPTED INPUT ==============
+
+@dataclass(frozen=True)
+class InputStep:
+    """Evento tastiera da iniettare all'inizio del passo `frame`."""
+    frame: int
+    key: int
+    down: bool = True
+
+
+class InputScript:
+    """Sequenza ordinata di pressioni/rilasci, indicizzata per passo di simulazione."""
+
+    def __init__(self, steps: Iterable[InputStep] = ()):
+        self._by_frame: dict[int, List[InputStep]] = {}
+        self.length = 0
+        for step in steps:
+            self.add(step)
+
+    def add(self, step: InputStep) -> "InputScript":
+        self._by_frame.setdefault(step.frame, []).append(step)
+        self.length = max(self.length, step.frame + 1)
+        return self
+
+    def tap(self, key, at: int, hold: int = 1) -> "InputScript":
+        """Premi `key` al passo `at` e rilascialo `hold` passi dopo."""
+        code = resolve_key(key)
+        self.add(InputStep(at, code, True))
+        return self.add(InputStep(at + max(1, hold), code, False))
+
+    def events_for(self, frame: int) -> List[pygame.event.Event]:
+        return [
+            pygame.event.Event(pygame.KEYDOWN if s.down else pygame.KEYUP, key=s.key)
+            for s in self._by_frame.get(frame, ())
+        ]
+
+    @classmethod
+    def from_list(cls, entries: list) -> "InputScript":
+        script = cls()
+        for entry in entries:
+            script.tap(entry["key"], int(entry["at"]), int(entry.get("hold", 1)))
+        return script
+
+    @classmethod
+    def load(cls, path: str) -> "InputScript":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_list(json.load(f))
+
+
+class RandomInputPolicy:
+    """
+    Input casuale ma riproducibile (seed) per soak test: tiene premuta una direzione
+    per qualche passo e ogni tanto conferma/interagisce.
+    """
+
+    MOVE_KEYS = (Action.MOVE_UP, Action.MOVE_DOWN, Action.MOVE_LEFT, Action.MOVE_RIGHT)
+    TAP_KEYS = (Action.CONFIRM, Action.INTERACT, Action.MENU_DOWN, Action.NEXT_CHARACTER)
+
+    def __init__(self, seed: Optional[int] = None, tap_chance: float = 0.05, min_hold: int = 10, max_hold: int = 60):
+        self.rng = random.Random(seed)
+        self.tap_chance = tap_chance
+        self.min_hold = min_hold
+        self.max_hold = max_hold
+        self._held: Optional[int] = None
+        self._release_at = 0
+
+    def __call__(self, driver: "HeadlessDriver") -> List[pygame.event.Event]:
+        events = []
+        frame = driver.step_index
+
+        if self._held is not None and frame >= self._release_at:
+            events.append(pygame.event.Event(pygame.KEYUP, key=self._held))
+            self._held = None
+
+        if self._held is None:
+            self._held = resolve_key(self.rng.choice(self.MOVE_KEYS))
+            self._release_at = frame + self.rng.randint(self.min_hold, self.max_hold)
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=self._held))
+
+        if self.rng.random() < self.tap_chance:
+            key = resolve_key(self.rng.choice(self.TAP_KEYS))
+            if key != self._held:
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=key))
+                events.append(pygame.event.Event(pygame.KEYUP, key=key))
+        return events
+
+
+# ============== DRIVER ==============
+
+@dataclass
+class HeadlessReport:
+    steps: int
+    frames_rendered: int
+    sim_seconds: float
+    wall_seconds: float
+    final_state: Optional[str]
+    room_id: Optional[str]
+    quit_requested: bool = False
+    error: Optional[str] = None
+
+    @property
+    def speedup(self) -> float:
+        """Quante volte più veloce del tempo reale."""
+        return self.sim_seconds / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["speedup"] = round(self.speedup, 2)
+        return data
+
+
+class HeadlessDriver:
+    """
+    Avanza il gioco a passi fissi senza finestra.
+
+    - step(events): un passo (eventi -> process_frame -> render opzionale)
+    - run(...): fino a max_steps / condizione `until` / uscita dal gioco (sys.exit dal menu)
+    """
+
+    def __init__(self, render: bool = False, sim_hz: int = DEFAULT_SIM_HZ, seed: Optional[int] = None,
+                 controller_factory: Optional[Callable] = None, save_dir: Optional[str] = None):
+        pygame.init()
+        # Con il driver "dummy" set_mode non apre finestre: serve solo a convert_alpha()
+        self.screen = pygame.display.set_mode(SCREEN_SIZE)
+
+        if seed is not None:
+            random.seed(seed)
+
+        # Senza save_dir esplicita: cartella temporanea, rimossa in shutdown()
+        self._temp_save_dir = None
+        if save_dir is None:
+            self._temp_save_dir = tempfile.TemporaryDirectory(prefix="sikula_headless_")
+            save_dir = self._temp_save_dir.name
+        self.save_dir = save_dir
+
+        if controller_factory is None:
+            from src.controller.game_controller import GameController
+            controller_factory = GameController
+        self.controller = controller_factory(save_dir=save_dir)
+        self.controller.game.load_content()
+
+        self.render = render
+        self.step_dt = 1.0 / max(1, int(sim_hz))
+        self.step_index = 0
+        self.frames_rendered = 0
+        self.quit_requested = False
+
+    # ============== SHORTCUTS ==============
+
+    def main_menu(self) -> None:
+        from src.model.states.base_state import StateID
+        self.controller.state_machine.change_state(StateID.MAIN_MENU)
+
+    def start_new_game(self, num_players: int = 2) -> None:
+        """Salta il menu: stessa chiamata di "Nuova partita"."""
+        self.controller.start_new_game(num_players)
+
+    def enter_room(self, room_id: str, spawn_id: str = "default") -> None:
+        """Teletrasporto in una stanza (come l'azione CHANGE_ROOM), es. per partire da una regione."""
+        from src.model.states.base_state import StateID
+        self.controller.game.gamestate.current_room_id = room_id
+        state_id = StateID.HUB if room_id == "hub" else StateID.ROOM
+        self.controller.state_machine.change_state(state_id, room_id=room_id, spawn_id=spawn_id)
+
+    @property
+    def current_state_id(self):
+        state = self.controller.state_machine.peek()
+        return state.state_id if state else None
+
+    # ============== LOOP ==============
+
+    def step(self, events: Iterable[pygame.event.Event] = ()) -> None:
+        controller = self.controller
+        frame_profiler.begin_frame()
+
+        with frame_profiler.measure(PHASE_EVENTS):
+            for event in events:
+                controller.input_manager.process_event(event)
+                controller.state_machine.handle_event(event)
+
+        frame_profiler.count(COUNT_SIM_STEPS)
+        with frame_profiler.measure(PHASE_PROCESS):
+            controller.process_frame(self.step_dt)
+
+        if self.render:
+            render_ctrl = controller.render_controller
+            render_ctrl.set_interpolation(1.0)
+            with frame_profiler.measure(PHASE_RENDER):
+                render_ctrl.render_frame(self.screen, controller.state_machine, controller.game, self.step_dt)
+            with frame_profiler.measure(PHASE_PRESENT):
+                render_ctrl.present()
+            self.frames_rendered += 1
+
+        frame_profiler.end_frame()
+        self.step_index += 1
+
+    def run(self, max_steps: int, script: Optional[InputScript] = None,
+            policy: Optional[Callable[["HeadlessDriver"], Iterable]] = None,
+            until: Optional[Callable[["HeadlessDriver"], bool]] = None) -> HeadlessReport:
+        start_step = self.step_index
+        error = None
+        t0 = time.perf_counter()
+
+        try:
+            for _ in range(max_steps):
+                if until is not None and until(self):
+                    break
+                events = []
+                if script is not None:
+                    events.extend(script.events_for(self.step_index))
+                if policy is not None:
+                    events.extend(policy(self))
+                self.step(events)
+        except SystemExit:
+            # "Esci" dal menu principale chiama sys.exit()
+            self.quit_requested = True
+        except Exception as e:
+            logger.exception(f"Headless run crashed at step {self.step_index}")
+            error = f"{type(e).__name__}: {e}"
+
+        steps = self.step_index - start_step
+        state_id = self.current_state_id
+        return HeadlessReport(
+            steps=steps,
+            frames_rendered=self.frames_rendered,
+            sim_seconds=steps * self.step_dt,
+            wall_seconds=time.perf_counter() - t0,
+            final_state=state_id.name if state_id else None,
+            room_id=self.controller.game.gamestate.current_room_id,
+            quit_requested=self.quit_requested,
+            error=error,
+        )
+
+    def shutdown(self) -> None:
+        self.controller.render_controller.asset_preloader.shutdown()
+        self.controller.autosave.close()
+        self.controller.save_service.shutdown()
+        if self._temp_save_dir is not None:
+            self._temp_save_dir.cleanup()
+            self._temp_save_dir = None
+
+
+# ============== CLI ==============
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run Sikula headless (soak / balance / perf runs).")
+    parser.add_argument("--steps", type=int, default=10000, help="Passi di simulazione per run")
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--sim-hz", type=int, default=DEFAULT_SIM_HZ)
+    parser.add_argument("--seed", type=int, default=0, help="Seed della prima run (le successive usano seed+i)")
+    parser.add_argument("--render", action="store_true", help="Esegui anche il rendering (su superficie dummy)")
+    parser.add_argument("--new-game", type=int, metavar="PLAYERS", help="Salta il menu e avvia una nuova partita")
+    parser.add_argument("--script", help="Script di input JSON")
+    parser.add_argument("--policy", choices=("none", "random"), default="none")
+    parser.add_argument("--save-dir", help="Cartella dei salvataggi (default: temporanea, rimossa a fine run)")
+    parser.add_argument("--out", help="Scrive i report in JSON")
+    parser.add_argument("--trace", help="Dump del FrameProfiler dell'ultima run (.csv o .json)")
+    args = parser.parse_args(argv)
+
+    script = InputScript.load(args.script) if args.script else None
+    reports = []
+    for i in range(args.runs):
+        seed = args.seed + i
+        driver = HeadlessDriver(render=args.render, sim_hz=args.sim_hz, seed=seed, save_dir=args.save_dir)
+        if args.new_game:
+            driver.start_new_game(args.new_game)
+        else:
+            driver.main_menu()
+        policy = RandomInputPolicy(seed) if args.policy == "random" else None
+
+        report = driver.run(args.steps, script=script, policy=policy)
+        driver.shutdown()
+        reports.append(report.to_dict())
+        print(f"[Headless] run {i} seed={seed}: {report.steps} steps, {report.speedup:.1f}x realtime, "
+              f"state={report.final_state} room={report.room_id}" + (f" ERROR {report.error}" if report.error else ""))
+
+    if args.trace:
+        frame_profiler.dump(args.trace)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2)
+
+    pygame.quit()
+    return 1 if any(r["error"] for r in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,8 +2,17 @@
 FILE: ./src/controller/render_controller.py
 Render Controller - Coordina il rendering tra View e Model
 Updated: Passed AssetManager to MainMenuView for background rendering.
+Updated: AssetPreloader wiring (state/room manifests, region residency, per-frame pump).
+Updated: Baked sprite atlases loaded per region before falling back to per-file decode.
+Updated: Exploration rendered in retained mode (static layer cache + dirty rect present()).
+Updated: Frame dispatch by state moved here from main.py (render_frame), shared with the headless driver.
+Updated: Party and camera interpolated between fixed simulation steps (set_interpolation).
+Updated: Per-frame cache miss / text render counters and profiler graph in the F3 overlay.
+Updated: Entity render category read from the ContentRegistry index instead of per-frame keyword scans.
+Updated: Room entities drawn from render descriptors resolved at room load (refreshed only on change).
 """
 
+from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 import pygame
 
@@ -11,16 +20,63 @@ from src.model.render_system import (
     Renderer, Camera, DebugSettings, RenderLayer, CameraMode
 )
 from src.model.room_data import RoomData
+from src.model.content.categories import (
+    entity_render_category, CATEGORY_BOSS, CATEGORY_GATEKEEPER, CATEGORY_NPC, CATEGORY_PROP
+)
 from src.view.room_view import RoomView
 from src.view.combat_view import CombatView
 from src.view.inventory_view import InventoryView
 from src.view.main_menu_view import MainMenuView
 from src.view.pause_view import PauseView
 from src.view.game_over_view import GameOverView
-from src.model.assets.asset_manager import AssetManager
+from src.model.assets.asset_manager import AssetManager, AssetRequest
+from src.model.assets.asset_preloader import AssetPreloader, GLOBAL_REGION
+from src.model.assets.text_cache import text_cache
 from src.model.ui.exploration_hud import ExplorationHUDBuilder, ExplorationHUDData
 from src.view.aces_view import AcesView
 from src.view.ui_style import UIStyle 
+from src.model.states.base_state import StateID
+from src.model.utils.frame_profiler import frame_profiler, COUNT_ASSET_MISSES, COUNT_TEXT_RENDERS
+
+# Stati che occupano tutto lo schermo e hanno la precedenza sul mondo (stesso ordine del dispatch)
+FULLSCREEN_STATES = (
+    StateID.BOSS_OSTE, StateID.CUTSCENE, StateID.COMBAT, StateID.SCOPA,
+    StateID.BRISCOLA, StateID.SETTE_MEZZO, StateID.CUCU, StateID.ACES_MENU,
+)
+
+
+def is_world_frame(sm) -> bool:
+    """True se il frame è l'esplorazione (Hub/Room), disegnata in retained mode."""
+    if any(sm.has_state(s) for s in FULLSCREEN_STATES):
+        return False
+    return sm.has_state(StateID.HUB) or sm.has_state(StateID.ROOM)
+
+
+@dataclass
+class EntityRenderDescriptor:
+    """
+    Sprite, rettangolo di disegno, layer e chiave di ordinamento di un'entità, risolti una volta.
+    `actor` è il dict passato a RoomView, riusato a ogni frame finché l'entità non cambia.
+    """
+    entity: Any
+    source: tuple
+    width: int
+    height: int
+    fallback: str
+    actor: dict
+
+    @staticmethod
+    def source_of(entity) -> tuple:
+        return (entity.entity_id, entity.entity_type, entity.x, entity.y, entity.width, entity.height)
+
+    def is_stale(self) -> bool:
+        e = self.entity
+        return self.source != (e.entity_id, e.entity_type, e.x, e.y, e.width, e.height)
+
+
+# Spostamenti più lunghi di così in un passo sono teletrasporti (cambio stanza, spawn): niente lerp
+INTERPOLATION_SNAP_DISTANCE = 64
+
 
 class RenderController:
     """Controller per coordinare il rendering."""
@@ -30,6 +86,7 @@ class RenderController:
         self.renderer = Renderer(self.debug_settings)
         self.camera = Camera(screen_width, screen_height)
         self.asset_manager = AssetManager()
+        self.asset_preloader = AssetPreloader(self.asset_manager)
         
         self.room_view = RoomView(self.renderer, self.camera)
         self.combat_view = CombatView(self.renderer)
@@ -42,15 +99,36 @@ class RenderController:
         self.aces_view = AcesView(self.renderer, self.asset_manager)
         
         self._current_room: Optional[RoomData] = None
+        # ContentRegistry della stanza corrente: categorie di rendering precalcolate
+        self._content = None
+        # Descrittori delle entità della stanza corrente (vedi _entity_actors)
+        self._entity_descriptors: List[EntityRenderDescriptor] = []
+        self._descriptors_signature: Optional[tuple] = None
+        self._descriptors_assets_version: int = -1
         self._fps: float = 0.0
-        self._font_ui = pygame.font.SysFont("Consolas", 14)
+        self._font_ui = text_cache.font("Consolas", 14)
+        self._manifested_regions: set = set()
+
+        # Retained mode per l'esplorazione: cache dei layer statici + display.update(rects)
+        self.retained_rendering: bool = True
+
+        # Interpolazione tra passi di simulazione fissi (FixedTimestepLoop)
+        self.interpolation_alpha: float = 1.0
+        self._prev_positions: Dict[Any, tuple] = {}
+
+        # Contatori per frame del profiler: miss della cache immagini e testi effettivamente renderizzati
+        frame_profiler.watch(COUNT_ASSET_MISSES, lambda: self.asset_manager.images.misses)
+        frame_profiler.watch(COUNT_TEXT_RENDERS, lambda: text_cache.stats.misses)
     
     def toggle_debug(self) -> bool:
         self.debug_settings.toggle()
         return self.debug_settings.enabled
     
-    def load_room(self, room_data: RoomData, spawn_id: Optional[str] = None) -> tuple:
+    def load_room(self, room_data: RoomData, spawn_id: Optional[str] = None, content=None) -> tuple:
         self._current_room = room_data
+        if content is not None:
+            self._content = content
+        self._build_entity_descriptors()
         
         bg_image = None
         if room_data.background_id:
@@ -63,103 +141,297 @@ class RenderController:
             
         return self.room_view.load_room(room_data, spawn_id, bg_image)
     
+    def declare_state_assets(self, states) -> None:
+        """Registra i manifest degli stati nei residency set del preloader."""
+        for state in states:
+            manifest = state.get_asset_manifest()
+            if manifest:
+                self.asset_preloader.declare(state.asset_region, manifest)
+
+    def warm_up_assets(self) -> None:
+        """Avvia la decodifica in background degli asset globali (menu, intro, ritratti)."""
+        self.asset_manager.load_atlas_region(GLOBAL_REGION)
+        self.asset_preloader.warm_up()
+
+    def prefetch_for_room(self, content, room_data: RoomData, party_names=()) -> None:
+        """
+        Rende residente la regione della stanza e precarica le stanze vicine (uscite
+        verso altre regioni). La prima volta che si entra in una regione il suo
+        residency set viene costruito dai manifest di tutte le sue stanze.
+        """
+        region = room_data.region_id
+        self._content = content
+        self._declare_region_rooms(content, region, party_names)
+
+        # Prima l'atlas baked (se presente): il preloader accoda solo ciò che manca
+        self.asset_manager.load_atlas_region(region)
+        self.asset_preloader.enter_region(region)
+
+        # La stanza corrente non deve mai essere sfrattata dalla LRU
+        self.asset_manager.pin(req.cache_key for req in self.get_room_manifest(room_data, party_names))
+
+        # Stanze vicine: il registry le materializza nei frame successivi (prefetch), poi i loro asset
+        def request_neighbour(neighbour):
+            if neighbour.region_id != region:
+                self.asset_preloader.request(self.get_room_manifest(neighbour, party_names))
+
+        for trigger in room_data.triggers:
+            if trigger.target_room:
+                content.prefetch("rooms", trigger.target_room, on_ready=request_neighbour)
+
+    def _declare_region_rooms(self, content, region: str, party_names=()) -> None:
+        if region in self._manifested_regions:
+            return
+        self._manifested_regions.add(region)
+        for room in content.all("rooms", region):
+            self.asset_preloader.declare(region, self.get_room_manifest(room, party_names))
+
+    def collect_asset_manifests(self, content, party_names=()) -> Dict[Optional[str], set]:
+        """Residency set di tutte le regioni (stati + stanze). Usato dal bake degli atlas."""
+        for room in content.all("rooms"):
+            self._declare_region_rooms(content, room.region_id, party_names)
+        return {region: self.asset_preloader.get_residency(region)
+                for region in self.asset_preloader.regions()}
+
+    def get_room_manifest(self, room_data: RoomData, party_names=()) -> List[AssetRequest]:
+        """Immagini disegnate in una stanza: background, entità, party e asset extra dichiarati."""
+        manifest = []
+        if room_data.background_id:
+            manifest.append(AssetRequest(room_data.background_id, room_data.width, room_data.height, "background"))
+
+        for entity in room_data.entities:
+            target_w, target_h, fallback = self._entity_sprite_spec(entity, self._entity_category(entity))
+            manifest.append(AssetRequest(entity.entity_id, target_w, target_h, fallback))
+
+        p_width, p_height = self._party_sprite_size(room_data.room_id)
+        for name in party_names:
+            fallback_key = "player2" if "Rosalia" in name else "player"
+            manifest.append(AssetRequest(f"characters/{name}", p_width, p_height, fallback_key))
+
+        manifest.extend(room_data.preload_assets)
+        return manifest
+
+    def _entity_category(self, entity) -> str:
+        if self._content is not None:
+            return self._content.entity_category(entity)
+        return entity_render_category(entity)
+
+    @staticmethod
+    def _entity_sprite_spec(entity, category: Optional[str] = None) -> tuple:
+        """Dimensioni di rendering e fallback di un'entità, in base alla sua categoria."""
+        if category is None:
+            category = entity_render_category(entity)
+
+        # 1. BOSS (Giganti)
+        if category == CATEGORY_BOSS:
+            return 120, 160, "enemy"
+
+        # 2. GATEKEEPER (Grandi)
+        if category == CATEGORY_GATEKEEPER:
+            return 80, 110, "enemy"
+
+        # 3. NPC Standard (Giufà, ecc.) - Alti come il player standard
+        if category == CATEGORY_NPC:
+            return 32, 64, "npc"
+
+        # 4. Oggetti/Props (Scala 2x standard)
+        if category == CATEGORY_PROP:
+            return entity.width * 2, entity.height * 2, entity.entity_type
+
+        return entity.width, entity.height, "prop"
+
+    # ============== ENTITY RENDER DESCRIPTORS ==============
+
+    def _build_entity_descriptors(self) -> None:
+        entities = self._current_room.entities if self._current_room else []
+        self._entity_descriptors = [self._describe_entity(entity) for entity in entities]
+        self._descriptors_signature = (id(entities), len(entities))
+        self._descriptors_assets_version = self.asset_manager.images.version
+
+    def _describe_entity(self, entity) -> EntityRenderDescriptor:
+        target_w, target_h, fallback = self._entity_sprite_spec(entity, self._entity_category(entity))
+
+        # Allineamento ai piedi: sprite centrata sulla hitbox, base della sprite = base della hitbox
+        draw_x = entity.x + (entity.width // 2) - (target_w // 2)
+        draw_y = (entity.y + entity.height) - target_h
+
+        actor = {
+            "surface": self.asset_manager.get_image(
+                key=entity.entity_id, width=target_w, height=target_h, fallback_type=fallback
+            ),
+            "rect": pygame.Rect(draw_x, draw_y, target_w, target_h),
+            "layer": RenderLayer.ACTORS,
+            # Ordinamento Z (Depth): coordinata Y dei piedi (Bottom)
+            "sort_y": entity.y + entity.height,
+        }
+        return EntityRenderDescriptor(entity, EntityRenderDescriptor.source_of(entity),
+                                      target_w, target_h, fallback, actor)
+
+    def _entity_actors(self) -> list:
+        """
+        Actor delle entità della stanza dai descrittori preparati: un descrittore viene
+        ricalcolato solo se la sua entità è cambiata; le sprite vengono rilette solo se
+        la cache immagini è cambiata (es. il preloader ha sostituito un placeholder).
+        """
+        if not self._current_room:
+            return []
+        entities = self._current_room.entities
+        if self._descriptors_signature != (id(entities), len(entities)):
+            self._build_entity_descriptors()
+
+        images = self.asset_manager.images
+        refresh_sprites = images.version != self._descriptors_assets_version
+        descriptors = self._entity_descriptors
+        for i, desc in enumerate(descriptors):
+            if desc.is_stale():
+                descriptors[i] = self._describe_entity(desc.entity)
+            elif refresh_sprites:
+                desc.actor["surface"] = self.asset_manager.get_image(
+                    key=desc.entity.entity_id, width=desc.width, height=desc.height, fallback_type=desc.fallback
+                )
+        self._descriptors_assets_version = images.version
+        return [desc.actor for desc in descriptors]
+
+    @staticmethod
+    def _party_sprite_size(room_id: str) -> tuple:
+        # Hub: Standard Size / Regioni: Zoomed In (1.5x)
+        if room_id == "hub":
+            return 32, 64
+        return 48, 96
+
     def update_camera(self, target_x: int, target_y: int, dt: float = 0.0) -> None:
         if self._current_room and self._current_room.camera_mode == CameraMode.FOLLOW:
             self.room_view.update_camera(target_x, target_y, dt)
     
     def update_fps(self, fps: float) -> None:
         self._fps = fps
+
+    def store_previous_state(self, game_model) -> None:
+        """Chiamato prima di ogni passo di simulazione: fotografa le posizioni da interpolare."""
+        self.camera.store_previous()
+        gs = game_model.gamestate
+        self._prev_positions = {"party": tuple(gs.party_position)}
+        for char in gs.party.main_characters:
+            self._prev_positions[id(char)] = (char.x, char.y)
+
+    def set_interpolation(self, alpha: float) -> None:
+        """alpha in [0, 1]: frazione del passo successivo già trascorsa (vedi FixedTimestepLoop.alpha)."""
+        self.interpolation_alpha = alpha
+        self.camera.interpolation_alpha = alpha
+
+    def _interpolated(self, key, x: float, y: float) -> tuple:
+        alpha = self.interpolation_alpha
+        prev = self._prev_positions.get(key)
+        if prev is None or alpha >= 1.0:
+            return x, y
+        px, py = prev
+        if abs(x - px) > INTERPOLATION_SNAP_DISTANCE or abs(y - py) > INTERPOLATION_SNAP_DISTANCE:
+            return x, y
+        return px + (x - px) * alpha, py + (y - py) * alpha
     
+    def invalidate_screen(self) -> None:
+        """Da chiamare quando si disegna sullo schermo senza passare dal Renderer."""
+        self.renderer.invalidate_screen()
+
+    def present(self) -> None:
+        """Porta il frame a schermo: solo i rettangoli sporchi se il frame era retained."""
+        rects = self.renderer.take_dirty_rects()
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
     def begin_frame(self) -> None:
+        # Consegna al main thread le immagini decodificate in background
+        self.asset_preloader.pump()
         self.renderer.begin_frame()
 
-    def render_game_state(self, screen: pygame.Surface, game_model, dt: float):
-        room_mgr = game_model.gamestate
+    def render_frame(self, screen: pygame.Surface, sm, game_model, dt: float) -> None:
+        """
+        Disegna un frame completo (mondo/stato a tutto schermo + overlay) senza presentarlo.
+        Usato da main.py e dal driver headless; present() resta a carico del chiamante.
+        """
+        # In retained mode il mondo ripristina da sé lo sfondo: niente fill a tutto schermo
+        if not (self.retained_rendering and is_world_frame(sm)):
+            screen.fill((0, 0, 0))
+            self.invalidate_screen()
         
-        actors = []
+        self.begin_frame()
         
-        # A. Entità della stanza (Con logica di scaling personalizzata)
-        if self._current_room:
-            for entity in self._current_room.entities:
-                
-                # Definiamo le dimensioni di rendering in base all'ID o al Tipo
-                target_w = entity.width
-                target_h = entity.height
-                
-                # Keywords per identificare i Boss e i Gatekeeper
-                eid = entity.entity_id.lower()
-                is_boss = any(x in eid for x in ["boss", "tanino", "peppino", "goats", "toto", "oste", "ciccio"])
-                is_gatekeeper = any(x in eid for x in ["guards", "golem", "sphinx", "colapesce"])
-                
-                fallback = "prop"
+        # 1. Logic per Background/Mondo (Stati Principali)
+        
+        # --- BOSS FINALE ---
+        if sm.has_state(StateID.BOSS_OSTE):
+            boss_state = sm._get_state(StateID.BOSS_OSTE)
+            boss_state.render(screen)
 
-                # 1. BOSS (Giganti)
-                if is_boss:
-                    target_w = 120
-                    target_h = 160
-                    fallback = "enemy"
-                
-                # 2. GATEKEEPER (Grandi)
-                elif is_gatekeeper:
-                    target_w = 80
-                    target_h = 110
-                    fallback = "enemy"
-
-                # 3. NPC Standard (Giufà, ecc.) - Alti come il player standard
-                elif entity.entity_type == "npc":
-                    target_w = 32
-                    target_h = 64
-                    fallback = "npc"
-                    
-                # 4. Oggetti/Props (Scala 2x standard)
-                elif entity.entity_type in ["prop", "item", "interactable"]:
-                    target_w = entity.width * 2
-                    target_h = entity.height * 2
-                    fallback = entity.entity_type
-
-                # --- CARICAMENTO SPRITE ---
-                sprite = self.asset_manager.get_image(
-                    key=entity.entity_id, 
-                    width=target_w, 
-                    height=target_h,
-                    fallback_type=fallback
-                )
-                
-                # --- ALLINEAMENTO AI PIEDI ---
-                # Calcolo centro X logico
-                logic_center_x = entity.x + (entity.width // 2)
-                
-                # Nuova X di disegno (per centrare la sprite larga sulla hitbox stretta)
-                draw_x = logic_center_x - (target_w // 2)
-                
-                # Nuova Y di disegno (la base della sprite coincide con la base della hitbox)
-                draw_y = (entity.y + entity.height) - target_h
-                
-                draw_rect = pygame.Rect(draw_x, draw_y, target_w, target_h)
-                
-                # Ordinamento Z (Depth): Si basa sempre sulla coordinata Y dei piedi (Bottom)
-                sort_y = entity.y + entity.height
+        # --- CUTSCENE (INTRO/OUTRO) --- 
+        elif sm.has_state(StateID.CUTSCENE):
+            cutscene_state = sm._get_state(StateID.CUTSCENE)
+            # La cutscene si disegna da sola direttamente sulla surface
+            cutscene_state.render(screen)
+        
+        # --- ALTRI STATI ---
+        elif sm.has_state(StateID.COMBAT):
+            combat_state = sm._get_state(StateID.COMBAT)
+            self.render_combat(screen, combat_state)
+        elif sm.has_state(StateID.SCOPA):
+            scopa_state = sm._get_state(StateID.SCOPA)
+            self.render_scopa(screen, scopa_state)
+        elif sm.has_state(StateID.BRISCOLA):
+            briscola_state = sm._get_state(StateID.BRISCOLA)
+            self.render_briscola(screen, briscola_state)
+        elif sm.has_state(StateID.SETTE_MEZZO):
+            sm_state = sm._get_state(StateID.SETTE_MEZZO)
+            self.render_sette_mezzo(screen, sm_state)
+        elif sm.has_state(StateID.CUCU): 
+            cucu_state = sm._get_state(StateID.CUCU)
+            self.render_cucu(screen, cucu_state)
+        elif sm.has_state(StateID.ACES_MENU): 
+            aces_state = sm._get_state(StateID.ACES_MENU)
+            self.render_aces_menu(screen, aces_state)
+        elif sm.has_state(StateID.HUB) or sm.has_state(StateID.ROOM):
+            # Se siamo in gioco (anche sotto pausa), renderizziamo il mondo
+            self.render_game_state(screen, game_model, dt)
+        elif sm.has_state(StateID.MAIN_MENU):
+            menu_state = sm._get_state(StateID.MAIN_MENU)
+            self.render_main_menu(screen, menu_state)
 
-                actors.append({
-                    "surface": sprite,
-                    "rect": draw_rect,
-                    "layer": RenderLayer.ACTORS,
-                    "sort_y": sort_y
-                })
+        # 2. Logic per Overlay/Popup
+        # Nota: BOSS_OSTE e CUTSCENE non usano overlay standard sopra di essi in questo modo
+        if not sm.has_state(StateID.BOSS_OSTE) and not sm.has_state(StateID.CUTSCENE):
+            current_state = sm.peek()
+            if current_state:
+                if current_state.state_id == StateID.INVENTORY:
+                    self.render_inventory(screen, current_state)
+                elif current_state.state_id == StateID.PAUSE: 
+                    self.render_pause_menu(screen, current_state)
+                elif current_state.state_id == StateID.SAVE_LOAD: 
+                    self.render_save_load(screen, current_state)
+                elif current_state.state_id == StateID.GAME_OVER: 
+                    self.render_game_over(screen, current_state)
+                elif current_state.is_overlay: 
+                    # Renderizza elementi UI generici (dialoghi, prompt)
+                    current_state.render(screen)
+                    self.invalidate_screen()
+
+        # 3. Grafico del profiler (F3), sopra a tutto
+        if self.debug_settings.enabled:
+            self.room_view.debug_overlay.draw_frame_profile(screen, frame_profiler, (screen.get_width() - 250, 10))
+            self.invalidate_screen()
+
+    def render_game_state(self, screen: pygame.Surface, game_model, dt: float):
+        room_mgr = game_model.gamestate
+        
+        # A. Entità della stanza (descrittori risolti al caricamento della stanza)
+        actors = self._entity_actors()
 
         # B. Party Members (DYNAMIC SCALING)
         active_char = game_model.gamestate.get_active_player()
         is_hub = (game_model.gamestate.current_room_id == "hub")
         
-        # LOGICA DIMENSIONI DINAMICHE
-        if is_hub:
-            # Hub: Standard Size
-            P_WIDTH = 32
-            P_HEIGHT = 64
-        else:
-            # Regioni: Zoomed In (1.5x)
-            P_WIDTH = 48
-            P_HEIGHT = 96
+        # LOGICA DIMENSIONI DINAMICHE (Hub: Standard Size / Regioni: Zoomed In 1.5x)
+        P_WIDTH, P_HEIGHT = self._party_sprite_size(game_model.gamestate.current_room_id)
             
         # Calcolo Offset Y per mantenere i piedi a terra
         # L'hitbox logica è alta 32. 
@@ -184,7 +456,8 @@ class RenderController:
                     # Se P_WIDTH è 32, offset_x è 0. Se è 48, offset_x è (48-32)/2 = 8
                     offset_x = (P_WIDTH - 32) // 2
                     
-                    p_rect = pygame.Rect(char.x - offset_x, char.y - P_OFFSET_Y, P_WIDTH, P_HEIGHT)
+                    cx, cy = self._interpolated(id(char), char.x, char.y)
+                    p_rect = pygame.Rect(round(cx) - offset_x, round(cy) - P_OFFSET_Y, P_WIDTH, P_HEIGHT)
                     
                     actors.append({
                         "surface": p_sprite,
@@ -196,11 +469,12 @@ class RenderController:
             # Nelle Regioni, disegniamo SOLO il personaggio attivo
             if active_char:
                 px, py = game_model.gamestate.party_position 
+                ix, iy = self._interpolated("party", px, py)
                 
                 # Centratura orizzontale per sprite larghi
                 offset_x = (P_WIDTH - 32) // 2
                 
-                p_rect = pygame.Rect(px - offset_x, py - P_OFFSET_Y, P_WIDTH, P_HEIGHT)
+                p_rect = pygame.Rect(round(ix) - offset_x, round(iy) - P_OFFSET_Y, P_WIDTH, P_HEIGHT)
                 
                 fallback_key = "player" 
                 if "Rosalia" in active_char.name: fallback_key = "player2" 
@@ -232,7 +506,8 @@ class RenderController:
 
         ui_elements.append({
             "draw_func": draw_hud,
-            "layer": RenderLayer.UI
+            "layer": RenderLayer.UI,
+            "bounds": self._exploration_hud_bounds(screen.get_size(), hud_data)
         })
 
         if game_model.prompts.info_message:
@@ -246,17 +521,35 @@ class RenderController:
                 pygame.draw.rect(surface, (255, 255, 255), bg_rect, 1)
                 surface.blit(text_surf, text_surf.get_rect(center=(w//2, 100)))
 
+            msg_w, msg_h = self._font_ui.size(msg)
+            info_bounds = pygame.Rect(0, 0, msg_w, msg_h).inflate(22, 12)
+            info_bounds.center = (screen.get_width() // 2, 100)
+
             ui_elements.append({
                 "draw_func": draw_info,
-                "layer": RenderLayer.UI_OVERLAY 
+                "layer": RenderLayer.UI_OVERLAY,
+                "bounds": info_bounds
             })
 
         self.room_view.render(actors=actors, ui_elements=ui_elements)
         
         if self.debug_settings.enabled and self.debug_settings.show_fps:
             self.room_view.debug_overlay.draw_fps(self._fps)
+            self.room_view.debug_overlay.draw_text(self.asset_manager.cache_stats().summary(), (10, 50))
         
-        self.renderer.flush(screen, self.camera)
+        if self.retained_rendering:
+            self.renderer.flush_retained(screen, self.camera)
+        else:
+            self.renderer.flush(screen, self.camera)
+
+    def _exploration_hud_bounds(self, screen_size: tuple, data: ExplorationHUDData) -> pygame.Rect:
+        """Area toccata da _draw_exploration_hud (pannello + eventuale hint di interazione)."""
+        w, h = screen_size
+        bounds = pygame.Rect(10, h - 130, 220, 120).inflate(2, 2)
+        if data.interact_hint:
+            hint_w, hint_h = self._font_ui.size(data.interact_hint)
+            bounds.union_ip(pygame.Rect(w // 2 - hint_w // 2, h - 50, hint_w + 1, hint_h))
+        return bounds
 
     def _draw_exploration_hud(self, surface: pygame.Surface, data: ExplorationHUDData):
         panel_rect = pygame.Rect(10, surface.get_height() - 130, 220, 120)
@@ -341,10 +634,11 @@ class RenderController:
     def render_save_load(self, screen: pygame.Surface, sl_state):
         self.pause_view.render_save(
             screen.get_size(), 
-            sl_state.slots, 
-            sl_state.cursor_index,
+            sl_state.browser,
             is_input=sl_state.is_input_active,
-            input_text=sl_state.input_text
+            input_text=sl_state.input_text,
+            save_progress=sl_state.save_job.progress if sl_state.save_job else None,
+            title="SALVA PARTITA" if sl_state.mode == "save" else "CARICA PARTITA"
         )
         self.renderer.flush(screen, self.camera)
 
@@ -1,12 +1,16 @@
 """
 Room Manager for loading and unloading rooms.
 User Story 2: Load and unload rooms deterministically.
+Updated: once_flag handled through FlagManager subscriptions: entities hide/show as their flag changes.
+Updated: removed entities are hidden in the room data too, and every hide/show/removal
+         refreshes the ContentRegistry secondary indexes of the room (set_content).
 """
 
 import logging
 from typing import Optional
 from src.model.room_data import RoomData, EntityDefinition
 from src.model.persistent_world_state import PersistentWorldState
+from src.model.flag_manager import FlagManager
 
 logger = logging.getLogger(__name__)
 
@@ -18,26 +22,46 @@ class RoomManager:
     Features:
     - Deterministic loading of room data
     - Applies PersistentWorldState to filter removed entities
+    - Hides entities whose once_flag is set, and reacts to later flag changes
     - Clean unloading to prevent ghost updates
     """
     
-    def __init__(self, world_state: PersistentWorldState = None):
+    def __init__(self, world_state: PersistentWorldState = None, flags: FlagManager = None):
         """
         Initialize the room manager.
         
         Args:
             world_state: Reference to persistent world state.
+            flags: FlagManager for once_flag entities (optional).
         """
         self._world_state = world_state or PersistentWorldState()
+        self._flags = flags
+        self._flag_subscription: Optional[int] = None
+        # once_flag -> entity_id delle entità della stanza corrente che lo usano
+        self._once_flag_entities: dict[str, list[str]] = {}
         self._current_room: Optional[RoomData] = None
         self._current_room_id: Optional[str] = None
         self._spawned_entities: list[EntityDefinition] = []
         self._room_cache: dict[str, RoomData] = {}
         self._is_loaded = False
+        # ContentRegistry della stanza: gli indici delle entità si aggiornano a ogni hide/show
+        self._content = None
     
     def set_world_state(self, world_state: PersistentWorldState):
         """Set the world state reference."""
         self._world_state = world_state
+
+    def set_flag_manager(self, flags: FlagManager):
+        """Set the FlagManager used for once_flag entities (takes effect on the next load)."""
+        self._flags = flags
+
+    def set_content(self, content):
+        """Set the ContentRegistry whose entity indexes follow the loaded room (optional)."""
+        self._content = content
+
+    def _reindex_room(self, room: RoomData):
+        if self._content is not None:
+            self._content.reindex("rooms", room.room_id)
     
     def load_room(self, room_data: RoomData, spawn_id: str = 'default') -> tuple[int, int]:
         """
@@ -59,6 +83,10 @@ class RoomManager:
         
         # Filter entities based on persistent world state
         self._spawned_entities = self._filter_removed_entities(room_data)
+        self._subscribe_once_flags(room_data)
+
+        # Broadphase per collisioni/trigger/interagibili della stanza
+        room_data.build_spatial_index()
         
         self._is_loaded = True
         
@@ -86,28 +114,60 @@ class RoomManager:
     def _filter_removed_entities(self, room_data: RoomData) -> list[EntityDefinition]:
         """
         Filter out entities based on persistent state (removed or once_flag).
+        Filtered entities are hidden in the room data too (render, interaction, content indexes).
         """
-        filtered = []
-        # Accesso ai flag del gioco tramite game reference (se disponibile) o world_state esteso
-        # Per ora usiamo world_state.is_entity_removed (US 5.5)
-        # US 65: Integrazione con FlagManager sarebbe ideale, ma per ora usiamo removed_entities
-        
-        for entity in room_data.entities:
-            # 1. Check if explicitly removed (US 5.5)
-            if self._world_state.is_entity_removed(room_data.room_id, entity.entity_id):
-                continue
-                
-            # 2. Check US 65 'once_flag'
-            # (Richiede accesso ai flag globali. Assumiamo che RoomManager possa accedervi o che 
-            #  il filtering avvenga a livello di GameState.
-            #  FIX: Spostiamo questo check nel caricamento in GameState o iniettiamo i flags qui?)
-            
-            # Approccio: RoomManager filtra solo 'removed'. La logica 'once_flag' è gestita
-            # marcando l'entità come 'removed' nel momento in cui il flag viene settato (via script).
-            
-            filtered.append(entity)
-            
-        return filtered
+        # Anche le entità nascoste in un caricamento precedente si rivalutano con lo stato
+        # attuale (es. nuova partita: flag e rimozioni azzerati)
+        changed = False
+        for entity in list(room_data.entities) + room_data.hidden_entities():
+            # US 5.5: rimossa esplicitamente; US 65: 'once_flag' (spawn solo se il flag è FALSE)
+            hidden = (self._world_state.is_entity_removed(room_data.room_id, entity.entity_id)
+                      or bool(entity.once_flag and self._flags and self._flags.has_flag(entity.once_flag)))
+            if hidden:
+                changed |= room_data.hide_entity(entity.entity_id)
+            else:
+                changed |= room_data.show_entity(entity.entity_id)
+        if changed:
+            self._reindex_room(room_data)
+        return list(room_data.entities)
+
+    def _subscribe_once_flags(self, room_data: RoomData):
+        """Iscrizione ai once_flag della stanza: le entità compaiono/scompaiono al cambio del flag."""
+        self._unsubscribe_once_flags()
+        if not self._flags:
+            return
+        for entity in list(room_data.entities) + room_data.hidden_entities():
+            if entity.once_flag and not self._world_state.is_entity_removed(room_data.room_id, entity.entity_id):
+                self._once_flag_entities.setdefault(entity.once_flag, []).append(entity.entity_id)
+        if self._once_flag_entities:
+            self._flag_subscription = self._flags.subscribe(self._once_flag_entities, self._on_once_flag_changed)
+
+    def _unsubscribe_once_flags(self):
+        if self._flags and self._flag_subscription is not None:
+            self._flags.unsubscribe(self._flag_subscription)
+        self._flag_subscription = None
+        self._once_flag_entities = {}
+
+    def _on_once_flag_changed(self, flag_name: str, value):
+        room = self._current_room
+        if room is None:
+            return
+        changed = False
+        for entity_id in self._once_flag_entities.get(flag_name, ()):
+            if value:
+                if room.hide_entity(entity_id):
+                    changed = True
+                    self._spawned_entities = [e for e in self._spawned_entities if e.entity_id != entity_id]
+                    logger.debug(f"once_flag '{flag_name}' set: hid '{entity_id}' in '{room.room_id}'")
+            elif (not self._world_state.is_entity_removed(room.room_id, entity_id)
+                  and room.show_entity(entity_id)):
+                changed = True
+                # Stesso ordine della stanza
+                spawned = {id(e) for e in self._spawned_entities}
+                self._spawned_entities = [e for e in room.entities if id(e) in spawned or e.entity_id == entity_id]
+                logger.debug(f"once_flag '{flag_name}' cleared: restored '{entity_id}' in '{room.room_id}'")
+        if changed:
+            self._reindex_room(room)
     
     def unload_room(self):
         """
@@ -119,6 +179,8 @@ class RoomManager:
         
         logger.info(f"Unloading room '{self._current_room_id}'")
         
+        self._unsubscribe_once_flags()
+
         # Clear spawned entities
         self._spawned_entities.clear()
         
@@ -156,5 +218,10 @@ class RoomManager:
         
         # Persist the removal
         self._world_state.remove_entity(self._current_room_id, entity_id)
+
+        # Nascosta nei dati della stanza (indice spaziale e indici del ContentRegistry):
+        # torna visibile solo se lo stato del mondo cambia (es. nuova partita)
+        if self._current_room.hide_entity(entity_id):
+            self._reindex_room(self._current_room)
         
         logger.info(f"Removed entity '{entity_id}' from room '{self._current_room_id}'")
\ No newline at end of file
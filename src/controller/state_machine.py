@@ -59,6 +59,10 @@ class StateMachine:
             state = state_class(self)
             self.register_state(state)
     
+    def get_registered_states(self) -> list[BaseState]:
+        """Returns all registered state instances."""
+        return list(self._registered_states.values())
+
     def _get_state(self, state_id: StateID) -> Optional[BaseState]:
         """Get a registered state by ID."""
         return self._registered_states.get(state_id)
@@ -1,9 +1,12 @@
 """
 Sikula: L'ultimo brindisi
 Main Entry Point - The Game Loop
+Updated: Fixed-timestep simulation (FixedTimestepLoop) decoupled from the render rate.
+Updated: Per-phase FrameProfiler timings (F3 graph, F6 dumps a CSV trace to logs/).
 """
 import sys
 import os
+import time
 import pygame
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -11,11 +14,15 @@ parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 
 from src.controller.game_controller import GameController
+from src.controller.fixed_timestep import FixedTimestepLoop
 from src.model.states.base_state import StateID
+from src.model.utils.frame_profiler import (
+    frame_profiler, PHASE_EVENTS, PHASE_PROCESS, PHASE_RENDER, PHASE_PRESENT, COUNT_SIM_STEPS
+)
 
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
-TARGET_FPS = 60
+
 
 def main():
     pygame.init()
@@ -29,18 +36,31 @@ def main():
     
     # Carica i contenuti (stanze, oggetti, script)
     controller.game.load_content()
+
+    # Avvia in background la decodifica degli asset globali (menu, intro, ritratti)
+    controller.render_controller.warm_up_assets()
     
     # Start at MAIN MENU
     print("[Main] Entering Main Menu...")
     controller.state_machine.change_state(StateID.MAIN_MENU)
     
+    # Simulazione a passo fisso (sim_hz), render limitato a parte (render_fps_cap, 0 = illimitato)
+    settings = controller.game.settings
+    sim_loop = FixedTimestepLoop(settings.sim_hz, settings.max_sim_steps)
+
     print("[Main] Game Loop Started.")
     running = True
+    last_time = time.perf_counter()
     
     while running:
-        dt = clock.tick(TARGET_FPS) / 1000.0
+        clock.tick(settings.render_fps_cap)
+        now = time.perf_counter()
+        frame_dt = now - last_time
+        last_time = now
+        frame_profiler.begin_frame()
         controller.render_controller.update_fps(clock.get_fps())
 
+        t_events = time.perf_counter()
         events = pygame.event.get()
         for event in events:
             if event.type == pygame.QUIT:
@@ -55,77 +75,32 @@ def main():
                         screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
                     else:
                         screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN)
+                if event.key == pygame.K_F6:
+                    trace_path = os.path.join("logs", time.strftime("profile_%Y%m%d_%H%M%S.csv"))
+                    print(f"[Main] Frame trace: {frame_profiler.dump(trace_path)} frames -> {trace_path}")
 
             controller.input_manager.process_event(event)
             controller.state_machine.handle_event(event)
+        frame_profiler.add_time(PHASE_EVENTS, time.perf_counter() - t_events)
 
-        controller.process_frame(dt)
+        # C. SIMULAZIONE: zero o più passi fissi (gli input "just pressed" restano validi fino al primo passo)
+        steps = sim_loop.advance(frame_dt)
+        frame_profiler.count(COUNT_SIM_STEPS, steps)
+        with frame_profiler.measure(PHASE_PROCESS):
+            for _ in range(steps):
+                controller.process_frame(sim_loop.step_dt)
+        controller.render_controller.set_interpolation(sim_loop.alpha)
 
         # D. RENDERING
-        screen.fill((0, 0, 0)) 
-        
-        controller.render_controller.begin_frame()
-        
-        sm = controller.state_machine
-        
-        # 1. Logic per Background/Mondo (Stati Principali)
-        
-        # --- BOSS FINALE ---
-        if sm.has_state(StateID.BOSS_OSTE):
-            boss_state = sm._get_state(StateID.BOSS_OSTE)
-            boss_state.render(screen)
-
-        # --- CUTSCENE (INTRO/OUTRO) --- 
-        elif sm.has_state(StateID.CUTSCENE):
-            cutscene_state = sm._get_state(StateID.CUTSCENE)
-            # La cutscene si disegna da sola direttamente sulla surface
-            cutscene_state.render(screen)
-        
-        # --- ALTRI STATI ---
-        elif sm.has_state(StateID.COMBAT):
-            combat_state = sm._get_state(StateID.COMBAT)
-            controller.render_controller.render_combat(screen, combat_state)
-        elif sm.has_state(StateID.SCOPA):
-            scopa_state = sm._get_state(StateID.SCOPA)
-            controller.render_controller.render_scopa(screen, scopa_state)
-        elif sm.has_state(StateID.BRISCOLA):
-            briscola_state = sm._get_state(StateID.BRISCOLA)
-            controller.render_controller.render_briscola(screen, briscola_state)
-        elif sm.has_state(StateID.SETTE_MEZZO):
-            sm_state = sm._get_state(StateID.SETTE_MEZZO)
-            controller.render_controller.render_sette_mezzo(screen, sm_state)
-        elif sm.has_state(StateID.CUCU): 
-            cucu_state = sm._get_state(StateID.CUCU)
-            controller.render_controller.render_cucu(screen, cucu_state)
-        elif sm.has_state(StateID.ACES_MENU): 
-            aces_state = sm._get_state(StateID.ACES_MENU)
-            controller.render_controller.render_aces_menu(screen, aces_state)
-        elif sm.has_state(StateID.HUB) or sm.has_state(StateID.ROOM):
-            # Se siamo in gioco (anche sotto pausa), renderizziamo il mondo
-            controller.render_controller.render_game_state(screen, controller.game, dt)
-        elif sm.has_state(StateID.MAIN_MENU):
-            menu_state = sm._get_state(StateID.MAIN_MENU)
-            controller.render_controller.render_main_menu(screen, menu_state)
-
-        # 2. Logic per Overlay/Popup
-        # Nota: BOSS_OSTE e CUTSCENE non usano overlay standard sopra di essi in questo modo
-        if not sm.has_state(StateID.BOSS_OSTE) and not sm.has_state(StateID.CUTSCENE):
-            current_state = sm.peek()
-            if current_state:
-                if current_state.state_id == StateID.INVENTORY:
-                    controller.render_controller.render_inventory(screen, current_state)
-                elif current_state.state_id == StateID.PAUSE: 
-                    controller.render_controller.render_pause_menu(screen, current_state)
-                elif current_state.state_id == StateID.SAVE_LOAD: 
-                    controller.render_controller.render_save_load(screen, current_state)
-                elif current_state.state_id == StateID.GAME_OVER: 
-                    controller.render_controller.render_game_over(screen, current_state)
-                elif current_state.is_overlay: 
-                    # Renderizza elementi UI generici (dialoghi, prompt)
-                    current_state.render(screen)
-
-        pygame.display.flip()
+        with frame_profiler.measure(PHASE_RENDER):
+            controller.render_controller.render_frame(screen, controller.state_machine, controller.game, frame_dt)
+        with frame_profiler.measure(PHASE_PRESENT):
+            controller.render_controller.present()
+        frame_profiler.end_frame()
 
+    controller.render_controller.asset_preloader.shutdown()
+    controller.autosave.close()
+    controller.save_service.shutdown()
     pygame.quit()
     sys.exit()
 
@@ -2,14 +2,29 @@
 FILE: ./src/model/assets/asset_manager.py
 Asset Manager - Centralized handling for graphic resources.
 Updated: Compatible with PyInstaller exe.
+Updated: Decode/scale split from convert so the AssetPreloader can work off the main thread.
+Updated: Images held in a byte-budgeted LRU (SurfaceCache) with pinning for the current room.
+Updated: Pre-baked per-region sprite atlases (assets/atlas) served as subsurfaces.
+Updated: Atlas variants copied out of their page, so the byte budget matches real memory.
 """
 import os
 import sys
 import pygame
 import logging
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from src.model.assets.surface_cache import SurfaceCache, CacheStats, DEFAULT_BUDGET_BYTES
+from src.model.assets.atlas import AtlasStore, ATLAS_DIR_NAME
+from src.model.assets.text_cache import text_cache
 
 logger = logging.getLogger(__name__)
 
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+# Dimensioni dei ritratti mostrati da DialogueState (usate anche nei manifest delle stanze)
+PORTRAIT_SIZE = (200, 300)
+
 
 def resource_path(relative_path):
     """
@@ -22,14 +37,41 @@ def resource_path(relative_path):
     return os.path.join(os.path.abspath("."), relative_path)
 
 
+def make_cache_key(key: str, width: int, height: int, preserve_aspect: bool) -> str:
+    """Chiave di cache di una variante scalata (stesso formato usato da get_image)."""
+    return f"{key}_{width}x{height}_{'AR' if preserve_aspect else 'STRETCH'}"
+
+
+@dataclass(frozen=True)
+class AssetRequest:
+    """
+    Singola voce di un manifest di asset: un'immagine a una dimensione precisa.
+    Stanze e stati dichiarano liste di AssetRequest per il preload in background.
+    """
+    key: str
+    width: int = 32
+    height: int = 32
+    fallback_type: str = "prop"
+    preserve_aspect: bool = False
+
+    @property
+    def cache_key(self) -> str:
+        return make_cache_key(self.key, self.width, self.height, self.preserve_aspect)
+
+
+def portrait_request(name: str, fallback_type: str = "npc") -> AssetRequest:
+    """Manifest helper: ritratto di un personaggio come disegnato nei dialoghi."""
+    return AssetRequest(f"characters/{name}", PORTRAIT_SIZE[0], PORTRAIT_SIZE[1], fallback_type)
+
+
 class AssetManager:
-    def __init__(self, asset_dir_name: str = "assets"):
+    def __init__(self, asset_dir_name: str = "assets", cache_budget_bytes: int = DEFAULT_BUDGET_BYTES):
         # NUOVO: Usa resource_path invece del calcolo manuale
         self.asset_dir = resource_path(asset_dir_name)
-        
-        self.images: dict[str, pygame.Surface] = {}
-        self.fonts: dict[str, pygame.font.Font] = {}
-        
+
+        self.images = SurfaceCache(cache_budget_bytes)
+        self.atlas = AtlasStore(os.path.join(self.asset_dir, ATLAS_DIR_NAME))
+
         self.color_map = {
             "player": (0, 255, 0),    # Verde (Turiddu/P1)
             "player2": (0, 255, 255), # Ciano (Rosalia/P2)
@@ -41,7 +83,7 @@ class AssetManager:
             "wall": (50, 50, 50),
             "background": (20, 20, 30)
         }
-        
+
         logger.info(f"AssetManager initialized. Looking for assets in: {self.asset_dir}")
 
     def get_image(
@@ -52,50 +94,97 @@ class AssetManager:
         fallback_type: str = "prop",
         preserve_aspect: bool = False
     ) -> pygame.Surface:
-        cache_key = f"{key}_{width}x{height}_{'AR' if preserve_aspect else 'STRETCH'}"
-        
-        if cache_key in self.images:
-            return self.images[cache_key]
+        cache_key = make_cache_key(key, width, height, preserve_aspect)
+
+        surf = self.images.get(cache_key)
+        if surf is not None:
+            return surf
 
+        for full_path in self.candidate_paths(key):
+            try:
+                surf = self.load_scaled(full_path, width, height, preserve_aspect).convert_alpha()
+                self.images.put(cache_key, surf)
+                return surf
+            except Exception as e:
+                logger.warning(f"Error loading image at {full_path}: {e}")
+
+        return self._create_placeholder(cache_key, width, height, fallback_type)
+
+    def candidate_paths(self, key: str) -> Iterator[str]:
+        """Percorsi esistenti su disco per una chiave, in ordine di priorità."""
         potential_paths = [
             os.path.join(self.asset_dir, "images", key),
             os.path.join(self.asset_dir, key)
         ]
 
         for path in potential_paths:
-            for ext in [".png", ".jpg", ".jpeg"]:
+            for ext in IMAGE_EXTENSIONS:
                 full_path = path if path.endswith(ext) else path + ext
-                
                 if os.path.exists(full_path):
-                    try:
-                        surf = pygame.image.load(full_path).convert_alpha()
-                        if surf.get_width() != width or surf.get_height() != height:
-                            if preserve_aspect:
-                                iw, ih = surf.get_size()
-                                if iw > 0 and ih > 0:
-                                    s = min(width / iw, height / ih)
-                                    new_size = (max(1, int(iw * s)), max(1, int(ih * s)))
-                                    surf = pygame.transform.smoothscale(surf, new_size)
-                            else:
-                                surf = pygame.transform.smoothscale(surf, (width, height))
-                        
-                        self.images[cache_key] = surf
-                        return surf
-                    except Exception as e:
-                        logger.warning(f"Error loading image at {full_path}: {e}")
+                    yield full_path
 
-        return self._create_placeholder(cache_key, width, height, fallback_type)
+    @staticmethod
+    def load_scaled(full_path: str, width: int, height: int, preserve_aspect: bool) -> pygame.Surface:
+        """
+        Decodifica e scala un'immagine SENZA convert_alpha.
+        Non tocca il display, quindi è sicuro da chiamare da un worker thread.
+        """
+        surf = pygame.image.load(full_path)
+        if surf.get_width() != width or surf.get_height() != height:
+            if preserve_aspect:
+                iw, ih = surf.get_size()
+                if iw > 0 and ih > 0:
+                    s = min(width / iw, height / ih)
+                    new_size = (max(1, int(iw * s)), max(1, int(ih * s)))
+                    surf = pygame.transform.smoothscale(surf, new_size)
+            else:
+                surf = pygame.transform.smoothscale(surf, (width, height))
+        return surf
+
+    def is_cached(self, cache_key: str) -> bool:
+        return cache_key in self.images
+
+    def store_image(self, cache_key: str, surf: pygame.Surface) -> None:
+        """Inserisce in cache una superficie già pronta (es. prodotta dal preloader)."""
+        self.images.put(cache_key, surf)
+
+    def discard(self, cache_keys: Iterable[str]) -> int:
+        """Rimuove dalla cache le chiavi indicate. Ritorna quante ne sono state rimosse."""
+        removed = 0
+        for cache_key in cache_keys:
+            if self.images.pop(cache_key) is not None:
+                removed += 1
+        return removed
+
+    def load_atlas_region(self, region) -> int:
+        """
+        Mette in cache le varianti pre-calcolate di una regione (copiate dalle pagine atlas).
+        Senza atlas baked è un no-op. Ritorna quante immagini sono state aggiunte.
+        """
+        sprites = self.atlas.load_region(region, skip=self.images)
+        for cache_key, surf in sprites.items():
+            self.images.put(cache_key, surf)
+        if sprites:
+            logger.info(f"Loaded {len(sprites)} atlas sprites for region '{region}'")
+        return len(sprites)
+
+    def pin(self, cache_keys: Iterable[str]) -> None:
+        """Sostituisce l'insieme di immagini non sfrattabili (asset della stanza corrente)."""
+        self.images.set_pinned(cache_keys)
+
+    def set_cache_budget(self, budget_bytes: int) -> None:
+        self.images.set_budget(budget_bytes)
+
+    def cache_stats(self) -> CacheStats:
+        return self.images.stats
 
     def _create_placeholder(self, cache_key: str, w: int, h: int, entity_type: str) -> pygame.Surface:
         surf = pygame.Surface((w, h))
         color = self.color_map.get(entity_type, (255, 0, 255))
         surf.fill(color)
         pygame.draw.rect(surf, (255, 255, 255), surf.get_rect(), 1)
-        self.images[cache_key] = surf
+        self.images.put(cache_key, surf)
         return surf
 
-    def get_font(self, size: int = 24) -> pygame.font.Font:
-        key = f"default_{size}"
-        if key not in self.fonts:
-            self.fonts[key] = pygame.font.SysFont("Arial", size, bold=True)
-        return self.fonts[key]
\ No newline at end of file
+    def get_font(self, size: int = 24):
+        return text_cache.font("Arial", size, bold=True)
@@ -0,0 +1,224 @@
+"""
+Asset Preloader - Decodifica in background delle immagini dichiarate nei manifest.
+
+Stanze (WorldBuilder) e stati (game_states) dichiarano quali AssetRequest useranno.
+Il preloader raggruppa i manifest in "residency set" per regione: entrando in una regione
+le sue immagini vengono decodificate e scalate su un worker thread, mentre quelle delle
+regioni lasciate vengono rilasciate dalla cache dell'AssetManager.
+
+Il worker non tocca mai il display: convert_alpha() e l'inserimento in cache avvengono
+sul main thread in pump(), chiamato una volta per frame con un budget limitato.
+Le varianti senza file (o non decodificabili) vengono ricordate: si cercano su disco una volta sola.
+"""
+import logging
+import queue
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+import pygame
+
+from src.model.assets.asset_manager import AssetManager, AssetRequest
+
+logger = logging.getLogger(__name__)
+
+# Regione speciale per gli asset sempre residenti (menu, intro, ritratti del party)
+GLOBAL_REGION = None
+
+# Default di pump(): usa max_uploads_per_frame (None esplicito = nessun limite)
+_DEFAULT_BUDGET = object()
+
+
+class AssetPreloader:
+    """
+    Preload asincrono con residency set per regione.
+
+    Flusso:
+    - declare(region, requests): registra il manifest di una regione (o globale se region=None)
+    - enter_region(region): accoda il residency set della regione e rilascia le altre
+    - request(requests): accoda richieste singole (es. stanze vicine)
+    - pump(): sul main thread, consegna le superfici pronte all'AssetManager
+    """
+
+    # Secondi di inattività dopo cui il worker termina (viene riavviato alla prossima richiesta)
+    IDLE_TIMEOUT = 2.0
+
+    def __init__(self, asset_manager: AssetManager, max_uploads_per_frame: int = 4):
+        self.asset_manager = asset_manager
+        self.max_uploads_per_frame = max_uploads_per_frame
+
+        self._regions: Dict[Optional[str], Set[AssetRequest]] = {}
+        self._active_region: Optional[str] = None
+
+        self._jobs: "queue.Queue[AssetRequest]" = queue.Queue()
+        self._results: "queue.Queue[Tuple[AssetRequest, Optional[pygame.Surface]]]" = queue.Queue()
+        self._in_flight: Set[str] = set()
+        # Varianti senza file su disco: non si riaccodano (get_image mostrerà il placeholder)
+        self._missing: Set[str] = set()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    # ============== MANIFEST / RESIDENCY ==============
+
+    def declare(self, region: Optional[str], requests: Iterable[AssetRequest]) -> None:
+        """Aggiunge richieste al residency set di una regione (None = sempre residenti)."""
+        self._regions.setdefault(region, set()).update(requests)
+
+    def has_region(self, region: Optional[str]) -> bool:
+        return region in self._regions
+
+    def regions(self) -> list:
+        return list(self._regions)
+
+    def get_residency(self, region: Optional[str]) -> Set[AssetRequest]:
+        return set(self._regions.get(region, ()))
+
+    @property
+    def active_region(self) -> Optional[str]:
+        return self._active_region
+
+    def enter_region(self, region: Optional[str]) -> None:
+        """
+        Rende residente una regione: accoda il suo manifest e rilascia dalla cache
+        le varianti che appartengono solo ad altre regioni.
+        """
+        if region != self._active_region:
+            keep = self._regions.get(GLOBAL_REGION, set()) | self._regions.get(region, set())
+            keep_keys = {r.cache_key for r in keep}
+            release = {
+                r.cache_key
+                for other, reqs in self._regions.items()
+                if other not in (GLOBAL_REGION, region)
+                for r in reqs
+                if r.cache_key not in keep_keys
+            }
+            released = self.asset_manager.discard(release)
+            if released:
+                logger.info(f"Preloader: released {released} images leaving region '{self._active_region}'")
+            self._active_region = region
+
+        self.request(self._regions.get(region, ()))
+
+    def warm_up(self) -> None:
+        """Accoda gli asset globali (menu, intro, ritratti del party)."""
+        self.request(self._regions.get(GLOBAL_REGION, ()))
+
+    # ============== QUEUE ==============
+
+    def request(self, requests: Iterable[AssetRequest]) -> int:
+        """
+        Accoda le richieste non ancora in cache, in lavorazione o già risultate mancanti.
+        Ritorna quante ne accoda.
+        """
+        queued = 0
+        with self._lock:
+            for req in requests:
+                cache_key = req.cache_key
+                if (cache_key in self._in_flight or cache_key in self._missing
+                        or self.asset_manager.is_cached(cache_key)):
+                    continue
+                self._in_flight.add(cache_key)
+                self._jobs.put(req)
+                queued += 1
+
+            if queued and self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="AssetPreloader", daemon=True)
+                self._worker.start()
+        return queued
+
+    def pending_count(self) -> int:
+        """Richieste accodate o decodificate ma non ancora consegnate al main thread."""
+        with self._lock:
+            return len(self._in_flight)
+
+    def is_idle(self) -> bool:
+        return self.pending_count() == 0
+
+    def wait_until_decoded(self, timeout: float = 5.0) -> bool:
+        """Blocca finché il worker ha decodificato tutte le richieste pendenti (loading screen e test)."""
+        deadline = time.monotonic() + timeout
+        while self._results.qsize() < self.pending_count():
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+    # ============== MAIN THREAD ==============
+
+    def pump(self, max_uploads=_DEFAULT_BUDGET) -> int:
+        """
+        Consegna all'AssetManager fino a max_uploads superfici pronte
+        (default max_uploads_per_frame, None = tutte quelle pronte).
+        Va chiamato dal main thread (convert_alpha richiede il display).
+        """
+        budget = self.max_uploads_per_frame if max_uploads is _DEFAULT_BUDGET else max_uploads
+        delivered = 0
+
+        while budget is None or delivered < budget:
+            try:
+                req, surf = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            cache_key = req.cache_key
+            with self._lock:
+                self._in_flight.discard(cache_key)
+                if surf is None:
+                    self._missing.add(cache_key)
+
+            # Se nel frattempo get_image l'ha caricata in modo sincrono, non sovrascriviamo
+            if surf is None or self.asset_manager.is_cached(cache_key):
+                continue
+
+            if pygame.display.get_surface() is not None:
+                try:
+                    surf = surf.convert_alpha()
+                except pygame.error as e:
+                    logger.warning(f"Preloader: convert failed for {cache_key}: {e}")
+
+            self.asset_manager.store_image(cache_key, surf)
+            delivered += 1
+
+        return delivered
+
+    def shutdown(self) -> None:
+        """Svuota la coda e attende la chiusura del worker."""
+        with self._lock:
+            worker = self._worker
+            while True:
+                try:
+                    req = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                self._in_flight.discard(req.cache_key)
+                self._jobs.task_done()
+        if worker is not None:
+            worker.join(timeout=self.IDLE_TIMEOUT + 1.0)
+
+    # ============== WORKER THREAD ==============
+
+    def _run(self) -> None:
+        while True:
+            try:
+                req = self._jobs.get(timeout=self.IDLE_TIMEOUT)
+            except queue.Empty:
+                with self._lock:
+                    if self._jobs.empty():
+                        self._worker = None
+                        return
+                continue
+
+            try:
+                self._results.put((req, self._decode(req)))
+            finally:
+                self._jobs.task_done()
+
+    def _decode(self, req: AssetRequest) -> Optional[pygame.Surface]:
+        for full_path in self.asset_manager.candidate_paths(req.key):
+            try:
+                return AssetManager.load_scaled(full_path, req.width, req.height, req.preserve_aspect)
+            except Exception as e:
+                logger.warning(f"Preloader: error decoding {full_path}: {e}")
+        # Asset mancante: il placeholder lo crea get_image al primo uso (costo trascurabile)
+        return None
+
@@ -0,0 +1,205 @@
+"""
+Sprite Atlas - Varianti scalate pre-calcolate offline, impacchettate per regione.
+
+Il bake (src/model/assets/atlas_bake.py) prende i manifest di stanze e stati, decodifica e
+scala ogni variante (key, w, h) una volta sola e la impacchetta in pagine PNG per regione,
+più un indice JSON. A runtime l'AssetManager carica le pagine della regione e mette in cache
+una copia di ogni variante: niente decode né smoothscale per le varianti presenti nell'atlas.
+Le copie (non subsurface) non tengono in vita la pagina intera, così il budget in byte della
+SurfaceCache resta esatto e sfrattare una variante libera davvero la sua memoria.
+
+Formato di assets/atlas/atlas_index.json:
+    {
+      "version": 1,
+      "regions": {
+        "global": {"pages": ["global_0.png"], "entries": {"<cache_key>": [page, x, y, w, h]}},
+        "aurion": {...}
+      }
+    }
+"""
+import json
+import logging
+import os
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+import pygame
+
+if TYPE_CHECKING:
+    from src.model.assets.asset_manager import AssetManager, AssetRequest
+
+logger = logging.getLogger(__name__)
+
+ATLAS_DIR_NAME = "atlas"
+INDEX_FILE_NAME = "atlas_index.json"
+INDEX_VERSION = 1
+
+# Nome su disco della regione globale (GLOBAL_REGION = None nel preloader)
+GLOBAL_REGION_NAME = "global"
+
+DEFAULT_PAGE_SIZE = 2048
+# Varianti più grandi (sfondi, cutscene) restano file singoli: riempirebbero una pagina da sole
+MAX_ENTRY_SIZE = 512
+PADDING = 1
+
+Placement = Tuple[int, int, int]  # (page, x, y)
+
+
+def region_file_name(region: Optional[str]) -> str:
+    return GLOBAL_REGION_NAME if region is None else region
+
+
+def pack_shelves(sizes: List[Tuple[int, int]], page_size: int = DEFAULT_PAGE_SIZE,
+                 padding: int = PADDING) -> List[Placement]:
+    """
+    Shelf packing: ordina per altezza decrescente e riempie righe da sinistra a destra,
+    aprendo una nuova pagina quando la corrente è piena.
+    Ritorna una Placement per ciascuna size, nello stesso ordine dell'input.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0]))
+    placements: List[Optional[Placement]] = [None] * len(sizes)
+
+    page, x, y, shelf_h = 0, 0, 0, 0
+    for i in order:
+        w, h = sizes[i]
+        if w + padding > page_size or h + padding > page_size:
+            raise ValueError(f"Entry {w}x{h} does not fit in a {page_size}px atlas page")
+
+        if x + w + padding > page_size:
+            # Nuova riga
+            x, y = 0, y + shelf_h
+            shelf_h = 0
+        if y + h + padding > page_size:
+            # Nuova pagina
+            page, x, y, shelf_h = page + 1, 0, 0, 0
+
+        placements[i] = (page, x, y)
+        x += w + padding
+        shelf_h = max(shelf_h, h + padding)
+
+    return placements
+
+
+def bake_atlases(asset_manager: "AssetManager",
+                 manifests: Dict[Optional[str], Iterable["AssetRequest"]],
+                 out_dir: str,
+                 page_size: int = DEFAULT_PAGE_SIZE,
+                 max_entry_size: int = MAX_ENTRY_SIZE) -> dict:
+    """
+    Decodifica, scala e impacchetta le varianti dei manifest (una pagina o più per regione).
+    Scrive le pagine PNG e l'indice JSON in out_dir. Ritorna l'indice.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    index = {"version": INDEX_VERSION, "regions": {}}
+
+    for region, requests in manifests.items():
+        name = region_file_name(region)
+        surfaces: List[Tuple[str, pygame.Surface]] = []
+        seen = set()
+
+        for req in sorted(requests, key=lambda r: r.cache_key):
+            if req.cache_key in seen or req.width > max_entry_size or req.height > max_entry_size:
+                continue
+            seen.add(req.cache_key)
+            surf = _decode(asset_manager, req)
+            if surf is not None:
+                surfaces.append((req.cache_key, surf))
+
+        if not surfaces:
+            continue
+
+        placements = pack_shelves([s.get_size() for _, s in surfaces], page_size)
+        page_count = max(p for p, _, _ in placements) + 1
+        # Pagine alte solo quanto serve (l'ultima è spesso mezza vuota)
+        used_h = [0] * page_count
+        for (_, surf), (page, _, y) in zip(surfaces, placements):
+            used_h[page] = max(used_h[page], y + surf.get_height())
+        pages = [pygame.Surface((page_size, h), pygame.SRCALPHA) for h in used_h]
+
+        entries = {}
+        for (cache_key, surf), (page, x, y) in zip(surfaces, placements):
+            pages[page].blit(surf, (x, y))
+            entries[cache_key] = [page, x, y, surf.get_width(), surf.get_height()]
+
+        page_files = []
+        for n, page_surf in enumerate(pages):
+            file_name = f"{name}_{n}.png"
+            pygame.image.save(page_surf, os.path.join(out_dir, file_name))
+            page_files.append(file_name)
+
+        index["regions"][name] = {"pages": page_files, "entries": entries}
+        logger.info(f"Atlas '{name}': {len(entries)} sprites in {page_count} page(s)")
+
+    with open(os.path.join(out_dir, INDEX_FILE_NAME), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    return index
+
+
+def _decode(asset_manager: "AssetManager", req: "AssetRequest") -> Optional[pygame.Surface]:
+    for full_path in asset_manager.candidate_paths(req.key):
+        try:
+            return asset_manager.load_scaled(full_path, req.width, req.height, req.preserve_aspect)
+        except Exception as e:
+            logger.warning(f"Atlas bake: error decoding {full_path}: {e}")
+    return None
+
+
+class AtlasStore:
+    """Accesso runtime all'indice e alle pagine dell'atlas (nessun atlas = no-op)."""
+
+    def __init__(self, atlas_dir: str):
+        self.atlas_dir = atlas_dir
+        self._index: Optional[dict] = None
+
+    @property
+    def index(self) -> dict:
+        if self._index is None:
+            self._index = self._read_index()
+        return self._index
+
+    def _read_index(self) -> dict:
+        path = os.path.join(self.atlas_dir, INDEX_FILE_NAME)
+        if not os.path.exists(path):
+            return {"regions": {}}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.warning(f"Corrupt atlas index at {path}: {e}. Falling back to per-file loading.")
+            return {"regions": {}}
+        if data.get("version") != INDEX_VERSION:
+            logger.warning(f"Atlas index version {data.get('version')} not supported, ignoring it.")
+            return {"regions": {}}
+        return data
+
+    def entries(self, region: Optional[str]) -> Dict[str, list]:
+        return self.index["regions"].get(region_file_name(region), {}).get("entries", {})
+
+    def load_region(self, region: Optional[str], skip=()) -> Dict[str, pygame.Surface]:
+        """
+        Carica le pagine di una regione e ritorna {cache_key: copia della variante}.
+        Le pagine si rilasciano all'uscita: ogni variante ha i suoi pixel.
+        Le chiavi in skip (già in cache) non vengono ritornate; se sono tutte in skip
+        le pagine non vengono nemmeno lette.
+        """
+        data = self.index["regions"].get(region_file_name(region))
+        if not data:
+            return {}
+
+        wanted = {k: v for k, v in data["entries"].items() if k not in skip}
+        if not wanted:
+            return {}
+
+        has_display = pygame.display.get_surface() is not None
+        pages = []
+        try:
+            for file_name in data["pages"]:
+                page = pygame.image.load(os.path.join(self.atlas_dir, file_name))
+                pages.append(page.convert_alpha() if has_display else page)
+        except (pygame.error, FileNotFoundError) as e:
+            logger.warning(f"Atlas pages for '{region_file_name(region)}' unreadable: {e}")
+            return {}
+
+        return {
+            cache_key: pages[page].subsurface((x, y, w, h)).copy()
+            for cache_key, (page, x, y, w, h) in wanted.items()
+        }
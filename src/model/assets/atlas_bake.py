@@ -0,0 +1,59 @@
+"""
+Asset bake - Genera gli atlas di sprite pre-scalati in assets/atlas.
+
+Uso (dalla root del repository):
+    python -m src.model.assets.atlas_bake [--page-size 2048] [--out assets/atlas]
+
+Raccoglie i manifest dichiarati da stati e stanze (gli stessi usati dall'AssetPreloader),
+quindi le varianti impacchettate sono esattamente quelle richieste a runtime.
+Va rilanciato quando cambiano immagini in assets/images o dimensioni di rendering.
+"""
+import argparse
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from src.model.assets.asset_manager import resource_path
+from src.model.assets.atlas import (
+    ATLAS_DIR_NAME, DEFAULT_PAGE_SIZE, MAX_ENTRY_SIZE, bake_atlases
+)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Bake scaled sprite atlases for Sikula.")
+    parser.add_argument("--out", default=os.path.join("assets", ATLAS_DIR_NAME),
+                        help="Cartella di output (default: assets/atlas)")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--max-entry", type=int, default=MAX_ENTRY_SIZE,
+                        help="Lato massimo di una variante impacchettata")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+
+    # Import ritardato: GameController costruisce viste e font, serve pygame inizializzato
+    from src.controller.game_controller import GameController
+    from src.model.party_factory import PartyFactory
+
+    controller = GameController()
+    controller.game.load_content()
+
+    party_names = [c.name for c in PartyFactory().create_main_party().main_characters]
+    render_ctrl = controller.render_controller
+    manifests = render_ctrl.collect_asset_manifests(controller.game.content, party_names)
+
+    index = bake_atlases(render_ctrl.asset_manager, manifests, resource_path(args.out),
+                         page_size=args.page_size, max_entry_size=args.max_entry)
+
+    for name, data in sorted(index["regions"].items()):
+        print(f"[Bake] {name}: {len(data['entries'])} sprites, {len(data['pages'])} page(s)")
+
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""
+Surface Cache - LRU con budget in byte per le superfici scalate dell'AssetManager.
+
+Ogni voce pesa width * height * bytesize. Quando il budget viene superato si
+eliminano le voci usate meno di recente, saltando quelle "pinned" (gli asset
+della stanza corrente). I contatori hit/miss/eviction servono al debug overlay
+e ai test di memoria. `version` cambia a ogni inserimento/rimozione: chi tiene
+riferimenti alle superfici (descrittori di rendering) sa quando rileggerle.
+"""
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional, Set
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+# Budget di default: ~128 MB di superfici residenti (32 bpp)
+DEFAULT_BUDGET_BYTES = 128 * 1024 * 1024
+
+
+def surface_bytes(surf: pygame.Surface) -> int:
+    """Memoria occupata dai pixel di una superficie."""
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    used_bytes: int
+    budget_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def summary(self, label: str = "Img cache") -> str:
+        return (f"{label}: {self.entries} img {self.used_bytes / 1048576:.1f}/"
+                f"{self.budget_bytes / 1048576:.0f} MB  hit {self.hit_rate:.0%}  evict {self.evictions}")
+
+
+class SurfaceCache:
+    """
+    Mappa cache_key -> Surface ordinata per uso (LRU), con budget in byte.
+
+    - get(): conta hit/miss e sposta la voce in coda (più recente)
+    - put(): inserisce e sfratta le voci meno recenti non pinned fino a rientrare nel budget
+    - set_pinned(): sostituisce l'insieme delle chiavi non sfrattabili
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self._entries: "OrderedDict[str, pygame.Surface]" = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._pinned: Set[str] = set()
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.version = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ============== LOOKUP ==============
+
+    def get(self, cache_key: str) -> Optional[pygame.Surface]:
+        surf = self._entries.get(cache_key)
+        if surf is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(cache_key)
+        return surf
+
+    def __contains__(self, cache_key: str) -> bool:
+        return cache_key in self._entries
+
+    def __getitem__(self, cache_key: str) -> pygame.Surface:
+        return self._entries[cache_key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    # ============== INSERT / REMOVE ==============
+
+    def put(self, cache_key: str, surf: pygame.Surface) -> None:
+        self.pop(cache_key)
+        size = surface_bytes(surf)
+        self._entries[cache_key] = surf
+        self._sizes[cache_key] = size
+        self.used_bytes += size
+        self.version += 1
+        self._evict(protect=cache_key)
+
+    def pop(self, cache_key: str) -> Optional[pygame.Surface]:
+        surf = self._entries.pop(cache_key, None)
+        if surf is not None:
+            self.used_bytes -= self._sizes.pop(cache_key)
+            self.version += 1
+        return surf
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._sizes.clear()
+        self.used_bytes = 0
+        self.version += 1
+
+    # ============== BUDGET / PINNING ==============
+
+    def set_budget(self, budget_bytes: int) -> None:
+        self.budget_bytes = max(0, int(budget_bytes))
+        self._evict()
+
+    def set_pinned(self, cache_keys: Iterable[str]) -> None:
+        """Le chiavi pinned non vengono mai sfrattate (possono anche non essere ancora in cache)."""
+        self._pinned = set(cache_keys)
+        self._evict()
+
+    def is_pinned(self, cache_key: str) -> bool:
+        return cache_key in self._pinned
+
+    def _evict(self, protect: Optional[str] = None) -> None:
+        if self.used_bytes <= self.budget_bytes:
+            return
+
+        for cache_key in list(self._entries):
+            if self.used_bytes <= self.budget_bytes:
+                break
+            if cache_key == protect or cache_key in self._pinned:
+                continue
+            self.pop(cache_key)
+            self.evictions += 1
+
+        if self.used_bytes > self.budget_bytes:
+            # Solo voci pinned (o quella appena inserita): restiamo sopra budget piuttosto che ricaricare ogni frame
+            logger.debug(f"SurfaceCache over budget: {self.used_bytes} > {self.budget_bytes} bytes")
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            entries=len(self._entries),
+            used_bytes=self.used_bytes,
+            budget_bytes=self.budget_bytes,
+        )
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = self.evictions = 0
@@ -0,0 +1,172 @@
+"""
+Text Cache - Font condivisi e superfici di testo già renderizzate.
+
+Tutte le viste e gli stati prendono i font da qui (text_cache.font) invece di creare
+SysFont propri. I font restituiti sono CachedFont: stessa API di pygame.font.Font, ma
+render() passa dalla cache (chiave: font, testo, colore, antialias, sfondo), quindi
+etichette statiche, nomi degli speaker e stringhe HUD costano un blit per frame.
+Anche il word-wrap dei dialoghi (wrap) viene memorizzato.
+"""
+import logging
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import pygame
+
+from src.model.assets.surface_cache import SurfaceCache, CacheStats
+
+logger = logging.getLogger(__name__)
+
+# Budget delle superfici di testo (sono piccole: qualche MB basta per migliaia di stringhe)
+DEFAULT_TEXT_BUDGET_BYTES = 8 * 1024 * 1024
+DEFAULT_MAX_LAYOUTS = 256
+
+
+def _color_key(color) -> Optional[tuple]:
+    if color is None:
+        return None
+    key = tuple(color)
+    # (r, g, b) e pygame.Color/(r, g, b, 255) sono lo stesso colore
+    return key + (255,) if len(key) == 3 else key
+
+
+class CachedFont:
+    """Wrapper di pygame.font.Font con render() in cache. Gli altri metodi sono delegati."""
+
+    __slots__ = ("font", "key", "_cache")
+
+    def __init__(self, font: pygame.font.Font, key: tuple, cache: "TextCache"):
+        self.font = font
+        self.key = key
+        self._cache = cache
+
+    def render(self, text, antialias, color, background=None) -> pygame.Surface:
+        return self._cache.render(self, text, color, antialias, background)
+
+    def __getattr__(self, name):
+        return getattr(self.font, name)
+
+
+class TextCache:
+    """
+    Servizio testo condiviso:
+    - font(name, size, bold, italic): un'istanza per combinazione (SysFont è lento da creare)
+    - render(...): superfici in una SurfaceCache LRU a budget
+    - render_outlined(...): testo con contorno composto una volta sola
+    - wrap(font, text, max_width): righe del word-wrap, in LRU
+    """
+
+    def __init__(self, budget_bytes: int = DEFAULT_TEXT_BUDGET_BYTES, max_layouts: int = DEFAULT_MAX_LAYOUTS):
+        self._fonts: dict = {}
+        self._surfaces = SurfaceCache(budget_bytes)
+        self._layouts: "OrderedDict[tuple, Tuple[str, ...]]" = OrderedDict()
+        self.max_layouts = max_layouts
+
+    # ============== FONTS ==============
+
+    def font(self, name: Optional[str], size: int, bold: bool = False, italic: bool = False) -> CachedFont:
+        """name=None usa il font di default di pygame (come pygame.font.Font(None, size))."""
+        key = (name.lower() if name else None, size, bold, italic)
+        cached = self._fonts.get(key)
+        if cached is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            if name is None:
+                raw = pygame.font.Font(None, size)
+                raw.set_bold(bold)
+                raw.set_italic(italic)
+            else:
+                raw = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+            cached = CachedFont(raw, key, self)
+            self._fonts[key] = cached
+        return cached
+
+    # ============== SURFACES ==============
+
+    def render(self, font, text, color, antialias: bool = True, background=None) -> pygame.Surface:
+        """
+        Superficie del testo, dalla cache se già vista.
+        Le superfici sono condivise: chi le modifica (set_alpha, fill...) deve farne una copy().
+        """
+        raw, font_key = self._unwrap(font)
+        text = str(text)
+        key = (font_key, text, _color_key(color), bool(antialias), _color_key(background))
+
+        surf = self._surfaces.get(key)
+        if surf is None:
+            if background is None:
+                surf = raw.render(text, antialias, color)
+            else:
+                surf = raw.render(text, antialias, color, background)
+            self._surfaces.put(key, surf)
+        return surf
+
+    def render_outlined(self, font, text, color, outline_color=(0, 0, 0), thickness: int = 2) -> pygame.Surface:
+        """Testo con contorno: una superficie sola invece di nove blit per frame."""
+        _, font_key = self._unwrap(font)
+        text = str(text)
+        key = ("outline", font_key, text, _color_key(color), _color_key(outline_color), thickness)
+
+        surf = self._surfaces.get(key)
+        if surf is None:
+            fg = self.render(font, text, color)
+            shadow = self.render(font, text, outline_color)
+            t = thickness
+            surf = pygame.Surface((fg.get_width() + 2 * t, fg.get_height() + 2 * t), pygame.SRCALPHA)
+            offsets = [(-t, -t), (-t, t), (t, -t), (t, t), (-1, 0), (1, 0), (0, -1), (0, 1)]
+            for ox, oy in offsets:
+                surf.blit(shadow, (t + ox, t + oy))
+            surf.blit(fg, (t, t))
+            self._surfaces.put(key, surf)
+        return surf
+
+    # ============== LAYOUT ==============
+
+    def wrap(self, font, text: str, max_width: int) -> Tuple[str, ...]:
+        """
+        Word-wrap per parole: una riga sta nella larghezza se font.size(riga) <= max_width.
+        Il risultato è memorizzato (i dialoghi ridisegnano lo stesso testo ogni frame).
+        """
+        raw, font_key = self._unwrap(font)
+        key = (font_key, text, max_width)
+        lines = self._layouts.get(key)
+        if lines is not None:
+            self._layouts.move_to_end(key)
+            return lines
+
+        out = []
+        current = []
+        for word in text.split(' '):
+            if raw.size(' '.join(current + [word]))[0] <= max_width:
+                current.append(word)
+            else:
+                out.append(' '.join(current))
+                current = [word]
+        out.append(' '.join(current))
+        lines = tuple(out)
+
+        self._layouts[key] = lines
+        if len(self._layouts) > self.max_layouts:
+            self._layouts.popitem(last=False)
+        return lines
+
+    # ============== MISC ==============
+
+    @staticmethod
+    def _unwrap(font):
+        if isinstance(font, CachedFont):
+            return font.font, font.key
+        # Font creato altrove: la chiave tiene un riferimento, quindi l'id non viene riusato
+        return font, ("raw", id(font), font)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._surfaces.stats
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+        self._layouts.clear()
+
+
+# Istanza condivisa da viste e stati
+text_cache = TextCache()
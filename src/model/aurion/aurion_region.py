@@ -85,7 +85,7 @@ class AurionRegion:
         if inventory.get(ItemIds.ARANCINA_CALDA, 0) > 0:
             return {"outcome": "skip", "msg": "Guardie: 'Mbare, ma sono calde! Passate pure!'"}
         elif inventory.get(ItemIds.SACCO_MONETE, 0) > 0:
-            self.game.inventory_global[ItemIds.SACCO_MONETE] -= 1
+            self.game.remove_global_item(ItemIds.SACCO_MONETE)
             return {"outcome": "skip", "msg": "Le guardie accettano l'oro. 'Avanti!'"}
         elif inventory.get(ItemIds.FASCICOLO_SEGRETO, 0) > 0:
             self.game.set_flag(self.boss_weakened_flag, True)
@@ -0,0 +1,31 @@
+"""
+Entity Categories - Categoria di rendering di un'entità (boss, gatekeeper, npc, prop).
+
+La categoria dipende dall'id (parole chiave dei boss/gatekeeper) e dal tipo dell'entità.
+Il ContentRegistry la calcola una volta quando registra la stanza, così il render loop
+non deve ricercare le parole chiave nell'id a ogni frame.
+"""
+
+CATEGORY_BOSS = "boss"
+CATEGORY_GATEKEEPER = "gatekeeper"
+CATEGORY_NPC = "npc"
+CATEGORY_PROP = "prop"
+CATEGORY_OTHER = "other"
+
+BOSS_KEYWORDS = ("boss", "tanino", "peppino", "goats", "toto", "oste", "ciccio")
+GATEKEEPER_KEYWORDS = ("guards", "golem", "sphinx", "colapesce")
+PROP_TYPES = ("prop", "item", "interactable")
+
+
+def entity_render_category(entity) -> str:
+    """Categoria di un'entità: le parole chiave dell'id hanno la precedenza sul tipo."""
+    eid = entity.entity_id.lower()
+    if any(x in eid for x in BOSS_KEYWORDS):
+        return CATEGORY_BOSS
+    if any(x in eid for x in GATEKEEPER_KEYWORDS):
+        return CATEGORY_GATEKEEPER
+    if entity.entity_type == "npc":
+        return CATEGORY_NPC
+    if entity.entity_type in PROP_TYPES:
+        return CATEGORY_PROP
+    return CATEGORY_OTHER
@@ -1,20 +1,176 @@
+"""
+Loader Base - Carica e valida i file JSON di contenuto di una cartella.
+
+- Lettura su un thread pool (con centinaia di file il costo è l'I/O); il parsing resta
+  sul thread chiamante
+- Backend JSON più veloce (orjson) se installato, altrimenti il modulo json
+- Validazione in batch dopo il parsing: tutti gli errori della cartella (JSON non valido
+  compreso) in un'unica ValidationError, più il controllo degli id duplicati tra file diversi
+- Modalità incrementale (manifest_path): un manifest JSON con mtime, dimensione, sha1 e
+  contenuto già validato di ogni file permette di saltare lettura, parsing e validazione
+  dei file non modificati
+"""
+import hashlib
 import json
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.model.content.validators import ValidationError
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    JSON_BACKEND = "orjson"
+except ImportError:
+    _json_loads = json.loads
+    JSON_BACKEND = "json"
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+# File minimi per worker: sotto questa soglia il pool costa più di quanto fa risparmiare
+MIN_FILES_FOR_POOL = 8
+DEFAULT_MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+@dataclass(frozen=True)
+class LoadStats:
+    files: int
+    parsed: int
+    skipped: int
+
 
 class LoaderBase:
-    def __init__(self, validator_fn):
+    def __init__(self, validator_fn: Callable[[dict], None], max_workers: int = DEFAULT_MAX_WORKERS):
         self.validator_fn = validator_fn
+        self.max_workers = max(1, max_workers)
+        self.last_stats = LoadStats(0, 0, 0)
 
-    def load_all(self, dir_path: str) -> list[dict]:
-        out = []
+    def load_all(self, dir_path: str, manifest_path: Optional[str] = None) -> list[dict]:
+        """
+        Oggetti di tutti i file .json di dir_path, in ordine di nome file.
+        Con manifest_path i file invariati (mtime/dimensione o sha1) riusano il contenuto del manifest.
+        """
         if not os.path.isdir(dir_path):
-            return out
-        for name in os.listdir(dir_path):
-            if not name.endswith(".json"):
+            self.last_stats = LoadStats(0, 0, 0)
+            return []
+
+        names = sorted(name for name in os.listdir(dir_path) if name.endswith(".json"))
+        previous = self._read_manifest(manifest_path) if manifest_path else {}
+
+        results: Dict[str, dict] = {}
+        entries: Dict[str, dict] = {}
+        to_read = []
+        for name in names:
+            st = os.stat(os.path.join(dir_path, name))
+            old = previous.get(name)
+            if old and old["mtime_ns"] == st.st_mtime_ns and old["size"] == st.st_size:
+                results[name] = old["obj"]
+                entries[name] = old
+            else:
+                to_read.append((name, st))
+
+        fresh: Dict[str, dict] = {}
+        parsed, parse_errors = self._read_files(dir_path, to_read, hashed=manifest_path is not None)
+        for name, st, digest, obj in parsed:
+            old = previous.get(name)
+            if old and digest is not None and old["sha1"] == digest:
+                # Solo toccato (mtime cambiato, contenuto identico): niente validazione
+                obj = old["obj"]
+            else:
+                fresh[name] = obj
+            results[name] = obj
+            entries[name] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha1": digest, "obj": obj}
+
+        self.validate_batch(fresh, results, parse_errors)
+        self.last_stats = LoadStats(files=len(names), parsed=len(fresh), skipped=len(names) - len(fresh))
+
+        if manifest_path and (to_read or entries.keys() != previous.keys()):
+            self._write_manifest(manifest_path, entries)
+        return [results[name] for name in names]
+
+    # ============== VALIDATION ==============
+
+    def validate_batch(self, fresh: Dict[str, dict], all_objects: Dict[str, dict],
+                       parse_errors: Optional[Dict[str, str]] = None) -> None:
+        """
+        Valida i file nuovi/modificati e controlla gli id duplicati su tutta la cartella.
+        Raccoglie tutti gli errori (anche quelli di parsing, {file: messaggio}) prima di fallire.
+        """
+        errors = [f"{name}: {message}" for name, message in (parse_errors or {}).items()]
+        for name, obj in fresh.items():
+            try:
+                self.validator_fn(obj)
+            except ValidationError as e:
+                errors.append(f"{name}: {e}")
+
+        seen: Dict[str, str] = {}
+        for name, obj in all_objects.items():
+            obj_id = obj.get("id") if isinstance(obj, dict) else None
+            if obj_id is None:
                 continue
-            path = os.path.join(dir_path, name)
-            with open(path, "r", encoding="utf-8") as f:
-                obj = json.load(f)
-            self.validator_fn(obj)
-            out.append(obj)
-        return out
+            if obj_id in seen:
+                errors.append(f"{name}: duplicate id '{obj_id}' (also in {seen[obj_id]})")
+            else:
+                seen[obj_id] = name
+
+        if errors:
+            raise ValidationError(f"{len(errors)} invalid content file(s):\n" + "\n".join(errors))
+
+    # ============== I/O ==============
+
+    def _read_files(self, dir_path: str, files: List[Tuple[str, os.stat_result]], hashed: bool):
+        """[(nome, stat, sha1, oggetto)] dei file validi e {nome: errore} di quelli non parsabili."""
+        def read_chunk(chunk):
+            raws = []
+            for name, _ in chunk:
+                with open(os.path.join(dir_path, name), "rb") as f:
+                    raws.append(f.read())
+            return raws
+
+        # Il pool serve solo alle letture (rilasciano il GIL); il parsing resta sul thread chiamante.
+        # Un blocco contiguo di file per worker: un future per file costerebbe più della lettura.
+        workers = min(self.max_workers, len(files) // MIN_FILES_FOR_POOL)
+        if workers <= 1:
+            raws = read_chunk(files)
+        else:
+            size = -(-len(files) // workers)
+            chunks = [files[i:i + size] for i in range(0, len(files), size)]
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ContentLoader") as pool:
+                raws = [raw for part in pool.map(read_chunk, chunks) for raw in part]
+
+        out = []
+        errors: Dict[str, str] = {}
+        for (name, st), raw in zip(files, raws):
+            try:
+                obj = _json_loads(raw)
+            except ValueError as e:
+                errors[name] = f"invalid JSON ({e})"
+                continue
+            out.append((name, st, hashlib.sha1(raw).hexdigest() if hashed else None, obj))
+        return out, errors
+
+    @staticmethod
+    def _read_manifest(path: str) -> Dict[str, dict]:
+        try:
+            with open(path, "rb") as f:
+                data = _json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return {}
+        return data.get("files", {})
+
+    @staticmethod
+    def _write_manifest(path: str, entries: Dict[str, dict]) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": MANIFEST_VERSION, "files": entries}, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write content manifest {path}: {e}")
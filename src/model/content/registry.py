@@ -1,3 +1,31 @@
+"""
+Content Registry - Contenuti del gioco (stanze, oggetti, dialoghi) per tipo e id.
+
+Updated: caricamento lazy per regione. Un loader registrato con register_region_loader
+costruisce gli oggetti della sua regione solo quando servono (get/all), oppure in anticipo
+con prefetch() + pump() (un paio di regioni per frame, sul main thread). Le regioni
+lontane possono essere scaricate con evict_regions() e verranno ricostruite dal loader.
+
+Updated: indici secondari costruiti alla registrazione (e tolti all'eviction): regione per
+ogni tipo, oggetti per tag, entità delle stanze per tipo, regione, script_id e categoria di
+rendering. Le ricerche (find, entities_by_*, items_with_tag) sono lookup O(1) e vedono solo
+i contenuti già caricati. Le entità nascoste o rimosse a runtime escono dagli indici con
+reindex() (lo chiama RoomManager).
+"""
+import logging
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.model.content.categories import entity_render_category
+
+logger = logging.getLogger(__name__)
+
+
+def region_of(obj_id: str) -> str:
+    """Regione di un contenuto dal prefisso dell'id (es. 'aurion_entry' -> 'aurion')."""
+    return obj_id.split("_", 1)[0]
+
+
 class ContentRegistry:
     def __init__(self):
         self._data = {
@@ -6,18 +34,205 @@ class ContentRegistry:
             "dialogues": {},
             "npcs": {},
         }
+        # (kind, region) -> loader(registry) che registra gli oggetti della regione
+        self._loaders: Dict[Tuple[str, str], Callable] = {}
+        # (kind, region) -> id registrati dal loader (ciò che evict_regions può togliere)
+        self._loaded: Dict[Tuple[str, str], Set[str]] = {}
+        self._loading: Optional[Tuple[str, str]] = None
+        self._prefetch_queue: deque = deque()
+        self._prefetch_callbacks: Dict[Tuple[str, str], list] = {}
+
+        # (kind, indice) -> chiave -> {id: oggetto}. Le entità sono indicizzate come kind
+        # "entities" con id (room_id, entity_id).
+        self._indexes: Dict[Tuple[str, str], Dict[Any, Dict[Any, Any]]] = {}
+        # (kind, id) registrato -> voci d'indice che ha creato, per toglierle in O(voci)
+        self._index_entries: Dict[Tuple[str, str], List[Tuple[str, str, Any, Any]]] = {}
+        # id(entity) -> categoria di rendering (l'entità resta referenziata dall'indice)
+        self._entity_categories: Dict[int, str] = {}
 
     def register(self, kind: str, obj: dict):
         obj_id = obj.get("id")
-        
+
         # Se stiamo registrando una stanza creata dal WorldBuilder, estraiamo l'oggetto reale
-        real_obj = obj.get("obj", obj) 
-        
+        real_obj = obj.get("obj", obj)
+
         if not obj_id:
             raise ValueError(f"Missing stable id for kind={kind}")
-        
+
         # Sovrascriviamo se esiste (utile per ricaricamenti o fix)
+        self._unindex(kind, obj_id)
         self._data[kind][obj_id] = real_obj
+        self._index(kind, obj_id, real_obj)
+        if self._loading is not None and self._loading[0] == kind:
+            self._loaded[self._loading].add(obj_id)
 
     def get(self, kind: str, obj_id: str):
-        return self._data.get(kind, {}).get(obj_id)
\ No newline at end of file
+        objects = self._data.get(kind, {})
+        obj = objects.get(obj_id)
+        if obj is None and self._materialize(kind, region_of(obj_id)):
+            obj = objects.get(obj_id)
+        return obj
+
+    def all(self, kind: str, region: Optional[str] = None) -> list:
+        """Tutti gli oggetti del tipo (materializza le regioni lazy), o solo quelli di `region`."""
+        if region is None:
+            for loader_kind, loader_region in list(self._loaders):
+                if loader_kind == kind:
+                    self._materialize(kind, loader_region)
+            return list(self._data.get(kind, {}).values())
+
+        self._materialize(kind, region)
+        return self.find(kind, "region", region)
+
+    # ============== SECONDARY INDEXES ==============
+
+    def find(self, kind: str, index: str, key) -> list:
+        """Oggetti già caricati di `kind` con `key` nell'indice `index`, in ordine di registrazione."""
+        return list(self._indexes.get((kind, index), {}).get(key, {}).values())
+
+    def entities_by_type(self, entity_type: str) -> list:
+        return self.find("entities", "type", entity_type)
+
+    def entities_in_region(self, region: str) -> list:
+        self._materialize("rooms", region)
+        return self.find("entities", "region", region)
+
+    def entities_by_script(self, script_id: str) -> list:
+        return self.find("entities", "script_id", script_id)
+
+    def entities_by_category(self, category: str) -> list:
+        return self.find("entities", "category", category)
+
+    def items_with_tag(self, tag: str) -> list:
+        return self.find("items", "tag", tag)
+
+    def entity_category(self, entity) -> str:
+        """Categoria di rendering: O(1) per le entità registrate, calcolata altrimenti."""
+        category = self._entity_categories.get(id(entity))
+        return category if category is not None else entity_render_category(entity)
+
+    def reindex(self, kind: str, obj_id: str) -> None:
+        """Da chiamare dopo aver modificato un oggetto registrato (es. entità aggiunte, nascoste o rimosse)."""
+        obj = self._data.get(kind, {}).get(obj_id)
+        self._unindex(kind, obj_id)
+        if obj is not None:
+            self._index(kind, obj_id, obj)
+
+    def _index(self, kind: str, obj_id: str, obj) -> None:
+        entries = self._index_entries.setdefault((kind, obj_id), [])
+
+        def add(index_kind, index, key, entry_id, entry):
+            self._indexes.setdefault((index_kind, index), {}).setdefault(key, {})[entry_id] = entry
+            entries.append((index_kind, index, key, entry_id))
+
+        region = region_of(obj_id)
+        add(kind, "region", region, obj_id, obj)
+
+        if isinstance(obj, dict):
+            for tag in obj.get("tags", ()):
+                add(kind, "tag", tag, obj_id, obj)
+
+        entities = getattr(obj, "entities", None)
+        if kind == "rooms" and isinstance(entities, list):
+            for entity in entities:
+                entity_key = (obj_id, entity.entity_id)
+                category = entity_render_category(entity)
+                self._entity_categories[id(entity)] = category
+                add("entities", "type", entity.entity_type, entity_key, entity)
+                add("entities", "region", region, entity_key, entity)
+                add("entities", "category", category, entity_key, entity)
+                script_ids = {entity.script_id} | {a.get("script_id") for a in entity.actions}
+                for script_id in script_ids - {None}:
+                    add("entities", "script_id", script_id, entity_key, entity)
+
+    def _unindex(self, kind: str, obj_id: str) -> None:
+        for index_kind, index, key, entry_id in self._index_entries.pop((kind, obj_id), ()):
+            buckets = self._indexes[(index_kind, index)]
+            entry = buckets[key].pop(entry_id, None)
+            if not buckets[key]:
+                del buckets[key]
+            if index_kind == "entities" and entry is not None:
+                self._entity_categories.pop(id(entry), None)
+
+    # ============== LAZY REGIONS ==============
+
+    def register_region_loader(self, kind: str, region: str, loader: Callable) -> None:
+        """loader(registry) deve registrare (register) gli oggetti di `region` e solo quelli."""
+        self._loaders[(kind, region)] = loader
+        self._loaded.pop((kind, region), None)
+
+    def is_loaded(self, kind: str, region: str) -> bool:
+        key = (kind, region)
+        return key in self._loaded or key not in self._loaders
+
+    def loaded_regions(self, kind: str) -> Set[str]:
+        return {region for (k, region) in self._loaded if k == kind}
+
+    def _materialize(self, kind: str, region: str) -> bool:
+        """Esegue il loader della regione se non è ancora caricata. True se ha caricato qualcosa."""
+        key = (kind, region)
+        loader = self._loaders.get(key)
+        if loader is None or key in self._loaded:
+            return False
+
+        self._loaded[key] = set()
+        previous, self._loading = self._loading, key
+        try:
+            loader(self)
+        finally:
+            self._loading = previous
+        logger.debug(f"Content: materialized {kind}/{region} ({len(self._loaded[key])} objects)")
+
+        for callback in self._prefetch_callbacks.pop(key, ()):
+            callback()
+        return True
+
+    def prefetch(self, kind: str, obj_id: str, on_ready: Optional[Callable] = None) -> None:
+        """
+        Accoda la regione di obj_id, che pump() materializzerà nei frame successivi.
+        on_ready(obj) viene chiamato quando l'oggetto è disponibile (subito se lo è già).
+        """
+        key = (kind, region_of(obj_id))
+        if self.is_loaded(*key):
+            if on_ready is not None:
+                obj = self.get(kind, obj_id)
+                if obj is not None:
+                    on_ready(obj)
+            return
+
+        if on_ready is not None:
+            def deliver():
+                obj = self._data.get(kind, {}).get(obj_id)
+                if obj is not None:
+                    on_ready(obj)
+            self._prefetch_callbacks.setdefault(key, []).append(deliver)
+        if key not in self._prefetch_queue:
+            self._prefetch_queue.append(key)
+
+    def pump(self, max_regions: int = 1) -> int:
+        """Materializza fino a max_regions regioni in coda. Va chiamato una volta per frame."""
+        done = 0
+        while self._prefetch_queue and done < max_regions:
+            if self._materialize(*self._prefetch_queue.popleft()):
+                done += 1
+        return done
+
+    def evict_regions(self, kind: str, keep: Iterable[str]) -> Set[str]:
+        """
+        Scarica le regioni lazy di `kind` non in `keep`: i loro oggetti escono dal registry
+        e verranno ricostruiti dal loader alla prossima richiesta. Ritorna le regioni scaricate.
+        """
+        keep = set(keep)
+        evicted = set()
+        for key in list(self._loaded):
+            loader_kind, region = key
+            if loader_kind != kind or region in keep:
+                continue
+            objects = self._data.get(kind, {})
+            for obj_id in self._loaded.pop(key):
+                objects.pop(obj_id, None)
+                self._unindex(kind, obj_id)
+            evicted.add(region)
+        if evicted:
+            logger.debug(f"Content: evicted {kind} regions {sorted(evicted)}")
+        return evicted
@@ -0,0 +1,159 @@
+"""
+Room Cache - Mondo compilato su disco per non rieseguire WorldBuilder a ogni avvio.
+
+Il file contiene un header fisso (magic, versione del formato, hash del contenuto) e le
+RoomData in pickle. L'hash copre il sorgente dei moduli che definiscono il mondo
+(WorldBuilder, schema RoomData e tipi che contiene): se uno cambia il file è considerato
+vecchio e Game.load_content torna a WorldBuilder finché non si ricompila.
+
+Come per gli atlas, il file si genera con un passo di build (dalla root del repository):
+    python -m src.model.content.room_cache [--out cache/rooms.bin]
+
+Con il mondo attuale (27 stanze) WorldBuilder impiega ~0.5 ms e la lettura del cache
+~0.8 ms: il cache conviene quando il contenuto cresce, per questo non viene scritto in
+automatico al primo avvio.
+"""
+import argparse
+import hashlib
+import importlib
+import logging
+import os
+import pickle
+import struct
+import sys
+import time
+from typing import Callable, Iterable, List, Optional
+
+from src.model.content.registry import ContentRegistry
+from src.model.content.world_builder import WorldBuilder
+from src.model.room_data import RoomData
+from src.version import VERSION
+
+logger = logging.getLogger(__name__)
+
+ROOM_CACHE_PATH = os.path.join(".", "cache", "rooms.bin")
+
+MAGIC = b"SKRC"
+FORMAT_VERSION = 1
+# magic, versione del formato, sha256 del contenuto
+HEADER = struct.Struct("<4sH32s")
+
+# Moduli il cui sorgente determina il contenuto delle stanze
+SOURCE_MODULES = (
+    "src.model.content.world_builder",
+    "src.model.room_data",
+    "src.model.render_system",       # CameraMode / CameraBounds
+    "src.model.assets.asset_manager",  # AssetRequest / portrait_request
+)
+
+
+def content_hash(modules: Iterable[str] = SOURCE_MODULES) -> bytes:
+    """
+    sha256 di versione del formato + sorgenti dei moduli del mondo.
+    Senza sorgenti (eseguibile impacchettato) si usa la versione del gioco.
+    """
+    digest = hashlib.sha256(struct.pack("<H", FORMAT_VERSION))
+    for name in modules:
+        module = importlib.import_module(name)
+        path = getattr(module, "__file__", None)
+        try:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        except (OSError, TypeError):
+            digest.update(f"{name}@{VERSION}".encode("utf-8"))
+    return digest.digest()
+
+
+# ============== READ / WRITE ==============
+
+def write_room_cache(rooms: List[RoomData], path: str = ROOM_CACHE_PATH, digest: Optional[bytes] = None) -> None:
+    """Scrittura atomica (tmp + replace), come per i salvataggi."""
+    digest = digest or content_hash()
+    payload = pickle.dumps(rooms, protocol=pickle.HIGHEST_PROTOCOL)
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, digest))
+        f.write(payload)
+    os.replace(temp_path, path)
+
+
+def read_room_cache(path: str = ROOM_CACHE_PATH, digest: Optional[bytes] = None) -> Optional[List[RoomData]]:
+    """Stanze dal cache, o None se manca, è di un'altra versione/hash o è illeggibile."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    if len(data) < HEADER.size:
+        return None
+    magic, version, file_digest = HEADER.unpack_from(data)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        logger.info(f"Room cache {path}: unknown format, ignoring")
+        return None
+    if file_digest != (digest or content_hash()):
+        logger.info(f"Room cache {path}: content changed, using WorldBuilder (recompile to refresh)")
+        return None
+
+    try:
+        rooms = pickle.loads(data[HEADER.size:])
+    except Exception as e:
+        logger.warning(f"Room cache {path} unreadable: {e}")
+        return None
+    if not isinstance(rooms, list) or not all(isinstance(r, RoomData) for r in rooms):
+        logger.warning(f"Room cache {path}: unexpected payload, ignoring")
+        return None
+    return rooms
+
+
+# ============== LOAD ==============
+
+def build_rooms(builder: Callable = WorldBuilder.build_all) -> List[RoomData]:
+    """Esegue il builder su un registry vuoto e ne ritorna le stanze."""
+    scratch = ContentRegistry()
+    builder(scratch)
+    return scratch.all("rooms")
+
+
+def load_rooms(content_registry, path: Optional[str] = ROOM_CACHE_PATH,
+               builder: Callable = WorldBuilder.register_regions) -> bool:
+    """
+    Registra le stanze del mondo in content_registry: dal cache compilato se presente e
+    aggiornato (tutte subito, il file è già letto), altrimenti con il builder, che di
+    default registra i loader lazy per regione. path=None ignora il cache.
+    Con un cache valido tutte le stanze sono registrate subito e i loader lazy per
+    regione non vengono usati. Il cache non viene mai scritto qui (vedi main()).
+    Ritorna True se le stanze arrivano dal cache.
+    """
+    t0 = time.perf_counter()
+    rooms = read_room_cache(path) if path else None
+
+    if rooms is None:
+        builder(content_registry)
+        source = "WorldBuilder"
+    else:
+        for room in rooms:
+            content_registry.register("rooms", {"id": room.room_id, "obj": room})
+        source = "room cache"
+
+    logger.info(f"Rooms loaded from {source} in {(time.perf_counter() - t0) * 1000:.1f} ms")
+    return rooms is not None
+
+
+# ============== CLI ==============
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compile Sikula rooms into the binary room cache.")
+    parser.add_argument("--out", default=ROOM_CACHE_PATH, help="File di output (default: cache/rooms.bin)")
+    args = parser.parse_args(argv)
+
+    rooms = build_rooms()
+    write_room_cache(rooms, args.out)
+    print(f"[RoomCache] {len(rooms)} rooms -> {args.out} ({os.path.getsize(args.out)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,6 @@
+from src.model.content.loader_base import LoaderBase
+from src.model.content.validators import validate_script_file
+
+class ScriptsLoader(LoaderBase):
+    def __init__(self):
+        super().__init__(validate_script_file)
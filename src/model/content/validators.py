@@ -13,3 +13,8 @@ def validate_room(obj: dict):
 
 def validate_item(obj: dict):
     _require_keys(obj, ["id", "display_name", "description"], "item")
+
+def validate_script_file(obj: dict):
+    _require_keys(obj, ["id", "scripts"], "script file")
+    if not isinstance(obj["scripts"], dict):
+        raise ValidationError("script file.scripts must be a dict")
@@ -2,14 +2,31 @@
 World Builder - Constructs the entire game world.
 FULL VERSION: Aurion, Ferrum, Viridor, Vinalia + ETNA (Finale).
 Updated: FIXED HUB LAYOUT (Removed overlapping Etna trigger).
+Updated: build_all can build a subset of regions (lazy loading via register_regions).
 """
 import pygame
 from src.model.room_data import RoomData, TriggerZone, EntityDefinition, SpawnPoint, Collider
 from src.model.render_system import CameraMode
+from src.model.assets.asset_manager import portrait_request
+
+# Regioni del mondo: ogni stanza appartiene a quella del prefisso del suo id (vedi region_of)
+WORLD_REGIONS = ("hub", "etna", "aurion", "ferrum", "viridor", "vinalia")
+
 
 class WorldBuilder:
     @staticmethod
-    def build_all(content_registry):
+    def register_regions(content_registry):
+        """Registra un loader per regione: le stanze si costruiscono alla prima richiesta."""
+        for region in WORLD_REGIONS:
+            content_registry.register_region_loader(
+                "rooms", region, lambda registry, r=region: WorldBuilder.build_all(registry, regions=(r,)))
+
+    @staticmethod
+    def build_all(content_registry, regions=None):
+        """Costruisce le stanze di tutte le regioni, o solo di quelle in `regions`."""
+        def wanted(region):
+            return regions is None or region in regions
+
         # Layout Constants
         SCREEN_W = 800
         SCREEN_H = 600
@@ -179,78 +196,83 @@ class WorldBuilder:
         # =========================================================================
         # 1. HUB CENTRALE (UPDATED FIXED VERSION)
         # =========================================================================
-        hub = RoomData("hub", name="Ombelico della Sicilia", width=SCREEN_W, height=SCREEN_H, 
-                       camera_mode=CameraMode.FIXED, background_id="hub")
+        if wanted("hub"):
+            hub = RoomData("hub", name="Ombelico della Sicilia", width=SCREEN_W, height=SCREEN_H, 
+                           camera_mode=CameraMode.FIXED, background_id="hub")
         
-        # --- Spawn Points ---
-        hub.spawns["default"] = SpawnPoint("default", 400, 300, "down") # Centro esatto
-        hub.spawns["from_aurion"] = SpawnPoint("from_aurion", 400, 100, "down")
-        hub.spawns["from_ferrum"] = SpawnPoint("from_ferrum", 400, 500, "up")
-        hub.spawns["from_vinalia"] = SpawnPoint("from_vinalia", 100, 300, "right")
-        hub.spawns["from_viridor"] = SpawnPoint("from_viridor", 700, 300, "left")
+            # --- Spawn Points ---
+            hub.spawns["default"] = SpawnPoint("default", 400, 300, "down") # Centro esatto
+            hub.spawns["from_aurion"] = SpawnPoint("from_aurion", 400, 100, "down")
+            hub.spawns["from_ferrum"] = SpawnPoint("from_ferrum", 400, 500, "up")
+            hub.spawns["from_vinalia"] = SpawnPoint("from_vinalia", 100, 300, "right")
+            hub.spawns["from_viridor"] = SpawnPoint("from_viridor", 700, 300, "left")
 
-        # --- Colliders (Muri) ---
-        hub.colliders = [
-            Collider("confine_superiore", pygame.Rect(0, 0, 800, 80)),
-            Collider("muro_botti", pygame.Rect(80+60, 0, 60, 205+75)),
-            Collider("confine_destro", pygame.Rect(795, 0, 30, 600)),
-            Collider("confine_inferiore", pygame.Rect(0, 595, 800, 5)),
-            Collider("wall_top_L", pygame.Rect(0, 0, 370, 170)),
-            Collider("wall_top_R", pygame.Rect(430, 0, 380, 170)),
-            Collider("wall_bottom_L", pygame.Rect(0, 490, 340, 110)),
-            Collider("wall_bottom_R", pygame.Rect(460, 490, 340, 110)),
-            Collider("wall_left_U", pygame.Rect(0, 0, 205, 230)),
-            Collider("wall_left_D", pygame.Rect(0, 210, 80, 390)),
-            Collider("wall_right_U", pygame.Rect(590, 0, 210, 270)),
-            Collider("wall_right_D", pygame.Rect(590, 345, 210, 255)),
-        ]
+            # --- Colliders (Muri) ---
+            hub.colliders = [
+                Collider("confine_superiore", pygame.Rect(0, 0, 800, 80)),
+                Collider("muro_botti", pygame.Rect(80+60, 0, 60, 205+75)),
+                Collider("confine_destro", pygame.Rect(795, 0, 30, 600)),
+                Collider("confine_inferiore", pygame.Rect(0, 595, 800, 5)),
+                Collider("wall_top_L", pygame.Rect(0, 0, 370, 170)),
+                Collider("wall_top_R", pygame.Rect(430, 0, 380, 170)),
+                Collider("wall_bottom_L", pygame.Rect(0, 490, 340, 110)),
+                Collider("wall_bottom_R", pygame.Rect(460, 490, 340, 110)),
+                Collider("wall_left_U", pygame.Rect(0, 0, 205, 230)),
+                Collider("wall_left_D", pygame.Rect(0, 210, 80, 390)),
+                Collider("wall_right_U", pygame.Rect(590, 0, 210, 270)),
+                Collider("wall_right_D", pygame.Rect(590, 345, 210, 255)),
+            ]
 
-        # --- Trigger Gates (Interactive Exits) ---
-        hub.triggers.append(TriggerZone(id="gate_aurion", rect=pygame.Rect(380, 80, 40, 40), trigger_type="script", script_id="interact_gate_aurion", requires_confirm=False, label="Verso Aurion"))
-        hub.triggers.append(TriggerZone(id="gate_ferrum", rect=pygame.Rect(340, 500, 120, 100), trigger_type="script", script_id="interact_gate_ferrum", requires_confirm=False, label="Verso Ferrum"))
-        hub.triggers.append(TriggerZone(id="gate_vinalia", rect=pygame.Rect(80, 210, 60, 60), trigger_type="script", script_id="interact_gate_vinalia", requires_confirm=False, label="Verso Vinalia"))
-        hub.triggers.append(TriggerZone(id="gate_viridor", rect=pygame.Rect(710, 250, 50, 100), trigger_type="script", script_id="interact_gate_viridor", requires_confirm=False, label="Verso Viridor"))
+            # --- Trigger Gates (Interactive Exits) ---
+            hub.triggers.append(TriggerZone(id="gate_aurion", rect=pygame.Rect(380, 80, 40, 40), trigger_type="script", script_id="interact_gate_aurion", requires_confirm=False, label="Verso Aurion"))
+            hub.triggers.append(TriggerZone(id="gate_ferrum", rect=pygame.Rect(340, 500, 120, 100), trigger_type="script", script_id="interact_gate_ferrum", requires_confirm=False, label="Verso Ferrum"))
+            hub.triggers.append(TriggerZone(id="gate_vinalia", rect=pygame.Rect(80, 210, 60, 60), trigger_type="script", script_id="interact_gate_vinalia", requires_confirm=False, label="Verso Vinalia"))
+            hub.triggers.append(TriggerZone(id="gate_viridor", rect=pygame.Rect(710, 250, 50, 100), trigger_type="script", script_id="interact_gate_viridor", requires_confirm=False, label="Verso Viridor"))
         
-        # --- FIX: RIMOSSO TRIGGER INVISIBILE SOVRAPPOSTO AL CENTRO ---
-        # L'accesso all'Etna ora avviene SOLO tramite il Carretto.
+            # --- FIX: RIMOSSO TRIGGER INVISIBILE SOVRAPPOSTO AL CENTRO ---
+            # L'accesso all'Etna ora avviene SOLO tramite il Carretto.
         
-        # --- NPCs e Props ---
-        # Giufà (Sinistra)
-        hub.entities.append(EntityDefinition(
-            entity_id="npc_giufa",
-            entity_type="npc",
-            x=280, y=300, 
-            interaction_label="Parla con Giufà",
-            script_id="giufa_hub_talk"
-        ))
+            # --- NPCs e Props ---
+            # Giufà (Sinistra)
+            hub.entities.append(EntityDefinition(
+                entity_id="npc_giufa",
+                entity_type="npc",
+                x=280, y=300, 
+                interaction_label="Parla con Giufà",
+                script_id="giufa_hub_talk"
+            ))
+
+            # Carretto (Destra) - Spostato leggermente per essere ben visibile
+            hub.entities.append(EntityDefinition(
+                entity_id="obj_carretto",
+                entity_type="interactable", 
+                x=520, y=300,
+                interaction_label="Esamina Carretto",
+                script_id="interact_carretto",
+                properties={"name": "Carretto", "is_carretto": True}
+            ))
 
-        # Carretto (Destra) - Spostato leggermente per essere ben visibile
-        hub.entities.append(EntityDefinition(
-            entity_id="obj_carretto",
-            entity_type="interactable", 
-            x=520, y=300,
-            interaction_label="Esamina Carretto",
-            script_id="interact_carretto",
-            properties={"name": "Carretto", "is_carretto": True}
-        ))
+            # --- Asset Manifest (ritratti dei dialoghi dell'Hub) ---
+            hub.preload_assets.append(portrait_request("Giufa"))
 
-        content_registry.register("rooms", { "id": hub.room_id, "obj": hub })
+            content_registry.register("rooms", { "id": hub.room_id, "obj": hub })
 
         # =========================================================================
         # 2. ETNA REGION (FINALE)
         # =========================================================================
-        etna_e = RoomData("etna_entry", name="Cratere Centrale", width=SCREEN_W, height=SCREEN_H, background_id="bg_etna_entry")
-        etna_e.spawns["bottom"] = SpawnPoint("bottom", 400, 500, "up")
-        etna_e.colliders = list(LAYOUT_ETNA["entry"])
-        etna_e.triggers.append(TriggerZone("to_boss", pygame.Rect(350, 0, 100, 50), "exit", target_room="etna_boss_room", target_spawn="bottom", label="Affronta il Destino"))
-        etna_e.triggers.append(TriggerZone("intro_etna", pygame.Rect(350, 450, 100, 100), "script", script_id="intro_etna_entry_entry", auto_trigger=True))
-        content_registry.register("rooms", { "id": etna_e.room_id, "obj": etna_e })
+        if wanted("etna"):
+            etna_e = RoomData("etna_entry", name="Cratere Centrale", width=SCREEN_W, height=SCREEN_H, background_id="bg_etna_entry")
+            etna_e.spawns["bottom"] = SpawnPoint("bottom", 400, 500, "up")
+            etna_e.colliders = list(LAYOUT_ETNA["entry"])
+            etna_e.triggers.append(TriggerZone("to_boss", pygame.Rect(350, 0, 100, 50), "exit", target_room="etna_boss_room", target_spawn="bottom", label="Affronta il Destino"))
+            etna_e.triggers.append(TriggerZone("intro_etna", pygame.Rect(350, 450, 100, 100), "script", script_id="intro_etna_entry_entry", auto_trigger=True))
+            content_registry.register("rooms", { "id": etna_e.room_id, "obj": etna_e })
 
-        etna_b = RoomData("etna_boss_room", name="Tavola dell'Oste", width=SCREEN_W, height=SCREEN_H, background_id="bg_etna_hall")
-        etna_b.spawns["bottom"] = SpawnPoint("bottom", 400, 450, "up")
-        etna_b.colliders = list(LAYOUT_ETNA["boss"])
-        etna_b.entities.append(EntityDefinition("boss_oste", "enemy", 400, 200, interaction_label="L'Oste Eterno", script_id="start_boss_etna"))
-        content_registry.register("rooms", { "id": etna_b.room_id, "obj": etna_b })
+            etna_b = RoomData("etna_boss_room", name="Tavola dell'Oste", width=SCREEN_W, height=SCREEN_H, background_id="bg_etna_hall")
+            etna_b.spawns["bottom"] = SpawnPoint("bottom", 400, 450, "up")
+            etna_b.colliders = list(LAYOUT_ETNA["boss"])
+            etna_b.entities.append(EntityDefinition("boss_oste", "enemy", 400, 200, interaction_label="L'Oste Eterno", script_id="start_boss_etna"))
+            content_registry.register("rooms", { "id": etna_b.room_id, "obj": etna_b })
 
         # =========================================================================
         # 3. OTHER REGIONS (HELPER BUILDER)
@@ -285,6 +307,7 @@ class WorldBuilder:
             g.colliders = list(layout["gate"])
             npc_x, npc_y = config["gate_npc_pos"]
             g.entities.append(EntityDefinition(gatekeeper_cfg["sprite"], "npc", npc_x, npc_y, interaction_label=gatekeeper_cfg["name"], script_id=f"{prefix}_gate"))
+            g.preload_assets.append(portrait_request(gatekeeper_cfg["portrait"]))
             content_registry.register("rooms", { "id": g.room_id, "obj": g })
 
             bid = f"{prefix}_boss_room"; b = RoomData(bid, name=f"{name}: Sala del Trono", width=SCREEN_W, height=SCREEN_H, background_id=f"bg_{prefix}_boss")
@@ -292,9 +315,14 @@ class WorldBuilder:
             b.colliders = list(layout["boss"])
             boss_x, boss_y = config["boss_pos"]
             b.entities.append(EntityDefinition(boss_cfg["sprite"], "enemy", boss_x, boss_y, interaction_label=boss_cfg["name"], script_id=f"start_boss_{prefix}"))
+            b.preload_assets.append(portrait_request(boss_cfg["portrait"]))
             content_registry.register("rooms", { "id": b.room_id, "obj": b })
 
-        build_region("aurion", "Aurion", [("arancina", "Arancina", "pickup_arancina", "item_arancina"), ("monete", "Monete", "pickup_monete", "item_sacco"), ("dossier", "Dossier", "pickup_dossier", "item_dossier")], {"name": "Guardie d'Elite", "sprite": "npc_guards"}, {"name": "Don Tanino", "sprite": "enemy_tanino"})
-        build_region("ferrum", "Ferrum", [("oil", "Olio Eterno", "pickup_oil", "item_oil"), ("shield", "Scudo Torre", "pickup_shield", "item_shield"), ("head", "Testa Pupi", "pickup_head", "item_head")], {"name": "Golem di Scarti", "sprite": "enemy_golem"}, {"name": "Cavalier Peppino", "sprite": "enemy_peppino"})
-        build_region("viridor", "Viridor", [("figs", "Fichi", "pickup_figs", "item_figs"), ("water", "Acqua Santa", "pickup_water", "item_water"), ("shears", "Cesoie", "pickup_shears", "item_shears")], {"name": "La Sphinx", "sprite": "enemy_sphinx"}, {"name": "Nonno Ciccio", "sprite": "enemy_ciccio"})
-        build_region("vinalia", "Vinalia", [("wine", "Vino Eterno", "pickup_wine", "item_wine"), ("vinegar", "Aceto Madre", "pickup_vinegar", "item_vinegar"), ("marranzano", "Marranzano", "pickup_marranzano", "item_marranzano")], {"name": "Colapesce", "sprite": "enemy_colapesce"}, {"name": "Zio Totò", "sprite": "enemy_toto"})
\ No newline at end of file
+        if wanted("aurion"):
+            build_region("aurion", "Aurion", [("arancina", "Arancina", "pickup_arancina", "item_arancina"), ("monete", "Monete", "pickup_monete", "item_sacco"), ("dossier", "Dossier", "pickup_dossier", "item_dossier")], {"name": "Guardie d'Elite", "sprite": "npc_guards", "portrait": "Guardia"}, {"name": "Don Tanino", "sprite": "enemy_tanino", "portrait": "Don Tanino"})
+        if wanted("ferrum"):
+            build_region("ferrum", "Ferrum", [("oil", "Olio Eterno", "pickup_oil", "item_oil"), ("shield", "Scudo Torre", "pickup_shield", "item_shield"), ("head", "Testa Pupi", "pickup_head", "item_head")], {"name": "Golem di Scarti", "sprite": "enemy_golem", "portrait": "Golem"}, {"name": "Cavalier Peppino", "sprite": "enemy_peppino", "portrait": "Cavaliere Peppino"})
+        if wanted("viridor"):
+            build_region("viridor", "Viridor", [("figs", "Fichi", "pickup_figs", "item_figs"), ("water", "Acqua Santa", "pickup_water", "item_water"), ("shears", "Cesoie", "pickup_shears", "item_shears")], {"name": "La Sphinx", "sprite": "enemy_sphinx", "portrait": "Sphinx"}, {"name": "Nonno Ciccio", "sprite": "enemy_ciccio", "portrait": "Nonno Ciccio"})
+        if wanted("vinalia"):
+            build_region("vinalia", "Vinalia", [("wine", "Vino Eterno", "pickup_wine", "item_wine"), ("vinegar", "Aceto Madre", "pickup_vinegar", "item_vinegar"), ("marranzano", "Marranzano", "pickup_marranzano", "item_marranzano")], {"name": "Colapesce", "sprite": "enemy_colapesce", "portrait": "Colapesce"}, {"name": "Zio Totò", "sprite": "enemy_toto", "portrait": "Zio Totò"})
\ No newline at end of file
@@ -82,7 +82,7 @@ class FerrumRegion:
         inv = self.game.inventory_global
         
         if inv.get(ItemIds.OLIO_LUBRIFICANTE, 0) > 0:
-            self.game.inventory_global[ItemIds.OLIO_LUBRIFICANTE] -= 1
+            self.game.remove_global_item(ItemIds.OLIO_LUBRIFICANTE)
             return {"outcome": "skip", "msg": "Il Golem scivola sull'olio e si disattiva!"}
             
         elif inv.get(ItemIds.SCUDO_TORRE, 0) > 0:
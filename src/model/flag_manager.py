@@ -1,18 +1,80 @@
 """
 Flag Manager for centralized flags and condition evaluation.
 User Story 5: Centralized flags and condition evaluation.
+Updated: player_stat condition and bind_flags (storage shared with GameState), used by the script table.
+Updated: Conditions compiled once into closures that record the flags/sources they read.
+         Results are memoized and invalidated by set_flag/clear_flag and notify_changed().
+Updated: subscribe()/unsubscribe(): listeners notified when a flag changes value
+         (set_flag, clear_flag, bind_flags/load_from_dict on the changed keys).
 """
 
 import logging
-from typing import Any, Optional, Callable
+from collections import OrderedDict
+from typing import Any, Optional, Callable, Dict, Iterable, List, Set, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Sorgenti esterne (checker) che una condizione può leggere oltre ai flag
+SOURCE_ITEM = "item"
+SOURCE_ACE = "ace"
+SOURCE_GUEST = "guest"
+SOURCE_STAT = "stat"
+
+# Listener dei flag: callback(nome, valore); valore None se il flag è stato rimosso
+FlagListener = Callable[[str, Any], None]
+
+# Condizioni compilate tenute in cache per evaluate_condition (per identità del dict)
+MAX_CACHED_CONDITIONS = 512
+
+_COMPARISONS = {
+    '>=': lambda a, b: a >= b,
+    '>': lambda a, b: a > b,
+    '==': lambda a, b: a == b,
+    '<=': lambda a, b: a <= b,
+    '<': lambda a, b: a < b,
+}
+
+
+class CompiledCondition:
+    """
+    Condizione compilata: callable senza argomenti che ritorna un bool.
+
+    `deps` contiene le chiavi lette: ("flag", nome), ("item", item_id), ("ace", None)...
+    Se la condizione legge una sorgente che non notifica i cambiamenti è `volatile`
+    e viene rivalutata a ogni chiamata; altrimenti il risultato resta in cache finché
+    il FlagManager non la invalida.
+    """
+    __slots__ = ("condition", "deps", "volatile", "_fn", "_value", "_valid")
+
+    def __init__(self, condition, fn: Callable[[], bool], deps: Set[Tuple[str, Any]], volatile: bool):
+        self.condition = condition
+        self.deps = frozenset(deps)
+        self.volatile = volatile
+        self._fn = fn
+        self._value = False
+        self._valid = False
+
+    def __call__(self) -> bool:
+        if self._valid:
+            return self._value
+        try:
+            value = bool(self._fn())
+        except Exception as e:
+            logger.warning(f"Error evaluating condition {self.condition}: {e}")
+            value = False
+        if not self.volatile:
+            self._value = value
+            self._valid = True
+        return value
+
+    def invalidate(self):
+        self._valid = False
+
 
 class FlagManager:
     """
     Centralized flag storage and condition evaluation.
-    
+
     Condition types supported:
     - flag(name): True if flag is set
     - not(condition): Negation
@@ -22,8 +84,9 @@ class FlagManager:
     - aces_count >= n: True if ace count meets requirement
     - has_ace(ace_id): True if player has specific ace
     - has_guest(guest_id): True if party has guest
+    - player_stat name >= n: Compares a stat of the active player
     """
-    
+
     def __init__(self):
         """Initialize the flag manager."""
         self._flags: dict[str, Any] = {}
@@ -31,82 +94,210 @@ class FlagManager:
         self._ace_checker: Optional[Callable[[str], bool]] = None
         self._ace_counter: Optional[Callable[[], int]] = None
         self._guest_checker: Optional[Callable[[str], bool]] = None
-    
+        self._stat_provider: Optional[Callable[[str], Any]] = None
+
+        # Sorgenti per cui l'host chiama notify_changed: solo queste sono memoizzabili
+        self._notified_sources: Set[str] = set()
+        # dipendenza -> condizioni compilate che la leggono
+        self._dependents: Dict[Tuple[str, Any], Set[CompiledCondition]] = {}
+        # id(dict condizione) -> CompiledCondition (LRU; il dict resta referenziato dalla voce)
+        self._compiled: "OrderedDict[int, CompiledCondition]" = OrderedDict()
+
+        # nome flag -> {handle: callback}; None = tutti i flag
+        self._listeners: Dict[Optional[str], Dict[int, FlagListener]] = {}
+        self._subscriptions: Dict[int, Tuple[Optional[str], ...]] = {}
+        self._next_handle = 1
+
+    def bind_flags(self, flags: dict):
+        """Use an external dict (e.g. GameState.flags) as flag storage."""
+        old = self._flags
+        self._flags = flags
+        self.invalidate_all()
+        self._notify_diff(old, flags)
+
     def set_item_checker(self, checker: Callable[[str], bool]):
         """Set callback to check if player has an item."""
         self._item_checker = checker
-    
+        self.invalidate_all()
+
     def set_ace_checker(self, checker: Callable[[str], bool]):
         """Set callback to check if player has a specific ace."""
         self._ace_checker = checker
-    
+        self.invalidate_all()
+
     def set_ace_counter(self, counter: Callable[[], int]):
         """Set callback to get total ace count."""
         self._ace_counter = counter
-    
+        self.invalidate_all()
+
     def set_guest_checker(self, checker: Callable[[str], bool]):
         """Set callback to check if party has a guest."""
         self._guest_checker = checker
-    
+        self.invalidate_all()
+
+    def set_stat_provider(self, provider: Callable[[str], Any]):
+        """Set callback returning a stat of the active player (None if no player)."""
+        self._stat_provider = provider
+        self.invalidate_all()
+
+    def set_notified_sources(self, *sources: str):
+        """
+        Declare the checker sources whose changes the host reports via notify_changed()
+        (e.g. SOURCE_ITEM, SOURCE_ACE). Conditions reading other sources are never cached.
+        """
+        self._notified_sources = set(sources)
+        self._compiled.clear()
+        self._dependents.clear()
+
     # --- Flag Operations ---
-    
+
     def set_flag(self, name: str, value: Any = True):
         """
         Set a flag value.
-        
+
         Args:
             name: The flag name.
             value: The value to set (default True).
         """
+        changed = name not in self._flags or self._flags[name] != value
         self._flags[name] = value
+        if changed:
+            self._invalidate(("flag", name))
+            self._notify(name, value)
         logger.debug(f"Flag set: {name} = {value}")
-    
+
     def clear_flag(self, name: str):
         """
         Clear/remove a flag.
-        
+
         Args:
             name: The flag name to clear.
         """
         if name in self._flags:
             del self._flags[name]
+            self._invalidate(("flag", name))
+            self._notify(name, None)
             logger.debug(f"Flag cleared: {name}")
-    
+
     def has_flag(self, name: str) -> bool:
         """
         Check if a flag is set (truthy).
-        
+
         Args:
             name: The flag name.
-            
+
         Returns:
             True if the flag exists and is truthy.
         """
         return bool(self._flags.get(name, False))
-    
+
     def get_flag(self, name: str, default: Any = None) -> Any:
         """
         Get a flag's value.
-        
+
         Args:
             name: The flag name.
             default: Default value if flag not set.
-            
+
         Returns:
             The flag value or default.
         """
         return self._flags.get(name, default)
-    
+
     def get_all_flags(self) -> dict[str, Any]:
         """Returns a copy of all flags."""
         return self._flags.copy()
-    
+
+    # --- Subscriptions ---
+
+    def subscribe(self, names: Union[str, Iterable[str], None], callback: FlagListener) -> int:
+        """
+        Call callback(name, value) whenever one of the flags changes value
+        (value is None when the flag is cleared). names=None listens to every flag.
+
+        Returns:
+            Handle for unsubscribe().
+        """
+        keys: Tuple[Optional[str], ...]
+        if names is None:
+            keys = (None,)
+        elif isinstance(names, str):
+            keys = (names,)
+        else:
+            keys = tuple(dict.fromkeys(names))
+        handle = self._next_handle
+        self._next_handle += 1
+        for key in keys:
+            self._listeners.setdefault(key, {})[handle] = callback
+        self._subscriptions[handle] = keys
+        return handle
+
+    def unsubscribe(self, handle: Optional[int]):
+        """Remove a subscription (unknown or None handles are ignored)."""
+        for key in self._subscriptions.pop(handle, ()):
+            listeners = self._listeners.get(key)
+            if listeners is not None:
+                listeners.pop(handle, None)
+                if not listeners:
+                    del self._listeners[key]
+
+    def _notify(self, name: str, value: Any):
+        specific = self._listeners.get(name)
+        wildcard = self._listeners.get(None)
+        if not specific and not wildcard:
+            return
+        # Copia: un listener può (dis)iscriversi durante la notifica
+        callbacks: List[FlagListener] = list(specific.values()) if specific else []
+        if wildcard:
+            callbacks.extend(wildcard.values())
+        for callback in callbacks:
+            try:
+                callback(name, value)
+            except Exception as e:
+                logger.warning(f"Flag listener failed for '{name}': {e}")
+
+    def _notify_diff(self, old: dict, new: dict):
+        """Notifica i flag che differiscono tra due storage (cambio partita, caricamento)."""
+        if not self._listeners or old is new:
+            return
+        for name in set(old) | set(new):
+            if name not in new:
+                self._notify(name, None)
+            elif name not in old or old[name] != new[name]:
+                self._notify(name, new[name])
+
+    # --- Change Notification ---
+
+    def notify_changed(self, source: str, key: Any = None):
+        """
+        Report a change of a checker source (inventory, aces...).
+        With key=None every condition reading that source is invalidated.
+        """
+        if key is not None:
+            self._invalidate((source, key))
+            self._invalidate((source, None))
+            return
+        for dep in [d for d in self._dependents if d[0] == source]:
+            self._invalidate(dep)
+
+    def invalidate_all(self):
+        """Drop every memoized result (compiled closures are kept)."""
+        for compiled in self._compiled.values():
+            compiled.invalidate()
+        for dependents in self._dependents.values():
+            for compiled in dependents:
+                compiled.invalidate()
+
+    def _invalidate(self, dep: Tuple[str, Any]):
+        for compiled in self._dependents.get(dep, ()):
+            compiled.invalidate()
+
     # --- Condition Evaluation ---
-    
+
     def evaluate_condition(self, condition: dict) -> bool:
         """
         Evaluate a condition expression.
-        
+
         Condition format:
         - {"type": "flag", "name": "flag_name"}
         - {"type": "not", "condition": {...}}
@@ -116,143 +307,167 @@ class FlagManager:
         - {"type": "aces_count", "operator": ">=", "value": 4}
         - {"type": "has_ace", "ace_id": "..."}
         - {"type": "has_guest", "guest_id": "..."}
-        
+        - {"type": "player_stat", "name": "regions_completed", "operator": ">=", "value": 2}
+
+        The condition is compiled on first use (cached by identity of the dict,
+        so long-lived condition dicts from content data hit the cache).
+
         Args:
             condition: The condition dictionary.
-            
+
         Returns:
             True if condition is met, False otherwise (fail-safe).
         """
+        key = id(condition)
+        compiled = self._compiled.get(key)
+        if compiled is None or compiled.condition is not condition:
+            compiled = self.compile(condition)
+            self._compiled[key] = compiled
+            if len(self._compiled) > MAX_CACHED_CONDITIONS:
+                self._forget(self._compiled.popitem(last=False)[1])
+        return compiled()
+
+    def compile(self, condition: dict) -> CompiledCondition:
+        """
+        Compile a condition into a memoized CompiledCondition bound to this manager.
+        Callers that gate every frame can keep the result and just call it.
+        """
+        deps: Set[Tuple[str, Any]] = set()
+        fn = self._compile_node(condition, deps)
+        volatile = any(source != "flag" and source not in self._notified_sources for source, _ in deps)
+        compiled = CompiledCondition(condition, fn, deps, volatile)
+        if not volatile:
+            for dep in deps:
+                self._dependents.setdefault(dep, set()).add(compiled)
+        return compiled
+
+    def _forget(self, compiled: CompiledCondition):
+        for dep in compiled.deps:
+            dependents = self._dependents.get(dep)
+            if dependents is not None:
+                dependents.discard(compiled)
+                if not dependents:
+                    del self._dependents[dep]
+
+    def _compile_node(self, condition, deps: Set[Tuple[str, Any]]) -> Callable[[], bool]:
+        """Closure for one node of the condition tree; records what it reads in deps."""
         if not condition or not isinstance(condition, dict):
             logger.warning(f"Invalid condition format: {condition}")
-            return False
-        
+            return lambda: False
+
         condition_type = condition.get('type', '')
-        
-        try:
-            if condition_type == 'flag':
-                return self._eval_flag(condition)
-            elif condition_type == 'not':
-                return self._eval_not(condition)
-            elif condition_type == 'and':
-                return self._eval_and(condition)
-            elif condition_type == 'or':
-                return self._eval_or(condition)
-            elif condition_type == 'has_item':
-                return self._eval_has_item(condition)
-            elif condition_type == 'aces_count':
-                return self._eval_aces_count(condition)
-            elif condition_type == 'has_ace':
-                return self._eval_has_ace(condition)
-            elif condition_type == 'has_guest':
-                return self._eval_has_guest(condition)
-            else:
-                logger.warning(f"Unknown condition type: {condition_type}")
+
+        if condition_type == 'flag':
+            name = condition.get('name', '')
+            deps.add(("flag", name))
+            flags_owner = self
+            return lambda: bool(flags_owner._flags.get(name, False))
+
+        elif condition_type == 'not':
+            inner = self._compile_node(condition.get('condition', {}), deps)
+            return lambda: not inner()
+
+        elif condition_type == 'and':
+            parts = tuple(self._compile_node(c, deps) for c in condition.get('conditions', []))
+            return lambda: all(part() for part in parts)
+
+        elif condition_type == 'or':
+            parts = tuple(self._compile_node(c, deps) for c in condition.get('conditions', []))
+            return lambda: any(part() for part in parts)
+
+        elif condition_type == 'has_item':
+            item_id = condition.get('item_id', '')
+            deps.add((SOURCE_ITEM, item_id))
+            return lambda: self._check(self._item_checker, "has_item", item_id)
+
+        elif condition_type == 'aces_count':
+            compare = self._comparison(condition.get('operator', '>='))
+            value = condition.get('value', 0)
+            deps.add((SOURCE_ACE, None))
+
+            def aces_count():
+                if self._ace_counter:
+                    return compare(self._ace_counter(), value)
+                logger.warning("aces_count condition used but no ace counter set")
                 return False
-        except Exception as e:
-            logger.warning(f"Error evaluating condition {condition}: {e}")
-            return False
-    
-    def _eval_flag(self, condition: dict) -> bool:
-        """Evaluate a flag condition."""
-        name = condition.get('name', '')
-        return self.has_flag(name)
-    
-    def _eval_not(self, condition: dict) -> bool:
-        """Evaluate a NOT condition."""
-        inner = condition.get('condition', {})
-        return not self.evaluate_condition(inner)
-    
-    def _eval_and(self, condition: dict) -> bool:
-        """Evaluate an AND condition."""
-        conditions = condition.get('conditions', [])
-        if not conditions:
-            return True
-        return all(self.evaluate_condition(c) for c in conditions)
-    
-    def _eval_or(self, condition: dict) -> bool:
-        """Evaluate an OR condition."""
-        conditions = condition.get('conditions', [])
-        if not conditions:
-            return False
-        return any(self.evaluate_condition(c) for c in conditions)
-    
-    def _eval_has_item(self, condition: dict) -> bool:
-        """Evaluate a has_item condition."""
-        item_id = condition.get('item_id', '')
-        if self._item_checker:
-            return self._item_checker(item_id)
-        logger.warning("has_item condition used but no item checker set")
-        return False
-    
-    def _eval_aces_count(self, condition: dict) -> bool:
-        """Evaluate an aces_count condition."""
-        operator = condition.get('operator', '>=')
-        value = condition.get('value', 0)
-        
-        if self._ace_counter:
-            count = self._ace_counter()
-            if operator == '>=':
-                return count >= value
-            elif operator == '>':
-                return count > value
-            elif operator == '==':
-                return count == value
-            elif operator == '<=':
-                return count <= value
-            elif operator == '<':
-                return count < value
-        
-        logger.warning("aces_count condition used but no ace counter set")
-        return False
-    
-    def _eval_has_ace(self, condition: dict) -> bool:
-        """Evaluate a has_ace condition."""
-        ace_id = condition.get('ace_id', '')
-        if self._ace_checker:
-            return self._ace_checker(ace_id)
-        logger.warning("has_ace condition used but no ace checker set")
-        return False
-    
-    def _eval_has_guest(self, condition: dict) -> bool:
-        """Evaluate a has_guest condition."""
-        guest_id = condition.get('guest_id', '')
-        if self._guest_checker:
-            return self._guest_checker(guest_id)
-        logger.warning("has_guest condition used but no guest checker set")
+            return aces_count
+
+        elif condition_type == 'has_ace':
+            ace_id = condition.get('ace_id', '')
+            deps.add((SOURCE_ACE, None))
+            return lambda: self._check(self._ace_checker, "has_ace", ace_id)
+
+        elif condition_type == 'has_guest':
+            guest_id = condition.get('guest_id', '')
+            deps.add((SOURCE_GUEST, None))
+            return lambda: self._check(self._guest_checker, "has_guest", guest_id)
+
+        elif condition_type == 'player_stat':
+            name = condition.get('name', '')
+            compare = self._comparison(condition.get('operator', '>='))
+            value = condition.get('value', 0)
+            deps.add((SOURCE_STAT, name))
+
+            def player_stat():
+                if not self._stat_provider:
+                    logger.warning("player_stat condition used but no stat provider set")
+                    return False
+                current = self._stat_provider(name)
+                return current is not None and compare(current, value)
+            return player_stat
+
+        logger.warning(f"Unknown condition type: {condition_type}")
+        return lambda: False
+
+    @staticmethod
+    def _check(checker: Optional[Callable[[str], bool]], condition_type: str, arg: str) -> bool:
+        if checker:
+            return checker(arg)
+        logger.warning(f"{condition_type} condition used but no checker set")
         return False
-    
+
+    @staticmethod
+    def _comparison(operator: str) -> Callable[[Any, Any], bool]:
+        compare = _COMPARISONS.get(operator)
+        if compare is None:
+            logger.warning(f"Unknown comparison operator: {operator}")
+            return lambda a, b: False
+        return compare
+
     # --- Serialization ---
-    
+
     def to_dict(self) -> dict:
         """
         Serialize flags for saving.
-        
+
         Returns:
             Dictionary of flags.
         """
         return {'flags': self._flags.copy()}
-    
+
     @classmethod
     def from_dict(cls, data: dict) -> 'FlagManager':
         """
         Deserialize flags from save data.
-        
+
         Args:
             data: Dictionary containing flags.
-            
+
         Returns:
             FlagManager instance.
         """
         manager = cls()
         manager._flags = data.get('flags', {}).copy()
         return manager
-    
+
     def load_from_dict(self, data: dict):
         """
         Load flags from dictionary (in-place).
-        
+
         Args:
             data: Dictionary containing flags.
         """
-        self._flags = data.get('flags', {}).copy()
\ No newline at end of file
+        old = self._flags
+        self._flags = data.get('flags', {}).copy()
+        self.invalidate_all()
+        self._notify_diff(old, self._flags)
@@ -2,6 +2,11 @@
 Game Model - Unified Facade (Amelia Architecture + Sicily Features)
 Updated: RPG Mechanics (2 Players, Stat Boosts, Ace Abilities)
 DEBUG DISABLED: Normal gameplay progression restored.
+Updated: FlagManager bound to GameState.flags (flag_manager), used by the script table conditions.
+Updated: set_flag/collect_ace/add_global_item/remove_global_item notify the FlagManager (memoized conditions).
+Updated: subscribe_flag/unsubscribe_flag (flag change listeners, see FlagManager.subscribe).
+Updated: add_change_listener (aces, global items, removed entities) and world_state
+         (PersistentWorldState over GameState.removed_entities), used by the autosave journal.
 """
 from src.model.ui.prompts import PromptManager
 from src.version import VERSION
@@ -16,9 +21,11 @@ from src.model.audio.audio_manager import AudioManager
 from src.model.settings.settings_manager import SettingsManager
 from src.model.content.registry import ContentRegistry
 from src.model.debug.debug_console import DebugConsole
+from src.model.flag_manager import FlagManager, SOURCE_ACE, SOURCE_ITEM
+from src.model.persistent_world_state import PersistentWorldState
 
 # Sicily Content Imports
-from src.model.content.world_builder import WorldBuilder
+from src.model.content.room_cache import load_rooms, ROOM_CACHE_PATH
 from src.model.vinalia.vinalia_region import VinaliaRegion
 from src.model.aurion.aurion_region import AurionRegion
 from src.model.viridor.viridor_region import ViridorRegion
@@ -37,6 +44,11 @@ SUIT_SPADE = "Spade"
 SUIT_COPPE = "Coppe"
 VALID_SUITS = {SUIT_DENARI, SUIT_BASTONI, SUIT_SPADE, SUIT_COPPE}
 
+# Cambiamenti notificati ai change listener: callback(tipo, chiave, valore)
+CHANGE_ACE = "ace"            # chiave = ace_id, valore = True
+CHANGE_ITEM = "item"          # chiave = item_id, valore = quantità attuale
+CHANGE_ENTITY_REMOVED = "removed"  # chiave = "room_id:entity_id", valore = True
+
 class Game:
     def __init__(self):
         # --- INFRASTRUCTURE (Sicily) ---
@@ -59,6 +71,7 @@ class Game:
             pass
 
         self.content = ContentRegistry()
+        self.room_cache_path = ROOM_CACHE_PATH  # None = ignora il room cache compilato
         self.debug = DebugConsole(enabled=False)
 
         # --- CORE GAMEPLAY (Amelia) ---
@@ -76,6 +89,23 @@ class Game:
         self.inventory_global = {} 
         self.flags = {}
 
+        # Condizioni (script, trigger): checker sul modello, flag presi da GameState
+        self._flag_manager = FlagManager()
+        self._flag_manager.set_ace_counter(self.get_ace_count)
+        self._flag_manager.set_ace_checker(lambda ace_id: ace_id in self.gamestate.aces_collected)
+        self._flag_manager.set_item_checker(lambda item_id: self.inventory_global.get(item_id, 0) > 0)
+        self._flag_manager.set_guest_checker(lambda guest_id: self.gamestate.guest_id == guest_id)
+        self._flag_manager.set_stat_provider(self._active_player_stat)
+        # Assi e inventario notificano i cambiamenti (collect_ace, add/remove_global_item):
+        # le condizioni che li leggono restano memoizzate fino al prossimo evento
+        self._flag_manager.set_notified_sources(SOURCE_ACE, SOURCE_ITEM)
+        self._flag_sources = None
+
+        # Entità rimosse (US 5.5) sopra GameState.removed_entities, ricostruito al cambio partita
+        self._world_state = None
+        self._world_state_source = None
+        self._change_listeners = []
+
     def start_new_game(self, num_players: int):
         """Inizializza una nuova partita resettando completamente lo stato (US22/Fix Reset)."""
         
@@ -135,6 +165,8 @@ class Game:
         ace_id = f"ace_{suit.lower()}"
         if ace_id not in self.gamestate.aces_collected:
             self.gamestate.aces_collected.append(ace_id)
+            self._flag_manager.notify_changed(SOURCE_ACE)
+            self._emit_change(CHANGE_ACE, ace_id, True)
             self.logger.info(f"Ace Collected: {suit_cap}")
             return True
         return False
@@ -169,8 +201,10 @@ class Game:
 
     def load_content(self):
         try:
-            # Carica tutto il mondo (Hub + Regioni)
-            WorldBuilder.build_all(self.content)
+            # Carica il mondo (Hub + Regioni): dal room cache compilato se aggiornato,
+            # altrimenti con WorldBuilder. Il cache non viene mai scritto qui: si rigenera
+            # con `python -m src.model.content.room_cache`
+            load_rooms(self.content, self.room_cache_path)
             self.logger.info("World content loaded successfully.")
         except Exception as e:
             self.logger.warning("Content load issue: %s", e)
@@ -179,6 +213,18 @@ class Game:
 
     def add_global_item(self, item_id: str, qty: int = 1):
         self.inventory_global[str(item_id)] = self.inventory_global.get(str(item_id), 0) + int(qty)
+        self._flag_manager.notify_changed(SOURCE_ITEM, str(item_id))
+        self._emit_change(CHANGE_ITEM, str(item_id), self.inventory_global[str(item_id)])
+
+    def remove_global_item(self, item_id: str, qty: int = 1) -> bool:
+        """Consuma qty pezzi di un oggetto globale; False se non ce ne sono abbastanza."""
+        item_id = str(item_id)
+        if self.inventory_global.get(item_id, 0) < qty:
+            return False
+        self.inventory_global[item_id] -= int(qty)
+        self._flag_manager.notify_changed(SOURCE_ITEM, item_id)
+        self._emit_change(CHANGE_ITEM, item_id, self.inventory_global[item_id])
+        return True
 
     def give_ace(self, suit: str):
         # FIX: Passa la stringa capitalizzata a collect_ace per validazione
@@ -238,11 +284,71 @@ class Game:
 
     def set_flag(self, key: str, value: bool):
         self.flags[str(key)] = value
-        self.gamestate.flags[str(key)] = value
+        # Via FlagManager: invalida le condizioni memoizzate che leggono il flag
+        self.flag_manager.set_flag(str(key), value)
 
     def get_flag(self, key: str) -> bool:
         return self.gamestate.flags.get(str(key), False)
 
+    def subscribe_flag(self, names, callback) -> int:
+        """callback(nome, valore) a ogni cambio dei flag indicati (None = tutti). Ritorna l'handle."""
+        return self.flag_manager.subscribe(names, callback)
+
+    def unsubscribe_flag(self, handle):
+        self._flag_manager.unsubscribe(handle)
+
+    @property
+    def flag_manager(self) -> FlagManager:
+        """
+        FlagManager sui flag del GameState corrente. Se GameState, flag, assi o inventario
+        vengono sostituiti (nuova partita, caricamento) si ricollega e svuota la memoizzazione.
+        """
+        fm = self._flag_manager
+        gs = self.gamestate
+        sources = (gs.flags, gs.aces_collected, self.inventory_global)
+        bound = self._flag_sources
+        if bound is None or any(a is not b for a, b in zip(sources, bound)):
+            self._flag_sources = sources
+            fm.bind_flags(gs.flags)
+        return fm
+
+    @property
+    def world_state(self) -> PersistentWorldState:
+        """Entità rimosse della partita corrente; le rimozioni finiscono in GameState.removed_entities."""
+        removed = self.gamestate.removed_entities
+        if self._world_state is None or self._world_state_source is not removed:
+            self._world_state_source = removed
+            self._world_state = PersistentWorldState(removed_entities=set(removed),
+                                                     on_remove=self._on_entity_removed)
+        return self._world_state
+
+    def _on_entity_removed(self, key: str):
+        self.gamestate.removed_entities.append(key)
+        self._emit_change(CHANGE_ENTITY_REMOVED, key, True)
+
+    def add_change_listener(self, callback):
+        """callback(tipo, chiave, valore) per assi, oggetti globali ed entità rimosse (CHANGE_*)."""
+        if callback not in self._change_listeners:
+            self._change_listeners.append(callback)
+
+    def remove_change_listener(self, callback):
+        if callback in self._change_listeners:
+            self._change_listeners.remove(callback)
+
+    def _emit_change(self, kind: str, key: str, value):
+        for callback in list(self._change_listeners):
+            try:
+                callback(kind, key, value)
+            except Exception as e:
+                self.logger.warning(f"Change listener failed for {kind} '{key}': {e}")
+
+    def evaluate_condition(self, condition: dict) -> bool:
+        return self.flag_manager.evaluate_condition(condition)
+
+    def _active_player_stat(self, name: str):
+        player = self.gamestate.get_active_player()
+        return getattr(player, name, None) if player else None
+
     def return_to_hub(self):
         self.enter_hub()
 
@@ -83,6 +83,7 @@ CONTEXT_ALLOWED_ACTIONS: dict[InputContext, set[Action]] = {
     
     InputContext.SAVE_LOAD: {
         Action.MENU_UP, Action.MENU_DOWN,
+        Action.MENU_LEFT, Action.MENU_RIGHT,  # Pagine del browser degli slot
         Action.CONFIRM, Action.CANCEL
     },
     
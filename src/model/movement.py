@@ -0,0 +1,113 @@
+"""
+Movement - Risoluzione del movimento del party contro i collider della stanza.
+
+Lo spostamento di un passo viene diviso in sotto-passi di al massimo MAX_SUBSTEP_DISTANCE
+pixel; in ogni sotto-passo si muove prima l'asse X e poi l'asse Y, ciascuno con uno
+sweep: i collider toccati dal rettangolo "spazzato" fermano la hitbox a filo del bordo.
+L'asse bloccato si azzera e l'altro prosegue, quindi contro un muro si scivola invece di
+fermarsi, e anche con dt grandi non si attraversano pareti sottili (lo sweep copre tutto
+il tragitto, non solo la posizione finale).
+
+I candidati arrivano dalla broadphase di RoomData (colliders_near), quindi più sotto-passi
+per frame restano economici anche in stanze dense.
+"""
+import math
+from dataclasses import dataclass
+from typing import Tuple
+
+# Lato dei sotto-passi: metà della hitbox del party (32x32)
+MAX_SUBSTEP_DISTANCE = 16.0
+# Spostamento massimo per passo di simulazione (es. dt enorme dopo un caricamento)
+MAX_STEP_DISTANCE = 96.0
+
+PARTY_HITBOX = (32, 32)
+
+
+@dataclass(frozen=True)
+class MoveResult:
+    x: float
+    y: float
+    blocked_x: bool = False
+    blocked_y: bool = False
+    substeps: int = 0
+
+    @property
+    def blocked(self) -> bool:
+        return self.blocked_x or self.blocked_y
+
+
+def resolve_movement(room_data, x: float, y: float, dx: float, dy: float,
+                     size: Tuple[int, int] = PARTY_HITBOX,
+                     max_substep: float = MAX_SUBSTEP_DISTANCE,
+                     max_distance: float = MAX_STEP_DISTANCE) -> MoveResult:
+    """
+    Sposta la hitbox (x, y, *size) di (dx, dy) contro i collider di room_data.
+    Ritorna la posizione finale e quali assi sono stati bloccati.
+    """
+    distance = math.hypot(dx, dy)
+    if distance == 0:
+        return MoveResult(x, y)
+    if distance > max_distance:
+        scale = max_distance / distance
+        dx, dy = dx * scale, dy * scale
+        distance = max_distance
+
+    substeps = max(1, math.ceil(distance / max_substep))
+    step_x, step_y = dx / substeps, dy / substeps
+    w, h = size
+    blocked_x = blocked_y = False
+
+    for _ in range(substeps):
+        if step_x:
+            x, hit = _sweep_x(room_data, x, y, w, h, step_x)
+            if hit:
+                blocked_x = True
+                step_x = 0.0
+        if step_y:
+            y, hit = _sweep_y(room_data, x, y, w, h, step_y)
+            if hit:
+                blocked_y = True
+                step_y = 0.0
+        if not step_x and not step_y:
+            break
+
+    return MoveResult(x, y, blocked_x, blocked_y, substeps)
+
+
+def _sweep_x(room_data, x: float, y: float, w: int, h: int, step: float) -> Tuple[float, bool]:
+    left = min(x, x + step)
+    area = (int(left), int(y), math.ceil(w + abs(step)) + 1, h + 1)
+    target = x + step
+    hit = False
+    for collider in room_data.colliders_near(area):
+        r = collider.rect
+        if not (y < r.bottom and y + h > r.top):
+            continue
+        if step > 0:
+            # Solo i collider davanti: uno già sovrapposto non impedisce di uscirne
+            if r.left >= x + w and target + w > r.left:
+                target = r.left - w
+                hit = True
+        elif r.right <= x and target < r.right:
+            target = r.right
+            hit = True
+    return target, hit
+
+
+def _sweep_y(room_data, x: float, y: float, w: int, h: int, step: float) -> Tuple[float, bool]:
+    top = min(y, y + step)
+    area = (int(x), int(top), w + 1, math.ceil(h + abs(step)) + 1)
+    target = y + step
+    hit = False
+    for collider in room_data.colliders_near(area):
+        r = collider.rect
+        if not (x < r.right and x + w > r.left):
+            continue
+        if step > 0:
+            if r.top >= y + h and target + h > r.top:
+                target = r.top - h
+                hit = True
+        elif r.bottom <= y and target < r.bottom:
+            target = r.bottom
+            hit = True
+    return target, hit
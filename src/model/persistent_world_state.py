@@ -1,10 +1,11 @@
 """
 Persistent world state for tracking one-time interactions.
 User Story 5.5: PersistentWorldState keyed by stable room/entity IDs.
+Updated: optional on_remove callback (Game mirrors removals into GameState and the autosave journal).
 """
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Callable, Optional
 
 
 @dataclass
@@ -14,9 +15,11 @@ class PersistentWorldState:
     
     - removed_entities: Set of "room_id:entity_id" keys for removed entities
     - entity_vars: Optional dict for entity-specific variables
+    - on_remove: Optional callback(key), called once per newly removed entity
     """
     removed_entities: set[str] = field(default_factory=set)
     entity_vars: dict[str, dict[str, Any]] = field(default_factory=dict)
+    on_remove: Optional[Callable[[str], None]] = field(default=None, repr=False, compare=False)
     
     def make_entity_key(self, room_id: str, entity_id: str) -> str:
         """
@@ -40,7 +43,11 @@ class PersistentWorldState:
             entity_id: The entity to remove.
         """
         key = self.make_entity_key(room_id, entity_id)
+        if key in self.removed_entities:
+            return
         self.removed_entities.add(key)
+        if self.on_remove is not None:
+            self.on_remove(key)
     
     def is_entity_removed(self, room_id: str, entity_id: str) -> bool:
         """
@@ -1,13 +1,25 @@
 """
 Render System - Pipeline di rendering con layer, camera e gestione draw order
 Epic 3: User Story 10, 11
+Updated: Retained mode (static layer cache + dirty rectangles) via Renderer.flush_retained.
+Updated: Command queue stored in parallel arrays with integer sort keys and batched blits.
+Updated: Camera interpolation between fixed simulation steps (see controller/fixed_timestep.py).
+Updated: Flush sort/draw timed into the FrameProfiler; profiler graph in DebugOverlay.
+Updated: Dirty-rect collection stops past MAX_DIRTY_RECTS (busy frames go straight to a full blit).
 """
 
+import time
+from array import array
 from enum import IntEnum
 from dataclasses import dataclass, field
 from typing import Callable, Optional, List, Tuple, Literal, Any
 import pygame
 
+from src.model.assets.text_cache import text_cache
+from src.model.utils.frame_profiler import (
+    frame_profiler, PHASE_FLUSH_SORT, PHASE_FLUSH_DRAW, COUNT_RENDER_COMMANDS, STACKED_PHASES
+)
+
 
 # ============== LAYER DEFINITIONS (US10) ==============
 class RenderLayer(IntEnum):
@@ -29,6 +41,13 @@ class RenderLayer(IntEnum):
     DEBUG_TEXT = 2100
 
 
+# Layer <= STATIC_LAYER_MAX vengono composti una volta nella cache statica (retained mode)
+STATIC_LAYER_MAX = RenderLayer.TILEMAP
+
+# Oltre questo numero di rettangoli sporchi conviene un update completo dello schermo
+MAX_DIRTY_RECTS = 32
+
+
 # ============== RENDER COMMAND (US10) ==============
 @dataclass
 class RenderCommand:
@@ -41,12 +60,14 @@ class RenderCommand:
         space: "world" o "screen" - determina se applicare camera offset
         draw_callable: Funzione che esegue il draw effettivo
         submit_index: Indice assegnato dal Renderer per tie-breaking stabile
+        bounds: Area toccata dal draw (nello stesso space). None = sconosciuta (tutto lo schermo)
     """
     layer: int
     sort_key: Tuple = field(default_factory=tuple)
     space: Literal["world", "screen"] = "world"
     draw_callable: Callable[[pygame.Surface, 'Camera'], None] = None
     submit_index: int = 0
+    bounds: Optional[pygame.Rect] = None
     
     def __lt__(self, other: 'RenderCommand') -> bool:
         """Comparatore per ordinamento: (layer, sort_key, submit_index)"""
@@ -83,11 +104,16 @@ class Camera:
     - Coordinate intere per il rendering (no jitter)
     - Clamping ai bounds del mondo
     - Supporto per modalità FIXED e FOLLOW
+    - Interpolazione tra l'ultimo passo di simulazione e il precedente (store_previous/interpolation_alpha)
     """
     
     def __init__(self, viewport_width: int, viewport_height: int):
         self._x: float = 0.0
         self._y: float = 0.0
+        self._prev_x: float = 0.0
+        self._prev_y: float = 0.0
+        # 1.0 = posizione corrente; < 1.0 = a metà tra il passo precedente e quello corrente
+        self.interpolation_alpha: float = 1.0
         self.viewport_width: int = viewport_width
         self.viewport_height: int = viewport_height
         self.mode: CameraMode = CameraMode.FIXED
@@ -98,29 +124,39 @@ class Camera:
     @property
     def x(self) -> int:
         """Posizione X come intero (per rendering)"""
-        return int(round(self._x))
+        if self.interpolation_alpha >= 1.0:
+            return int(round(self._x))
+        return int(round(self._prev_x + (self._x - self._prev_x) * self.interpolation_alpha))
     
     @property
     def y(self) -> int:
         """Posizione Y come intero (per rendering)"""
-        return int(round(self._y))
+        if self.interpolation_alpha >= 1.0:
+            return int(round(self._y))
+        return int(round(self._prev_y + (self._y - self._prev_y) * self.interpolation_alpha))
     
     @property
     def position(self) -> Tuple[int, int]:
         """Posizione camera come tupla intera"""
         return (self.x, self.y)
     
+    def store_previous(self) -> None:
+        """Memorizza la posizione corrente come "passo precedente" (prima di ogni passo di simulazione)."""
+        self._prev_x, self._prev_y = self._x, self._y
+    
     def set_mode(self, mode: CameraMode) -> None:
         """Imposta la modalità camera"""
         self.mode = mode
         if mode == CameraMode.FIXED:
             self._x, self._y = float(self.fixed_pos[0]), float(self.fixed_pos[1])
+            self.store_previous()
     
     def set_fixed_position(self, x: int, y: int) -> None:
         """Imposta la posizione fissa (per FIXED mode)"""
         self.fixed_pos = (x, y)
         if self.mode == CameraMode.FIXED:
             self._x, self._y = float(x), float(y)
+            self.store_previous()
     
     def set_bounds(self, bounds: Optional[CameraBounds]) -> None:
         """Imposta i limiti del mondo"""
@@ -132,12 +168,15 @@ class Camera:
         self._x = world_x - self.viewport_width // 2
         self._y = world_y - self.viewport_height // 2
         self._clamp()
+        # Uno snap è un teletrasporto: niente interpolazione dalla posizione vecchia
+        self.store_previous()
     
     def snap_to_position(self, x: int, y: int) -> None:
         """Sposta istantaneamente la camera a una posizione specifica"""
         self._x = float(x)
         self._y = float(y)
         self._clamp()
+        self.store_previous()
     
     def update_follow(self, target_center_x: int, target_center_y: int, dt: float = 0.0) -> None:
         """Aggiorna la camera in FOLLOW mode per seguire un target."""
@@ -217,6 +256,36 @@ class DebugSettings:
 
 
 # ============== RENDERER (US10) ==============
+# Op code della command queue
+OP_BLIT = 0   # surface + posizione: raggruppati in Surface.blits()
+OP_RECT = 1   # pygame.draw.rect con colore e spessore
+OP_CALL = 2   # draw_callable generico (RenderCommand / submit_ui)
+
+# Chiave di ordinamento intera: | layer (12 bit) | depth (20 bit) | submit index (24 bit) |
+_DEPTH_BITS = 20
+_INDEX_BITS = 24
+_DEPTH_OFFSET = 1 << (_DEPTH_BITS - 1)
+_DEPTH_MAX = (1 << _DEPTH_BITS) - 1
+_INDEX_MASK = (1 << _INDEX_BITS) - 1
+_LAYER_SHIFT = _DEPTH_BITS + _INDEX_BITS
+
+
+def make_sort_key(layer: int, depth, submit_index: int) -> int:
+    """
+    Impacchetta (layer, depth, submit_index) in un intero: ordinare gli interi equivale
+    a ordinare le tuple. depth è il primo elemento del sort_key (es. y dei piedi).
+    """
+    d = min(_DEPTH_MAX, max(0, int(depth) + _DEPTH_OFFSET))
+    return (int(layer) << _LAYER_SHIFT) | (d << _INDEX_BITS) | (submit_index & _INDEX_MASK)
+
+
+def _depth_of(sort_key) -> int:
+    # Si ordina sul primo elemento del sort_key; a parità vale l'ordine di submit
+    if not sort_key:
+        return 0
+    return sort_key[0] if isinstance(sort_key, tuple) else sort_key
+
+
 class Renderer:
     """
     Pipeline di rendering centralizzata.
@@ -226,12 +295,45 @@ class Renderer:
     - Ordinamento per layer/sort_key/submit_index
     - Applicazione trasformazioni camera
     - Draw finale
+
+    I comandi sono salvati in array paralleli (layer, chiave intera, op code, surface/colore/
+    callable, coordinate) invece che come RenderCommand + closure: submit_sprite e submit_rect
+    non allocano oggetti, l'ordinamento è un sort di interi e gli sprite consecutivi vengono
+    disegnati con un'unica Surface.blits(). Il sort_key conta solo per il primo elemento.
+
+    Retained mode (flush_retained):
+    - i layer statici (BACKGROUND/TILEMAP) vengono composti in una superficie cache,
+      invalidata al cambio stanza (invalidate_static) o quando la camera si muove
+    - dei comandi dinamici si ridisegna solo l'area toccata (bounds), ripristinando
+      sotto di loro la cache statica; take_dirty_rects() dice cosa aggiornare a schermo
     """
     
     def __init__(self, debug_settings: Optional[DebugSettings] = None):
-        self._commands: List[RenderCommand] = []
-        self._submit_counter: int = 0
         self._debug: DebugSettings = debug_settings or DebugSettings()
+
+        # Command buffer (array paralleli, indicizzati per submit index)
+        self._keys: List[int] = []
+        self._layers = array('i')
+        self._ops = array('b')
+        self._world = array('b')      # 1 = world space, 0 = screen space
+        self._bounded = array('b')    # 1 = x/y/w/h sono i bounds del comando
+        self._xs = array('i')
+        self._ys = array('i')
+        self._ws = array('i')
+        self._hs = array('i')
+        self._args = array('i')       # OP_RECT: spessore linea
+        self._refs: List[Any] = []    # surface (BLIT), colore (RECT), callable (CALL)
+
+        # Retained mode
+        self.clear_color: Tuple[int, int, int] = (0, 0, 0)
+        self._static_cache: Optional[pygame.Surface] = None
+        self._static_camera_pos: Optional[Tuple[int, int]] = None
+        self._static_valid: bool = False
+        self._last_camera_pos: Optional[Tuple[int, int]] = None
+        self._screen_ref: Optional[pygame.Surface] = None
+        self._screen_valid: bool = False
+        self._prev_dirty: List[pygame.Rect] = []
+        self._dirty_rects: Optional[List[pygame.Rect]] = None
     
     @property
     def debug_settings(self) -> DebugSettings:
@@ -239,55 +341,64 @@ class Renderer:
     
     def begin_frame(self) -> None:
         """Inizia un nuovo frame di rendering."""
-        self._commands.clear()
-        self._submit_counter = 0
+        # I buffer vengono svuotati ma mantengono la capacità allocata
+        del self._keys[:]
+        del self._layers[:]
+        del self._ops[:]
+        del self._world[:]
+        del self._bounded[:]
+        del self._xs[:]
+        del self._ys[:]
+        del self._ws[:]
+        del self._hs[:]
+        del self._args[:]
+        del self._refs[:]
+
+    def _push(self, op: int, layer: int, depth, world: bool, ref: Any,
+              x: int = 0, y: int = 0, w: int = 0, h: int = 0,
+              bounded: bool = True, arg: int = 0) -> int:
+        index = len(self._ops)
+        self._keys.append(make_sort_key(layer, depth, index))
+        self._layers.append(int(layer))
+        self._ops.append(op)
+        self._world.append(1 if world else 0)
+        self._bounded.append(1 if bounded else 0)
+        self._xs.append(int(x))
+        self._ys.append(int(y))
+        self._ws.append(int(w))
+        self._hs.append(int(h))
+        self._args.append(arg)
+        self._refs.append(ref)
+        return index
     
     def submit(self, command: RenderCommand) -> None:
         """Sottomette un comando di rendering."""
-        command.submit_index = self._submit_counter
-        self._submit_counter += 1
-        self._commands.append(command)
+        bounds = command.bounds
+        if bounds is not None:
+            x, y, w, h = bounds
+        else:
+            x = y = w = h = 0
+        command.submit_index = self._push(
+            OP_CALL, command.layer, _depth_of(command.sort_key), command.space == "world",
+            command.draw_callable, x, y, w, h, bounded=bounds is not None
+        )
     
     def submit_sprite(self, surface: pygame.Surface, world_rect: pygame.Rect,
                       layer: int = RenderLayer.ACTORS, 
                       sort_key: Tuple = None,
                       space: Literal["world", "screen"] = "world") -> None:
         """Helper per sottomettere uno sprite."""
-        if sort_key is None:
-            sort_key = (world_rect.bottom,)
-        
-        def draw(screen: pygame.Surface, camera: Camera):
-            if space == "world":
-                screen_rect = camera.apply(world_rect)
-            else:
-                screen_rect = world_rect
-            screen.blit(surface, screen_rect.topleft)
-        
-        self.submit(RenderCommand(
-            layer=layer,
-            sort_key=sort_key,
-            space=space,
-            draw_callable=draw
-        ))
+        depth = world_rect.bottom if sort_key is None else _depth_of(sort_key)
+        w, h = surface.get_size()
+        self._push(OP_BLIT, layer, depth, space == "world", surface, world_rect.x, world_rect.y, w, h)
     
     def submit_rect(self, color: Tuple[int, int, int], world_rect: pygame.Rect,
                     layer: int = RenderLayer.DEBUG,
                     width: int = 1,
                     space: Literal["world", "screen"] = "world") -> None:
         """Helper per sottomettere un rettangolo (debug)."""
-        def draw(screen: pygame.Surface, camera: Camera):
-            if space == "world":
-                screen_rect = camera.apply(world_rect)
-            else:
-                screen_rect = world_rect
-            pygame.draw.rect(screen, color, screen_rect, width)
-        
-        self.submit(RenderCommand(
-            layer=layer,
-            sort_key=(world_rect.y,),
-            space=space,
-            draw_callable=draw
-        ))
+        self._push(OP_RECT, layer, world_rect.y, space == "world", color,
+                   world_rect.x, world_rect.y, world_rect.width, world_rect.height, arg=width)
     
     def submit_debug_collider(self, world_rect: pygame.Rect) -> None:
         """Helper per debug: disegna collider"""
@@ -308,26 +419,204 @@ class Renderer:
                            RenderLayer.DEBUG, width=1, space="world")
     
     def submit_ui(self, draw_callable: Callable[[pygame.Surface, Camera], None],
-                  layer: int = RenderLayer.UI, sort_key: Tuple = None) -> None:
+                  layer: int = RenderLayer.UI, sort_key: Tuple = None,
+                  bounds: Optional[pygame.Rect] = None) -> None:
         """Helper per sottomettere elementi UI (sempre in screen space)."""
-        self.submit(RenderCommand(
-            layer=layer,
-            sort_key=sort_key or (0,),
-            space="screen",
-            draw_callable=draw_callable
-        ))
+        if bounds is not None:
+            x, y, w, h = bounds
+        else:
+            x = y = w = h = 0
+        self._push(OP_CALL, layer, _depth_of(sort_key), False, draw_callable,
+                   x, y, w, h, bounded=bounds is not None)
+
+    def _sorted_indices(self) -> List[int]:
+        # Le chiavi sono uniche (contengono il submit index): basta un sort di interi
+        return [key & _INDEX_MASK for key in sorted(self._keys)]
+
+    def _execute(self, target: pygame.Surface, camera: Camera, indices: List[int]) -> None:
+        """Esegue i comandi indicati, raggruppando gli sprite consecutivi in Surface.blits()."""
+        ops, refs, world = self._ops, self._refs, self._world
+        xs, ys = self._xs, self._ys
+        cx, cy = camera.x, camera.y
+        batch = []
+
+        for i in indices:
+            op = ops[i]
+            if op == OP_BLIT:
+                if world[i]:
+                    batch.append((refs[i], (xs[i] - cx, ys[i] - cy)))
+                else:
+                    batch.append((refs[i], (xs[i], ys[i])))
+                continue
+
+            if batch:
+                target.blits(batch, doreturn=False)
+                batch = []
+
+            if op == OP_RECT:
+                ox, oy = (cx, cy) if world[i] else (0, 0)
+                pygame.draw.rect(target, refs[i], (xs[i] - ox, ys[i] - oy, self._ws[i], self._hs[i]), self._args[i])
+            elif refs[i]:
+                refs[i](target, camera)
+
+        if batch:
+            target.blits(batch, doreturn=False)
     
     def flush(self, screen: pygame.Surface, camera: Camera) -> None:
         """Esegue il rendering di tutti i comandi sottomessi."""
-        self._commands.sort()
-        
-        for cmd in self._commands:
-            if cmd.draw_callable:
-                cmd.draw_callable(screen, camera)
+        if frame_profiler.active:
+            t0 = time.perf_counter()
+            order = self._sorted_indices()
+            t1 = time.perf_counter()
+            self._execute(screen, camera, order)
+            frame_profiler.add_time(PHASE_FLUSH_SORT, t1 - t0)
+            frame_profiler.add_time(PHASE_FLUSH_DRAW, time.perf_counter() - t1)
+            frame_profiler.count(COUNT_RENDER_COMMANDS, len(self._ops))
+        else:
+            self._execute(screen, camera, self._sorted_indices())
+
+        # Immediate mode: lo schermo è stato ridisegnato senza tracking, serve un update completo
+        self.invalidate_screen()
+
+    # ============== RETAINED MODE ==============
+
+    def invalidate_static(self) -> None:
+        """Da chiamare quando cambiano i layer statici (es. caricamento stanza)."""
+        self._static_valid = False
+        # Il salto di camera del cambio stanza non conta come movimento
+        self._last_camera_pos = None
+
+    def invalidate_screen(self) -> None:
+        """Qualcosa ha disegnato sullo schermo fuori dal Renderer: il prossimo frame è completo."""
+        self._screen_valid = False
+        self._dirty_rects = None
+
+    def take_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """
+        Rettangoli da aggiornare a schermo per l'ultimo frame (pygame.display.update).
+        None = aggiornare tutto (flip). Dopo la lettura si torna al default None.
+        """
+        rects = self._dirty_rects
+        self._dirty_rects = None
+        return rects
+
+    def flush_retained(self, screen: pygame.Surface, camera: Camera) -> None:
+        """
+        Come flush, ma con cache dei layer statici e ridisegno limitato alle aree sporche.
+        Non richiede screen.fill: nei frame completi la cache (o il clear) copre tutto lo schermo.
+        """
+        profiling = frame_profiler.active
+        if profiling:
+            t0 = time.perf_counter()
+
+        order = self._sorted_indices()
+        layers = self._layers
+        static_idx = [i for i in order if layers[i] <= STATIC_LAYER_MAX]
+        dynamic_idx = [i for i in order if layers[i] > STATIC_LAYER_MAX]
+
+        if profiling:
+            t1 = time.perf_counter()
+
+        full = not self._screen_valid or screen is not self._screen_ref
+
+        cam_pos = camera.position
+        camera_moving = self._last_camera_pos is not None and cam_pos != self._last_camera_pos
+        self._last_camera_pos = cam_pos
+
+        cache_ok = (self._static_valid and self._static_cache is not None
+                    and self._static_cache.get_size() == screen.get_size()
+                    and self._static_camera_pos == cam_pos)
+
+        if not cache_ok:
+            full = True
+            if camera_moving:
+                # Camera in movimento: ricostruire la cache ogni frame costerebbe un blit in più
+                self._static_valid = False
+                self._draw_static(screen, static_idx, camera)
+            else:
+                self._rebuild_static_cache(screen.get_size(), static_idx, camera)
+
+        current = self._screen_bounds(dynamic_idx, camera, screen.get_rect())
+
+        dirty = None
+        if not full and current is not None:
+            dirty = self._merge_rects(self._prev_dirty + current)
+
+        if dirty is None:
+            if self._static_valid:
+                screen.blit(self._static_cache, (0, 0))
+        else:
+            for rect in dirty:
+                screen.blit(self._static_cache, rect, rect)
+
+        self._execute(screen, camera, dynamic_idx)
+
+        self._screen_ref = screen
+        # Comandi senza bounds: non sappiamo cosa ripulire al frame successivo
+        self._screen_valid = current is not None
+        self._prev_dirty = current or []
+        self._dirty_rects = dirty
+
+        if profiling:
+            frame_profiler.add_time(PHASE_FLUSH_SORT, t1 - t0)
+            frame_profiler.add_time(PHASE_FLUSH_DRAW, time.perf_counter() - t1)
+            frame_profiler.count(COUNT_RENDER_COMMANDS, len(self._ops))
+
+    def _draw_static(self, target: pygame.Surface, static_idx: List[int], camera: Camera) -> None:
+        target.fill(self.clear_color)
+        self._execute(target, camera, static_idx)
+
+    def _rebuild_static_cache(self, size: Tuple[int, int], static_idx: List[int],
+                              camera: Camera) -> None:
+        if self._static_cache is None or self._static_cache.get_size() != size:
+            self._static_cache = pygame.Surface(size)
+        self._draw_static(self._static_cache, static_idx, camera)
+        self._static_camera_pos = camera.position
+        self._static_valid = True
+
+    def _screen_bounds(self, indices: List[int], camera: Camera,
+                       screen_rect: pygame.Rect) -> Optional[List[pygame.Rect]]:
+        """
+        Bounds in screen space dei comandi visibili; None se qualche comando non li dichiara
+        o se sono più di MAX_DIRTY_RECTS (il blit completo costa meno dei rettangoli da fondere).
+        """
+        cx, cy = camera.x, camera.y
+        rects = []
+        for i in indices:
+            if not self._bounded[i]:
+                return None
+            ox, oy = (cx, cy) if self._world[i] else (0, 0)
+            rect = pygame.Rect(self._xs[i] - ox, self._ys[i] - oy, self._ws[i], self._hs[i])
+            if self._ops[i] == OP_RECT:
+                rect.inflate_ip(self._args[i] * 2, self._args[i] * 2)
+            rect = rect.clip(screen_rect)
+            if rect.width and rect.height:
+                rects.append(rect)
+                if len(rects) > MAX_DIRTY_RECTS:
+                    return None
+        return rects
+
+    @staticmethod
+    def _merge_rects(rects: List[pygame.Rect]) -> Optional[List[pygame.Rect]]:
+        """Fonde i rettangoli sovrapposti; None appena sono troppi (conviene l'update completo)."""
+        merged: List[pygame.Rect] = []
+        for rect in rects:
+            rect = pygame.Rect(rect)
+            i = 0
+            while i < len(merged):
+                if merged[i].colliderect(rect):
+                    rect.union_ip(merged.pop(i))
+                    i = 0
+                else:
+                    i += 1
+            merged.append(rect)
+            if len(merged) > MAX_DIRTY_RECTS:
+                return None
+        return merged
     
     def get_command_count(self) -> int:
         """Ritorna il numero di comandi nella coda"""
-        return len(self._commands)
+        return len(self._ops)
 
 
 # ============== DEBUG OVERLAY HELPER (US10) ==============
@@ -338,12 +627,12 @@ class DebugOverlay:
         self.renderer = renderer
         self.debug = debug_settings
         self._font: Optional[pygame.font.Font] = None
+        self._profile_lines: List[list] = []
     
     def _get_font(self) -> pygame.font.Font:
         """Ottiene il font per il testo debug (lazy init)"""
         if self._font is None:
-            pygame.font.init()
-            self._font = pygame.font.Font(None, 20)
+            self._font = text_cache.font(None, 20)
         return self._font
     
     def draw_colliders(self, colliders: List[pygame.Rect]) -> None:
@@ -390,4 +679,84 @@ class DebugOverlay:
         if self.debug.enabled and self.debug.show_camera_info:
             mode_str = "FIXED" if camera.mode == CameraMode.FIXED else "FOLLOW"
             self.draw_text(f"Camera: ({camera.x}, {camera.y}) Mode: {mode_str}", 
-                          screen_pos)
\ No newline at end of file
+                          screen_pos)
+    # ============== PROFILER GRAPH ==============
+
+    PROFILE_COLORS = {
+        "events": (120, 120, 255),
+        "state_update": (80, 220, 80),
+        "sim_other": (30, 130, 30),
+        "submit": (255, 200, 60),
+        "flush_sort": (255, 120, 0),
+        "flush_draw": (230, 60, 60),
+        "present": (200, 80, 220),
+    }
+    PROFILE_LABELS = {
+        "events": "evt", "state_update": "upd", "sim_other": "sim", "submit": "submit",
+        "flush_sort": "sort", "flush_draw": "draw", "present": "flip",
+    }
+    PROFILE_GRAPH_FRAMES = 120
+    PROFILE_GRAPH_SIZE = (240, 80)
+    PROFILE_GRAPH_MAX_MS = 33.3
+    PROFILE_TEXT_REFRESH = 30
+
+    def draw_frame_profile(self, surface: pygame.Surface, profiler,
+                           screen_pos: Tuple[int, int] = (550, 10)) -> pygame.Rect:
+        """
+        Grafico a barre impilate degli ultimi frame (una colonna per frame, una banda per fase)
+        con riepilogo testuale delle medie. Disegna subito su `surface` (dopo il flush del frame):
+        ritorna l'area toccata.
+        """
+        gw, gh = self.PROFILE_GRAPH_SIZE
+        x0, y0 = screen_pos
+        font = text_cache.font(None, 16)
+        line_h = font.get_linesize()
+
+        # Il testo cambia a ogni frame: lo aggiorniamo ogni PROFILE_TEXT_REFRESH frame per non riempire la text cache
+        if not self._profile_lines or profiler.frame_index % self.PROFILE_TEXT_REFRESH == 0:
+            avg = profiler.averages(60)
+            white = (255, 255, 255)
+            phase_tokens = [(f"{self.PROFILE_LABELS[name]} {avg.get(name, 0):.1f}", self.PROFILE_COLORS[name])
+                            for name in STACKED_PHASES]
+            self._profile_lines = [
+                [(f"frame {avg.get('frame_ms', 0):.1f} ms (max {avg.get('max_frame_ms', 0):.1f})", white)],
+                phase_tokens[:4],
+                phase_tokens[4:],
+                [(f"cmds {avg.get('render_commands', 0):.0f}  img miss {avg.get('asset_misses', 0):.1f}"
+                  f"  txt {avg.get('text_renders', 0):.1f}  steps {avg.get('sim_steps', 0):.1f}", white)],
+            ]
+
+        area = pygame.Rect(x0, y0, gw, gh + line_h * len(self._profile_lines) + 4)
+        panel = pygame.Surface(area.size)
+        panel.set_alpha(190)
+        panel.fill((0, 0, 0))
+        surface.blit(panel, area.topleft)
+
+        scale = gh / self.PROFILE_GRAPH_MAX_MS
+        bar_w = max(1, gw // self.PROFILE_GRAPH_FRAMES)
+        frames = profiler.recent(self.PROFILE_GRAPH_FRAMES)
+        bx = x0 + gw - bar_w * len(frames)
+        bottom = y0 + gh
+        for rec in frames:
+            y = bottom
+            for name in STACKED_PHASES:
+                h = min(int(rec.phases.get(name, 0.0) * scale), y - y0)
+                if h > 0:
+                    y -= h
+                    surface.fill(self.PROFILE_COLORS[name], (bx, y, bar_w, h))
+            bx += bar_w
+
+        # Riferimenti a 60 e 30 FPS
+        for ms in (16.7, 33.3):
+            ly = bottom - int(ms * scale)
+            pygame.draw.line(surface, (255, 255, 255), (x0, ly), (x0 + gw - 1, ly))
+
+        ty = bottom + 2
+        for tokens in self._profile_lines:
+            tx = x0 + 2
+            for text, color in tokens:
+                text_surf = font.render(text, True, color)
+                surface.blit(text_surf, (tx, ty))
+                tx += text_surf.get_width() + 8
+            ty += line_h
+        return area
@@ -3,18 +3,26 @@ Room Data - Unified schema for room loading and runtime behavior
 Epic 1-2 (US2, US3) + Epic 3 (US11) + Epic 15 (US 58, 60, 61)
 Epic 27: Checkpoint support (US 110)
 Updated: Added auto_trigger and label to TriggerZone for better UX.
+Updated: Collision/trigger/interactable queries go through a per-room SpatialGrid.
+Updated: hide_entity/show_entity (once_flag entities toggled by flag changes).
 """
 
 import json
 import logging
-import math
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Tuple
 import pygame
 from src.model.render_system import CameraMode, CameraBounds
+from src.model.assets.asset_manager import AssetRequest
+from src.model.spatial_grid import SpatialGrid, DEFAULT_CELL_SIZE
+from src.model.content.registry import region_of
 
 logger = logging.getLogger(__name__)
 
+# Fino a questo numero di elementi la scansione lineare costa meno della griglia
+# (le stanze attuali hanno 5-15 collider/trigger); oltre si passa alla broadphase.
+LINEAR_SCAN_MAX_ITEMS = 24
+
 # ============== DEFINITIONS ==============
 
 @dataclass
@@ -106,11 +114,28 @@ class RoomData:
     # Epic 27: Checkpoint System (US 110)
     is_checkpoint: bool = False
 
+    # Asset extra da precaricare con la stanza (es. ritratti dei dialoghi).
+    # Background e sprite delle entità sono ricavati automaticamente dal RenderController.
+    preload_assets: List[AssetRequest] = field(default_factory=list)
+
     # Legacy Schema Holders (kept for backward compatibility with older tests)
     exits: List[Any] = field(default_factory=list)
     triggers_schema: List[Any] = field(default_factory=list)
     collisions: List[Tuple[int, int, int, int]] = field(default_factory=list)
 
+    # Indice spaziale (broadphase), costruito da build_spatial_index()
+    _collider_grid: Optional[SpatialGrid] = field(default=None, init=False, repr=False, compare=False)
+    _trigger_grid: Optional[SpatialGrid] = field(default=None, init=False, repr=False, compare=False)
+    _entity_grid: Optional[SpatialGrid] = field(default=None, init=False, repr=False, compare=False)
+    _index_signature: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # Entità nascoste (once_flag o rimosse): entity_id -> (posizione originale, entità), vedi hide_entity()
+    _hidden_entities: Dict[str, Tuple[int, EntityDefinition]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @property
+    def region_id(self) -> str:
+        """Regione di appartenenza, ricavata dal prefisso dell'id (es. 'aurion_entry' -> 'aurion')."""
+        return region_of(self.room_id)
+
     def get_spawn_point(self, spawn_id: Optional[str] = None) -> SpawnPoint:
         if spawn_id is None:
             spawn_id = self.default_spawn_id
@@ -124,25 +149,132 @@ class RoomData:
         sp = self.get_spawn_point(spawn_id)
         return (sp.x, sp.y)
 
-    def check_collision(self, rect: pygame.Rect) -> bool:
+    def __getstate__(self):
+        # L'indice spaziale non si serializza (room cache): si ricostruisce alla prima query
+        state = self.__dict__.copy()
+        state.update(_collider_grid=None, _trigger_grid=None, _entity_grid=None, _index_signature=None)
+        # Le entità nascoste tornano al loro posto: il cache descrive la stanza com'è nei dati
+        if self._hidden_entities:
+            entities = list(self.entities)
+            for index, entity in sorted(self._hidden_entities.values(), key=lambda pair: pair[0]):
+                entities.insert(min(index, len(entities)), entity)
+            state.update(entities=entities, _hidden_entities={})
+        return state
+
+    # ============== SPATIAL INDEX ==============
+
+    def build_spatial_index(self, cell_size: int = DEFAULT_CELL_SIZE) -> None:
+        """
+        (Ri)costruisce le griglie di collider, trigger ed entità.
+        Chiamato al caricamento della stanza; le query lo rifanno da sole se le liste
+        sono state sostituite o hanno cambiato lunghezza (es. builder che aggiungono elementi).
+        Chi sposta un elemento già indicizzato deve richiamarlo.
+        """
+        self._collider_grid = SpatialGrid(cell_size)
         for collider in self.colliders:
+            self._collider_grid.insert(collider, collider.rect)
+
+        self._trigger_grid = SpatialGrid(cell_size)
+        for trigger in self.triggers:
+            self._trigger_grid.insert(trigger, trigger.rect)
+
+        self._entity_grid = SpatialGrid(cell_size)
+        for entity in self.entities:
+            self._entity_grid.insert(entity, entity.get_rect())
+
+        self._index_signature = self._current_signature()
+
+    def _current_signature(self) -> tuple:
+        return (id(self.colliders), len(self.colliders),
+                id(self.triggers), len(self.triggers),
+                id(self.entities), len(self.entities))
+
+    def _ensure_index(self) -> None:
+        if self._index_signature != self._current_signature():
+            cell_size = self._collider_grid.cell_size if self._collider_grid is not None else DEFAULT_CELL_SIZE
+            self.build_spatial_index(cell_size)
+
+    def remove_entity(self, entity_id: str) -> Optional[EntityDefinition]:
+        """Toglie un'entità dalla stanza aggiornando l'indice senza ricostruirlo."""
+        for i, entity in enumerate(self.entities):
+            if entity.entity_id == entity_id:
+                break
+        else:
+            return None
+
+        index_valid = self._index_signature == self._current_signature()
+        del self.entities[i]
+        if index_valid:
+            self._entity_grid.remove(entity)
+            self._index_signature = self._current_signature()
+        return entity
+
+    def hide_entity(self, entity_id: str) -> bool:
+        """Nasconde un'entità (render e interazione) finché show_entity() non la ripristina."""
+        if entity_id in self._hidden_entities:
+            return False
+        index = next((i for i, e in enumerate(self.entities) if e.entity_id == entity_id), None)
+        if index is None:
+            return False
+        self._hidden_entities[entity_id] = (index, self.remove_entity(entity_id))
+        return True
+
+    def show_entity(self, entity_id: str) -> bool:
+        """Rimette un'entità nascosta con hide_entity() nella sua posizione originale."""
+        hidden = self._hidden_entities.pop(entity_id, None)
+        if hidden is None:
+            return False
+        index, entity = hidden
+        index_valid = self._index_signature == self._current_signature()
+        self.entities.insert(min(index, len(self.entities)), entity)
+        if index_valid:
+            self._entity_grid.insert(entity, entity.get_rect())
+            self._index_signature = self._current_signature()
+        return True
+
+    def is_entity_hidden(self, entity_id: str) -> bool:
+        return entity_id in self._hidden_entities
+
+    def hidden_entities(self) -> List[EntityDefinition]:
+        return [entity for _, entity in self._hidden_entities.values()]
+
+    # ============== QUERIES ==============
+
+    def _candidates(self, items: list, grid_attr: str, area) -> list:
+        """Elementi da testare per `area` (Rect o x, y, w, h): tutta la lista o la broadphase."""
+        if len(items) <= LINEAR_SCAN_MAX_ITEMS:
+            return items
+        self._ensure_index()
+        return getattr(self, grid_attr).query_area(*area)
+
+    def colliders_near(self, area) -> List[Collider]:
+        """Collider candidati per `area` (Rect o x, y, w, h); il test esatto spetta a chi chiama."""
+        return self._candidates(self.colliders, "_collider_grid", area)
+
+    def check_collision(self, rect: pygame.Rect) -> bool:
+        for collider in self._candidates(self.colliders, "_collider_grid", rect):
             if rect.colliderect(collider.rect):
                 return True
         return False
 
     def check_triggers(self, rect: pygame.Rect) -> List[TriggerZone]:
-        return [t for t in self.triggers if rect.colliderect(t.rect)]
+        return [t for t in self._candidates(self.triggers, "_trigger_grid", rect) if rect.colliderect(t.rect)]
 
     def get_closest_interactable(self, px: int, py: int, max_range: float) -> Optional[EntityDefinition]:
         nearest = None
-        min_dist = float('inf')
-        for entity in self.entities:
+        # Distanze al quadrato: stesso ordinamento, niente sqrt
+        min_dist_sq = float('inf')
+        max_range_sq = max_range * max_range
+        # +1: anche i centri esattamente a distanza max_range (bordo destro/basso) sono candidati
+        side = 2 * max_range + 1
+        area = (px - max_range, py - max_range, side, side)
+        for entity in self._candidates(self.entities, "_entity_grid", area):
             if not entity.script_id and not entity.interaction_label:
                 continue
             cx, cy = entity.get_center()
-            dist = math.sqrt((px - cx)**2 + (py - cy)**2)
-            if dist <= max_range and dist < min_dist:
-                min_dist = dist
+            dist_sq = (px - cx) ** 2 + (py - cy) ** 2
+            if dist_sq <= max_range_sq and dist_sq < min_dist_sq:
+                min_dist_sq = dist_sq
                 nearest = entity
         return nearest
 
@@ -187,7 +319,8 @@ class RoomData:
                 y=edata.get('y', 0),
                 properties=edata.get('properties', {}),
                 script_id=edata.get('script_id') or edata.get('properties', {}).get('interaction_script'),
-                interaction_label=edata.get('properties', {}).get('label')
+                interaction_label=edata.get('properties', {}).get('label'),
+                once_flag=edata.get('once_flag')
             ))
 
         # Runtime Collisions construction
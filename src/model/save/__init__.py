@@ -11,12 +11,26 @@ from src.model.save.constants import (
     CURRENT_SAVE_SCHEMA_VERSION,
     get_slot_filename,
     get_slot_filepath,
+    parse_slot_filename,
     SlotStatus,
+    SLOTS_PER_PAGE,
+    SORT_TIME,
+    SORT_REGION,
+    SORT_ACES,
+    SLOT_SORT_MODES,
+    SAVE_STAGE_QUEUED,
+    SAVE_STAGE_BACKUP,
+    SAVE_STAGE_ENCODE,
+    SAVE_STAGE_WRITE,
+    SAVE_STAGE_COMMIT,
+    SAVE_STAGE_DONE,
+    SAVE_STAGE_FAILED,
 )
 
 from src.model.save.dtos import (
     SaveMeta,
     SlotInfo,
+    SlotPage,
     WorldDTO,
     PlayerDTO,
     InventoryDTO,
@@ -41,11 +55,29 @@ from src.model.save.serializer import (
     GameSerializer,
 )
 
+from src.model.save.codec import (
+    SAVE_FORMAT_JSON,
+    SAVE_FORMAT_BINARY,
+    SaveFormatError,
+    encode_save,
+    decode_save,
+)
+
 # FIX: Importa da save_manager, non da manager
 from src.model.save.save_manager import (
     SaveManager,
 )
 
+from src.model.save.async_save import (
+    AsyncSaveService,
+    SaveJob,
+)
+
+from src.model.save.autosave import (
+    AUTOSAVE_FILENAME,
+    AutosaveJournal,
+)
+
 __all__ = [
     # Constants
     'SAVE_DIR',
@@ -53,10 +85,26 @@ __all__ = [
     'CURRENT_SAVE_SCHEMA_VERSION',
     'get_slot_filename',
     'get_slot_filepath',
+    'parse_slot_filename',
     'SlotStatus',
+    'SLOTS_PER_PAGE',
+    'SORT_TIME',
+    'SORT_REGION',
+    'SORT_ACES',
+    'SLOT_SORT_MODES',
+    'SAVE_STAGE_QUEUED',
+    'SAVE_STAGE_BACKUP',
+    'SAVE_STAGE_ENCODE',
+    'SAVE_STAGE_WRITE',
+    'SAVE_STAGE_COMMIT',
+    'SAVE_STAGE_DONE',
+    'SAVE_STAGE_FAILED',
+    'SAVE_FORMAT_JSON',
+    'SAVE_FORMAT_BINARY',
     # DTOs
     'SaveMeta',
     'SlotInfo',
+    'SlotPage',
     'WorldDTO',
     'PlayerDTO',
     'InventoryDTO',
@@ -74,5 +122,12 @@ __all__ = [
     'SaveValidator',
     'SaveStateChecker',
     'GameSerializer',
+    'SaveFormatError',
+    'encode_save',
+    'decode_save',
     'SaveManager',
+    'AsyncSaveService',
+    'SaveJob',
+    'AUTOSAVE_FILENAME',
+    'AutosaveJournal',
 ]
\ No newline at end of file
@@ -0,0 +1,182 @@
+"""
+Async Save Service - Salvataggi su worker thread.
+
+Sul main thread si fa solo lo snapshot (GameSerializer.to_dict produce dict/liste nuovi,
+indipendenti dal modello); backup, codifica JSON, scrittura con fsync e rename atomico
+avvengono sul worker tramite SaveManager.write_save.
+
+I callback di completamento non girano mai sul worker: pump(), chiamato una volta per
+frame dal GameController, li esegue sul main thread (UI, prompt, lista degli slot).
+
+Updated: submit() accoda uno snapshot già pronto con una scrittura propria (autosave).
+"""
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from src.model.save.constants import SAVE_STAGE_QUEUED, SAVE_STAGE_DONE, SAVE_STAGE_FAILED
+from src.model.save.dtos import SaveResult
+from src.model.save.serializer import GameSerializer
+
+logger = logging.getLogger(__name__)
+
+SaveCallback = Callable[[SaveResult], None]
+# Scrittura di un job: (snapshot, progress) -> SaveResult, sul worker
+SaveWriter = Callable[[dict, Callable[[str, float], None]], SaveResult]
+
+
+@dataclass(eq=False)
+class SaveJob:
+    """Un salvataggio in corso: stage/progress li aggiorna il worker, la UI li legge."""
+    slot_index: int
+    custom_name: str = ""
+    snapshot: Optional[dict] = field(default=None, repr=False)
+    on_complete: Optional[SaveCallback] = field(default=None, repr=False)
+    write: Optional[SaveWriter] = field(default=None, repr=False)  # None = SaveManager.write_save sullo slot
+    stage: str = SAVE_STAGE_QUEUED
+    progress: float = 0.0
+    result: Optional[SaveResult] = None
+    _done: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+
+    @property
+    def is_done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def _finish(self, result: SaveResult):
+        self.result = result
+        self.stage = SAVE_STAGE_DONE if result.ok else SAVE_STAGE_FAILED
+        self.progress = 1.0
+        self.snapshot = None
+        self._done.set()
+
+
+class AsyncSaveService:
+    """
+    Coda di salvataggi servita da un worker thread.
+
+    - save(slot, game, name, on_complete): snapshot sincrono, scrittura in background
+    - pump(): sul main thread, esegue i callback dei salvataggi conclusi
+    - flush()/shutdown(): attende che tutto sia su disco (uscita dal gioco, test)
+    """
+
+    def __init__(self, save_manager):
+        self.save_manager = save_manager
+        self._jobs: "queue.Queue[SaveJob]" = queue.Queue()
+        self._completed: "queue.Queue[SaveJob]" = queue.Queue()
+        self._pending: List[SaveJob] = []
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+
+    # ============== MAIN THREAD ==============
+
+    def save(self, slot_index: int, game_model, custom_name: str = "",
+             on_complete: Optional[SaveCallback] = None) -> SaveJob:
+        """Fotografa il gioco e accoda la scrittura. Gli errori arrivano a on_complete."""
+        job = SaveJob(slot_index, custom_name, on_complete=on_complete)
+        if not self.save_manager.is_valid_slot(slot_index):
+            return self.reject(job, SaveResult(ok=False, message=f"Invalid slot index: {slot_index}"))
+        try:
+            job.snapshot = GameSerializer.to_dict(game_model, custom_name=custom_name)
+        except Exception as e:
+            logger.error(f"Save snapshot failed for slot {slot_index}: {e}")
+            return self.reject(job, SaveResult(ok=False, message=f"Save failed: {e}", error=e))
+        return self._enqueue(job)
+
+    def submit(self, snapshot: dict, write: SaveWriter,
+               on_complete: Optional[SaveCallback] = None) -> SaveJob:
+        """Accoda uno snapshot già preso dal chiamante, scritto sul worker da write(snapshot, progress)."""
+        return self._enqueue(SaveJob(0, snapshot=snapshot, on_complete=on_complete, write=write))
+
+    def _enqueue(self, job: SaveJob) -> SaveJob:
+        with self._lock:
+            self._pending.append(job)
+            self._jobs.put(job)
+            if self._worker is None:
+                # Non daemon: all'uscita dell'interprete un salvataggio iniziato viene completato
+                self._worker = threading.Thread(target=self._run, name="AsyncSave", daemon=False)
+                self._worker.start()
+        return job
+
+    def reject(self, job: SaveJob, result: SaveResult) -> SaveJob:
+        """Chiude subito un job senza scrivere; il callback parte comunque da pump()."""
+        job._finish(result)
+        self._completed.put(job)
+        return job
+
+    def pump(self) -> int:
+        """Esegue i callback dei salvataggi conclusi. Ritorna quanti ne ha consegnati."""
+        delivered = 0
+        while True:
+            try:
+                job = self._completed.get_nowait()
+            except queue.Empty:
+                break
+            delivered += 1
+            if job.on_complete is None:
+                continue
+            try:
+                job.on_complete(job.result)
+            except Exception as e:
+                logger.error(f"Save completion callback failed (slot {job.slot_index}): {e}")
+        return delivered
+
+    def is_busy(self) -> bool:
+        with self._lock:
+            return bool(self._pending)
+
+    def active_job(self) -> Optional[SaveJob]:
+        """Il salvataggio in lavorazione (o il primo in coda), per la barra di avanzamento."""
+        with self._lock:
+            return self._pending[0] if self._pending else None
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Attende che la coda sia scritta su disco. False se scade il timeout."""
+        deadline = time.monotonic() + timeout
+        while True:
+            job = self.active_job()
+            if job is None:
+                return True
+            if not job.wait(max(0.0, deadline - time.monotonic())):
+                return False
+
+    def shutdown(self, timeout: float = 10.0) -> bool:
+        """Alla chiusura del gioco: i salvataggi accodati vanno comunque completati."""
+        done = self.flush(timeout)
+        self.pump()
+        return done
+
+    # ============== WORKER THREAD ==============
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                try:
+                    job = self._jobs.get_nowait()
+                except queue.Empty:
+                    self._worker = None
+                    return
+
+            def progress(stage: str, fraction: float, job=job):
+                job.stage, job.progress = stage, fraction
+
+            try:
+                if job.write is not None:
+                    result = job.write(job.snapshot, progress)
+                else:
+                    result = self.save_manager.write_save(job.slot_index, job.snapshot, progress)
+            except Exception as e:
+                logger.error(f"Async save failed for slot {job.slot_index}: {e}")
+                result = SaveResult(ok=False, message=f"Save failed: {e}", error=e)
+
+            # Risultato e callback in coda prima di uscire dai pending: flush() + pump() non lo perdono
+            job._finish(result)
+            self._completed.put(job)
+            with self._lock:
+                self._pending.remove(job)
+            self._jobs.task_done()
@@ -0,0 +1,335 @@
+"""
+Autosave - Salvataggio automatico incrementale (snapshot + journal dei delta).
+
+Durante il gioco l'autosave non rifà GameSerializer.to_dict + riscrittura del file a ogni
+evento: accoda una riga al journal (flag, oggetti globali, assi, entità rimosse, posizione)
+e solo ogni tanto compatta tutto in uno snapshot completo.
+
+File nella save_dir:
+- autosave.json: snapshot completo (GameSerializer.to_dict, formato delle impostazioni) con la
+  sezione "autosave": sessione, generazione e inventario globale (non presente nei save manuali)
+- autosave.<gen>.journal: intestazione {"session", "gen"} e poi una riga JSON per delta,
+  dalla presa dello snapshot <gen> in poi
+
+Delta (valori assoluti: rigiocare un delta già contenuto nello snapshot non cambia lo stato):
+    {"op": "flag", "k": nome, "v": valore}        valore None = flag rimosso
+    {"op": "item", "k": item_id, "v": quantità}
+    {"op": "ace", "k": ace_id}
+    {"op": "removed", "k": "room_id:entity_id"}
+    {"op": "pos", "room": room_id, "spawn": spawn_id, "xy": [x, y]}
+    {"op": "checkpoint", "room": room_id}
+
+Compattazione (inizio sessione, stanza checkpoint, ogni compact_every delta): sul main thread si
+prende lo snapshot e si apre il journal della generazione successiva; AsyncSaveService scrive lo
+snapshot sul worker e, a scrittura conclusa, lo stesso worker cancella i journal delle
+generazioni precedenti (il main thread scrive solo nel journal corrente, più recente). Se il gioco si chiude prima, restore() rigioca tutti i journal della
+stessa sessione con generazione >= quella dello snapshot su disco.
+
+Le righe si scrivono con flush (sopravvivono alla chiusura del processo), fsync solo alla
+compattazione. Una riga troncata (crash a metà scrittura) chiude la lettura di quel journal.
+"""
+import json
+import logging
+import os
+import re
+import uuid
+from functools import partial
+from typing import Iterator, Optional
+
+from src.model.save.codec import decode_save
+from src.model.save.constants import CURRENT_SAVE_SCHEMA_VERSION
+from src.model.save.dtos import LoadResult, SaveResult
+from src.model.save.serializer import GameSerializer
+from src.model.save.validator import SaveValidator
+
+logger = logging.getLogger(__name__)
+
+AUTOSAVE_FILENAME = "autosave.json"
+AUTOSAVE_NAME = "Autosave"
+AUTOSAVE_SECTION = "autosave"
+COMPACT_EVERY = 256  # delta nel journal prima di uno snapshot completo
+
+_JOURNAL_RE = re.compile(r"^autosave\.(\d+)\.journal$")
+
+OP_FLAG = "flag"
+OP_ITEM = "item"
+OP_ACE = "ace"
+OP_REMOVED = "removed"
+OP_POSITION = "pos"
+OP_CHECKPOINT = "checkpoint"
+
+
+def journal_filename(generation: int) -> str:
+    return f"autosave.{generation:06d}.journal"
+
+
+class AutosaveJournal:
+    """
+    Autosave di una partita: attach(game) una volta, poi start_session() a ogni nuova partita
+    o caricamento. Flag, oggetti, assi ed entità rimosse arrivano dai listener del Game;
+    posizione e checkpoint li segnala RoomState (record_position, checkpoint).
+    Snapshot e journal stanno nella save_dir del SaveManager del save_service.
+    """
+
+    def __init__(self, save_service, compact_every: int = COMPACT_EVERY):
+        self.save_service = save_service
+        self.compact_every = compact_every
+        self._game = None
+        self._flag_handle: Optional[int] = None
+        self._session: Optional[str] = None  # None = nessuna partita in corso, i delta si ignorano
+        self._generation: Optional[int] = None
+        self._journal = None
+        self._deltas = 0
+        self._change_ops: dict = {}
+
+    @property
+    def save_dir(self) -> str:
+        return self.save_service.save_manager.save_dir
+
+    @property
+    def active(self) -> bool:
+        return self._session is not None
+
+    @property
+    def pending_deltas(self) -> int:
+        """Delta nel journal corrente, non ancora compattati."""
+        return self._deltas
+
+    # ============== SESSIONE ==============
+
+    def attach(self, game):
+        # Import qui: src.model.game importa il pacchetto save
+        from src.model.game import CHANGE_ACE, CHANGE_ITEM, CHANGE_ENTITY_REMOVED
+        self._change_ops = {CHANGE_ITEM: OP_ITEM, CHANGE_ACE: OP_ACE, CHANGE_ENTITY_REMOVED: OP_REMOVED}
+        if self._game is not None:
+            self._game.unsubscribe_flag(self._flag_handle)
+            self._game.remove_change_listener(self._on_change)
+        self._game = game
+        self._flag_handle = game.subscribe_flag(None, self._on_flag)
+        game.add_change_listener(self._on_change)
+
+    def start_session(self):
+        """Nuova partita o partita caricata: lo stato attuale diventa la base dell'autosave."""
+        self._session = None
+        # Ricollega i flag al GameState attuale: le notifiche del cambio partita non sono delta
+        _ = self._game.flag_manager
+        self._session = uuid.uuid4().hex
+        return self.compact()
+
+    def end_session(self):
+        """Chiude il journal (ritorno al menu, uscita). I delta successivi si ignorano."""
+        self._session = None
+        self._close_journal()
+
+    close = end_session
+
+    # ============== DELTA ==============
+
+    def _on_flag(self, name: str, value):
+        self._append({"op": OP_FLAG, "k": name, "v": value})
+
+    def _on_change(self, kind: str, key: str, value):
+        op = self._change_ops.get(kind)
+        if op == OP_ITEM:
+            self._append({"op": op, "k": key, "v": value})
+        elif op is not None:
+            self._append({"op": op, "k": key})
+
+    def record_position(self):
+        """Stanza e posizione del party (ingresso in una stanza)."""
+        if not self.active:
+            return
+        gs = self._game.gamestate
+        self._append({"op": OP_POSITION, "room": gs.current_room_id, "spawn": gs.spawn_id,
+                      "xy": list(gs.party_position)})
+
+    def checkpoint(self):
+        """Stanza checkpoint raggiunta: il delta e poi uno snapshot completo."""
+        if not self.active:
+            return None
+        self._append({"op": OP_CHECKPOINT, "room": self._game.gamestate.checkpoint_room_id}, compact=False)
+        return self.compact()
+
+    def _append(self, delta: dict, compact: bool = True):
+        if self._journal is None:
+            return
+        try:
+            self._journal.write(json.dumps(delta, ensure_ascii=False, separators=(",", ":")) + "\n")
+            self._journal.flush()
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Autosave journal write failed ({delta.get('op')}): {e}")
+            return
+        self._deltas += 1
+        if compact and self._deltas >= self.compact_every:
+            self.compact()
+
+    # ============== COMPATTAZIONE ==============
+
+    def compact(self):
+        """Snapshot completo (scritto sul worker) e nuovo journal. Ritorna il SaveJob o None."""
+        if not self.active:
+            return None
+        game = self._game
+        try:
+            snapshot = GameSerializer.to_dict(game, custom_name=AUTOSAVE_NAME)
+        except Exception as e:
+            logger.error(f"Autosave snapshot failed: {e}")
+            return None
+
+        generation = self._next_generation()
+        snapshot[AUTOSAVE_SECTION] = {
+            "session": self._session,
+            "generation": generation,
+            "inventory_global": dict(game.inventory_global),
+        }
+        if not self._open_journal(generation):
+            return None
+        return self.save_service.submit(snapshot, partial(self._write_snapshot, generation))
+
+    def _write_snapshot(self, generation: int, snapshot: dict, progress) -> SaveResult:
+        # Sul worker: a snapshot <generation> su disco i journal precedenti non servono più
+        result = self.save_service.save_manager.write_snapshot(AUTOSAVE_FILENAME, snapshot, progress, index=False)
+        if not result.ok:
+            logger.warning(f"Autosave snapshot {generation} failed, journal kept: {result.message}")
+            return result
+        for gen, path in self._journal_files():
+            if gen < generation:
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    logger.warning(f"Autosave journal cleanup failed for {path}: {e}")
+        return result
+
+    def _next_generation(self) -> int:
+        if self._generation is None:
+            self._generation = max((gen for gen, _ in self._journal_files()), default=0)
+        self._generation += 1
+        return self._generation
+
+    def _open_journal(self, generation: int) -> bool:
+        self._close_journal()
+        path = os.path.join(self.save_dir, journal_filename(generation))
+        try:
+            os.makedirs(self.save_dir, exist_ok=True)
+            self._journal = open(path, 'w', encoding='utf-8')
+            self._journal.write(json.dumps({"session": self._session, "gen": generation}) + "\n")
+            self._journal.flush()
+        except OSError as e:
+            logger.error(f"Autosave journal unavailable: {e}")
+            self._journal = None
+            return False
+        self._deltas = 0
+        return True
+
+    def _close_journal(self):
+        if self._journal is None:
+            return
+        try:
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+        except OSError:
+            pass
+        finally:
+            self._journal.close()
+            self._journal = None
+
+    def _journal_files(self) -> list:
+        """[(generazione, path)] dei journal nella save_dir, in ordine di generazione."""
+        try:
+            names = os.listdir(self.save_dir)
+        except OSError:
+            return []
+        files = []
+        for name in names:
+            match = _JOURNAL_RE.match(name)
+            if match:
+                files.append((int(match.group(1)), os.path.join(self.save_dir, name)))
+        return sorted(files)
+
+    # ============== RIPRISTINO ==============
+
+    def exists(self) -> bool:
+        return os.path.exists(os.path.join(self.save_dir, AUTOSAVE_FILENAME))
+
+    def restore(self, game) -> LoadResult:
+        """
+        Carica nel modello lo snapshot e rigioca i journal della sua sessione.
+        Non avvia una sessione: il chiamante fa start_session() dopo il cambio di stato.
+        """
+        path = os.path.join(self.save_dir, AUTOSAVE_FILENAME)
+        if not os.path.exists(path):
+            return LoadResult(ok=False, message="No autosave")
+        try:
+            with open(path, 'rb') as f:
+                data = decode_save(f.read())
+            file_version = data.get('schema_version', 0)
+            if file_version > CURRENT_SAVE_SCHEMA_VERSION:
+                return LoadResult(ok=False, message="Save from a newer version - cannot load")
+            if file_version < CURRENT_SAVE_SCHEMA_VERSION:
+                from src.model.migration import migrate_to_current
+                data = migrate_to_current(data)
+            validation = SaveValidator.validate_save_dict(data)
+            if not validation.ok:
+                return LoadResult(ok=False, message="Save file invalid", error=Exception(str(validation.errors)))
+        except Exception as e:
+            return LoadResult(ok=False, message="File corrupted", error=e)
+
+        if not GameSerializer.from_dict(data, game):
+            return LoadResult(ok=False, message="Autosave could not be restored")
+
+        section = data.get(AUTOSAVE_SECTION) or {}
+        inventory = dict(section.get("inventory_global") or {})
+        replayed = 0
+        for delta in self._read_deltas(section.get("session"), section.get("generation", 0)):
+            self._apply(game.gamestate, inventory, delta)
+            replayed += 1
+        # Dizionario nuovo: il FlagManager si ricollega e svuota la memoizzazione
+        game.inventory_global = inventory
+        self._generation = max(self._generation or 0, section.get("generation", 0))
+        logger.info(f"Autosave restored ({replayed} journal deltas)")
+        return LoadResult(ok=True, message="Autosave loaded")
+
+    def _read_deltas(self, session: Optional[str], generation: int) -> Iterator[dict]:
+        for gen, path in self._journal_files():
+            if gen < generation:
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    lines = iter(f)
+                    header = json.loads(next(lines, "{}"))
+                    if header.get("session") != session:
+                        continue  # journal di un'altra partita
+                    for line in lines:
+                        try:
+                            delta = json.loads(line)
+                        except ValueError:
+                            logger.warning(f"Autosave journal {path} truncated, replay stops here")
+                            break
+                        if isinstance(delta, dict):
+                            yield delta
+            except (OSError, ValueError, AttributeError) as e:
+                logger.warning(f"Autosave journal {path} unreadable: {e}")
+
+    @staticmethod
+    def _apply(gs, inventory: dict, delta: dict):
+        op = delta.get("op")
+        if op == OP_FLAG:
+            if delta.get("v") is None:
+                gs.flags.pop(delta.get("k"), None)
+            else:
+                gs.flags[delta["k"]] = delta["v"]
+        elif op == OP_ITEM:
+            inventory[delta["k"]] = delta.get("v", 0)
+        elif op == OP_ACE:
+            if delta["k"] not in gs.aces_collected:
+                gs.aces_collected.append(delta["k"])
+        elif op == OP_REMOVED:
+            if delta["k"] not in gs.removed_entities:
+                gs.removed_entities.append(delta["k"])
+        elif op == OP_POSITION:
+            gs.current_room_id = delta.get("room") or gs.current_room_id
+            gs.spawn_id = delta.get("spawn")
+            gs.party_position = GameSerializer._validate_position(delta.get("xy"))
+        elif op == OP_CHECKPOINT:
+            gs.checkpoint_room_id = delta.get("room")
+        # op sconosciute (journal di una versione successiva): ignorate
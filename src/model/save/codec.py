@@ -0,0 +1,231 @@
+"""
+Save Codec - Codifica dei file di salvataggio su disco.
+
+Due formati, scelti per installazione (SettingsManager.save_format) e riconosciuti
+automaticamente in lettura, così un'installazione legge anche i save dell'altro formato:
+
+- "json": JSON UTF-8 indentato (formato storico, leggibile a mano)
+- "binary": header + payload binario con tag in stile msgpack, opzionalmente zlib
+
+Header binario (little endian, 16 byte):
+    magic b"SKSV" | versione codec (u8) | flag (u8, bit0 = zlib) | riservato (u16)
+    | lunghezza payload (u32) | CRC32 del payload così com'è su disco (u32)
+
+Il contenuto è sempre il dict di GameSerializer.to_dict, con il suo schema_version:
+la migrazione (migrate_to_current) resta a valle della decodifica, uguale per i due formati.
+"""
+import json
+import struct
+import zlib
+from typing import Any
+
+SAVE_FORMAT_JSON = "json"
+SAVE_FORMAT_BINARY = "binary"
+SAVE_FORMATS = (SAVE_FORMAT_JSON, SAVE_FORMAT_BINARY)
+
+BINARY_MAGIC = b"SKSV"
+BINARY_CODEC_VERSION = 1
+FLAG_ZLIB = 0x01
+
+_HEADER = struct.Struct("<4sBBHII")
+
+# Tag dei valori
+_T_NONE = 0xC0
+_T_FALSE = 0xC2
+_T_TRUE = 0xC3
+_T_FLOAT = 0xCB
+_T_INT = 0xD3       # int64
+_T_STR8 = 0xD9
+_T_STR32 = 0xDB
+_T_LIST16 = 0xDC
+_T_LIST32 = 0xDD
+_T_DICT16 = 0xDE
+_T_DICT32 = 0xDF
+_FIXINT_MAX = 0x7F  # 0..127 in un solo byte
+
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+
+class SaveFormatError(ValueError):
+    """File di salvataggio non decodificabile (header, checksum o payload non validi)."""
+
+
+# ============== API ==============
+
+def encode_save(save_dict: dict, save_format: str = SAVE_FORMAT_JSON, compress: bool = False) -> bytes:
+    if save_format == SAVE_FORMAT_JSON:
+        return json.dumps(save_dict, indent=2, ensure_ascii=False).encode("utf-8")
+    if save_format != SAVE_FORMAT_BINARY:
+        raise ValueError(f"Unknown save format: {save_format}")
+
+    out = bytearray()
+    _encode_value(save_dict, out)
+    payload = bytes(out)
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload, 6)
+        flags |= FLAG_ZLIB
+    header = _HEADER.pack(BINARY_MAGIC, BINARY_CODEC_VERSION, flags, 0, len(payload), zlib.crc32(payload))
+    return header + payload
+
+
+def detect_format(raw: bytes) -> str:
+    return SAVE_FORMAT_BINARY if raw[:len(BINARY_MAGIC)] == BINARY_MAGIC else SAVE_FORMAT_JSON
+
+
+def decode_save(raw: bytes) -> dict:
+    """Decodifica un file di salvataggio di qualunque formato. Errori: SaveFormatError."""
+    if detect_format(raw) == SAVE_FORMAT_JSON:
+        try:
+            data = json.loads(raw.decode("utf-8"))
+        except (UnicodeDecodeError, ValueError) as e:
+            raise SaveFormatError(f"Invalid JSON save: {e}") from e
+    else:
+        data = _decode_binary(raw)
+    if not isinstance(data, dict):
+        raise SaveFormatError("Save root is not an object")
+    return data
+
+
+# ============== BINARIO ==============
+
+def _decode_binary(raw: bytes) -> Any:
+    if len(raw) < _HEADER.size:
+        raise SaveFormatError("Truncated save header")
+    _, version, flags, _, length, crc = _HEADER.unpack_from(raw)
+    if version > BINARY_CODEC_VERSION:
+        raise SaveFormatError(f"Save codec version {version} is newer than supported ({BINARY_CODEC_VERSION})")
+    payload = raw[_HEADER.size:]
+    if len(payload) != length:
+        raise SaveFormatError(f"Payload length mismatch ({len(payload)} != {length})")
+    if zlib.crc32(payload) != crc:
+        raise SaveFormatError("Checksum mismatch")
+    if flags & FLAG_ZLIB:
+        try:
+            payload = zlib.decompress(payload)
+        except zlib.error as e:
+            raise SaveFormatError(f"Corrupt compressed payload: {e}") from e
+    try:
+        value, end = _decode_value(payload, 0)
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise SaveFormatError(f"Corrupt payload: {e}") from e
+    if end != len(payload):
+        raise SaveFormatError("Trailing bytes after payload")
+    return value
+
+
+def _encode_key(key) -> str:
+    # Stesse regole di json.dumps per le chiavi non stringa (1 -> "1", True -> "true", None -> "null")
+    if isinstance(key, str):
+        return key
+    if isinstance(key, (int, float, bool)) or key is None:
+        return json.dumps(key)
+    raise TypeError(f"Unsupported save key type: {type(key).__name__}")
+
+
+def _encode_value(value, out: bytearray):
+    if value is None:
+        out.append(_T_NONE)
+    elif value is True:
+        out.append(_T_TRUE)
+    elif value is False:
+        out.append(_T_FALSE)
+    elif isinstance(value, int):
+        if 0 <= value <= _FIXINT_MAX:
+            out.append(value)
+        else:
+            out.append(_T_INT)
+            out += _I64.pack(value)
+    elif isinstance(value, float):
+        out.append(_T_FLOAT)
+        out += _F64.pack(value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        if len(data) <= 0xFF:
+            out.append(_T_STR8)
+            out += _U8.pack(len(data))
+        else:
+            out.append(_T_STR32)
+            out += _U32.pack(len(data))
+        out += data
+    elif isinstance(value, (list, tuple)):
+        if len(value) <= 0xFFFF:
+            out.append(_T_LIST16)
+            out += _U16.pack(len(value))
+        else:
+            out.append(_T_LIST32)
+            out += _U32.pack(len(value))
+        for item in value:
+            _encode_value(item, out)
+    elif isinstance(value, dict):
+        if len(value) <= 0xFFFF:
+            out.append(_T_DICT16)
+            out += _U16.pack(len(value))
+        else:
+            out.append(_T_DICT32)
+            out += _U32.pack(len(value))
+        for key, item in value.items():
+            _encode_value(_encode_key(key), out)
+            _encode_value(item, out)
+    else:
+        raise TypeError(f"Unsupported save value type: {type(value).__name__}")
+
+
+def _decode_value(buf: bytes, pos: int):
+    """Ritorna (valore, posizione successiva). Dispatch sul tag con i casi più frequenti in testa."""
+    tag = buf[pos]
+    pos += 1
+    if tag <= _FIXINT_MAX:
+        return tag, pos
+    if tag == _T_STR8:
+        end = pos + 1 + buf[pos]
+        if end > len(buf):
+            raise IndexError("string past end of payload")
+        return buf[pos + 1:end].decode("utf-8"), end
+    if tag == _T_DICT16 or tag == _T_DICT32:
+        if tag == _T_DICT16:
+            count = _U16.unpack_from(buf, pos)[0]
+            pos += 2
+        else:
+            count = _U32.unpack_from(buf, pos)[0]
+            pos += 4
+        result = {}
+        for _ in range(count):
+            key, pos = _decode_value(buf, pos)
+            if type(key) is not str:
+                raise SaveFormatError("Non-string key in payload")
+            result[key], pos = _decode_value(buf, pos)
+        return result, pos
+    if tag == _T_LIST16 or tag == _T_LIST32:
+        if tag == _T_LIST16:
+            count = _U16.unpack_from(buf, pos)[0]
+            pos += 2
+        else:
+            count = _U32.unpack_from(buf, pos)[0]
+            pos += 4
+        items = [None] * count
+        for i in range(count):
+            items[i], pos = _decode_value(buf, pos)
+        return items, pos
+    if tag == _T_TRUE:
+        return True, pos
+    if tag == _T_FALSE:
+        return False, pos
+    if tag == _T_NONE:
+        return None, pos
+    if tag == _T_INT:
+        return _I64.unpack_from(buf, pos)[0], pos + 8
+    if tag == _T_FLOAT:
+        return _F64.unpack_from(buf, pos)[0], pos + 8
+    if tag == _T_STR32:
+        length = _U32.unpack_from(buf, pos)[0]
+        pos += 4
+        end = pos + length
+        if end > len(buf):
+            raise IndexError("string past end of payload")
+        return buf[pos:end].decode("utf-8"), end
+    raise SaveFormatError(f"Unknown tag 0x{tag:02X} at offset {pos - 1}")
@@ -1,16 +1,37 @@
 """
 Save System Constants and Enums
 Epic 5: User Stories 16, 17, 18, 19
+Updated: slots without a fixed limit (MAX_SLOTS = None), page size and sort modes of the slot browser.
 """
 
 import os
+import re
 from enum import Enum
+from typing import Optional
 
 # ============== PATHS & LIMITS ==============
 SAVE_DIR = "./saves"
-MAX_SLOTS = 3
+MAX_SLOTS = None  # Nessun limite: gli slot sono i file slot_NN.json presenti (int = slot fissi 1..N)
+SLOTS_PER_PAGE = 3
 CURRENT_SAVE_SCHEMA_VERSION = 1
 
+# Fasi di un salvataggio (AsyncSaveService / SaveManager.write_save), per la UI
+SAVE_STAGE_QUEUED = "queued"
+SAVE_STAGE_BACKUP = "backup"
+SAVE_STAGE_ENCODE = "encode"
+SAVE_STAGE_WRITE = "write"
+SAVE_STAGE_COMMIT = "commit"
+SAVE_STAGE_DONE = "done"
+SAVE_STAGE_FAILED = "failed"
+
+# Ordinamenti del browser degli slot (SaveManager.list_page)
+SORT_TIME = "time"      # più recenti prima
+SORT_REGION = "region"  # per regione della stanza, poi più recenti
+SORT_ACES = "aces"      # più assi prima, poi più recenti
+SLOT_SORT_MODES = (SORT_TIME, SORT_REGION, SORT_ACES)
+
+_SLOT_FILENAME_RE = re.compile(r"^slot_(\d+)\.json$")
+
 
 # ============== HELPER FUNCTIONS ==============
 def get_slot_filename(slot_index: int) -> str:
@@ -18,6 +39,12 @@ def get_slot_filename(slot_index: int) -> str:
     return f"slot_{slot_index:02d}.json"
 
 
+def parse_slot_filename(filename: str) -> Optional[int]:
+    """Indice dello slot dal nome del file (inverso di get_slot_filename), None se non è uno slot."""
+    match = _SLOT_FILENAME_RE.match(filename)
+    return int(match.group(1)) if match else None
+
+
 def get_slot_filepath(slot_index: int) -> str:
     """Generate full path for a slot."""
     return os.path.join(SAVE_DIR, get_slot_filename(slot_index))
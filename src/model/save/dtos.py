@@ -2,6 +2,7 @@
 Save System Data Transfer Objects
 Epic 5: User Stories 16, 17, 18, 19
 Updated: Added custom_name support.
+Updated: SlotPage (one page of the slot browser).
 """
 
 from dataclasses import dataclass, field, asdict
@@ -73,6 +74,16 @@ class SlotInfo:
         return f"Slot {self.slot_index}: Unknown"
 
 
+@dataclass
+class SlotPage:
+    """Una pagina del browser degli slot: solo questi SlotInfo hanno i metadati caricati."""
+    slots: List[SlotInfo]
+    page: int = 0
+    page_count: int = 1
+    total: int = 0
+    sort_by: str = "time"
+
+
 # ============== GAME DATA DTOs ==============
 @dataclass
 class WorldDTO:
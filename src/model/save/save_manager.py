@@ -1,27 +1,49 @@
 """
 Save Manager - File I/O for Save/Load (Merged: Amelia Structure + Sicily Atomic Writes)
+Updated: save_to_slot split into snapshot (GameSerializer.to_dict) + write_save, which the
+         AsyncSaveService runs on a worker thread. Writes are fsynced before the atomic rename.
+Updated: list_slots reads metadata from the sidecar SlotIndex (checked against mtime/size);
+         slot files are parsed only when unindexed or changed, full validation happens on load.
+Updated: save_format/compress select the on-disk encoding (codec: JSON or binary + zlib);
+         reads auto-detect the format, migration runs after decoding as before.
+Updated: write_snapshot (any file in save_dir, e.g. the autosave) split out of write_save.
+Updated: no fixed slot count by default (max_slots=None): slots are the slot_NN.json files
+         in save_dir. list_page sorts the index entries and reads/validates only the
+         visible page; next_free_slot picks the number for a new save.
+Updated: list_page stats every slot before sorting and re-reads the unindexed or changed
+         ones (copied file, restored backup), so the global order never uses stale metadata.
 """
 import os
 import json
 import shutil
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from src.model.save.constants import (
     SAVE_DIR, MAX_SLOTS, CURRENT_SAVE_SCHEMA_VERSION,
-    get_slot_filename, SlotStatus
+    get_slot_filename, parse_slot_filename, SlotStatus,
+    SLOTS_PER_PAGE, SORT_TIME, SORT_REGION, SORT_ACES,
+    SAVE_STAGE_BACKUP, SAVE_STAGE_ENCODE, SAVE_STAGE_WRITE, SAVE_STAGE_COMMIT, SAVE_STAGE_DONE
 )
 from src.model.save.dtos import (
-    SlotInfo, SaveMeta, SaveFileDTO,
+    SlotInfo, SlotPage, SaveMeta, SaveFileDTO,
     SaveResult, LoadResult
 )
 from src.model.save.validator import SaveValidator
 from src.model.save.serializer import GameSerializer
+from src.model.save.slot_index import SlotIndex, file_signature
+from src.model.save.codec import SAVE_FORMAT_JSON, SAVE_FORMATS, encode_save, decode_save
+from src.model.content.registry import region_of
 
 class SaveManager:
-    def __init__(self, save_dir: str = SAVE_DIR, max_slots: int = MAX_SLOTS):
+    def __init__(self, save_dir: str = SAVE_DIR, max_slots: Optional[int] = MAX_SLOTS,
+                 save_format: str = SAVE_FORMAT_JSON, compress: bool = False):
         self.save_dir = save_dir
         self.max_slots = max_slots
+        # Formato di scrittura (per installazione); in lettura il formato si riconosce dal file
+        self.save_format = save_format if save_format in SAVE_FORMATS else SAVE_FORMAT_JSON
+        self.compress = bool(compress)
         self._error_log: List[str] = []
+        self._index = SlotIndex(save_dir)
     
     def _get_slot_path(self, slot_index: int) -> str:
         return os.path.join(self.save_dir, get_slot_filename(slot_index))
@@ -34,39 +56,187 @@ class SaveManager:
         print(log_entry)
 
     def list_slots(self) -> List[SlotInfo]:
+        """
+        Stato e metadati degli slot: dall'indice se il file non è cambiato, altrimenti rilegge lo slot.
+        Con max_slots gli slot 1..max_slots (anche vuoti), senza limite solo quelli salvati.
+        Per i menu usare list_page, che legge solo la pagina visibile.
+        """
+        if self.max_slots is None:
+            indexes = sorted(self._saved_slots())
+        else:
+            indexes = range(1, self.max_slots + 1)
+        return self._slot_infos(indexes)
+
+    def slot_info(self, slot_index: int) -> SlotInfo:
+        return self._slot_infos([slot_index])[0]
+
+    def list_page(self, page: int = 0, page_size: int = SLOTS_PER_PAGE, sort_by: str = SORT_TIME) -> SlotPage:
+        """
+        Una pagina degli slot salvati, ordinata con i metadati dell'indice.
+        Prima di ordinare si controlla la firma (stat) di ogni slot: quelli non indicizzati o
+        cambiati fuori dal gioco (file copiati, backup ripristinati) si rileggono subito,
+        altrimenti finirebbero nella pagina sbagliata. Gli slot invariati non si leggono.
+        """
+        saved = self._saved_slots()
+        self._refresh_index(saved)
+        entries = self._index.entries()
+        order = self._sort_slots(saved, entries, sort_by)
+        page_size = max(1, page_size)
+        page_count = max(1, -(-len(order) // page_size))
+        page = min(max(0, page), page_count - 1)
+        visible = order[page * page_size:(page + 1) * page_size]
+        slots = [self._info_from_entry(i, entries.get(saved[i])) for i in visible]
+        return SlotPage(slots=slots, page=page, page_count=page_count,
+                        total=len(order), sort_by=sort_by)
+
+    def next_free_slot(self) -> Optional[int]:
+        """Primo numero di slot libero per un nuovo salvataggio (None se gli slot fissi sono pieni)."""
+        saved = self._saved_slots()
+        slot_index = 1
+        while slot_index in saved:
+            slot_index += 1
+        return slot_index if self.is_valid_slot(slot_index) else None
+
+    def _saved_slots(self) -> Dict[int, str]:
+        """{indice: nome file} degli slot presenti nella save_dir (solo l'elenco della directory)."""
+        try:
+            names = os.listdir(self.save_dir)
+        except OSError:
+            return {}
+        saved = {}
+        for name in names:
+            slot_index = parse_slot_filename(name)
+            if slot_index is not None and self.is_valid_slot(slot_index):
+                saved[slot_index] = name
+        return saved
+
+    def _refresh_index(self, saved: Dict[int, str]):
+        """
+        Allinea l'indice agli slot su disco: rilegge solo quelli con voce mancante o firma diversa.
+        Toglie da `saved` gli slot spariti nel frattempo.
+        """
+        dirty = False
+        for slot_index, filename in list(saved.items()):
+            signature = file_signature(os.path.join(self.save_dir, filename))
+            if signature is None:
+                del saved[slot_index]
+            elif self._index.lookup(filename, signature) is None:
+                info = self._scan_slot(slot_index)
+                meta = info.meta.to_dict() if info.meta else None
+                self._index.update(filename, signature, info.status, meta, write=False)
+                dirty = True
+        if dirty:
+            self._index.flush()
+
+    @staticmethod
+    def _sort_slots(saved: Dict[int, str], entries: Dict[str, dict], sort_by: str) -> List[int]:
+        """Ordine degli slot dai metadati indicizzati; slot non indicizzati o corrotti in fondo."""
+        def meta(slot_index) -> dict:
+            entry = entries.get(saved[slot_index])
+            if entry and entry.get('status') == SlotStatus.OK.value and entry.get('meta'):
+                return entry['meta']
+            return {}
+
+        # Sort stabili: a parità di chiave resta l'ordine precedente (più recenti prima)
+        order = sorted(saved)
+        order.sort(key=lambda i: meta(i).get('timestamp_iso', ''), reverse=True)
+        if sort_by == SORT_REGION:
+            order.sort(key=lambda i: (not meta(i), region_of(meta(i).get('room_id', ''))))
+        elif sort_by == SORT_ACES:
+            order.sort(key=lambda i: meta(i).get('aces_count', -1), reverse=True)
+        return order
+
+    def _slot_infos(self, indexes) -> List[SlotInfo]:
         slots = []
-        for i in range(1, self.max_slots + 1):
-            filepath = self._get_slot_path(i)
-            if not os.path.exists(filepath):
-                slots.append(SlotInfo(slot_index=i, status=SlotStatus.EMPTY))
-                continue
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                validation = SaveValidator.validate_save_dict(data)
-                if validation.ok:
-                    meta = SaveMeta.from_dict(data.get('meta', {}))
-                    slots.append(SlotInfo(slot_index=i, status=SlotStatus.OK, meta=meta))
-                else:
-                    slots.append(SlotInfo(slot_index=i, status=SlotStatus.CORRUPT))
-            except Exception as e:
-                self._log_error(f"Error reading slot {i}", e)
-                slots.append(SlotInfo(slot_index=i, status=SlotStatus.CORRUPT))
+        dirty = False
+        for i in indexes:
+            info, changed = self._indexed_slot_info(i)
+            slots.append(info)
+            dirty = dirty or changed
+        if dirty:
+            self._index.flush()
         return slots
 
+    def _indexed_slot_info(self, slot_index: int) -> Tuple[SlotInfo, bool]:
+        """SlotInfo dall'indice se la firma coincide, altrimenti dal file. True se l'indice è cambiato."""
+        filename = get_slot_filename(slot_index)
+        signature = file_signature(self._get_slot_path(slot_index))
+        if signature is None:
+            return SlotInfo(slot_index=slot_index, status=SlotStatus.EMPTY), False
+        entry = self._index.lookup(filename, signature)
+        if entry is None:
+            info = self._scan_slot(slot_index)
+            meta = info.meta.to_dict() if info.meta else None
+            self._index.update(filename, signature, info.status, meta, write=False)
+            return info, True
+        return self._info_from_entry(slot_index, entry), False
+
+    @staticmethod
+    def _info_from_entry(slot_index: int, entry: Optional[dict]) -> SlotInfo:
+        if entry is None:
+            return SlotInfo(slot_index=slot_index, status=SlotStatus.EMPTY)
+        if entry.get('status') == SlotStatus.OK.value and entry.get('meta') is not None:
+            return SlotInfo(slot_index=slot_index, status=SlotStatus.OK, meta=SaveMeta.from_dict(entry['meta']))
+        return SlotInfo(slot_index=slot_index, status=SlotStatus.CORRUPT)
+
+    def _scan_slot(self, slot_index: int) -> SlotInfo:
+        """Lettura completa di uno slot non indicizzato (o modificato fuori dal gioco)."""
+        filepath = self._get_slot_path(slot_index)
+        try:
+            data = self._read_save_file(filepath)
+            validation = SaveValidator.validate_save_dict(data)
+            if validation.ok:
+                meta = SaveMeta.from_dict(data.get('meta', {}))
+                return SlotInfo(slot_index=slot_index, status=SlotStatus.OK, meta=meta)
+            return SlotInfo(slot_index=slot_index, status=SlotStatus.CORRUPT)
+        except Exception as e:
+            self._log_error(f"Error reading slot {slot_index}", e)
+            return SlotInfo(slot_index=slot_index, status=SlotStatus.CORRUPT)
+
     def is_slot_occupied(self, slot_index: int) -> bool:
-        if not 1 <= slot_index <= self.max_slots: return False
+        if not self.is_valid_slot(slot_index): return False
         return os.path.exists(self._get_slot_path(slot_index))
 
+    def is_valid_slot(self, slot_index: int) -> bool:
+        return slot_index >= 1 and (self.max_slots is None or slot_index <= self.max_slots)
+
     def save_to_slot(self, slot_index: int, game_model, force_overwrite: bool = False, custom_name: str = "") -> SaveResult:
         """
         Salva il gioco usando scrittura atomica e backup (Sicily Logic).
         Accepts custom_name to name the save.
+        Sincrono: dal gioco si passa per AsyncSaveService, che fa solo lo snapshot sul main thread.
         """
-        if not 1 <= slot_index <= self.max_slots:
+        if not self.is_valid_slot(slot_index):
             return SaveResult(ok=False, message=f"Invalid slot index: {slot_index}")
-        
-        final_path = self._get_slot_path(slot_index)
+
+        # Serializzazione (Amelia Feature) - PASSING NAME
+        try:
+            save_dict = GameSerializer.to_dict(game_model, custom_name=custom_name)
+        except Exception as e:
+            self._log_error(f"Critical save error slot {slot_index}", e)
+            return SaveResult(ok=False, message=f"Save failed: {e}", error=e)
+        return self.write_save(slot_index, save_dict)
+
+    def write_save(self, slot_index: int, save_dict: dict,
+                   progress: Optional[Callable[[str, float], None]] = None) -> SaveResult:
+        """
+        Scrive uno snapshot già serializzato (GameSerializer.to_dict) nello slot: vedi write_snapshot.
+        Non tocca il modello di gioco, quindi può girare su un worker thread.
+        """
+        if not self.is_valid_slot(slot_index):
+            return SaveResult(ok=False, message=f"Invalid slot index: {slot_index}")
+        return self.write_snapshot(get_slot_filename(slot_index), save_dict, progress)
+
+    def write_snapshot(self, filename: str, save_dict: dict,
+                       progress: Optional[Callable[[str, float], None]] = None,
+                       index: bool = True) -> SaveResult:
+        """
+        Scrive un file di salvataggio nella save_dir: backup del file precedente, codifica,
+        scrittura su .tmp con fsync e rename atomico. progress(stage, fraction) riceve
+        l'avanzamento; index=False per i file che non sono slot (autosave).
+        """
+        report = progress or (lambda stage, fraction: None)
+        final_path = os.path.join(self.save_dir, filename)
         temp_path = final_path + ".tmp"
         bak_path = final_path + ".bak"
 
@@ -74,35 +244,60 @@ class SaveManager:
             os.makedirs(self.save_dir, exist_ok=True)
             
             # 1. Creazione Backup se esiste un save precedente (Sicily Feature)
+            report(SAVE_STAGE_BACKUP, 0.1)
             if os.path.exists(final_path):
                 try:
                     shutil.copy2(final_path, bak_path)
                 except Exception as e:
-                    self._log_error(f"Backup creation failed for slot {slot_index}", e)
+                    self._log_error(f"Backup creation failed for {filename}", e)
 
-            # 2. Serializzazione (Amelia Feature) - PASSING NAME
-            save_dict = GameSerializer.to_dict(game_model, custom_name=custom_name)
+            # 2. Codifica
+            report(SAVE_STAGE_ENCODE, 0.3)
+            payload = encode_save(save_dict, self.save_format, self.compress)
             
-            # 3. Scrittura Atomica (Sicily Feature)
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(save_dict, f, indent=2, ensure_ascii=False)
+            # 3. Scrittura Atomica (Sicily Feature): il .tmp è su disco prima del rename
+            report(SAVE_STAGE_WRITE, 0.6)
+            with open(temp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
             
             # Sostituzione finale
+            report(SAVE_STAGE_COMMIT, 0.9)
             os.replace(temp_path, final_path)
-            
+            self._fsync_dir()
+
+            # Metadati per list_slots, legati a mtime/size del file appena scritto
+            if index:
+                self._index.update(filename, file_signature(final_path), SlotStatus.OK, save_dict.get('meta'))
+
+            report(SAVE_STAGE_DONE, 1.0)
             return SaveResult(ok=True, message="Game saved successfully")
         
         except Exception as e:
-            self._log_error(f"Critical save error slot {slot_index}", e)
+            self._log_error(f"Critical save error {filename}", e)
             # Pulizia file temporaneo
             if os.path.exists(temp_path):
                 try: os.remove(temp_path)
                 except: pass
             return SaveResult(ok=False, message=f"Save failed: {e}", error=e)
 
+    def _fsync_dir(self):
+        """Rende persistente il rename (POSIX); dove non si può aprire una directory si ignora."""
+        try:
+            fd = os.open(self.save_dir, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
     def load_from_slot(self, slot_index: int) -> LoadResult:
         """Carica il gioco, con fallback al backup se il principale è corrotto (Sicily Logic)."""
-        if not 1 <= slot_index <= self.max_slots:
+        if not self.is_valid_slot(slot_index):
             return LoadResult(ok=False, message=f"Invalid slot index: {slot_index}")
         
         filepath = self._get_slot_path(slot_index)
@@ -112,6 +307,11 @@ class SaveManager:
         load_res = self._try_load_file(filepath, slot_index)
         if load_res.ok:
             return load_res
+
+        # La validazione completa avviene qui: l'indice non deve più mostrarlo come valido
+        signature = file_signature(filepath)
+        if signature is not None:
+            self._index.update(get_slot_filename(slot_index), signature, SlotStatus.CORRUPT)
             
         # Tentativo 2: Carica backup (Sicily Feature)
         if os.path.exists(bak_path):
@@ -123,13 +323,18 @@ class SaveManager:
                 
         return load_res # Ritorna l'errore originale se fallisce anche il backup
 
+    @staticmethod
+    def _read_save_file(path: str) -> dict:
+        """Legge e decodifica un file di salvataggio (JSON o binario, riconosciuto dal contenuto)."""
+        with open(path, 'rb') as f:
+            return decode_save(f.read())
+
     def _try_load_file(self, path: str, slot_index: int) -> LoadResult:
         if not os.path.exists(path):
             return LoadResult(ok=False, message="Empty slot")
         
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self._read_save_file(path)
             
             # Version Check & Migration
             file_version = data.get('schema_version', 0)
@@ -156,6 +361,7 @@ class SaveManager:
         try:
             if os.path.exists(filepath): os.remove(filepath)
             if os.path.exists(bak_path): os.remove(bak_path)
+            self._index.drop(get_slot_filename(slot_index))
             return SaveResult(ok=True, message="Deleted")
         except Exception as e:
             return SaveResult(ok=False, message=str(e))
@@ -0,0 +1,106 @@
+"""
+Slot Index - Indice dei metadati dei salvataggi (file accanto agli slot).
+
+Per ogni file di salvataggio l'indice tiene stato (ok/corrupt), metadati (SaveMeta) e
+la firma del file (st_mtime_ns, st_size) al momento dell'indicizzazione. Una voce è
+valida solo se la firma coincide con il file su disco: se il file è stato toccato da
+altro (copia manuale, save_atomic, backup ripristinato) la voce si ignora e lo slot
+viene riletto una volta.
+
+L'indice è una cache: se manca o è illeggibile si ricostruisce, non è mai la fonte
+di verità. Il browser degli slot ordina su tutte le voci e verifica le firme solo
+della pagina visibile. Viene riscritto con tmp + os.replace; SaveManager.write_save lo aggiorna
+dal worker del salvataggio, quindi gli accessi sono protetti da un lock.
+"""
+import json
+import logging
+import os
+import threading
+from typing import Dict, Optional
+
+from src.model.save.constants import SlotStatus
+
+logger = logging.getLogger(__name__)
+
+SLOT_INDEX_FILENAME = "slots_index.json"
+SLOT_INDEX_VERSION = 1
+
+
+def file_signature(path: str) -> Optional[tuple]:
+    """(mtime_ns, size) del file, None se non esiste."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class SlotIndex:
+    """Voci per nome del file di salvataggio: {"sig": [mtime_ns, size], "status": ..., "meta": {...}}."""
+
+    def __init__(self, save_dir: str):
+        self.path = os.path.join(save_dir, SLOT_INDEX_FILENAME)
+        self._entries: Optional[Dict[str, dict]] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self) -> Dict[str, dict]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == SLOT_INDEX_VERSION and isinstance(data.get('slots'), dict):
+                    self._entries = data['slots']
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, AttributeError) as e:
+                logger.warning(f"Slot index unreadable, rebuilding: {e}")
+        return self._entries
+
+    def lookup(self, filename: str, signature: Optional[tuple]) -> Optional[dict]:
+        """Voce valida per il file con questa firma, altrimenti None."""
+        if signature is None:
+            return None
+        with self._lock:
+            entry = self._ensure_loaded().get(filename)
+        if entry is None or tuple(entry.get('sig', ())) != signature:
+            return None
+        return entry
+
+    def entries(self) -> Dict[str, dict]:
+        """Tutte le voci, senza controllare le firme (SaveManager.list_page le verifica prima)."""
+        with self._lock:
+            return dict(self._ensure_loaded())
+
+    def update(self, filename: str, signature: Optional[tuple], status: SlotStatus,
+               meta: Optional[dict] = None, write: bool = True):
+        with self._lock:
+            entries = self._ensure_loaded()
+            if signature is None:
+                entries.pop(filename, None)
+            else:
+                entries[filename] = {'sig': list(signature), 'status': status.value, 'meta': meta}
+            if write:
+                self._write_locked()
+
+    def drop(self, filename: str, write: bool = True):
+        with self._lock:
+            removed = self._ensure_loaded().pop(filename, None) is not None
+            if removed and write:
+                self._write_locked()
+
+    def flush(self):
+        with self._lock:
+            if self._entries is not None:
+                self._write_locked()
+
+    def _write_locked(self):
+        temp_path = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': SLOT_INDEX_VERSION, 'slots': self._entries}, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            # Solo una cache: al prossimo list_slots gli slot si rileggono
+            logger.warning(f"Slot index write failed: {e}")
@@ -0,0 +1,199 @@
+"""
+Script Compiler - Compila la tabella degli script (data/scripts/*.json) in factory per id.
+
+Formato di una voce di "scripts":
+- "name": script_id del GameScript prodotto (default: l'id della voce)
+- "call" + "args": metodo del modello da chiamare prima (es. "aurion.make_choice", [0]);
+  il valore ritornato è disponibile come {result} nei testi e nelle condizioni "result"
+- "actions": azioni comuni, seguite da quelle del ramo scelto
+- "branches": rami valutati in ordine, vince il primo con "when" vero (o senza "when").
+  "when" è una condizione del FlagManager, oppure {"type": "result", "key": ..., "value": ...}.
+  "set_flags" imposta i flag subito, quando il ramo viene scelto.
+
+Azioni: ["Speaker", "testo"] è un dialogo; {"factory": argomenti} chiama la factory omonima
+di ScriptAction (es. {"change_room": ["hub", "bottom"]}, {"change_state": "SCOPA"}).
+Nei parametri testuali sono ammessi {player}, {aces}, {missing_aces} e {result}.
+
+Le azioni senza segnaposto vengono create una volta sola e riusate a ogni chiamata.
+"""
+import re
+from dataclasses import dataclass
+from string import Formatter
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from src.model.content.validators import ValidationError
+from src.model.script_actions import GameScript, ScriptAction
+from src.model.states.base_state import StateID
+
+TEMPLATE_FIELDS = frozenset({"player", "aces", "missing_aces", "result"})
+DEFAULT_PLAYER_NAME = "Turiddu"
+TOTAL_ACES = 4
+
+# Factory di ScriptAction utilizzabili dai file dati
+ACTION_FACTORIES = frozenset({
+    "show_dialogue", "show_choice", "wait", "fade_in", "fade_out",
+    "set_flag", "clear_flag", "give_item", "consume_item", "give_ace", "set_checkpoint",
+    "remove_entity", "change_room", "change_state", "start_combat", "recruit_guest",
+})
+
+_formatter = Formatter()
+
+
+def _template_fields(text: str) -> set:
+    """Nomi radice dei segnaposto di un testo ('result[msg]' -> 'result')."""
+    return {re.split(r"[.\[]", field)[0] for _, field, _, _ in _formatter.parse(text) if field is not None}
+
+
+@dataclass(frozen=True)
+class ActionTemplate:
+    action: ScriptAction
+    templated: Tuple[str, ...] = ()  # chiavi dei params con segnaposto
+
+    def build(self, context: dict) -> ScriptAction:
+        if not self.templated:
+            return self.action
+        params = dict(self.action.params)
+        for key in self.templated:
+            params[key] = params[key].format(**context)
+        return ScriptAction(self.action.action_type, params, self.action.blocking, self.action.cross_state)
+
+
+@dataclass(frozen=True)
+class ScriptBranch:
+    name: str
+    when: Optional[dict]
+    set_flags: Tuple[str, ...]
+    actions: Tuple[ActionTemplate, ...]
+    templated: bool
+
+
+class CompiledScript:
+    """Factory di un id di script: game_model -> GameScript."""
+
+    def __init__(self, script_id: str, branches: Iterable[ScriptBranch],
+                 call: Optional[str] = None, args: Tuple = ()):
+        self.script_id = script_id
+        self.branches = tuple(branches)
+        self.call = call
+        self.args = tuple(args)
+
+    def __call__(self, game_model) -> GameScript:
+        result = None
+        if self.call:
+            target = game_model
+            for attr in self.call.split("."):
+                target = getattr(target, attr)
+            result = target(*self.args)
+
+        for branch in self.branches:
+            if branch.when is None or self._check(branch.when, game_model, result):
+                break
+        else:
+            return GameScript("noop", [])
+
+        for flag in branch.set_flags:
+            game_model.set_flag(flag, True)
+
+        if not branch.templated:
+            return GameScript(branch.name, [t.action for t in branch.actions])
+        context = self._context(game_model, result)
+        return GameScript(branch.name, [t.build(context) for t in branch.actions])
+
+    @staticmethod
+    def _check(condition: dict, game_model, result) -> bool:
+        if condition.get("type") == "result":
+            return isinstance(result, dict) and result.get(condition.get("key")) == condition.get("value")
+        return game_model.evaluate_condition(condition)
+
+    @staticmethod
+    def _context(game_model, result) -> dict:
+        player = game_model.gamestate.get_active_player()
+        aces = game_model.get_ace_count()
+        return {
+            "player": player.name if player else DEFAULT_PLAYER_NAME,
+            "aces": aces,
+            "missing_aces": TOTAL_ACES - aces,
+            "result": result,
+        }
+
+
+# ============== COMPILAZIONE ==============
+
+def compile_action(spec, where: str) -> ActionTemplate:
+    if isinstance(spec, list) and len(spec) == 2 and all(isinstance(x, str) for x in spec):
+        action = ScriptAction.show_dialogue(*spec)
+    elif isinstance(spec, dict) and len(spec) == 1:
+        (factory_name, args), = spec.items()
+        if factory_name not in ACTION_FACTORIES:
+            raise ValidationError(f"{where}: unknown action '{factory_name}'")
+        if isinstance(args, dict):
+            args, kwargs = [], args
+        else:
+            args, kwargs = (list(args) if isinstance(args, list) else [args]), {}
+        if factory_name == "change_state":
+            args = [_state_id(args[0], where)] + args[1:] if args else args
+            if "state_id" in kwargs:
+                kwargs["state_id"] = _state_id(kwargs["state_id"], where)
+        try:
+            action = getattr(ScriptAction, factory_name)(*args, **kwargs)
+        except TypeError as e:
+            raise ValidationError(f"{where}: bad arguments for '{factory_name}': {e}") from e
+    else:
+        raise ValidationError(f"{where}: invalid action {spec!r}")
+
+    templated = []
+    for key, value in action.params.items():
+        if not isinstance(value, str):
+            continue
+        try:
+            fields = _template_fields(value)
+        except ValueError as e:
+            raise ValidationError(f"{where}: bad placeholder in {value!r}: {e}") from e
+        unknown = fields - TEMPLATE_FIELDS
+        if unknown:
+            raise ValidationError(f"{where}: unknown placeholder(s) {sorted(unknown)} in {value!r}")
+        if fields:
+            templated.append(key)
+    return ActionTemplate(action, tuple(templated))
+
+
+def _state_id(name, where: str) -> StateID:
+    try:
+        return StateID[name]
+    except KeyError:
+        raise ValidationError(f"{where}: unknown state '{name}'") from None
+
+
+def compile_script(script_id: str, entry: dict, where: str = "") -> CompiledScript:
+    where = f"{where}{script_id}"
+    if not isinstance(entry, dict):
+        raise ValidationError(f"{where}: script entry must be a dict")
+
+    common = [compile_action(a, f"{where}.actions") for a in entry.get("actions", [])]
+    default_name = entry.get("name", script_id)
+    raw_branches = entry.get("branches") or [{}]
+
+    branches = []
+    for i, raw in enumerate(raw_branches):
+        actions = common + [compile_action(a, f"{where}.branches[{i}]") for a in raw.get("actions", [])]
+        branches.append(ScriptBranch(
+            name=raw.get("name", default_name),
+            when=raw.get("when"),
+            set_flags=tuple(raw.get("set_flags", ())),
+            actions=tuple(actions),
+            templated=any(a.templated for a in actions),
+        ))
+    return CompiledScript(script_id, branches, entry.get("call"), tuple(entry.get("args", ())))
+
+
+def compile_script_table(files: Iterable[dict]) -> Dict[str, CompiledScript]:
+    """Compila i file di script (già validati) in un dict id -> CompiledScript."""
+    table: Dict[str, CompiledScript] = {}
+    origin: Dict[str, Any] = {}
+    for data in files:
+        for script_id, entry in data["scripts"].items():
+            if script_id in table:
+                raise ValidationError(f"duplicate script id '{script_id}' in {data['id']} (also in {origin[script_id]})")
+            table[script_id] = compile_script(script_id, entry, f"{data['id']}:")
+            origin[script_id] = data["id"]
+    return table
@@ -5,6 +5,7 @@ from dataclasses import asdict
 from typing import Optional
 
 from src.model.settings.audio_settings import AudioSettings
+from src.model.save.codec import SAVE_FORMATS, SAVE_FORMAT_JSON
 
 
 def _clamp01(x: float) -> float:
@@ -19,6 +20,52 @@ def _clamp01(x: float) -> float:
     return x
 
 
+DEFAULT_ASSET_CACHE_MB = 128
+MIN_ASSET_CACHE_MB = 16
+
+
+def _clamp_cache_mb(x) -> int:
+    try:
+        x = int(x)
+    except Exception:
+        return DEFAULT_ASSET_CACHE_MB
+    return max(MIN_ASSET_CACHE_MB, x)
+
+
+# Loop di gioco: simulazione a passo fisso (Hz), cap del render (0 = illimitato), passi max per frame
+DEFAULT_SIM_HZ = 60
+DEFAULT_RENDER_FPS_CAP = 60
+DEFAULT_MAX_SIM_STEPS = 5
+
+
+def _clamp_int(x, default: int, lo: int, hi: int) -> int:
+    try:
+        x = int(x)
+    except Exception:
+        return default
+    return max(lo, min(hi, x))
+
+
+def _clamp_sim_hz(x) -> int:
+    return _clamp_int(x, DEFAULT_SIM_HZ, 10, 240)
+
+
+def _clamp_render_fps_cap(x) -> int:
+    return _clamp_int(x, DEFAULT_RENDER_FPS_CAP, 0, 1000)
+
+
+def _clamp_max_sim_steps(x) -> int:
+    return _clamp_int(x, DEFAULT_MAX_SIM_STEPS, 1, 20)
+
+
+# Formato dei file di salvataggio (vedi src/model/save/codec.py)
+DEFAULT_SAVE_FORMAT = SAVE_FORMAT_JSON
+
+
+def _valid_save_format(x) -> str:
+    return x if x in SAVE_FORMATS else DEFAULT_SAVE_FORMAT
+
+
 class SettingsManager:
     """
     Settings unificati (Epic 29 US118 + Epic 10/US38 audio):
@@ -29,7 +76,10 @@ class SettingsManager:
         "volume": 0.3,
         "fullscreen": false,
         "keybinds": {...},
-        "audio": {"master": 0.3, "music": 1.0, "sfx": 1.0}
+        "audio": {"master": 0.3, "music": 1.0, "sfx": 1.0},
+        "asset_cache_mb": 128,
+        "sim_hz": 60, "render_fps_cap": 60, "max_sim_steps": 5,
+        "save_format": "json", "save_compress": false
       }
     """
 
@@ -45,6 +95,18 @@ class SettingsManager:
         # Audio channels (US38)
         self.audio = {"master": 1.0, "music": 1.0, "sfx": 1.0}
 
+        # Budget della cache immagini dell'AssetManager (MB)
+        self.asset_cache_mb = DEFAULT_ASSET_CACHE_MB
+
+        # Game loop (FixedTimestepLoop): render_fps_cap = 0 => render non limitato
+        self.sim_hz = DEFAULT_SIM_HZ
+        self.render_fps_cap = DEFAULT_RENDER_FPS_CAP
+        self.max_sim_steps = DEFAULT_MAX_SIM_STEPS
+
+        # Salvataggi: "json" (leggibile) o "binary" (compatto), opzionalmente compresso
+        self.save_format = DEFAULT_SAVE_FORMAT
+        self.save_compress = False
+
     # -----------------------
     # Epic29 persistence API
     # -----------------------
@@ -71,12 +133,24 @@ class SettingsManager:
 
         self.fullscreen = bool(data.get("fullscreen", self.fullscreen))
         self.keybinds = dict(data.get("keybinds", self.keybinds))
+        self.asset_cache_mb = _clamp_cache_mb(data.get("asset_cache_mb", self.asset_cache_mb))
+        self.sim_hz = _clamp_sim_hz(data.get("sim_hz", self.sim_hz))
+        self.render_fps_cap = _clamp_render_fps_cap(data.get("render_fps_cap", self.render_fps_cap))
+        self.max_sim_steps = _clamp_max_sim_steps(data.get("max_sim_steps", self.max_sim_steps))
+        self.save_format = _valid_save_format(data.get("save_format", self.save_format))
+        self.save_compress = bool(data.get("save_compress", self.save_compress))
 
     def save(self) -> None:
         data = {
             "volume": _clamp01(self.volume),
             "fullscreen": bool(self.fullscreen),
             "keybinds": dict(self.keybinds),
+            "asset_cache_mb": _clamp_cache_mb(self.asset_cache_mb),
+            "sim_hz": _clamp_sim_hz(self.sim_hz),
+            "render_fps_cap": _clamp_render_fps_cap(self.render_fps_cap),
+            "max_sim_steps": _clamp_max_sim_steps(self.max_sim_steps),
+            "save_format": _valid_save_format(self.save_format),
+            "save_compress": bool(self.save_compress),
             "audio": {
                 "master": _clamp01(self.audio.get("master", 1.0)),
                 "music": _clamp01(self.audio.get("music", 1.0)),
@@ -107,6 +181,23 @@ class SettingsManager:
     def set_fullscreen(self, b: bool) -> None:
         self.fullscreen = bool(b)
 
+    def set_asset_cache_mb(self, mb: int) -> None:
+        self.asset_cache_mb = _clamp_cache_mb(mb)
+
+    def set_sim_hz(self, hz: int) -> None:
+        self.sim_hz = _clamp_sim_hz(hz)
+
+    def set_render_fps_cap(self, fps: int) -> None:
+        self.render_fps_cap = _clamp_render_fps_cap(fps)
+
+    def set_max_sim_steps(self, steps: int) -> None:
+        self.max_sim_steps = _clamp_max_sim_steps(steps)
+
+    def set_save_format(self, save_format: str, compress: bool = None) -> None:
+        self.save_format = _valid_save_format(save_format)
+        if compress is not None:
+            self.save_compress = bool(compress)
+
     def set_keybind(self, action: str, key: str) -> None:
         self.keybinds[str(action)] = str(key)
 
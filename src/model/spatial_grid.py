@@ -0,0 +1,118 @@
+"""
+Spatial Grid - Indice a griglia uniforme per le query di prossimità delle stanze.
+
+Ogni oggetto viene registrato in tutte le celle toccate dal suo rettangolo; una query
+legge solo le celle sotto il rettangolo richiesto e ritorna i candidati (broadphase).
+Il test esatto (colliderect, distanza) resta a chi chiama: RoomData lo usa per
+collisioni, trigger e interagibili, così il costo dipende da quanti oggetti sono
+vicini al giocatore e non da quanti ne contiene la stanza.
+
+I candidati tornano nell'ordine di inserimento, lo stesso delle liste della stanza.
+"""
+from typing import Dict, Generic, Iterator, List, Tuple, TypeVar
+
+import pygame
+
+T = TypeVar("T")
+
+# Lato della cella in pixel: il doppio dell'hitbox del party (32x32), quindi una query tocca 1-4 celle
+DEFAULT_CELL_SIZE = 64
+
+
+class SpatialGrid(Generic[T]):
+    """
+    Hash spaziale a celle quadrate di lato cell_size.
+
+    - insert(item, rect) / remove(item): aggiornamento incrementale (identità dell'oggetto)
+    - query(rect) / query_area(x, y, w, h): oggetti nelle celle toccate, senza duplicati, in ordine di inserimento
+    - query_radius(x, y, r): come query sul quadrato circoscritto al cerchio
+    """
+
+    def __init__(self, cell_size: int = DEFAULT_CELL_SIZE):
+        self.cell_size = max(1, int(cell_size))
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._items: Dict[int, T] = {}                        # handle -> oggetto
+        self._item_cells: Dict[int, List[Tuple[int, int]]] = {}
+        self._handles: Dict[int, int] = {}                    # id(oggetto) -> handle
+        self._next_handle = 0
+
+    # ============== INSERT / REMOVE ==============
+
+    def insert(self, item: T, rect: pygame.Rect) -> None:
+        if id(item) in self._handles:
+            self.remove(item)
+        handle = self._next_handle
+        self._next_handle += 1
+
+        cells = list(self._cell_range(rect.x, rect.y, rect.width, rect.height))
+        for cell in cells:
+            self._cells.setdefault(cell, []).append(handle)
+        self._items[handle] = item
+        self._item_cells[handle] = cells
+        self._handles[id(item)] = handle
+
+    def remove(self, item: T) -> bool:
+        handle = self._handles.pop(id(item), None)
+        if handle is None:
+            return False
+        for cell in self._item_cells.pop(handle):
+            bucket = self._cells[cell]
+            bucket.remove(handle)
+            if not bucket:
+                del self._cells[cell]
+        del self._items[handle]
+        return True
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._items.clear()
+        self._item_cells.clear()
+        self._handles.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: T) -> bool:
+        return id(item) in self._handles
+
+    def __iter__(self) -> Iterator[T]:
+        return (self._items[h] for h in sorted(self._items))
+
+    # ============== QUERY ==============
+
+    def query(self, rect: pygame.Rect) -> List[T]:
+        return self.query_area(rect.x, rect.y, rect.width, rect.height)
+
+    def query_radius(self, x: float, y: float, radius: float) -> List[T]:
+        # +1: anche i punti esattamente a distanza radius (bordo destro/basso) sono candidati
+        return self.query_area(x - radius, y - radius, 2 * radius + 1, 2 * radius + 1)
+
+    def query_area(self, x, y, w, h) -> List[T]:
+        x0, y0, x1, y1 = self._cell_bounds(x, y, w, h)
+        cells = self._cells
+        items = self._items
+
+        if x0 == x1 and y0 == y1:
+            # Caso tipico (hitbox del party dentro una cella): i bucket sono già in ordine di handle
+            bucket = cells.get((x0, y0))
+            return [items[h] for h in bucket] if bucket else []
+
+        found = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+        return [items[h] for h in sorted(found)] if found else []
+
+    def _cell_bounds(self, x, y, w, h) -> Tuple[int, int, int, int]:
+        cs = self.cell_size
+        # Un rettangolo vuoto occupa comunque la cella del suo angolo
+        return (int(x // cs), int(y // cs),
+                int((x + max(w, 1) - 1) // cs), int((y + max(h, 1) - 1) // cs))
+
+    def _cell_range(self, x, y, w, h) -> Iterator[Tuple[int, int]]:
+        x0, y0, x1, y1 = self._cell_bounds(x, y, w, h)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield (cx, cy)
@@ -71,6 +71,10 @@ STATE_INPUT_CONTEXTS: dict[StateID, InputContext] = {
 
 
 class BaseState(ABC):
+    # Regione a cui appartengono gli asset dello stato (None = sempre residenti).
+    # Usata dall'AssetPreloader per costruire i residency set.
+    asset_region = None
+
     def __init__(self, state_id: StateID, state_machine=None):
         self._state_id = state_id
         self._state_machine = state_machine
@@ -102,6 +106,13 @@ class BaseState(ABC):
     
     def set_state_machine(self, state_machine):
         self._state_machine = state_machine
+
+    def get_asset_manifest(self) -> list:
+        """
+        Immagini (AssetRequest) che lo stato disegna, da decodificare in anticipo.
+        Di default nessuna: gli stati con asset pesanti fanno override.
+        """
+        return []
     
     @abstractmethod
     def enter(self, prev_state: 'BaseState' = None, **kwargs):
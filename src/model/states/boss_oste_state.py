@@ -16,8 +16,10 @@ import random
 import math
 
 from src.model.states.base_state import BaseState, StateID
+from src.model.assets.text_cache import text_cache
 from src.model.items.item_ids import ItemIds
 from src.model.script_actions import GameScript, ScriptAction
+from src.model.assets.asset_manager import AssetRequest
 
 # --- CONFIGURAZIONI ---
 SCREEN_WIDTH = 800
@@ -492,13 +494,8 @@ class Boss:
 
         # 2. UI e Testi
         def outline(text, font, col, center):
-            for ox, oy in [(-2, -2), (-2, 2), (2, -2), (2, 2), (-1, 0), (1, 0), (0, -1), (0, 1)]:
-                s = font.render(text, True, BLACK)
-                r = s.get_rect(center=(center[0] + ox, center[1] + oy))
-                screen.blit(s, r)
-            s = font.render(text, True, col)
-            r = s.get_rect(center=center)
-            screen.blit(s, r)
+            s = text_cache.render_outlined(font, text, col, BLACK)
+            screen.blit(s, s.get_rect(center=center))
 
         outline(
             self.nome,
@@ -555,6 +552,8 @@ class CombatLog:
 
 # --- CLASS STATE PRINCIPALE ---
 class BossOsteState(BaseState):
+    asset_region = "etna"
+
     def __init__(self, state_machine=None):
         super().__init__(StateID.BOSS_OSTE, state_machine)
         self.fonts = {}
@@ -601,14 +600,13 @@ class BossOsteState(BaseState):
         self.dialogue_index = 0
 
     def enter(self, prev_state=None, **kwargs):
-        pygame.font.init()
         self.fonts = {
-            "title": pygame.font.SysFont("Georgia", 40, bold=True),
-            "main": pygame.font.SysFont("Arial", 20, bold=True),
-            "small": pygame.font.SysFont("Arial", 16),
-            "dmg": pygame.font.SysFont("Arial", 24, bold=True),
-            "big_msg": pygame.font.SysFont("Arial", 40, bold=True),
-            "btn": pygame.font.SysFont("Arial", 18, bold=True),
+            "title": text_cache.font("Georgia", 40, bold=True),
+            "main": text_cache.font("Arial", 20, bold=True),
+            "small": text_cache.font("Arial", 16),
+            "dmg": text_cache.font("Arial", 24, bold=True),
+            "big_msg": text_cache.font("Arial", 40, bold=True),
+            "btn": text_cache.font("Arial", 18, bold=True),
         }
         self.assets = self._state_machine.controller.render_controller.asset_manager
         self.party = self.build_party_from_gamestate()
@@ -633,6 +631,17 @@ class BossOsteState(BaseState):
     def exit(self, next_state=None):
         pass
 
+    def get_asset_manifest(self) -> list:
+        manifest = [
+            AssetRequest("enemy_boss_oste", 300, 350, "enemy", preserve_aspect=True),
+            AssetRequest("enemy_boss_oste", 260, 300, "enemy", preserve_aspect=True),
+            AssetRequest("outro_scena1", SCREEN_WIDTH, SCREEN_HEIGHT, "background"),
+        ]
+        for name in ("Turiddu", "Rosalia"):
+            manifest.append(AssetRequest(f"characters/{name}", 100, 100, "player", preserve_aspect=True))
+            manifest.append(AssetRequest(f"characters/{name}", 200, 260, "player", preserve_aspect=True))
+        return manifest
+
     def layout_party_positions(self):
         if len(self.party) != 2:
             return
@@ -865,34 +874,17 @@ class BossOsteState(BaseState):
                 self.game_state = "BOSS_DYING"
 
     def outline(self, screen, text, font, col, center):
-        for ox, oy in [(-2, -2), (-2, 2), (2, -2), (2, 2), (-1, 0), (1, 0), (0, -1), (0, 1)]:
-            s = font.render(text, True, BLACK)
-            r = s.get_rect(center=(center[0] + ox, center[1] + oy))
-            screen.blit(s, r)
-        s = font.render(text, True, col)
-        r = s.get_rect(center=center)
-        screen.blit(s, r)
+        # Contorno composto una volta sola e tenuto in cache
+        s = text_cache.render_outlined(font, text, col, BLACK)
+        screen.blit(s, s.get_rect(center=center))
 
     def draw_text_wrapped(self, screen, text, font, color, rect):
         y = rect.top
         font_height = font.get_height()
         paragraphs = text.split("\n")
         for paragraph in paragraphs:
-            words = paragraph.split(" ")
-            cur_line = []
-            cur_w = 0
-            for word in words:
-                w_surf = font.render(word, True, color)
-                if cur_w + w_surf.get_width() >= rect.width:
-                    screen.blit(font.render(" ".join(cur_line), True, color), (rect.left, y))
-                    y += font_height
-                    cur_line = [word]
-                    cur_w = w_surf.get_width()
-                else:
-                    cur_line.append(word)
-                    cur_w += w_surf.get_width() + 5
-            if cur_line:
-                screen.blit(font.render(" ".join(cur_line), True, color), (rect.left, y))
+            for line in text_cache.wrap(font, paragraph, rect.width - 1):
+                screen.blit(font.render(line, True, color), (rect.left, y))
                 y += font_height
             y += 5
 
@@ -3,6 +3,12 @@ Concrete game state implementations.
 Updated: 
 - CutsceneState: Fixed aspect ratio (no stretching).
 - CutsceneState: Removed dark rectangle overlay, using Alpha transparency for inactive speakers.
+- RoomState: movement resolved with per-axis sweeps and wall sliding (src/model/movement.py).
+- RoomState: far room regions are evicted from the ContentRegistry on enter.
+- RoomState: rooms loaded through RoomManager, once_flag entities follow flag changes (subscriptions).
+- RoomState: removed entities from Game.world_state; room entry and checkpoints go to the autosave journal.
+- MainMenuState/SaveLoadState: saves browsed through a paged, sortable SlotBrowser (unlimited slots).
+- MainMenuState: "Continua" resumes the autosave; New Game asks before overwriting it.
 """
 
 import logging
@@ -20,44 +26,76 @@ from src.model.combat.damage_calculator import DamageCalculator
 from src.model.utils.rng import RNG
 from src.model.ai.enemy_ai import EnemyBrain, DonTaninoBrain, BossOsteBrain
 from src.model.ui.interaction_menu_state import InteractionMenuStateData
+from src.model.ui.slot_browser import SlotBrowser, ROW_SORT, ROW_NEW, ROW_BACK
 from src.model.combat.targeting_system import TargetingSystem
 from src.model.combat.action_pipeline import ActionPipeline
 from src.model.room_data import EntityDefinition
+from src.controller.room_manager import RoomManager
+from src.model.content.registry import region_of
+from src.model.movement import resolve_movement
 from src.model.etna.boss_oste import BossOste
+from src.model.assets.asset_manager import AssetRequest, PORTRAIT_SIZE, portrait_request
+from src.model.assets.text_cache import text_cache
 
 # Minigame Imports
-from src.model.minigame.scopa_model import ScopaModel
+from src.model.minigame.scopa_model import ScopaModel, ScopaCard
 from src.view.scopa_view import ScopaView
-from src.model.minigame.briscola_model import BriscolaModel
+from src.model.minigame.briscola_model import BriscolaModel, BriscolaCard
 from src.view.briscola_view import BriscolaView
-from src.model.minigame.sette_mezzo_model import SetteMezzoModel
+from src.model.minigame.sette_mezzo_model import SetteMezzoModel, SmCard
 from src.view.sette_mezzo_view import SetteMezzoView
-from src.model.minigame.cucu_model import CucuModel
+from src.model.minigame.cucu_model import CucuModel, CucuCard
 from src.view.cucu_view import CucuView
 from src.model.states.boss_oste_state import BossOsteState
 
 logger = logging.getLogger(__name__)
 
+
+def _card_table_manifest(card_cls, card_w: int, card_h: int, table_bg: str) -> list:
+    """Manifest di un minigioco di carte: mazzo completo + retro + tavolo, alle dimensioni della view."""
+    semi = ["Coppe", "Denari", "Bastoni", "Spade"]
+    manifest = [AssetRequest(card_cls(v, s).asset_key, card_w, card_h, "item") for s in semi for v in range(1, 11)]
+    manifest.append(AssetRequest("retro_carta", card_w, card_h, "prop"))
+    manifest.append(AssetRequest(table_bg, 800, 600, "background"))
+    return manifest
+
 # --- MAIN MENU STATE ---
+MENU_CONTINUE = "continue"
+MENU_NEW_GAME = "new_game"
+MENU_LOAD_GAME = "load_game"
+MENU_QUIT = "quit"
+
+
 class MainMenuState(BaseState):
     def __init__(self, state_machine=None):
         super().__init__(StateID.MAIN_MENU, state_machine)
         self.sub_menu = "root"  # root, load_game
         self.cursor_index = 0
-        self.save_slots = []
+        self.options = [MENU_NEW_GAME, MENU_LOAD_GAME, MENU_QUIT]
+        # Nuova partita con un autosave presente: serve una seconda conferma (lo sovrascrive)
+        self.confirm_new_game = False
+        self.slot_browser = None  # pagina dei salvataggi, caricata all'apertura di load_game
         self.version = "Alpha 0.2 (RPG Mode)"
 
     def enter(self, prev_state=None, **kwargs):
         self.sub_menu = "root"
         self.cursor_index = 0
+        self.confirm_new_game = False
         if self._state_machine and self._state_machine.controller:
-            self.save_slots = self._state_machine.controller.save_manager.list_slots()
+            controller = self._state_machine.controller
+            self.options = [MENU_NEW_GAME, MENU_LOAD_GAME, MENU_QUIT]
+            if controller.autosave.exists():
+                self.options.insert(0, MENU_CONTINUE)
+            self.slot_browser = SlotBrowser(controller.save_manager)
             # Musica del menu
             self._state_machine.controller.game.audio.play_bgm("intro.ogg", fade_ms=1000)
 
     def exit(self, next_state=None):
         pass
 
+    def get_asset_manifest(self) -> list:
+        return [AssetRequest("main_menu_bg", 800, 600, "background")]
+
     def handle_event(self, event) -> bool:
         input_manager = self._state_machine.controller.input_manager
         
@@ -67,6 +105,13 @@ class MainMenuState(BaseState):
         if input_manager.was_just_pressed(Action.MENU_UP):
             self._move_cursor(-1)
             return True
+        if self.sub_menu == "load_game":
+            if input_manager.was_just_pressed(Action.MENU_RIGHT):
+                self.slot_browser.change_page(1)
+                return True
+            if input_manager.was_just_pressed(Action.MENU_LEFT):
+                self.slot_browser.change_page(-1)
+                return True
         if input_manager.was_just_pressed(Action.CONFIRM):
             self._confirm_selection()
             return True
@@ -83,33 +128,47 @@ class MainMenuState(BaseState):
         pass
 
     def _move_cursor(self, delta):
-        limit = 0
-        if self.sub_menu == "root": limit = 3
-        elif self.sub_menu == "load_game": limit = len(self.save_slots) + 1
-        
-        if limit > 0:
-            self.cursor_index = (self.cursor_index + delta) % limit
+        if self.sub_menu == "load_game":
+            self.slot_browser.move(delta)
+        elif self.sub_menu == "root":
+            self.cursor_index = (self.cursor_index + delta) % len(self.options)
+            self.confirm_new_game = False
 
     def _confirm_selection(self):
         controller = self._state_machine.controller
         
         if self.sub_menu == "root":
-            if self.cursor_index == 0: # New Game
+            option = self.options[self.cursor_index]
+            if option == MENU_CONTINUE:
+                res = controller.load_autosave()
+                if not res.ok:
+                    print(f"Load Error: {res.message}")
+
+            elif option == MENU_NEW_GAME:
+                if MENU_CONTINUE in self.options and not self.confirm_new_game:
+                    self.confirm_new_game = True
+                    return
+                self.confirm_new_game = False
                 # FIX: Avvia direttamente con 2 giocatori fissi (Turiddu & Rosalia)
                 controller.start_new_game(2)
                 
-            elif self.cursor_index == 1: # Load Game
+            elif option == MENU_LOAD_GAME:
                 self.sub_menu = "load_game"
                 self.cursor_index = 0
-                self.save_slots = controller.save_manager.list_slots()
-            elif self.cursor_index == 2: # Quit
+                if self.slot_browser is None:
+                    self.slot_browser = SlotBrowser(controller.save_manager)
+                self.slot_browser.reset()
+            elif option == MENU_QUIT:
                 sys.exit()
 
         elif self.sub_menu == "load_game":
-            if self.cursor_index == len(self.save_slots): # Back option
+            row = self.slot_browser.selected()
+            if row == ROW_BACK:
                 self._go_back()
+            elif row == ROW_SORT:
+                self.slot_browser.cycle_sort()
             else:
-                slot = self.save_slots[self.cursor_index]
+                slot = row
                 if slot.status.name != "EMPTY":
                     res = controller.load_game(slot.slot_index)
                     if not res.ok:
@@ -119,7 +178,7 @@ class MainMenuState(BaseState):
 
     def _go_back(self):
         if self.sub_menu == "root":
-            pass
+            self.confirm_new_game = False
         else:
             self.sub_menu = "root"
             self.cursor_index = 0
@@ -171,9 +230,8 @@ class CutsceneState(BaseState):
         self.assets = self._state_machine.controller.render_controller.asset_manager
         
         # Init Fonts
-        if not pygame.font.get_init(): pygame.font.init()
-        self.font = pygame.font.SysFont("Arial", 20)
-        self.font_name = pygame.font.SysFont("Arial", 22, bold=True)
+        self.font = text_cache.font("Arial", 20)
+        self.font_name = text_cache.font("Arial", 22, bold=True)
 
         # Configurazione Intro
         self.slides = [
@@ -236,6 +294,12 @@ class CutsceneState(BaseState):
     def exit(self, next_state=None):
         pass
 
+    def get_asset_manifest(self) -> list:
+        manifest = [AssetRequest(f"intro_scena{i}", self.SCREEN_W, self.SCREEN_H, "background") for i in (1, 2, 3)]
+        for name in ("Turiddu", "Rosalia", "U Strammu"):
+            manifest.append(AssetRequest(f"characters/{name}", self.PORTRAIT_W, self.PORTRAIT_H, "npc"))
+        return manifest
+
     def handle_event(self, event) -> bool:
         if self.state == "PLAYING":
             slide = self.slides[self.current_slide_idx]
@@ -350,17 +414,8 @@ class CutsceneState(BaseState):
             name_surf = self.font_name.render(speaker, True, (255, 215, 0)) # Gold
             surface.blit(name_surf, (box_rect.x + 20, box_rect.y + 15))
             
-            # Text Wrapping
-            words = text.split(' ')
-            lines = []
-            curr_line = []
-            for word in words:
-                curr_line.append(word)
-                if self.font.size(' '.join(curr_line))[0] > box_rect.width - 40:
-                    curr_line.pop()
-                    lines.append(' '.join(curr_line))
-                    curr_line = [word]
-            lines.append(' '.join(curr_line))
+            # Text Wrapping (layout in cache)
+            lines = text_cache.wrap(self.font, text, box_rect.width - 40)
             
             for i, line in enumerate(lines):
                 line_surf = self.font.render(line, True, (255, 255, 255))
@@ -387,6 +442,9 @@ class RoomState(BaseState):
         
         # MODIFICA: Aumentato da 90.0 a 140.0 per facilitare l'interazione col Carretto
         self.interaction_range = 140.0 
+
+        # Caricamento stanza + entità once_flag (nascoste/ripristinate al cambio del flag)
+        self.room_manager = RoomManager()
         
     def enter(self, prev_state: BaseState = None, **kwargs):
         self.room_id = kwargs.get('room_id')
@@ -399,29 +457,54 @@ class RoomState(BaseState):
             
             room_data = game.content.get("rooms", self.room_id)
             if room_data:
-                render_ctrl.load_room(room_data, self.spawn_id)
-                spawn_pos = room_data.get_spawn_position(self.spawn_id)
+                self.room_manager.set_flag_manager(game.flag_manager)
+                self.room_manager.set_world_state(game.world_state)
+                self.room_manager.set_content(game.content)
+                spawn_pos = self.room_manager.load_room(room_data, self.spawn_id)
+                render_ctrl.load_room(room_data, self.spawn_id, game.content)
                 
                 game.gamestate.party_position = list(spawn_pos)
                 game.gamestate.current_room_id = self.room_id
+                game.gamestate.spawn_id = self.spawn_id
                 
                 active = game.gamestate.get_active_player()
                 if active:
                     active.x, active.y = spawn_pos
-                
+
+                autosave = self._state_machine.controller.autosave
+                autosave.record_position()
                 if room_data.is_checkpoint:
                     game.gamestate.set_checkpoint()
+                    autosave.checkpoint()
                     game.prompts.show_info("Checkpoint Reached", 0, 1500)
                 
                 # Check immediato dei trigger all'ingresso
                 player_rect = pygame.Rect(spawn_pos[0], spawn_pos[1], 32, 32)
                 self._check_triggers(game, player_rect, on_enter=True)
 
-        except AttributeError:
-            pass
+                self._update_room_residency(game, room_data)
+                self._prefetch_room_assets(render_ctrl, game, room_data)
+
+        except AttributeError as e:
+            # Controller/contenuti parziali (test, headless senza stanza valida)
+            logger.debug(f"RoomState.enter({self.room_id}) on a partial controller: {e}")
+
+    def _update_room_residency(self, game, room_data):
+        """Restano caricate la regione corrente, quelle raggiungibili dalle uscite e l'Hub; le altre si scaricano."""
+        keep = {room_data.region_id, "hub"}
+        keep.update(region_of(t.target_room) for t in room_data.triggers if t.target_room)
+        game.content.evict_regions("rooms", keep)
+
+    def _prefetch_room_assets(self, render_ctrl, game, room_data):
+        """Preload best-effort: un errore qui non deve bloccare l'ingresso nella stanza."""
+        try:
+            party_names = [c.name for c in game.gamestate.party.main_characters]
+            render_ctrl.prefetch_for_room(game.content, room_data, party_names)
+        except (AttributeError, TypeError) as e:
+            logger.debug(f"Asset prefetch skipped for {room_data.room_id}: {e}")
 
     def exit(self, next_state: BaseState = None):
-        pass
+        self.room_manager.unload_room()
         
     def handle_event(self, event) -> bool:
         input_manager = self._state_machine.controller.input_manager
@@ -485,14 +568,17 @@ class RoomState(BaseState):
         if dx != 0 or dy != 0:
             length = (dx**2 + dy**2)**0.5
             dx, dy = dx/length, dy/length
-            current_pos = game.gamestate.party_position
-            target_x = current_pos[0] + dx * self.move_speed * dt
-            target_y = current_pos[1] + dy * self.move_speed * dt
-            
-            player_rect = pygame.Rect(target_x, target_y, 32, 32)
             room_data = game.content.get("rooms", game.gamestate.current_room_id)
-            
-            if room_data and not room_data.check_collision(player_rect):
+            if not room_data:
+                return
+
+            # Sweep per asse con scivolamento sui muri (vedi src/model/movement.py)
+            current_pos = game.gamestate.party_position
+            result = resolve_movement(room_data, current_pos[0], current_pos[1],
+                                      dx * self.move_speed * dt, dy * self.move_speed * dt)
+            target_x, target_y = result.x, result.y
+
+            if (target_x, target_y) != (current_pos[0], current_pos[1]):
                 # Aggiorna posizione globale (per camera e trigger)
                 game.gamestate.party_position = [target_x, target_y]
                 
@@ -505,6 +591,7 @@ class RoomState(BaseState):
 
                 if render_ctrl:
                     render_ctrl.update_camera(int(target_x), int(target_y), dt)
+                player_rect = pygame.Rect(target_x, target_y, 32, 32)
                 self._check_triggers(game, player_rect, on_enter=True)
 
     def _update_focus(self, game):
@@ -872,6 +959,8 @@ class CombatState(BaseState):
 
 # --- SCOPA MINIGAME STATE ---
 class ScopaState(BaseState):
+    asset_region = "aurion"
+
     def __init__(self, state_machine=None):
         super().__init__(StateID.SCOPA, state_machine)
         self.model = ScopaModel()
@@ -898,6 +987,9 @@ class ScopaState(BaseState):
     def exit(self, next_state=None):
         self._state_machine.controller.game.exit_combat()
 
+    def get_asset_manifest(self) -> list:
+        return _card_table_manifest(ScopaCard, ScopaView.CARD_W, ScopaView.CARD_H, "sfondo_tavolo")
+
     def handle_event(self, event) -> bool:
         if self.model.is_game_over():
             if event.type == pygame.KEYDOWN:
@@ -1060,17 +1152,17 @@ class SaveLoadState(BaseState):
         super().__init__(StateID.SAVE_LOAD, state_machine)
         self._render_below = True
         self.mode = "save"
-        self.slots = []
-        self.cursor_index = 0
+        self.browser = None  # SlotBrowser: pagina visibile degli slot + cursore
         
         self.is_input_active = False
         self.input_text = ""
         self.target_slot = -1
+        self.save_job = None  # salvataggio in corso (AsyncSaveService), per la barra di avanzamento
 
     def enter(self, prev_state=None, **kwargs):
         self.mode = kwargs.get('mode', 'save')
-        self.slots = self._state_machine.controller.save_manager.list_slots()
-        self.cursor_index = 0
+        self.browser = SlotBrowser(self._state_machine.controller.save_manager, allow_new=(self.mode == "save"))
+        self.browser.reset()
         self.is_input_active = False
         self.input_text = ""
 
@@ -1094,19 +1186,27 @@ class SaveLoadState(BaseState):
             return True
 
         input_manager = self._state_machine.controller.input_manager
-        limit = len(self.slots) + 1
         
         if input_manager.was_just_pressed(Action.MENU_DOWN): 
-            self.cursor_index = (self.cursor_index + 1) % limit
+            self.browser.move(1)
             return True
         if input_manager.was_just_pressed(Action.MENU_UP): 
-            self.cursor_index = (self.cursor_index - 1) % limit
+            self.browser.move(-1)
+            return True
+        if input_manager.was_just_pressed(Action.MENU_RIGHT):
+            self.browser.change_page(1)
+            return True
+        if input_manager.was_just_pressed(Action.MENU_LEFT):
+            self.browser.change_page(-1)
             return True
             
         if input_manager.was_just_pressed(Action.CONFIRM):
-            if self.cursor_index == len(self.slots): 
+            row = self.browser.selected()
+            if row == ROW_BACK:
                 self._state_machine.pop_state()
-            else: 
+            elif row == ROW_SORT:
+                self.browser.cycle_sort()
+            else:
                 self._handle_slot_selection()
             return True
             
@@ -1117,10 +1217,18 @@ class SaveLoadState(BaseState):
 
     def _handle_slot_selection(self):
         controller = self._state_machine.controller
-        if self.cursor_index < len(self.slots):
-            slot_idx = self.slots[self.cursor_index].slot_index
-        else:
+        row = self.browser.selected()
+        if row == ROW_NEW:
+            slot_idx = controller.save_manager.next_free_slot()
+            if slot_idx is None:
+                controller.game.prompts.show_info("Nessuno slot libero", 0, 1500)
+                return
+        elif row in (ROW_SORT, ROW_BACK):
             return
+        else:
+            slot_idx = row.slot_index
+            if self.mode == "load" and row.status.name == "EMPTY":
+                return
 
         if self.mode == "save":
             self.is_input_active = True
@@ -1136,11 +1244,16 @@ class SaveLoadState(BaseState):
                 controller.game.prompts.show_info(f"Err: {res.message}", 0, 2000)
 
     def _perform_save(self, slot_idx, name):
+        # La scrittura va sul worker: il menu continua a disegnarsi mentre si salva
+        controller = self._state_machine.controller
+        self.save_job = controller.save_game_async(slot_idx, custom_name=name, on_complete=self._on_save_complete)
+
+    def _on_save_complete(self, res):
         controller = self._state_machine.controller
-        res = controller.save_game(slot_idx, confirmed=True, custom_name=name)
+        self.save_job = None
         if res.ok:
             controller.game.prompts.show_info("Saved!", 0, 1500)
-            self.slots = controller.save_manager.list_slots()
+            self.browser.refresh()
         else:
             controller.game.prompts.show_info(f"Error: {res.message}", 0, 2000)
 
@@ -1210,8 +1323,7 @@ class DialogueState(BaseState):
         self.assets = None
         
         # Dimensioni Ritratti (Identiche a CutsceneState FIXED)
-        self.PORTRAIT_W = 200
-        self.PORTRAIT_H = 300
+        self.PORTRAIT_W, self.PORTRAIT_H = PORTRAIT_SIZE
         self.SCREEN_W = 800
         self.SCREEN_H = 600
         self.TEXT_BOX_H = 150
@@ -1220,15 +1332,18 @@ class DialogueState(BaseState):
         self.dialogue_data = kwargs.get('dialogue_data', [])
         self.current_index = 0
         
-        if not pygame.font.get_init(): pygame.font.init()
-        self.font = pygame.font.SysFont("Arial", 20)
-        self.font_name = pygame.font.SysFont("Arial", 22, bold=True)
+        self.font = text_cache.font("Arial", 20)
+        self.font_name = text_cache.font("Arial", 22, bold=True)
         
         if self._state_machine and self._state_machine.controller:
             self.assets = self._state_machine.controller.render_controller.asset_manager
 
     def exit(self, next_state=None): pass
 
+    def get_asset_manifest(self) -> list:
+        # Solo il party: i ritratti degli NPC sono dichiarati dalle stanze (WorldBuilder)
+        return [portrait_request("Turiddu"), portrait_request("Rosalia")]
+
     def handle_event(self, event) -> bool:
         if event.type == pygame.KEYDOWN and event.key in (pygame.K_SPACE, pygame.K_RETURN, pygame.K_ESCAPE):
             self.current_index += 1
@@ -1285,20 +1400,9 @@ class DialogueState(BaseState):
         name_surf = self.font_name.render(speaker, True, name_col)
         surface.blit(name_surf, (box_rect.x + 20, box_rect.y + 15))
         
-        # Text Wrapping
-        words = text.split(' ')
-        lines = []
-        current_line = []
+        # Text Wrapping (layout in cache; una riga deve restare strettamente sotto max_width)
         max_width = box_rect.width - 40
-        
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            if self.font.size(test_line)[0] < max_width:
-                current_line.append(word)
-            else:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-        lines.append(' '.join(current_line))
+        lines = text_cache.wrap(self.font, text, max_width - 1)
         
         for i, line in enumerate(lines):
             txt_surf = self.font.render(line, True, (255, 255, 255))
@@ -1330,8 +1434,8 @@ class PromptState(BaseState):
         self.on_yes = kwargs.get('on_yes')        
         self.on_no = kwargs.get('on_no')          
         self.current_selection = 0
-        self.font = pygame.font.SysFont("Arial", 32, bold=True)
-        self.font_small = pygame.font.SysFont("Arial", 24)
+        self.font = text_cache.font("Arial", 32, bold=True)
+        self.font_small = text_cache.font("Arial", 24)
 
     def exit(self, next_state=None): pass
 
@@ -1405,7 +1509,7 @@ class InteractionMenuState(BaseState):
         rect = pygame.Rect(w - 250, 100, 200, 300)
         pygame.draw.rect(surface, (0, 0, 40), rect)
         pygame.draw.rect(surface, (255, 255, 255), rect, 2)
-        font = pygame.font.SysFont("Arial", 20)
+        font = text_cache.font("Arial", 20)
         title = font.render(self.menu_data.title, True, (255, 255, 0))
         surface.blit(title, (rect.x + 10, rect.y + 10))
         for i, opt in enumerate(self.menu_data.options):
@@ -1414,6 +1518,8 @@ class InteractionMenuState(BaseState):
             surface.blit(txt, (rect.x + 20, rect.y + 50 + i * 30))
 
 class BriscolaState(BaseState):
+    asset_region = "ferrum"
+
     def __init__(self, state_machine=None):
         super().__init__(StateID.BRISCOLA, state_machine)
         self.model = BriscolaModel()
@@ -1433,6 +1539,9 @@ class BriscolaState(BaseState):
     def exit(self, next_state=None):
         self._state_machine.controller.game.exit_combat()
 
+    def get_asset_manifest(self) -> list:
+        return _card_table_manifest(BriscolaCard, BriscolaView.CARD_W, BriscolaView.CARD_H, "sfondo_tavolo")
+
     def handle_event(self, event) -> bool:
         if self.model.state == "GAME_OVER":
             if event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_SPACE):
@@ -1491,6 +1600,8 @@ class BriscolaState(BaseState):
             self.view.render(surface.get_size(), self.model, self.cursor_index)
 
 class SetteMezzoState(BaseState):
+    asset_region = "vinalia"
+
     def __init__(self, state_machine=None):
         super().__init__(StateID.SETTE_MEZZO, state_machine)
         self.model = SetteMezzoModel()
@@ -1510,6 +1621,9 @@ class SetteMezzoState(BaseState):
     def exit(self, next_state=None):
         self._state_machine.controller.game.exit_combat()
 
+    def get_asset_manifest(self) -> list:
+        return _card_table_manifest(SmCard, SetteMezzoView.CARD_W, SetteMezzoView.CARD_H, "sfondo_vinalia")
+
     def handle_event(self, event) -> bool:
         if self.model.state == "GAME_OVER":
             if event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_SPACE):
@@ -1564,6 +1678,8 @@ class SetteMezzoState(BaseState):
             self.view.render(surface.get_size(), self.model, self.cursor_index)
 
 class CucuState(BaseState):
+    asset_region = "viridor"
+
     def __init__(self, state_machine=None):
         super().__init__(StateID.CUCU, state_machine)
         self.model = CucuModel()
@@ -1583,6 +1699,9 @@ class CucuState(BaseState):
     def exit(self, next_state=None):
         self._state_machine.controller.game.exit_combat()
 
+    def get_asset_manifest(self) -> list:
+        return _card_table_manifest(CucuCard, CucuView.CARD_W, CucuView.CARD_H, "sfondo_viridor")
+
     def handle_event(self, event) -> bool:
         input_manager = self._state_machine.controller.input_manager
         
@@ -0,0 +1,72 @@
+"""
+Slot Browser - Model della lista paginata dei salvataggi (menu principale e SaveLoadState).
+
+Righe navigabili: ordinamento, "nuovo salvataggio" (solo in modalità save), gli slot della
+pagina corrente, indietro. Sinistra/destra cambiano pagina. Ogni refresh chiede a
+SaveManager.list_page solo la pagina visibile.
+"""
+from typing import List, Optional, Union
+
+from src.model.save.constants import SLOTS_PER_PAGE, SLOT_SORT_MODES, SORT_TIME, SORT_REGION, SORT_ACES
+from src.model.save.dtos import SlotInfo, SlotPage
+
+ROW_SORT = "sort"
+ROW_NEW = "new"
+ROW_BACK = "back"
+
+SORT_LABELS = {SORT_TIME: "Data", SORT_REGION: "Regione", SORT_ACES: "Assi"}
+
+
+class SlotBrowser:
+    def __init__(self, save_manager, allow_new: bool = False, page_size: int = SLOTS_PER_PAGE):
+        self.save_manager = save_manager
+        self.allow_new = allow_new
+        self.page_size = page_size
+        self.sort_by = SORT_TIME
+        self.cursor_index = 0
+        self.page = SlotPage(slots=[])
+
+    @property
+    def slots(self) -> List[SlotInfo]:
+        return self.page.slots
+
+    @property
+    def rows(self) -> List[Union[str, SlotInfo]]:
+        head = [ROW_SORT, ROW_NEW] if self.allow_new else [ROW_SORT]
+        return head + self.page.slots + [ROW_BACK]
+
+    @property
+    def sort_label(self) -> str:
+        return SORT_LABELS.get(self.sort_by, self.sort_by)
+
+    @property
+    def page_label(self) -> str:
+        return f"Pagina {self.page.page + 1}/{self.page.page_count} ({self.page.total})"
+
+    def refresh(self, page: Optional[int] = None):
+        """Ricarica la pagina (dopo un salvataggio, o per cambiare pagina/ordinamento)."""
+        target = self.page.page if page is None else page
+        self.page = self.save_manager.list_page(target, self.page_size, self.sort_by)
+        self.cursor_index = min(self.cursor_index, len(self.rows) - 1)
+
+    def reset(self):
+        self.sort_by = SORT_TIME
+        self.cursor_index = 0
+        self.refresh(0)
+
+    def move(self, delta: int):
+        self.cursor_index = (self.cursor_index + delta) % len(self.rows)
+
+    def change_page(self, delta: int):
+        target = self.page.page + delta
+        if 0 <= target < self.page.page_count:
+            self.refresh(target)
+
+    def cycle_sort(self):
+        i = SLOT_SORT_MODES.index(self.sort_by) if self.sort_by in SLOT_SORT_MODES else -1
+        self.sort_by = SLOT_SORT_MODES[(i + 1) % len(SLOT_SORT_MODES)]
+        self.refresh(0)
+
+    def selected(self) -> Union[str, SlotInfo]:
+        """ROW_SORT, ROW_NEW, ROW_BACK o lo SlotInfo sotto il cursore."""
+        return self.rows[self.cursor_index]
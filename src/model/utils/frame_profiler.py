@@ -0,0 +1,194 @@
+"""
+Frame Profiler - Tempi per fase del main loop e contatori per frame.
+
+Il main loop (e il driver headless) chiamano begin_frame()/end_frame(); le fasi
+accumulano secondi con add_time() (più passi di simulazione nello stesso frame si
+sommano). Il Renderer misura da sé sort e draw di ogni flush. I contatori "watch"
+sono letture cumulative (es. miss della cache immagini) di cui si registra il delta.
+
+Gli ultimi frame restano in un buffer circolare: il debug overlay (F3) li disegna come
+grafico a barre impilate e dump() li salva in CSV o JSON per analizzare gli scatti.
+"""
+import csv
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional
+
+# Fasi misurate direttamente
+PHASE_EVENTS = "events"
+PHASE_PROCESS = "process_frame"
+PHASE_STATE_UPDATE = "state_update"
+PHASE_RENDER = "render"
+PHASE_FLUSH_SORT = "flush_sort"
+PHASE_FLUSH_DRAW = "flush_draw"
+PHASE_PRESENT = "present"
+
+# Fasi derivate in end_frame (così il grafico impilato non conta due volte lo stesso tempo)
+PHASE_SIM_OTHER = "sim_other"   # process_frame - state_update
+PHASE_SUBMIT = "submit"         # render - flush_sort - flush_draw
+
+# Ordine delle barre nel grafico: la somma è il tempo "spiegato" del frame
+STACKED_PHASES = (
+    PHASE_EVENTS, PHASE_STATE_UPDATE, PHASE_SIM_OTHER, PHASE_SUBMIT,
+    PHASE_FLUSH_SORT, PHASE_FLUSH_DRAW, PHASE_PRESENT,
+)
+MEASURED_PHASES = (
+    PHASE_EVENTS, PHASE_PROCESS, PHASE_STATE_UPDATE, PHASE_RENDER,
+    PHASE_FLUSH_SORT, PHASE_FLUSH_DRAW, PHASE_PRESENT,
+)
+
+COUNT_RENDER_COMMANDS = "render_commands"
+COUNT_SIM_STEPS = "sim_steps"
+COUNT_ASSET_MISSES = "asset_misses"
+COUNT_TEXT_RENDERS = "text_renders"
+
+DEFAULT_HISTORY = 600  # ~10 s a 60 FPS
+
+
+@dataclass(frozen=True)
+class FrameRecord:
+    """Un frame concluso: tempi in millisecondi, contatori interi."""
+    index: int
+    frame_ms: float
+    phases: Dict[str, float] = field(default_factory=dict)
+    counts: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {"index": self.index, "frame_ms": round(self.frame_ms, 3),
+                **{k: round(v, 3) for k, v in self.phases.items()}, **self.counts}
+
+
+class FrameProfiler:
+    """
+    - begin_frame() / end_frame(): delimitano un frame
+    - add_time(phase, seconds) o measure(phase): tempo di una fase
+    - count(name, n): contatore del frame corrente
+    - watch(name, source): source() è un totale cumulativo, nel record finisce il delta
+    """
+
+    def __init__(self, history: int = DEFAULT_HISTORY):
+        self.enabled = True
+        self.frames: Deque[FrameRecord] = deque(maxlen=history)
+        self.frame_index = 0
+        self._times: Dict[str, float] = {}
+        self._counts: Dict[str, int] = {}
+        self._sources: Dict[str, Callable[[], int]] = {}
+        self._last_values: Dict[str, int] = {}
+        self._frame_start: Optional[float] = None
+
+    # ============== RECORDING ==============
+
+    def begin_frame(self) -> None:
+        if not self.enabled:
+            return
+        self._times = dict.fromkeys(MEASURED_PHASES, 0.0)
+        self._counts = {}
+        self._frame_start = time.perf_counter()
+
+    @property
+    def active(self) -> bool:
+        """True tra begin_frame ed end_frame (chi misura da sé può saltare perf_counter altrimenti)."""
+        return self._frame_start is not None
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        if self._frame_start is not None:
+            self._times[phase] = self._times.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def measure(self, phase: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(phase, time.perf_counter() - start)
+
+    def count(self, name: str, n: int = 1) -> None:
+        if self._frame_start is not None:
+            self._counts[name] = self._counts.get(name, 0) + n
+
+    def watch(self, name: str, source: Callable[[], int]) -> None:
+        """Registra (o sostituisce) un contatore cumulativo da campionare a fine frame."""
+        self._sources[name] = source
+        self._last_values[name] = source()
+
+    def end_frame(self) -> Optional[FrameRecord]:
+        if self._frame_start is None:
+            return None
+        frame_s = time.perf_counter() - self._frame_start
+        self._frame_start = None
+
+        t = self._times
+        t[PHASE_SIM_OTHER] = max(0.0, t[PHASE_PROCESS] - t[PHASE_STATE_UPDATE])
+        t[PHASE_SUBMIT] = max(0.0, t[PHASE_RENDER] - t[PHASE_FLUSH_SORT] - t[PHASE_FLUSH_DRAW])
+
+        counts = self._counts
+        for name, source in self._sources.items():
+            value = source()
+            counts[name] = value - self._last_values.get(name, value)
+            self._last_values[name] = value
+
+        record = FrameRecord(
+            index=self.frame_index,
+            frame_ms=frame_s * 1000.0,
+            phases={k: v * 1000.0 for k, v in t.items()},
+            counts=counts,
+        )
+        self.frames.append(record)
+        self.frame_index += 1
+        return record
+
+    # ============== QUERY ==============
+
+    @property
+    def last(self) -> Optional[FrameRecord]:
+        return self.frames[-1] if self.frames else None
+
+    def recent(self, n: int) -> List[FrameRecord]:
+        return list(self.frames)[-n:] if n > 0 else []
+
+    def averages(self, n: int = 60) -> Dict[str, float]:
+        """Media per fase (ms) e per contatore sugli ultimi n frame, più "frame_ms" e "max_frame_ms"."""
+        frames = self.recent(n)
+        if not frames:
+            return {}
+        out: Dict[str, float] = {}
+        for rec in frames:
+            for k, v in rec.phases.items():
+                out[k] = out.get(k, 0.0) + v
+            for k, v in rec.counts.items():
+                out[k] = out.get(k, 0.0) + v
+        out = {k: v / len(frames) for k, v in out.items()}
+        out["frame_ms"] = sum(r.frame_ms for r in frames) / len(frames)
+        out["max_frame_ms"] = max(r.frame_ms for r in frames)
+        return out
+
+    def clear(self) -> None:
+        self.frames.clear()
+
+    # ============== EXPORT ==============
+
+    def dump(self, path: str) -> int:
+        """Salva la history in CSV o JSON (dall'estensione). Ritorna il numero di frame scritti."""
+        rows = [rec.to_dict() for rec in self.frames]
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        if path.lower().endswith(".json"):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"frames": rows}, f, indent=1)
+        else:
+            columns = ["index", "frame_ms", *MEASURED_PHASES, PHASE_SIM_OTHER, PHASE_SUBMIT]
+            for row in rows:
+                columns.extend(k for k in row if k not in columns)
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=columns, restval=0)
+                writer.writeheader()
+                writer.writerows(rows)
+        return len(rows)
+
+
+# Istanza condivisa da main loop, GameController e Renderer
+frame_profiler = FrameProfiler()
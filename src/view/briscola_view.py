@@ -7,12 +7,14 @@ from src.view.ui_style import UIStyle, COLOR_SELECTED, COLOR_TEXT
 from src.model.minigame.briscola_model import BriscolaModel
 
 class BriscolaView:
+    # Dimensioni carte (class-level: usate anche dai manifest di preload degli stati)
+    CARD_W = 76
+    CARD_H = 114
+
     def __init__(self, renderer: Renderer, asset_manager):
         self.renderer = renderer
         self.assets = asset_manager
         
-        self.CARD_W = 76
-        self.CARD_H = 114
         self.SPACING = 20
         self.COLOR_TABLE = (20, 100, 40) # Verde più scuro per Briscola
 
@@ -7,11 +7,12 @@ import pygame
 from src.model.render_system import Renderer, RenderLayer, Camera
 from src.model.ui.combat_menu_state import CombatMenuState
 from src.model.combat.targeting_system import TargetingSystem
+from src.model.assets.text_cache import text_cache
 
 class CombatMenuView:
     def __init__(self, renderer: Renderer):
         self.renderer = renderer
-        self.font = pygame.font.SysFont("Arial", 22, bold=True)
+        self.font = text_cache.font("Arial", 22, bold=True)
         self.panel_color = (0, 0, 100) # RPG Blue
         self.border_color = (255, 255, 255)
         self.text_color = (255, 255, 255)
@@ -7,12 +7,14 @@ from src.view.ui_style import UIStyle, COLOR_SELECTED, COLOR_TEXT
 from src.model.minigame.cucu_model import CucuModel
 
 class CucuView:
+    # Dimensioni carte (class-level: usate anche dai manifest di preload degli stati)
+    CARD_W = 100
+    CARD_H = 150
+
     def __init__(self, renderer: Renderer, asset_manager):
         self.renderer = renderer
         self.assets = asset_manager
         
-        self.CARD_W = 100
-        self.CARD_H = 150
         self.COLOR_TABLE = (139, 69, 19) # Marrone legno per Viridor
 
     def render(self, screen_size: tuple, model: CucuModel, cursor_index: int):
@@ -4,11 +4,12 @@ Game Over View - Renders the Game Over screen.
 import pygame
 from src.model.render_system import Renderer, RenderLayer, Camera
 from src.view.ui_style import UIStyle, COLOR_SELECTED, COLOR_TEXT
+from src.model.assets.text_cache import text_cache
 
 class GameOverView:
     def __init__(self, renderer: Renderer):
         self.renderer = renderer
-        self.font_big = pygame.font.SysFont("Arial", 60, bold=True)
+        self.font_big = text_cache.font("Arial", 60, bold=True)
 
     def render(self, screen_size: tuple, cursor_index: int):
         w, h = screen_size
@@ -2,19 +2,30 @@
 Main Menu View - Visualizzazione del menu iniziale.
 Gestisce: Schermata Titolo, Selezione Slot Salvataggio.
 Updated: Background image support via AssetManager.
+Updated: Load list drawn from the SlotBrowser page (sort row, page indicator, back).
+Updated: root options come from MainMenuState.options ("Continua" when an autosave exists).
 """
 import pygame
 from src.model.render_system import Renderer, RenderLayer, Camera
 from src.view.ui_style import UIStyle, COLOR_SELECTED, COLOR_TEXT, COLOR_DISABLED, COLOR_BG
 # Import opzionale per type hinting, non strettamente necessario a runtime se usiamo duck typing
 from src.model.assets.asset_manager import AssetManager 
+from src.model.assets.text_cache import text_cache
+from src.model.ui.slot_browser import ROW_SORT, ROW_BACK
+from src.model.states.game_states import MENU_CONTINUE, MENU_NEW_GAME, MENU_LOAD_GAME, MENU_QUIT
+
+OPTION_LABELS = {
+    MENU_CONTINUE: "Continua",
+    MENU_NEW_GAME: "Nuova Partita",
+    MENU_LOAD_GAME: "Carica Partita",
+    MENU_QUIT: "Esci",
+}
 
 class MainMenuView:
     def __init__(self, renderer: Renderer, asset_manager: AssetManager):
         self.renderer = renderer
         self.assets = asset_manager
-        pygame.font.init()
-        self.title_font = pygame.font.SysFont("Times New Roman", 60, bold=True)
+        self.title_font = text_cache.font("Times New Roman", 60, bold=True)
         UIStyle.init_fonts()
 
     def render(self, screen_size: tuple, menu_state):
@@ -53,13 +64,17 @@ class MainMenuView:
 
             # 3. Contenuto del Menu
             if menu_state.sub_menu == "root":
-                self._draw_options(screen, center_x, 300, 
-                                   ["Nuova Partita", "Carica Partita", "Esci"], 
-                                   menu_state.cursor_index)
+                options = [OPTION_LABELS[o] for o in menu_state.options]
+                self._draw_options(screen, center_x, 300 - 25 * (len(options) - 3),
+                                   options, menu_state.cursor_index)
+                if menu_state.confirm_new_game:
+                    msg = "L'autosave verrà sovrascritto. [INVIO] Conferma   [ESC] Annulla"
+                    UIStyle.draw_text(screen, msg, center_x + 2, h - 78, align="center", color=(0, 0, 0))
+                    UIStyle.draw_text(screen, msg, center_x, h - 80, align="center", color=(255, 200, 0))
             
             elif menu_state.sub_menu == "load_game":
-                UIStyle.draw_text(screen, "Seleziona Slot:", center_x, 230, align="center", color=(0, 255, 255))
-                self._draw_save_slots(screen, center_x, 280, menu_state.save_slots, menu_state.cursor_index)
+                UIStyle.draw_text(screen, "Seleziona Slot:", center_x, 220, align="center", color=(0, 255, 255))
+                self._draw_save_slots(screen, center_x, 255, menu_state.slot_browser)
 
             # Footer
             UIStyle.draw_text(screen, f"Ver: {menu_state.version}", 10, h - 30, font_type="small", color=(100, 100, 100))
@@ -76,16 +91,29 @@ class MainMenuView:
             UIStyle.draw_text(screen, f"{prefix}{text}", x + 2, start_y + i * gap + 2, align="center", color=(0, 0, 0))
             UIStyle.draw_text(screen, f"{prefix}{text}", x, start_y + i * gap, align="center", color=color)
 
-    def _draw_save_slots(self, screen, center_x, start_y, slots, selected_idx):
-        panel_w, panel_h = 500, 80
-        gap = 90
-        
+    def _draw_save_slots(self, screen, center_x, start_y, browser):
+        panel_w, panel_h = 500, 75
+        gap = 85
+        rows = browser.rows
+        selected_idx = browser.cursor_index
+
+        # Riga ordinamento + indicatore di pagina
+        sort_idx = rows.index(ROW_SORT)
+        color = COLOR_SELECTED if selected_idx == sort_idx else COLOR_TEXT
+        prefix = "> " if selected_idx == sort_idx else ""
+        UIStyle.draw_text(screen, f"{prefix}Ordina: {browser.sort_label}", center_x - panel_w//2, start_y, color=color, font_type="small")
+        UIStyle.draw_text(screen, f"< {browser.page_label} >", center_x + panel_w//2, start_y, align="right", color=(150, 150, 150), font_type="small")
+        start_y += 35
+
+        slots = browser.slots
+        first_slot = sort_idx + 1
         for i, slot in enumerate(slots):
             rect = pygame.Rect(center_x - panel_w//2, start_y + i * gap, panel_w, panel_h)
+            selected = first_slot + i == selected_idx
             
             # Highlight border if selected
-            border_col = COLOR_SELECTED if i == selected_idx else (100, 100, 100)
-            border_w = 3 if i == selected_idx else 1
+            border_col = COLOR_SELECTED if selected else (100, 100, 100)
+            border_w = 3 if selected else 1
             
             # Background (semi-transparent)
             s = pygame.Surface((rect.width, rect.height))
@@ -107,9 +135,12 @@ class MainMenuView:
             UIStyle.draw_text(screen, slot_name, rect.x + 15, rect.y + 15, color=(255, 255, 0), font_type="small")
             UIStyle.draw_text(screen, slot_info, rect.x + 15, rect.y + 40, color=COLOR_TEXT)
 
+        if not slots:
+            UIStyle.draw_text(screen, "Nessun salvataggio", center_x, start_y + 20, align="center", color=COLOR_DISABLED)
+
         # Draw "Back" option as the last item
-        back_idx = len(slots)
-        back_y = start_y + len(slots) * gap + 20
+        back_idx = rows.index(ROW_BACK)
+        back_y = start_y + max(len(slots), 1) * gap + 20
         color = COLOR_SELECTED if selected_idx == back_idx else COLOR_TEXT
         prefix = "> " if selected_idx == back_idx else ""
         
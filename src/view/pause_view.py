@@ -1,8 +1,10 @@
 """
 Pause & Save View - Gestione grafica del menu di pausa e salvataggio in-game.
+Updated: save/load list drawn from the SlotBrowser page (sort, new save, page indicator).
 """
 import pygame
 from src.model.render_system import Renderer, RenderLayer, Camera
+from src.model.ui.slot_browser import ROW_SORT, ROW_NEW, ROW_BACK
 from src.view.ui_style import UIStyle, COLOR_SELECTED, COLOR_TEXT
 
 class PauseView:
@@ -36,10 +38,16 @@ class PauseView:
 
         self.renderer.submit_ui(draw_ui, layer=RenderLayer.UI_MODAL)
 
-    def render_save(self, screen_size: tuple, slots: list, cursor_index: int, is_input: bool = False, input_text: str = ""):
-        """Disegna la lista slot per il salvataggio (Simile al Main Menu ma in-game)."""
+    def render_save(self, screen_size: tuple, browser, is_input: bool = False, input_text: str = "",
+                    save_progress: float = None, title: str = "SALVA PARTITA"):
+        """
+        Disegna la pagina di slot del SlotBrowser (Simile al Main Menu ma in-game).
+        save_progress (0-1): salvataggio in corso sul worker, mostrato come barra.
+        """
         w, h = screen_size
-        panel_w, panel_h = 500, 400
+        panel_w, panel_h = 500, 490
+        rows = browser.rows
+        cursor_index = browser.cursor_index
         rect = pygame.Rect((w - panel_w)//2, (h - panel_h)//2, panel_w, panel_h)
 
         def draw_ui(screen: pygame.Surface, camera: Camera):
@@ -50,16 +58,34 @@ class PauseView:
             screen.blit(overlay, (0, 0))
 
             UIStyle.draw_panel(screen, rect)
-            UIStyle.draw_text(screen, "SALVA PARTITA", rect.centerx, rect.y + 30, font_type="title", align="center")
+            UIStyle.draw_text(screen, title, rect.centerx, rect.y + 30, font_type="title", align="center")
+
+            # Disegna Righe: ordinamento, nuovo salvataggio, slot della pagina
+            row_y = rect.y + 75
+            for i, row in enumerate(rows):
+                if row == ROW_BACK:
+                    continue
+                selected = i == cursor_index
+                color = COLOR_SELECTED if selected else COLOR_TEXT
+                prefix = "> " if selected else ""
+                if row == ROW_SORT:
+                    UIStyle.draw_text(screen, f"{prefix}Ordina: {browser.sort_label}", rect.x + 30, row_y, color=color, font_type="small")
+                    UIStyle.draw_text(screen, f"< {browser.page_label} >", rect.right - 30, row_y, align="right",
+                                      color=(150, 150, 150), font_type="small")
+                    row_y += 35
+                    continue
+                if row == ROW_NEW:
+                    UIStyle.draw_text(screen, f"{prefix}+ Nuovo salvataggio", rect.x + 30, row_y, color=color, font_type="small")
+                    row_y += 35
+                    continue
 
-            # Disegna Slots
-            slot_start_y = rect.y + 80
-            for i, slot in enumerate(slots):
                 # Box dello slot
-                s_rect = pygame.Rect(rect.x + 30, slot_start_y + i * 70, rect.width - 60, 60)
+                slot = row
+                s_rect = pygame.Rect(rect.x + 30, row_y, rect.width - 60, 60)
+                row_y += 70
                 
-                border_col = COLOR_SELECTED if i == cursor_index else (100, 100, 100)
-                border_w = 3 if i == cursor_index else 1
+                border_col = COLOR_SELECTED if selected else (100, 100, 100)
+                border_w = 3 if selected else 1
                 
                 pygame.draw.rect(screen, (20, 20, 30), s_rect)
                 pygame.draw.rect(screen, border_col, s_rect, border_w)
@@ -68,12 +94,14 @@ class PauseView:
                 info = "Slot Vuoto"
                 if slot.status.name == "OK" and slot.meta:
                     info = slot.meta.format_display()
+                elif slot.status.name == "CORRUPT":
+                    info = "Dati corrotti"
                 
                 UIStyle.draw_text(screen, f"Slot {slot.slot_index}", s_rect.x + 10, s_rect.y + 10, color=(255, 255, 0), font_type="small")
                 UIStyle.draw_text(screen, info, s_rect.x + 10, s_rect.y + 35, color=COLOR_TEXT, font_type="small")
 
             # Tasto Indietro
-            back_idx = len(slots)
+            back_idx = rows.index(ROW_BACK)
             color = COLOR_SELECTED if cursor_index == back_idx else COLOR_TEXT
             UIStyle.draw_text(screen, "Indietro", rect.centerx, rect.bottom - 40, align="center", color=color)
 
@@ -88,4 +116,13 @@ class PauseView:
                 # Testo digitato
                 UIStyle.draw_text(screen, input_text + "_", input_rect.centerx, input_rect.y + 40, align="center", color=(0, 255, 0), font_type="main")
 
+            if save_progress is not None:
+                bar_rect = pygame.Rect(rect.x + 30, rect.bottom - 75, rect.width - 60, 12)
+                pygame.draw.rect(screen, (20, 20, 30), bar_rect)
+                fill = bar_rect.copy()
+                fill.width = int(bar_rect.width * max(0.0, min(1.0, save_progress)))
+                pygame.draw.rect(screen, (0, 200, 0), fill)
+                pygame.draw.rect(screen, (100, 100, 100), bar_rect, 1)
+                UIStyle.draw_text(screen, "Salvataggio...", rect.centerx, bar_rect.y - 22, align="center", font_type="small")
+
         self.renderer.submit_ui(draw_ui, layer=RenderLayer.UI_MODAL)
\ No newline at end of file
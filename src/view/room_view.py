@@ -2,6 +2,7 @@
 FILE: ./src/view/room_view.py
 Room View - Rendering of exploration rooms.
 Updated: Background blit positioning.
+Updated: Static layer cache invalidated on room load; UI elements may declare bounds.
 """
 
 from typing import Optional, List, Dict, Any
@@ -24,6 +25,7 @@ class RoomView:
     
     def load_room(self, room_data: RoomData, spawn_id: Optional[str] = None, bg_image: Optional[pygame.Surface] = None) -> tuple:
         self._room_data = room_data
+        self.renderer.invalidate_static()
         
         if bg_image:
             self._background_surface = bg_image
@@ -95,7 +97,7 @@ class RoomView:
 
     def _submit_ui(self, ui_elements):
         for u in ui_elements:
-            if u.get('draw_func'): self.renderer.submit_ui(u['draw_func'], u.get('layer', RenderLayer.UI), u.get('sort_key', (0,)))
+            if u.get('draw_func'): self.renderer.submit_ui(u['draw_func'], u.get('layer', RenderLayer.UI), u.get('sort_key', (0,)), u.get('bounds'))
 
     def _submit_debug(self):
         self.debug_overlay.draw_colliders(self._room_data.get_collider_rects())
@@ -1,6 +1,7 @@
 """
 Save/Load Menu - Interfaccia utente per salvataggio e caricamento
 Epic 5: User Stories 16, 17
+Updated: slot numbers validated by SaveManager (no fixed 1-3 range).
 """
 
 from src.model.save import SlotStatus
@@ -33,7 +34,7 @@ class SaveLoadMenu:
             print(slot.get_display_text())
         
         print("-" * 40)
-        print("Select slot (1-3) or 0 to cancel")
+        print("Select slot number or 0 to cancel")
         
         return slots
     
@@ -78,7 +79,7 @@ class SaveLoadMenu:
         if slot_index == 0:
             return {'status': 'cancelled', 'message': 'Save cancelled'}
         
-        if slot_index < 1 or slot_index > 3:
+        if not self.controller.save_manager.is_valid_slot(slot_index):
             return {'status': 'error', 'message': 'Invalid slot'}
         
         # Tenta il salvataggio
@@ -138,7 +139,7 @@ class SaveLoadMenu:
         if slot_index == 0:
             return {'status': 'cancelled', 'message': 'Load cancelled'}
         
-        if slot_index < 1 or slot_index > 3:
+        if not self.controller.save_manager.is_valid_slot(slot_index):
             return {'status': 'error', 'message': 'Invalid slot'}
         
         # Verifica se lo slot è vuoto
@@ -9,13 +9,15 @@ from src.view.ui_style import UIStyle, COLOR_SELECTED, COLOR_TEXT
 from src.model.minigame.scopa_model import ScopaModel, ScopaCard
 
 class ScopaView:
+    # Dimensioni carte (class-level: usate anche dai manifest di preload degli stati)
+    CARD_W = 76
+    CARD_H = 114
+
     def __init__(self, renderer: Renderer, asset_manager):
         self.renderer = renderer
         self.assets = asset_manager
         
         # Layout Constants
-        self.CARD_W = 76
-        self.CARD_H = 114
         self.SPACING = 12
         
         # Colors
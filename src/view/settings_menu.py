@@ -3,6 +3,7 @@ from typing import Tuple, List
 from src.model.settings.audio_settings import AudioSettings
 from src.model.settings.settings_manager import SettingsManager
 from src.model.render_system import Renderer, RenderLayer, Camera
+from src.model.assets.text_cache import text_cache
 
 class SettingsMenu:
     """
@@ -23,7 +24,7 @@ class SettingsMenu:
         self.options = ["Master Volume", "Music Volume", "SFX Volume", "Save & Back"]
         
         # Visual Config
-        self.font = pygame.font.SysFont("Arial", 24, bold=True)
+        self.font = text_cache.font("Arial", 24, bold=True)
         self.color_text = (255, 255, 255)
         self.color_selected = (255, 255, 0)
         self.color_bar_bg = (50, 50, 50)
@@ -1,8 +1,10 @@
 """
 UI Style - Shared resources for UI rendering.
 Provides standard colors, fonts, and drawing primitives for the RPG look.
+Updated: Fonts and rendered strings come from the shared text cache.
 """
 import pygame
+from src.model.assets.text_cache import text_cache
 
 # Colors
 COLOR_BG = (0, 0, 40)          # Dark Blue Background
@@ -22,10 +24,9 @@ class UIStyle:
     @classmethod
     def init_fonts(cls):
         if cls._font_main is None:
-            pygame.font.init()
-            cls._font_main = pygame.font.SysFont("Arial", 24, bold=True)
-            cls._font_small = pygame.font.SysFont("Arial", 18)
-            cls._font_title = pygame.font.SysFont("Arial", 32, bold=True)
+            cls._font_main = text_cache.font("Arial", 24, bold=True)
+            cls._font_small = text_cache.font("Arial", 18)
+            cls._font_title = text_cache.font("Arial", 32, bold=True)
 
     @classmethod
     def draw_panel(cls, surface: pygame.Surface, rect: pygame.Rect, border_width: int = 3):
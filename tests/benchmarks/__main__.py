@@ -0,0 +1,52 @@
+"""
+Benchmark suite - python -m tests.benchmarks [opzioni]
+
+    python -m tests.benchmarks --out bench_results.json
+    python -m tests.benchmarks --baseline bench_baseline.json --threshold 0.25
+    python -m tests.benchmarks --group render --quick
+
+Gira headless (driver SDL "dummy"). Con --baseline confronta le mediane per operazione
+e termina con codice 1 se qualche benchmark è più lento della soglia.
+"""
+import argparse
+import sys
+
+from tests.benchmarks.harness import (
+    DEFAULT_THRESHOLD, compare, load_results, run_benchmarks, write_results
+)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Sikula performance benchmarks (headless).")
+    parser.add_argument("--out", default="bench_results.json", help="File JSON dei risultati")
+    parser.add_argument("--baseline", help="Risultati precedenti con cui confrontare")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Rallentamento relativo tollerato sulla mediana (default 0.25)")
+    parser.add_argument("--group", action="append", help="Solo questi gruppi (render, assets, simulation, save)")
+    parser.add_argument("--quick", action="store_true", help="Iterazioni ridotte (smoke test)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(groups=args.group, quick=args.quick)
+    write_results(args.out, results)
+    print(f"[Bench] {len(results)} results -> {args.out}")
+
+    if not args.baseline:
+        return 0
+
+    regressions = 0
+    for cmp in compare(results, load_results(args.baseline), args.threshold):
+        if cmp.baseline_ms is None:
+            print(f"[Bench] NEW        {cmp.name:<42} {cmp.current_ms:9.3f} ms")
+            continue
+        print(f"[Bench] {cmp.status.upper():<10} {cmp.name:<42} {cmp.baseline_ms:9.3f} -> {cmp.current_ms:9.3f} ms"
+              f"  ({cmp.ratio:.2f}x)")
+        regressions += cmp.status == "regression"
+
+    if regressions:
+        print(f"[Bench] {regressions} regression(s) over +{args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+"""
+Benchmark dell'AssetManager: get_image a cache fredda (decode + scale + convert) e calda.
+"""
+from src.model.assets.asset_manager import AssetManager
+from tests.benchmarks.harness import benchmark, measure
+
+# Varianti reali richieste dal gioco (sfondo regione, ritratto, sprite attore)
+REQUESTS = (
+    ("bg_viridor_hall", 1600, 1200),
+    ("enemy_golem", 120, 160),
+    ("characters/Turiddu", 48, 96),
+)
+
+
+@benchmark("assets")
+def bench_get_image(ctx):
+    assets = AssetManager()
+
+    def load_all():
+        for key, w, h in REQUESTS:
+            assets.get_image(key, w, h)
+
+    return [
+        measure("assets.get_image_cold", load_all, number=1, repeat=ctx.scale(10),
+                setup=assets.images.clear, images=len(REQUESTS)),
+        measure("assets.get_image_warm", load_all, number=ctx.scale(2000), images=len(REQUESTS)),
+    ]
@@ -0,0 +1,93 @@
+"""
+Benchmark del Renderer: submit + flush da 100 a 10k comandi, immediate e retained mode.
+"""
+import random
+
+import pygame
+
+from src.model.render_system import Camera, Renderer, RenderLayer
+from tests.benchmarks.harness import benchmark, measure
+
+COMMAND_COUNTS = (100, 1000, 10000)
+
+
+def _make_frame(renderer: Renderer, n: int, sprites, seed: int = 0):
+    rng = random.Random(seed)
+    # Mix tipico di una stanza: sfondo, attori ordinati per y, qualche elemento UI
+    placements = [(sprites[i % len(sprites)], rng.randrange(0, 1600), rng.randrange(0, 1200)) for i in range(n)]
+    background = pygame.Surface((1600, 1200))
+
+    def draw_ui(surface, camera):
+        pygame.draw.rect(surface, (255, 255, 255), (10, 470, 220, 120), 1)
+
+    def submit():
+        renderer.begin_frame()
+        renderer.submit_sprite(background, background.get_rect(), RenderLayer.BACKGROUND)
+        for surf, x, y in placements:
+            renderer.submit_sprite(surf, pygame.Rect(x, y, surf.get_width(), surf.get_height()), RenderLayer.ACTORS)
+        renderer.submit_ui(draw_ui, RenderLayer.UI, bounds=pygame.Rect(10, 470, 221, 121))
+
+    return submit
+
+
+@benchmark("render")
+def bench_submit_flush(ctx):
+    screen = pygame.Surface((800, 600))
+    camera = Camera(800, 600)
+    camera.snap_to_position(400, 300)
+    sprites = [pygame.Surface((w, h), pygame.SRCALPHA) for w, h in ((32, 64), (48, 96), (76, 114))]
+
+    results = []
+    for n in COMMAND_COUNTS:
+        number = ctx.scale(max(1, 20000 // n))
+
+        renderer = Renderer()
+        submit = _make_frame(renderer, n, sprites)
+
+        def immediate():
+            submit()
+            renderer.flush(screen, camera)
+
+        results.append(measure(f"render.submit_flush[n={n}]", immediate, number=number, commands=n))
+
+        retained_renderer = Renderer()
+        submit_retained = _make_frame(retained_renderer, n, sprites)
+
+        def retained():
+            submit_retained()
+            retained_renderer.flush_retained(screen, camera)
+
+        results.append(measure(f"render.submit_flush_retained[n={n}]", retained, number=number, commands=n))
+    return results
+
+
+@benchmark("render")
+def bench_room_frame(ctx):
+    """Frame tipico di esplorazione a camera ferma: sfondo e props statici, pochi attori dinamici."""
+    screen = pygame.Surface((800, 600))
+    camera = Camera(800, 600)
+    camera.snap_to_position(400, 300)
+    rng = random.Random(0)
+    background = pygame.Surface((1600, 1200))
+    prop = pygame.Surface((48, 48), pygame.SRCALPHA)
+    actor = pygame.Surface((48, 96), pygame.SRCALPHA)
+    props = [pygame.Rect(rng.randrange(0, 1600), rng.randrange(0, 1200), 48, 48) for _ in range(200)]
+    actors = [pygame.Rect(rng.randrange(0, 760), rng.randrange(0, 500), 48, 96) for _ in range(8)]
+
+    def submit(renderer):
+        renderer.begin_frame()
+        renderer.submit_sprite(background, background.get_rect(), RenderLayer.BACKGROUND)
+        for rect in props:
+            renderer.submit_sprite(prop, rect, RenderLayer.TILEMAP)
+        for rect in actors:
+            renderer.submit_sprite(actor, rect, RenderLayer.ACTORS)
+
+    immediate_renderer, retained_renderer = Renderer(), Renderer()
+    number = ctx.scale(200)
+    return [
+        measure("render.room_frame", lambda: (submit(immediate_renderer), immediate_renderer.flush(screen, camera)),
+                number=number, commands=len(props) + len(actors) + 1),
+        measure("render.room_frame_retained",
+                lambda: (submit(retained_renderer), retained_renderer.flush_retained(screen, camera)),
+                number=number, commands=len(props) + len(actors) + 1),
+    ]
@@ -0,0 +1,27 @@
+"""
+Benchmark dei salvataggi: round trip save_to_slot -> load_from_slot -> GameSerializer.from_dict.
+"""
+import os
+
+from src.model.save import GameSerializer, SaveManager
+from tests.benchmarks.harness import benchmark, measure
+
+
+@benchmark("save")
+def bench_save_load_roundtrip(ctx):
+    game = ctx.driver().controller.game
+    game.start_new_game(2)
+    manager = SaveManager(save_dir=os.path.join(ctx.tmp_dir, "saves"), max_slots=3)
+
+    def save():
+        manager.save_to_slot(1, game, force_overwrite=True)
+
+    def roundtrip():
+        manager.save_to_slot(1, game, force_overwrite=True)
+        result = manager.load_from_slot(1)
+        GameSerializer.from_dict(result.save_data.to_dict(), game)
+
+    return [
+        measure("save.save_to_slot", save, number=ctx.scale(50)),
+        measure("save.roundtrip", roundtrip, number=ctx.scale(50)),
+    ]
@@ -0,0 +1,111 @@
+"""
+Benchmark della simulazione: movimento con collisioni in RoomState, query spaziali su
+una stanza densa, ricerca delle prese di scopa e una run completa in regione (driver
+headless con rendering).
+"""
+import random
+
+import pygame
+
+from src.model.input_actions import Action
+from src.model.minigame.scopa_model import ScopaCard, ScopaModel, SEMI
+from src.model.states.base_state import StateID
+from tests.benchmarks.harness import benchmark, measure
+
+REGION_ROOM = "viridor_entry"
+STEP_DT = 1.0 / 60
+
+
+@benchmark("simulation")
+def bench_room_movement(ctx):
+    from src.controller.headless_driver import resolve_key
+
+    driver = ctx.driver()
+    controller = driver.controller
+    game = controller.game
+    driver.render = False
+    game.start_new_game(2)
+    driver.enter_room(REGION_ROOM)
+
+    room_state = controller.state_machine._get_state(StateID.ROOM)
+    input_manager = controller.input_manager
+    render_ctrl = controller.render_controller
+    spawn = list(game.gamestate.party_position)
+    right, left = resolve_key(Action.MOVE_RIGHT), resolve_key(Action.MOVE_LEFT)
+    steps = 120
+
+    def reset():
+        game.gamestate.party_position = list(spawn)
+
+    def walk():
+        # Avanti e indietro: ogni passo è un check di collisione (+ trigger) sulla stanza
+        for key in (right, left):
+            input_manager.process_event(pygame.event.Event(pygame.KEYDOWN, key=key))
+            for _ in range(steps // 2):
+                room_state._handle_movement(STEP_DT, game, input_manager, render_ctrl)
+            input_manager.process_event(pygame.event.Event(pygame.KEYUP, key=key))
+
+    return measure("sim.room_handle_movement[per_step]", walk, number=ctx.scale(20), setup=reset,
+                   ops=steps, room=REGION_ROOM)
+
+
+@benchmark("simulation")
+def bench_dense_room_queries(ctx):
+    from src.model.room_data import RoomData, Collider, TriggerZone, EntityDefinition
+
+    rng = random.Random(11)
+    room = RoomData(room_id="bench_dense", width=4000, height=4000)
+    for i in range(2000):
+        x, y = rng.randrange(0, 3950), rng.randrange(0, 3950)
+        room.colliders.append(Collider(f"c{i}", pygame.Rect(x, y, 48, 48)))
+        room.triggers.append(TriggerZone(f"t{i}", pygame.Rect(y, x, 64, 64), "script"))
+        room.entities.append(EntityDefinition(f"e{i}", "npc", x + 20, y + 60, script_id="talk"))
+    room.build_spatial_index()
+    probes = [(rng.randrange(0, 4000), rng.randrange(0, 4000)) for _ in range(200)]
+
+    def query():
+        # Le tre query che RoomState fa a ogni passo
+        for px, py in probes:
+            rect = pygame.Rect(px, py, 32, 32)
+            room.check_collision(rect)
+            room.check_triggers(rect)
+            room.get_closest_interactable(px, py, 140.0)
+
+    return measure("sim.room_queries[objects=2000]", query, number=ctx.scale(20), ops=len(probes), objects=2000)
+
+
+@benchmark("simulation")
+def bench_scopa_capture_search(ctx):
+    rng = random.Random(7)
+    model = ScopaModel()
+    # Tavolo pieno: 8 carte basse, il caso peggiore per la ricerca delle somme
+    model.tavolo = [ScopaCard(rng.randint(1, 5), rng.choice(SEMI)) for _ in range(8)]
+    hand = [ScopaCard(v, "Coppe") for v in range(1, 11)]
+
+    def search():
+        for card in hand:
+            model.analizza_presa(card)
+
+    return measure("sim.scopa_analizza_presa[table=8]", search, number=ctx.scale(200), ops=len(hand), table=8)
+
+
+@benchmark("simulation")
+def bench_region_run(ctx):
+    from src.controller.headless_driver import RandomInputPolicy
+
+    driver = ctx.driver()
+    steps = ctx.scale(600)
+
+    def setup():
+        random.seed(0)
+        driver.controller.game.start_new_game(2)
+        driver.enter_room(REGION_ROOM)
+
+    def run():
+        driver.render = True
+        driver.run(steps, policy=RandomInputPolicy(seed=0))
+        driver.render = False
+
+    # Un'operazione = un passo di simulazione (eventi + process_frame + render)
+    return measure("sim.region_run_rendered[per_step]", run, number=1, repeat=5, setup=setup,
+                   ops=steps, room=REGION_ROOM)
@@ -0,0 +1,193 @@
+"""
+Benchmark harness - Registro dei benchmark, misure ripetute e confronto con una baseline.
+
+Ogni benchmark è una funzione registrata con @benchmark(nome) che riceve un BenchContext
+(risorse condivise: display dummy, driver headless, cartelle temporanee) e ritorna uno o più
+BenchResult, di solito tramite measure(). I risultati vanno su JSON; compare() li confronta
+con un file precedente sulla mediana per chiamata.
+"""
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+RESULTS_VERSION = 1
+DEFAULT_THRESHOLD = 0.25   # +25% sulla mediana = regressione
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """Tempi per singola operazione, in millisecondi."""
+    name: str
+    median_ms: float
+    min_ms: float
+    mean_ms: float
+    stdev_ms: float
+    repeat: int
+    number: int
+    params: Dict = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline_ms: Optional[float]
+    current_ms: float
+    status: str   # "ok" | "regression" | "improved" | "new"
+
+    @property
+    def ratio(self) -> Optional[float]:
+        return self.current_ms / self.baseline_ms if self.baseline_ms else None
+
+
+def measure(name: str, fn: Callable[[], None], number: int = 1, repeat: int = 7,
+            setup: Optional[Callable[[], None]] = None, warmup: int = 1, ops: int = 1,
+            **params) -> BenchResult:
+    """
+    Esegue fn `number` volte per campione, `repeat` campioni (più `warmup` scartati).
+    setup() gira prima di ogni campione e non viene cronometrato (es. svuotare una cache).
+    ops = operazioni fatte da una chiamata di fn: i tempi sono riportati per operazione.
+    """
+    samples = []
+    for i in range(warmup + repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if i >= warmup:
+            samples.append(elapsed * 1000.0 / (number * ops))
+
+    return BenchResult(
+        name=name,
+        median_ms=statistics.median(samples),
+        min_ms=min(samples),
+        mean_ms=statistics.fmean(samples),
+        stdev_ms=statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        repeat=repeat,
+        number=number,
+        params={**params, "ops": ops} if ops != 1 else params,
+    )
+
+
+# ============== REGISTRY ==============
+
+_REGISTRY: List[tuple] = []
+
+
+def benchmark(group: str):
+    """Registra una funzione benchmark(ctx) -> BenchResult | list[BenchResult]."""
+    def decorator(fn):
+        _REGISTRY.append((group, fn))
+        return fn
+    return decorator
+
+
+class BenchContext:
+    """Risorse condivise tra i benchmark, create al primo uso."""
+
+    def __init__(self, quick: bool = False):
+        self.quick = quick
+        self._driver = None
+        self._tmp = tempfile.TemporaryDirectory(prefix="sikula_bench_")
+        pygame.init()
+        if pygame.display.get_surface() is None:
+            # convert_alpha() richiede un display (il driver dummy non apre finestre)
+            pygame.display.set_mode((800, 600))
+
+    def scale(self, n: int) -> int:
+        """Iterazioni ridotte in modalità --quick (smoke test del suite)."""
+        return max(1, n // 10) if self.quick else n
+
+    @property
+    def tmp_dir(self) -> str:
+        return self._tmp.name
+
+    def driver(self):
+        """HeadlessDriver condiviso (creare GameController e caricare i contenuti costa)."""
+        if self._driver is None:
+            from src.controller.headless_driver import HeadlessDriver
+            self._driver = HeadlessDriver(render=False, seed=0)
+        return self._driver
+
+    def close(self) -> None:
+        if self._driver is not None:
+            self._driver.shutdown()
+        self._tmp.cleanup()
+
+
+def run_benchmarks(groups: Optional[List[str]] = None, quick: bool = False,
+                   log: Callable[[str], None] = print) -> List[BenchResult]:
+    # Import dei moduli bench_*: registrano i benchmark
+    from tests.benchmarks import bench_render, bench_assets, bench_simulation, bench_save  # noqa: F401
+
+    ctx = BenchContext(quick=quick)
+    results: List[BenchResult] = []
+    try:
+        for group, fn in _REGISTRY:
+            if groups and group not in groups:
+                continue
+            out = fn(ctx)
+            for res in (out if isinstance(out, list) else [out]):
+                log(f"[Bench] {res.name:<42} median {res.median_ms:9.3f} ms  (min {res.min_ms:.3f}, n={res.number}x{res.repeat})")
+                results.append(res)
+    finally:
+        ctx.close()
+    return results
+
+
+# ============== I/O + BASELINE ==============
+
+def results_to_dict(results: List[BenchResult]) -> dict:
+    return {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+        },
+        "results": {r.name: asdict(r) for r in results},
+    }
+
+
+def write_results(path: str, results: List[BenchResult]) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results_to_dict(results), f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return data.get("results", {})
+
+
+def compare(results: List[BenchResult], baseline: Dict[str, dict],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Comparison]:
+    """Confronto sulle mediane: oltre (1 + threshold) è regressione, sotto (1 - threshold) miglioramento."""
+    out = []
+    for res in results:
+        base = baseline.get(res.name)
+        if base is None:
+            out.append(Comparison(res.name, None, res.median_ms, "new"))
+            continue
+        base_ms = base["median_ms"]
+        if res.median_ms > base_ms * (1.0 + threshold):
+            status = "regression"
+        elif res.median_ms < base_ms * (1.0 - threshold):
+            status = "improved"
+        else:
+            status = "ok"
+        out.append(Comparison(res.name, base_ms, res.median_ms, status))
+    return out
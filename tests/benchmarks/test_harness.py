@@ -0,0 +1,50 @@
+"""
+Test del benchmark harness (misure, I/O dei risultati, confronto con la baseline).
+I benchmark veri non girano con pytest: python -m tests.benchmarks
+"""
+import os
+import tempfile
+import unittest
+
+from tests.benchmarks.harness import BenchResult, compare, load_results, measure, write_results
+
+
+def _result(name, median_ms):
+    return BenchResult(name, median_ms, median_ms, median_ms, 0.0, repeat=1, number=1)
+
+
+class TestHarness(unittest.TestCase):
+
+    def test_measure_runs_setup_per_sample_and_reports_per_op(self):
+        calls = {"setup": 0, "fn": 0}
+
+        def setup():
+            calls["setup"] += 1
+
+        def fn():
+            calls["fn"] += 1
+
+        res = measure("noop", fn, number=3, repeat=4, warmup=1, setup=setup, ops=10)
+
+        self.assertEqual(calls, {"setup": 5, "fn": 15})
+        self.assertEqual((res.repeat, res.number), (4, 3))
+        self.assertEqual(res.params["ops"], 10)
+        self.assertLessEqual(res.min_ms, res.median_ms)
+
+    def test_compare_statuses(self):
+        baseline = {"a": {"median_ms": 1.0}, "b": {"median_ms": 1.0}, "c": {"median_ms": 1.0}}
+        current = [_result("a", 1.1), _result("b", 1.5), _result("c", 0.5), _result("d", 2.0)]
+
+        statuses = {c.name: c.status for c in compare(current, baseline, threshold=0.25)}
+        self.assertEqual(statuses, {"a": "ok", "b": "regression", "c": "improved", "d": "new"})
+
+    def test_results_roundtrip(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "bench.json")
+            write_results(path, [_result("render.submit_flush[n=100]", 1.25)])
+            loaded = load_results(path)
+        self.assertAlmostEqual(loaded["render.submit_flush[n=100]"]["median_ms"], 1.25)
+
+
+if __name__ == '__main__':
+    unittest.main()
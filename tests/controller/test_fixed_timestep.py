@@ -0,0 +1,71 @@
+"""
+Test per il FixedTimestepLoop: accumulatore, interpolazione e frame-skip.
+"""
+import os
+import tempfile
+import unittest
+
+from src.controller.fixed_timestep import FixedTimestepLoop
+from src.model.settings.settings_manager import SettingsManager
+
+
+class TestFixedTimestepLoop(unittest.TestCase):
+
+    def test_steps_independent_of_render_rate(self):
+        fast = FixedTimestepLoop(sim_hz=60)
+        slow = FixedTimestepLoop(sim_hz=60)
+
+        fast_steps = sum(fast.advance(1 / 240) for _ in range(240))
+        slow_steps = sum(slow.advance(1 / 30) for _ in range(30))
+
+        self.assertEqual(fast_steps, 60)
+        self.assertEqual(slow_steps, 60)
+
+    def test_alpha_is_leftover_fraction(self):
+        loop = FixedTimestepLoop(sim_hz=50)
+        self.assertEqual(loop.advance(0.03), 1)
+        self.assertAlmostEqual(loop.alpha, 0.5)
+
+        self.assertEqual(loop.advance(0.005), 0)
+        self.assertAlmostEqual(loop.alpha, 0.75)
+
+    def test_frame_skip_caps_steps_and_drops_excess(self):
+        loop = FixedTimestepLoop(sim_hz=100, max_steps=3)
+
+        self.assertEqual(loop.advance(0.1), 3)
+        self.assertAlmostEqual(loop.dropped_time, 0.07)
+        self.assertEqual(loop.skipped_frames, 2)
+        self.assertLess(loop.accumulator, loop.step_dt)
+
+    def test_huge_frame_is_clamped(self):
+        loop = FixedTimestepLoop(sim_hz=60, max_steps=100, max_frame_time=0.25)
+        self.assertEqual(loop.advance(10.0), 15)
+
+    def test_configure_changes_rate(self):
+        loop = FixedTimestepLoop(sim_hz=60)
+        loop.configure(120, 2)
+        self.assertAlmostEqual(loop.step_dt, 1 / 120)
+        self.assertEqual(loop.advance(0.1), 2)
+
+
+
+class TestLoopSettings(unittest.TestCase):
+
+    def test_roundtrip_and_clamping(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "settings.json")
+            sm = SettingsManager(path=path)
+            sm.set_sim_hz(120)
+            sm.set_render_fps_cap(0)
+            sm.set_max_sim_steps(999)
+            sm.save()
+
+            loaded = SettingsManager(path=path)
+            loaded.load()
+            self.assertEqual(loaded.sim_hz, 120)
+            self.assertEqual(loaded.render_fps_cap, 0)  # 0 = render non limitato
+            self.assertEqual(loaded.max_sim_steps, 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
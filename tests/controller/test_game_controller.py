@@ -3,22 +3,35 @@ Unit tests for GameController
 Epic 4 (US13) + Epic 5 (US16, US17)
 """
 
+import os
 import unittest
 import tempfile
 import shutil
 
 from src.controller.game_controller import GameController
+from src.controller.headless_driver import HeadlessDriver, InputScript
+from src.model.save import AUTOSAVE_FILENAME
+from src.model.states.base_state import StateID
+from src.model.states.game_states import MENU_CONTINUE, MENU_NEW_GAME
 from src.model.save import SaveManager, SlotStatus
 
 
+def close_controller(controller):
+    """Chiude autosave e worker dei salvataggi prima di cancellare la save_dir temporanea."""
+    controller.autosave.close()
+    controller.save_service.shutdown()
+
+
 class TestGameControllerNewGame(unittest.TestCase):
     """Tests for US13: Starting new games."""
     
     def setUp(self):
-        self.controller = GameController()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.controller = GameController(save_dir=self.temp_dir.name)
     
     def tearDown(self):
-        self.controller = None
+        close_controller(self.controller)
+        self.temp_dir.cleanup()
     
     def test_start_singleplayer_game(self):
         """
@@ -59,9 +72,14 @@ class TestGameControllerInventory(unittest.TestCase):
     """Tests for inventory and abilities access."""
     
     def setUp(self):
-        self.controller = GameController()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.controller = GameController(save_dir=self.temp_dir.name)
         self.controller.start_new_game(1)
     
+    def tearDown(self):
+        close_controller(self.controller)
+        self.temp_dir.cleanup()
+    
     def test_get_player_inventory_returns_tuple(self):
         """get_player_inventory returns (items, capacity, count)."""
         items, capacity, count = self.controller.get_player_inventory(0)
@@ -84,13 +102,13 @@ class TestGameControllerSaveLoad(unittest.TestCase):
     
     def setUp(self):
         self.temp_dir = tempfile.mkdtemp()
-        self.controller = GameController()
+        # Cleanup LIFO: i controller (anche quelli creati nei test) si chiudono prima della rmtree
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.controller = GameController(save_dir=self.temp_dir)
+        self.addCleanup(close_controller, self.controller)
         self.controller.save_manager = SaveManager(save_dir=self.temp_dir, max_slots=3)
         self.controller.start_new_game(1)
     
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
-    
     def test_can_save_in_hub_state(self):
         """US16: Save allowed in HubState."""
         self.controller.set_current_state("HubState")
@@ -153,7 +171,8 @@ class TestGameControllerSaveLoad(unittest.TestCase):
         self.controller.save_game(1, confirmed=True)
         
         # Create new controller and load
-        new_controller = GameController()
+        new_controller = GameController(save_dir=self.temp_dir)
+        self.addCleanup(close_controller, new_controller)
         new_controller.save_manager = SaveManager(save_dir=self.temp_dir, max_slots=3)
         result = new_controller.load_game(1)
         
@@ -171,7 +190,8 @@ class TestGameControllerSaveLoad(unittest.TestCase):
         self.controller.save_game(1, confirmed=True)
         
         # Load in new controller
-        new_controller = GameController()
+        new_controller = GameController(save_dir=self.temp_dir)
+        self.addCleanup(close_controller, new_controller)
         new_controller.save_manager = SaveManager(save_dir=self.temp_dir, max_slots=3)
         new_controller.load_game(1)
         
@@ -201,7 +221,12 @@ class TestGameControllerStateManagement(unittest.TestCase):
     """Tests for state management."""
     
     def setUp(self):
-        self.controller = GameController()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.controller = GameController(save_dir=self.temp_dir.name)
+    
+    def tearDown(self):
+        close_controller(self.controller)
+        self.temp_dir.cleanup()
     
     def test_initial_state_is_main_menu(self):
         """Initial state should be MainMenu."""
@@ -218,5 +243,46 @@ class TestGameControllerStateManagement(unittest.TestCase):
         self.assertEqual(self.controller.get_current_state(), "PauseState")
 
 
+class TestMainMenuContinue(unittest.TestCase):
+    """Main menu "Continua": resumes the autosave, New Game asks before overwriting it."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        played = HeadlessDriver(save_dir=self.temp_dir.name)
+        played.start_new_game(2)
+        played.controller.game.set_flag("met_giufa", True)
+        played.shutdown()
+
+        self.driver = HeadlessDriver(save_dir=self.temp_dir.name)
+        self.addCleanup(self.driver.shutdown)
+        self.driver.main_menu()
+        self.menu = self.driver.controller.state_machine.peek()
+
+    def test_continue_resumes_autosave(self):
+        self.assertEqual(self.menu.options[0], MENU_CONTINUE)
+
+        report = self.driver.run(5, script=InputScript().tap("CONFIRM", at=1))
+
+        self.assertIsNone(report.error)
+        self.assertEqual(self.driver.current_state_id, StateID.HUB)
+        self.assertTrue(self.driver.controller.game.gamestate.flags.get("met_giufa"))
+
+    def test_new_game_asks_before_overwriting_autosave(self):
+        path = os.path.join(self.temp_dir.name, AUTOSAVE_FILENAME)
+        with open(path, "rb") as f:
+            before = f.read()
+
+        self.driver.run(4, script=InputScript().tap("MENU_DOWN", at=0).tap("CONFIRM", at=2))
+        self.assertEqual(self.menu.options[self.menu.cursor_index], MENU_NEW_GAME)
+        self.assertTrue(self.menu.confirm_new_game)
+        self.assertEqual(self.driver.current_state_id, StateID.MAIN_MENU)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), before)
+
+        self.driver.run(3, script=InputScript().tap("CONFIRM", at=self.driver.step_index + 1))
+        self.assertEqual(self.driver.current_state_id, StateID.CUTSCENE)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""
+Test per il driver headless: input scriptato, run senza finestra e uscita dal gioco.
+"""
+import os
+import unittest
+
+import pygame
+
+from src.controller.headless_driver import HeadlessDriver, InputScript, RandomInputPolicy, resolve_key
+from src.model.input_actions import Action
+from src.model.save import AUTOSAVE_FILENAME, SAVE_DIR
+from src.model.states.base_state import StateID
+
+
+class TestInputScript(unittest.TestCase):
+
+    def test_tap_produces_down_then_up(self):
+        pygame.init()
+        script = InputScript().tap("CONFIRM", at=3, hold=2)
+
+        self.assertEqual([e.type for e in script.events_for(3)], [pygame.KEYDOWN])
+        self.assertEqual([e.type for e in script.events_for(5)], [pygame.KEYUP])
+        self.assertEqual(script.events_for(4), [])
+        self.assertEqual(script.length, 6)
+
+    def test_resolve_key_names(self):
+        pygame.init()
+        self.assertEqual(resolve_key("d"), pygame.K_d)
+        self.assertEqual(resolve_key("MOVE_RIGHT"), resolve_key(Action.MOVE_RIGHT))
+        with self.assertRaises(ValueError):
+            resolve_key("not-a-key")
+
+
+class TestHeadlessDriver(unittest.TestCase):
+
+    def setUp(self):
+        self.driver = HeadlessDriver(render=True, seed=1)
+        self.driver.main_menu()
+
+    def tearDown(self):
+        self.driver.shutdown()
+
+    def test_quit_from_main_menu_via_script(self):
+        script = (InputScript()
+                  .tap("MENU_DOWN", at=1)
+                  .tap("MENU_DOWN", at=3)
+                  .tap("CONFIRM", at=5))
+
+        report = self.driver.run(100, script=script)
+
+        self.assertTrue(report.quit_requested)
+        self.assertIsNone(report.error)
+        self.assertEqual(report.steps, 5)
+        self.assertEqual(report.frames_rendered, 5)
+
+    def test_new_game_runs_with_random_input(self):
+        self.driver.render = False
+        self.driver.start_new_game(2)
+
+        report = self.driver.run(600, policy=RandomInputPolicy(seed=3))
+
+        self.assertIsNone(report.error)
+        self.assertEqual(report.steps, 600)
+        self.assertEqual(report.frames_rendered, 0)
+        self.assertNotEqual(self.driver.current_state_id, StateID.MAIN_MENU)
+
+    def test_new_game_autosaves_to_temp_dir(self):
+        self.driver.start_new_game(2)
+        save_dir = self.driver.save_dir
+
+        self.assertNotEqual(os.path.abspath(save_dir), os.path.abspath(SAVE_DIR))
+        self.assertTrue(self.driver.controller.save_service.flush(5.0))
+        self.assertTrue(os.path.exists(os.path.join(save_dir, AUTOSAVE_FILENAME)))
+
+        self.driver.shutdown()
+        self.assertFalse(self.driver.controller.autosave.active)
+        self.assertFalse(os.path.exists(save_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
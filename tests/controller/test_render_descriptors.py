@@ -0,0 +1,70 @@
+"""
+Test per i descrittori di rendering delle entità (RenderController._entity_actors).
+"""
+import os
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+pygame.init()
+
+from src.controller.render_controller import RenderController
+from src.model.render_system import RenderLayer
+from src.model.room_data import RoomData, EntityDefinition
+
+
+class TestEntityRenderDescriptors(unittest.TestCase):
+
+    def setUp(self):
+        self.ctrl = RenderController()
+        self.room = RoomData("etna_test", "Test")
+        self.room.entities.append(EntityDefinition("boss_oste", "enemy", 400, 200))
+        self.room.entities.append(EntityDefinition("giufa", "npc", 100, 100))
+        self.room.entities.append(EntityDefinition("barrel", "prop", 50, 60, width=16, height=16))
+        self.ctrl.load_room(self.room)
+
+    def test_descriptors_resolved_at_load(self):
+        boss, npc, barrel = self.ctrl._entity_actors()
+        self.assertEqual(boss["rect"], pygame.Rect(400 + 16 - 60, 232 - 160, 120, 160))
+        self.assertEqual(boss["sort_y"], 232)
+        self.assertEqual(boss["layer"], RenderLayer.ACTORS)
+        self.assertEqual(npc["rect"].size, (32, 64))
+        self.assertEqual(barrel["rect"].size, (32, 32))
+
+    def test_unchanged_entities_are_not_re_resolved(self):
+        first = self.ctrl._entity_actors()
+        with patch.object(self.ctrl.asset_manager, "get_image") as get_image, \
+             patch.object(self.ctrl, "_entity_sprite_spec") as spec:
+            second = self.ctrl._entity_actors()
+        get_image.assert_not_called()
+        spec.assert_not_called()
+        for a, b in zip(first, second):
+            self.assertIs(a, b)
+
+    def test_moved_entity_is_refreshed(self):
+        before = self.ctrl._entity_actors()
+        self.room.entities[1].x += 10
+        after = self.ctrl._entity_actors()
+        self.assertEqual(after[1]["rect"].x, before[1]["rect"].x + 10)
+        self.assertIs(after[0], before[0])
+
+    def test_removed_entity_rebuilds_list(self):
+        self.room.remove_entity("giufa")
+        actors = self.ctrl._entity_actors()
+        self.assertEqual(len(actors), 2)
+        self.assertEqual(actors[1]["rect"].size, (32, 32))
+
+    def test_replaced_sprite_is_picked_up(self):
+        actor = self.ctrl._entity_actors()[1]
+        cache_key = "giufa_32x64_STRETCH"
+        replacement = pygame.Surface((32, 64))
+        self.ctrl.asset_manager.images.put(cache_key, replacement)
+        self.assertIs(self.ctrl._entity_actors()[1]["surface"], replacement)
+        self.assertIs(actor["surface"], replacement)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,8 @@ import unittest
 from src.controller.room_manager import RoomManager
 from src.model.room_data import RoomData
 from src.model.persistent_world_state import PersistentWorldState
+from src.model.flag_manager import FlagManager
+from src.model.content.registry import ContentRegistry
 
 
 class TestRoomManagerLoading(unittest.TestCase):
@@ -76,5 +78,110 @@ class TestRoomManagerLoading(unittest.TestCase):
         self.assertIsNone(self.room_manager.get_current_room())
 
 
+class TestRoomManagerOnceFlag(unittest.TestCase):
+    """once_flag entities follow flag changes through FlagManager subscriptions."""
+
+    def setUp(self):
+        self.flags = FlagManager()
+        self.room_manager = RoomManager(PersistentWorldState(), self.flags)
+        self.room = RoomData.from_dict({
+            'room_id': 'vault',
+            'entities': [
+                {'entity_id': 'chest', 'entity_type': 'interactable', 'x': 50, 'y': 50,
+                 'once_flag': 'chest_opened', 'properties': {'label': 'Apri'}},
+                {'entity_id': 'npc_01', 'entity_type': 'npc', 'x': 150, 'y': 100},
+            ]
+        })
+
+    def _spawned_ids(self):
+        return [e.entity_id for e in self.room_manager.get_spawned_entities()]
+
+    def test_once_flag_set_before_load_hides_entity(self):
+        self.flags.set_flag('chest_opened')
+        self.room_manager.load_room(self.room)
+        self.assertEqual(self._spawned_ids(), ['npc_01'])
+        self.assertTrue(self.room.is_entity_hidden('chest'))
+        self.assertIsNone(self.room.get_closest_interactable(66, 66, 10))
+
+    def test_flag_change_while_loaded_updates_room(self):
+        self.room_manager.load_room(self.room)
+        self.assertEqual(self._spawned_ids(), ['chest', 'npc_01'])
+
+        self.flags.set_flag('chest_opened')
+        self.assertEqual(self._spawned_ids(), ['npc_01'])
+        self.assertEqual([e.entity_id for e in self.room.entities], ['npc_01'])
+
+        self.flags.clear_flag('chest_opened')
+        self.assertEqual(self._spawned_ids(), ['chest', 'npc_01'])
+        self.assertEqual(self.room.get_closest_interactable(66, 66, 10).entity_id, 'chest')
+
+    def test_unload_unsubscribes_and_reload_reevaluates(self):
+        self.room_manager.load_room(self.room)
+        self.room_manager.unload_room()
+        self.flags.set_flag('chest_opened')
+        self.assertFalse(self.room.is_entity_hidden('chest'))
+
+        self.room_manager.load_room(self.room)
+        self.assertEqual(self._spawned_ids(), ['npc_01'])
+        self.room_manager.unload_room()
+
+        self.flags.bind_flags({})
+        self.room_manager.load_room(self.room)
+        self.assertEqual(self._spawned_ids(), ['chest', 'npc_01'])
+
+
+class TestRoomManagerContentIndexes(unittest.TestCase):
+    """Hidden and removed entities leave the ContentRegistry secondary indexes."""
+
+    def setUp(self):
+        self.flags = FlagManager()
+        self.world_state = PersistentWorldState()
+        self.content = ContentRegistry()
+        self.room = RoomData.from_dict({
+            'room_id': 'vault_a',
+            'entities': [
+                {'entity_id': 'chest', 'entity_type': 'interactable', 'x': 50, 'y': 50,
+                 'once_flag': 'chest_opened', 'properties': {'label': 'Apri'}},
+                {'entity_id': 'npc_01', 'entity_type': 'npc', 'x': 150, 'y': 100},
+            ]
+        })
+        self.content.register("rooms", {"id": self.room.room_id, "obj": self.room})
+        self.room_manager = RoomManager(self.world_state, self.flags)
+        self.room_manager.set_content(self.content)
+
+    def _indexed(self, entity_type):
+        return [e.entity_id for e in self.content.entities_by_type(entity_type)]
+
+    def test_removed_entity_leaves_indexes(self):
+        self.room_manager.load_room(self.room)
+        self.room_manager.remove_entity('npc_01')
+
+        self.assertEqual(self._indexed('npc'), [])
+        self.assertEqual([e.entity_id for e in self.content.entities_in_region('vault')], ['chest'])
+
+        # Nuova partita: stato del mondo azzerato, l'entità torna
+        self.room_manager.set_world_state(PersistentWorldState())
+        self.room_manager.load_room(self.room)
+        self.assertEqual(self._indexed('npc'), ['npc_01'])
+
+    def test_once_flag_toggles_indexes(self):
+        self.room_manager.load_room(self.room)
+        self.flags.set_flag('chest_opened')
+        self.assertEqual(self._indexed('interactable'), [])
+
+        self.flags.clear_flag('chest_opened')
+        self.assertEqual(self._indexed('interactable'), ['chest'])
+
+    def test_removed_before_load_not_indexed_or_restored_by_flag(self):
+        self.world_state.remove_entity('vault_a', 'chest')
+        self.room_manager.load_room(self.room)
+        self.assertEqual(self._indexed('interactable'), [])
+
+        self.flags.set_flag('chest_opened')
+        self.flags.clear_flag('chest_opened')
+        self.assertEqual(self._indexed('interactable'), [])
+        self.assertEqual([e.entity_id for e in self.room_manager.get_spawned_entities()], ['npc_01'])
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -17,6 +17,7 @@ from src.model.combat.combat_types import Encounter
 from src.controller.state_machine import StateMachine, StateID
 from src.controller.game_controller import GameController
 from src.model.input_actions import Action
+from src.model.room_data import RoomData, SpawnPoint
 
 class TestDamageFormula_US72(unittest.TestCase):
     def setUp(self):
@@ -87,10 +88,13 @@ class TestCombatFlow_US74_75_76(unittest.TestCase):
         self.hero.atk = 10; self.hero.defense = 5; self.hero.spd = 10
         self.controller.game.gamestate.party.get_enabled_characters.return_value = [self.hero]
 
-        # Configure content mock
-        mock_room_data = Mock()
-        mock_room_data.get_spawn_position.return_value = (100, 200)
-        self.controller.game.content.get.return_value = mock_room_data
+        self.controller.autosave = Mock()
+        self.controller.action_runner = Mock()
+
+        # Configure content mock: stanza vera (RoomManager itera entità e trigger)
+        room_data = RoomData(room_id="hub", spawns={"default": SpawnPoint("default", 100, 200)})
+        self.controller.game.content.get.return_value = room_data
+        self.controller.game.world_state.is_entity_removed.return_value = False
         
         # Setup State Machine
         self.sm = StateMachine()
@@ -0,0 +1,124 @@
+"""
+Test per AssetPreloader: decodifica in background, consegna sul main thread,
+residency set per regione.
+"""
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from src.model.assets.asset_manager import AssetManager, AssetRequest
+from src.model.assets.asset_preloader import AssetPreloader, GLOBAL_REGION
+from src.model.room_data import RoomData
+
+pygame.init()
+
+
+class TestAssetPreloader(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        images_dir = os.path.join(self._tmp.name, "images")
+        os.makedirs(images_dir)
+        for name in ("hero", "tree"):
+            surf = pygame.Surface((8, 8))
+            surf.fill((200, 10, 10))
+            pygame.image.save(surf, os.path.join(images_dir, f"{name}.png"))
+
+        self.assets = AssetManager(self._tmp.name)
+        self.preloader = AssetPreloader(self.assets)
+
+    def tearDown(self):
+        self.preloader.shutdown()
+        self._tmp.cleanup()
+
+    def test_request_decode_and_pump(self):
+        """Le richieste vengono decodificate dal worker e messe in cache da pump()."""
+        req = AssetRequest("hero", 16, 24)
+        self.assertEqual(self.preloader.request([req]), 1)
+        self.assertTrue(self.preloader.wait_until_decoded())
+
+        self.assertEqual(self.preloader.pump(), 1)
+        self.assertTrue(self.preloader.is_idle())
+        self.assertTrue(self.assets.is_cached(req.cache_key))
+
+        surf = self.assets.get_image("hero", 16, 24)
+        self.assertIs(surf, self.assets.images[req.cache_key])
+        self.assertEqual(surf.get_size(), (16, 24))
+
+    def test_request_skips_cached_and_in_flight(self):
+        req = AssetRequest("hero", 16, 16)
+        self.assertEqual(self.preloader.request([req, req]), 1)
+        self.assertEqual(self.preloader.request([req]), 0)
+
+        self.preloader.wait_until_decoded()
+        self.preloader.pump()
+        self.assertEqual(self.preloader.request([req]), 0)
+
+    def test_missing_asset_is_not_stored(self):
+        """Asset assente su disco: nessuna superficie, il placeholder resta a get_image."""
+        req = AssetRequest("missing", 10, 10)
+        self.preloader.request([req])
+        self.preloader.wait_until_decoded()
+        self.assertEqual(self.preloader.pump(), 0)
+        self.assertFalse(self.assets.is_cached(req.cache_key))
+        self.assertTrue(self.preloader.is_idle())
+        # Miss risolto una volta sola: niente nuovo probe su disco alla prossima richiesta
+        self.assertEqual(self.preloader.request([req]), 0)
+
+    def test_pump_respects_budget(self):
+        reqs = [AssetRequest("hero", 10 + i, 10) for i in range(3)]
+        self.preloader.request(reqs)
+        self.preloader.wait_until_decoded()
+
+        self.assertEqual(self.preloader.pump(max_uploads=2), 2)
+        self.assertEqual(self.preloader.pending_count(), 1)
+        self.assertEqual(self.preloader.pump(), 1)
+
+    def test_pump_none_is_unlimited(self):
+        reqs = [AssetRequest("hero", 10 + i, 10) for i in range(self.preloader.max_uploads_per_frame + 2)]
+        self.preloader.request(reqs)
+        self.preloader.wait_until_decoded()
+
+        self.assertEqual(self.preloader.pump(max_uploads=None), len(reqs))
+        self.assertEqual(self.preloader.pending_count(), 0)
+
+    def test_enter_region_releases_other_regions(self):
+        """Cambiando regione si liberano solo le varianti non condivise né globali."""
+        shared = AssetRequest("hero", 20, 20)
+        aurion_only = AssetRequest("tree", 20, 20)
+        ferrum_only = AssetRequest("tree", 30, 30)
+        global_req = AssetRequest("hero", 40, 40)
+
+        self.preloader.declare(GLOBAL_REGION, [global_req])
+        self.preloader.declare("aurion", [shared, aurion_only])
+        self.preloader.declare("ferrum", [shared, ferrum_only])
+
+        self.preloader.warm_up()
+        self.preloader.enter_region("aurion")
+        self.preloader.wait_until_decoded()
+        self.preloader.pump(max_uploads=None)
+        self.assertTrue(self.assets.is_cached(aurion_only.cache_key))
+
+        self.preloader.enter_region("ferrum")
+        self.assertEqual(self.preloader.active_region, "ferrum")
+        self.assertFalse(self.assets.is_cached(aurion_only.cache_key))
+        self.assertTrue(self.assets.is_cached(shared.cache_key))
+        self.assertTrue(self.assets.is_cached(global_req.cache_key))
+
+        self.preloader.wait_until_decoded()
+        self.preloader.pump(max_uploads=None)
+        self.assertTrue(self.assets.is_cached(ferrum_only.cache_key))
+
+
+class TestRoomRegion(unittest.TestCase):
+
+    def test_region_id_from_room_prefix(self):
+        self.assertEqual(RoomData(room_id="hub").region_id, "hub")
+        self.assertEqual(RoomData(room_id="aurion_gate").region_id, "aurion")
+        self.assertEqual(RoomData(room_id="etna_boss_room").region_id, "etna")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Test per gli atlas di sprite: packing, bake su disco e caricamento delle varianti dalle pagine.
+"""
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from src.model.assets.asset_manager import AssetManager, AssetRequest
+from src.model.assets.atlas import ATLAS_DIR_NAME, bake_atlases, pack_shelves
+
+pygame.init()
+
+
+class TestPackShelves(unittest.TestCase):
+
+    def test_no_overlap_and_inside_page(self):
+        sizes = [(120, 160), (32, 64), (48, 96), (76, 114)] * 10
+        placements = pack_shelves(sizes, page_size=512, padding=1)
+
+        rects = [(page, pygame.Rect(x, y, w, h)) for (page, x, y), (w, h) in zip(placements, sizes)]
+        for i, (page_a, a) in enumerate(rects):
+            self.assertLessEqual(a.right, 512)
+            self.assertLessEqual(a.bottom, 512)
+            for page_b, b in rects[i + 1:]:
+                if page_a == page_b:
+                    self.assertFalse(a.colliderect(b))
+
+    def test_overflow_opens_new_page(self):
+        placements = pack_shelves([(100, 100)] * 5, page_size=210, padding=0)
+        self.assertEqual(max(p for p, _, _ in placements), 1)
+
+    def test_entry_too_large(self):
+        with self.assertRaises(ValueError):
+            pack_shelves([(300, 10)], page_size=256)
+
+
+class TestAtlasBakeAndLoad(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        images_dir = os.path.join(self._tmp.name, "images")
+        os.makedirs(images_dir)
+        for name, color in (("hero", (200, 10, 10)), ("tree", (10, 200, 10))):
+            surf = pygame.Surface((16, 16))
+            surf.fill(color)
+            pygame.image.save(surf, os.path.join(images_dir, f"{name}.png"))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_baked_variants_are_served_from_atlas(self):
+        baker = AssetManager(self._tmp.name)
+        manifests = {
+            None: [AssetRequest("hero", 32, 64)],
+            "aurion": [AssetRequest("tree", 48, 96), AssetRequest("missing", 8, 8)],
+        }
+        index = bake_atlases(baker, manifests, os.path.join(self._tmp.name, ATLAS_DIR_NAME), page_size=256)
+        self.assertEqual(set(index["regions"]), {"global", "aurion"})
+        self.assertNotIn("missing_8x8_STRETCH", index["regions"]["aurion"]["entries"])
+
+        assets = AssetManager(self._tmp.name)
+        self.assertEqual(assets.load_atlas_region("aurion"), 1)
+        self.assertEqual(assets.load_atlas_region("aurion"), 0)  # già in cache
+
+        tree = assets.get_image("tree", 48, 96)
+        # Copia, non subsurface: la pagina non resta in memoria e il budget conta i pixel reali
+        self.assertIsNone(tree.get_parent())
+        self.assertEqual(assets.cache_stats().used_bytes, 48 * 96 * tree.get_bytesize())
+        self.assertEqual(tree.get_size(), (48, 96))
+        self.assertEqual(tuple(tree.get_at((24, 48)))[:3], (10, 200, 10))
+
+    def test_without_atlas_is_noop(self):
+        assets = AssetManager(self._tmp.name)
+        self.assertEqual(assets.load_atlas_region("aurion"), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
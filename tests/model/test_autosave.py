@@ -0,0 +1,133 @@
+"""
+Test per l'autosave incrementale (src/model/save/autosave.py): delta nel journal,
+snapshot completi compattati sul worker, ripristino snapshot + journal.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.model.game import Game
+from src.model.save import AsyncSaveService, AutosaveJournal, SaveManager, AUTOSAVE_FILENAME
+from src.model.save.autosave import journal_filename
+
+
+class TestAutosaveJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.service = AsyncSaveService(SaveManager(save_dir=self.temp_dir, max_slots=3))
+        self.autosave = AutosaveJournal(self.service)
+        self.game = Game()
+        self.game.start_new_game(1)
+        self.autosave.attach(self.game)
+
+    def tearDown(self):
+        self.autosave.close()
+        self.service.shutdown()
+        shutil.rmtree(self.temp_dir)
+
+    def _settle(self):
+        self.assertTrue(self.service.flush(5.0))
+        self.service.pump()
+
+    def _restore(self):
+        self.autosave.close()
+        self._settle()
+        game = Game()
+        game.start_new_game(1)
+        result = AutosaveJournal(self.service).restore(game)
+        self.assertTrue(result.ok, result.message)
+        return game
+
+    def _journals(self):
+        return sorted(name for name in os.listdir(self.temp_dir) if name.endswith(".journal"))
+
+    def test_events_journaled_without_rewriting_snapshot(self):
+        self.autosave.start_session()
+        self._settle()
+        with patch.object(SaveManager, "write_snapshot") as write:
+            self.game.set_flag("met_giufa", True)
+            self.game.add_global_item("chiave", 2)
+            self.game.remove_global_item("chiave", 1)
+            self.game.collect_ace("Denari")
+            self.game.world_state.remove_entity("vault", "chest")
+            self.game.gamestate.current_room_id = "vault"
+            self.game.gamestate.party_position = [64, 96]
+            self.autosave.record_position()
+            self._settle()
+        write.assert_not_called()
+        self.assertEqual(self.autosave.pending_deltas, 6)
+
+        restored = self._restore()
+        gs = restored.gamestate
+        self.assertTrue(gs.flags["met_giufa"])
+        self.assertEqual(restored.inventory_global, {"chiave": 1})
+        self.assertEqual(gs.aces_collected, ["ace_denari"])
+        self.assertEqual(gs.removed_entities, ["vault:chest"])
+        self.assertEqual((gs.current_room_id, gs.party_position), ("vault", [64, 96]))
+        self.assertTrue(restored.world_state.is_entity_removed("vault", "chest"))
+
+    def test_compaction_drops_older_journals(self):
+        self.autosave.compact_every = 3
+        self.autosave.start_session()
+        for i in range(3):
+            self.game.set_flag(f"f{i}", True)
+        self._settle()
+        self.assertEqual(self._journals(), [journal_filename(2)])
+        self.assertEqual(self.autosave.pending_deltas, 0)
+
+        self.game.set_flag("dopo", True)
+        self.game.gamestate.current_room_id = "aurion_final"
+        self.game.gamestate.set_checkpoint()
+        self.autosave.checkpoint()
+        self._settle()
+        self.assertEqual(self._journals(), [journal_filename(3)])
+
+        gs = self._restore().gamestate
+        self.assertTrue(all(gs.flags.get(k) for k in ("f0", "f1", "f2", "dopo")))
+        self.assertEqual(gs.checkpoint_room_id, "aurion_final")
+
+    def test_journal_replayed_when_snapshot_write_lost(self):
+        self.autosave.start_session()
+        self._settle()
+        self.game.set_flag("prima", True)
+        # Compattazione mai arrivata su disco (crash): snapshot 1 + journal 1 e 2
+        with patch.object(SaveManager, "write_snapshot", side_effect=OSError("disk full")):
+            self.autosave.compact()
+            self._settle()
+        self.game.set_flag("dopo", True)
+        self.game.set_flag("prima", False)
+
+        self.assertEqual(self._journals(), [journal_filename(1), journal_filename(2)])
+        flags = self._restore().gamestate.flags
+        self.assertEqual((flags["prima"], flags["dopo"]), (False, True))
+
+    def test_truncated_line_and_other_session_ignored(self):
+        self.autosave.start_session()
+        self._settle()
+        self.game.set_flag("salvato", True)
+        self.autosave.close()
+        with open(os.path.join(self.temp_dir, journal_filename(1)), "a", encoding="utf-8") as f:
+            f.write('{"op":"flag","k":"tron')
+        # Nuova partita il cui primo snapshot non è stato scritto: il suo journal non si applica
+        with open(os.path.join(self.temp_dir, journal_filename(2)), "w", encoding="utf-8") as f:
+            f.write('{"session":"altra","gen":2}\n{"op":"flag","k":"altra_partita","v":true}\n')
+
+        flags = self._restore().gamestate.flags
+        self.assertTrue(flags["salvato"])
+        self.assertNotIn("altra_partita", flags)
+
+    def test_no_deltas_before_session_and_no_autosave_to_restore(self):
+        self.game.set_flag("menu", True)
+        self.assertEqual(os.listdir(self.temp_dir), [])
+        self.assertFalse(AutosaveJournal(self.service).restore(self.game).ok)
+
+        self.autosave.start_session()
+        self._settle()
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, AUTOSAVE_FILENAME)))
+
+
+if __name__ == "__main__":
+    unittest.main()
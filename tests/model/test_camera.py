@@ -68,6 +68,20 @@ class TestCameraEssential(unittest.TestCase):
         self.assertEqual(camera.x, 0)
         self.assertEqual(camera.y, 0)
 
+    def test_interpolates_between_steps_but_not_after_snap(self):
+        """interpolation_alpha blends previous and current step; snaps are never blended"""
+        camera = Camera(800, 600)
+        camera.set_mode(CameraMode.FOLLOW)
+        camera.snap_to_position(0, 0)
+
+        camera.store_previous()
+        camera.update_follow(500, 300)  # camera -> (100, 0)
+        camera.interpolation_alpha = 0.25
+        self.assertEqual(camera.position, (25, 0))
+
+        camera.snap_to_position(300, 0)
+        self.assertEqual(camera.position, (300, 0))
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,127 @@
+"""
+Test per LoaderBase: caricamento parallelo, validazione in batch, manifest incrementale.
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from src.model.content.loader_base import LoaderBase, MIN_FILES_FOR_POOL
+from src.model.content.rooms_loader import RoomsLoader
+from src.model.content.items_loader import ItemsLoader
+from src.model.content.validators import ValidationError
+
+
+def _item(i):
+    return {"id": f"item_{i:03d}", "display_name": f"Item {i}", "description": "..."}
+
+
+class TestLoaderBase(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = os.path.join(self._tmp.name, "items")
+        os.makedirs(self.dir)
+        self.manifest = os.path.join(self._tmp.name, "cache", "items_manifest.json")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name, obj):
+        with open(os.path.join(self.dir, name), "w", encoding="utf-8") as f:
+            json.dump(obj, f)
+
+    def test_parallel_load_is_ordered_by_file_name(self):
+        count = MIN_FILES_FOR_POOL * 4
+        for i in reversed(range(count)):
+            self._write(f"{i:03d}.json", _item(i))
+        self._write("notes.txt", {"ignored": True})
+
+        objs = ItemsLoader().load_all(self.dir)
+        self.assertEqual([o["id"] for o in objs], [f"item_{i:03d}" for i in range(count)])
+
+    def test_missing_directory(self):
+        self.assertEqual(ItemsLoader().load_all(os.path.join(self.dir, "nope")), [])
+
+    def test_batch_validation_reports_every_error(self):
+        self._write("a.json", {"id": "room_a", "display_name": "A", "exits": {}})
+        self._write("b.json", {"id": "room_b", "display_name": "B", "exits": []})
+        self._write("c.json", {"id": "room_a", "display_name": "C", "exits": {}})
+        self._write("d.json", {"display_name": "D"})
+
+        with self.assertRaises(ValidationError) as ctx:
+            RoomsLoader().load_all(self.dir)
+        message = str(ctx.exception)
+        self.assertIn("3 invalid", message)
+        self.assertIn("b.json", message)
+        self.assertIn("duplicate id 'room_a'", message)
+        self.assertIn("d.json", message)
+
+    def test_invalid_json_is_a_validation_error(self):
+        with open(os.path.join(self.dir, "broken.json"), "w") as f:
+            f.write("{not json")
+        with self.assertRaises(ValidationError):
+            ItemsLoader().load_all(self.dir)
+
+    def test_every_invalid_json_file_reported_together(self):
+        for name in ("a.json", "b.json"):
+            with open(os.path.join(self.dir, name), "w") as f:
+                f.write("{not json")
+        self._write("c.json", {"id": "item_c"})  # manca display_name
+
+        with self.assertRaises(ValidationError) as ctx:
+            ItemsLoader().load_all(self.dir)
+        message = str(ctx.exception)
+        self.assertIn("3 invalid", message)
+        for name in ("a.json", "b.json", "c.json"):
+            self.assertIn(name, message)
+
+    def test_incremental_mode_skips_unchanged_files(self):
+        for i in range(3):
+            self._write(f"{i}.json", _item(i))
+
+        calls = []
+        loader = LoaderBase(lambda obj: calls.append(obj["id"]))
+        first = loader.load_all(self.dir, manifest_path=self.manifest)
+        self.assertEqual(loader.last_stats.parsed, 3)
+        self.assertTrue(os.path.exists(self.manifest))
+
+        calls.clear()
+        loader = LoaderBase(lambda obj: calls.append(obj["id"]))
+        self.assertEqual(loader.load_all(self.dir, manifest_path=self.manifest), first)
+        self.assertEqual((loader.last_stats.parsed, loader.last_stats.skipped), (0, 3))
+        self.assertEqual(calls, [])
+
+        # Modifica di un file: solo quello viene riletto e rivalidato
+        changed = dict(_item(1), display_name="Changed item")
+        self._write("1.json", changed)
+        st = os.stat(os.path.join(self.dir, "1.json"))
+        os.utime(os.path.join(self.dir, "1.json"), ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        objs = loader.load_all(self.dir, manifest_path=self.manifest)
+        self.assertEqual(objs[1]["display_name"], "Changed item")
+        self.assertEqual(loader.last_stats.parsed, 1)
+        self.assertEqual(calls, ["item_001"])
+
+        # File rimosso: sparisce anche dal manifest
+        os.remove(os.path.join(self.dir, "2.json"))
+        self.assertEqual(len(loader.load_all(self.dir, manifest_path=self.manifest)), 2)
+        with open(self.manifest, encoding="utf-8") as f:
+            self.assertEqual(sorted(json.load(f)["files"]), ["0.json", "1.json"])
+
+    def test_touched_file_with_same_content_is_not_revalidated(self):
+        self._write("0.json", _item(0))
+        calls = []
+        loader = LoaderBase(lambda obj: calls.append(obj["id"]))
+        loader.load_all(self.dir, manifest_path=self.manifest)
+
+        path = os.path.join(self.dir, "0.json")
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000))
+        calls.clear()
+        loader.load_all(self.dir, manifest_path=self.manifest)
+        self.assertEqual(calls, [])
+        self.assertEqual(loader.last_stats.skipped, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+"""
+Test per ContentRegistry: caricamento lazy per regione, prefetch a frame, eviction.
+"""
+import unittest
+import unittest.mock
+from unittest.mock import Mock
+
+import pygame
+
+from src.model.content.registry import ContentRegistry, region_of
+from src.model.content.world_builder import WorldBuilder, WORLD_REGIONS
+from src.model.content.room_cache import build_rooms
+from src.model.content.categories import (
+    entity_render_category, CATEGORY_BOSS, CATEGORY_GATEKEEPER, CATEGORY_NPC, CATEGORY_PROP
+)
+from src.model.room_data import RoomData, EntityDefinition
+
+pygame.init()
+
+
+class TestContentRegistryLazy(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = ContentRegistry()
+        WorldBuilder.register_regions(self.registry)
+
+    def test_nothing_built_until_requested(self):
+        self.assertEqual(self.registry.loaded_regions("rooms"), set())
+
+        room = self.registry.get("rooms", "ferrum_gatekeeper")
+        self.assertEqual(room.room_id, "ferrum_gatekeeper")
+        self.assertEqual(self.registry.loaded_regions("rooms"), {"ferrum"})
+        self.assertIsNone(self.registry.get("rooms", "ferrum_missing"))
+
+    def test_all_matches_eager_build(self):
+        eager = {r.room_id: r for r in build_rooms()}
+        lazy = {r.room_id: r for r in self.registry.all("rooms")}
+        self.assertEqual(lazy, eager)
+        self.assertEqual(self.registry.loaded_regions("rooms"), set(WORLD_REGIONS))
+
+    def test_all_for_region(self):
+        ids = sorted(r.room_id for r in self.registry.all("rooms", "etna"))
+        self.assertEqual(ids, ["etna_boss_room", "etna_entry"])
+        self.assertEqual(self.registry.loaded_regions("rooms"), {"etna"})
+
+    def test_prefetch_is_pumped_one_region_per_call(self):
+        ready = Mock()
+        self.registry.prefetch("rooms", "aurion_entry", on_ready=ready)
+        self.registry.prefetch("rooms", "viridor_entry")
+        ready.assert_not_called()
+
+        self.assertEqual(self.registry.pump(), 1)
+        ready.assert_called_once()
+        self.assertEqual(ready.call_args[0][0].room_id, "aurion_entry")
+        self.assertEqual(self.registry.loaded_regions("rooms"), {"aurion"})
+
+        self.assertEqual(self.registry.pump(), 1)
+        self.assertEqual(self.registry.pump(), 0)
+
+        # Regione già caricata: callback immediato
+        again = Mock()
+        self.registry.prefetch("rooms", "aurion_gatekeeper", on_ready=again)
+        again.assert_called_once()
+
+    def test_evict_far_regions_and_reload(self):
+        first = self.registry.get("rooms", "vinalia_entry")
+        self.registry.get("rooms", "hub")
+
+        evicted = self.registry.evict_regions("rooms", keep={"hub"})
+        self.assertEqual(evicted, {"vinalia"})
+        self.assertNotIn("vinalia_entry", self.registry._data["rooms"])
+
+        second = self.registry.get("rooms", "vinalia_entry")
+        self.assertIsNot(first, second)
+        self.assertEqual(first, second)
+
+    def test_eviction_keeps_manually_registered_content(self):
+        manual = Mock(room_id="aurion_test")
+        self.registry.register("rooms", {"id": "aurion_test", "obj": manual})
+        self.registry.get("rooms", "aurion_entry")
+
+        self.registry.evict_regions("rooms", keep=())
+        self.assertIs(self.registry.get("rooms", "aurion_test"), manual)
+
+    def test_region_of(self):
+        self.assertEqual(region_of("viridor_vault_figs"), "viridor")
+        self.assertEqual(region_of("hub"), "hub")
+
+
+class TestContentRegistryIndexes(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = ContentRegistry()
+        WorldBuilder.register_regions(self.registry)
+
+    def test_rooms_by_region_index(self):
+        self.registry.all("rooms")
+        for region in WORLD_REGIONS:
+            indexed = {r.room_id for r in self.registry.find("rooms", "region", region)}
+            scanned = {r.room_id for r in self.registry.all("rooms") if r.region_id == region}
+            self.assertEqual(indexed, scanned)
+
+    def test_entity_indexes_match_a_scan(self):
+        rooms = self.registry.all("rooms")
+        entities = [e for room in rooms for e in room.entities]
+
+        for entity_type in {e.entity_type for e in entities}:
+            self.assertCountEqual(self.registry.entities_by_type(entity_type),
+                                  [e for e in entities if e.entity_type == entity_type])
+        bosses = self.registry.entities_by_category(CATEGORY_BOSS)
+        self.assertTrue(bosses)
+        self.assertCountEqual(bosses, [e for e in entities if entity_render_category(e) == CATEGORY_BOSS])
+
+        boss = self.registry.entities_by_script("start_boss_etna")
+        self.assertEqual([e.entity_id for e in boss], ["boss_oste"])
+        etna = [e for room in self.registry.all("rooms", "etna") for e in room.entities]
+        self.assertCountEqual(self.registry.entities_in_region("etna"), etna)
+
+    def test_entity_category_is_precomputed(self):
+        room = self.registry.get("rooms", "etna_boss_room")
+        entity = next(e for e in room.entities if e.entity_id == "boss_oste")
+        with unittest.mock.patch("src.model.content.registry.entity_render_category") as classify:
+            self.assertEqual(self.registry.entity_category(entity), CATEGORY_BOSS)
+            classify.assert_not_called()
+
+        # Entità non registrata: classificata al volo
+        stray = EntityDefinition("lamp", "prop", 0, 0)
+        self.assertEqual(self.registry.entity_category(stray), CATEGORY_PROP)
+
+    def test_indexes_follow_eviction_and_overwrite(self):
+        self.registry.get("rooms", "etna_entry")
+        self.assertTrue(self.registry.find("rooms", "region", "etna"))
+        self.registry.evict_regions("rooms", keep=())
+        self.assertEqual(self.registry.find("rooms", "region", "etna"), [])
+        self.assertEqual(self.registry.entities_by_script("start_boss_etna"), [])
+
+        room = RoomData("aurion_test", "Test")
+        room.entities.append(EntityDefinition("golem_a", "npc", 0, 0, script_id="s1"))
+        self.registry.register("rooms", {"id": "aurion_test", "obj": room})
+        self.assertEqual(len(self.registry.entities_by_category(CATEGORY_GATEKEEPER)), 1)
+
+        replacement = RoomData("aurion_test", "Test")
+        replacement.entities.append(EntityDefinition("giufa", "npc", 0, 0, script_id="s1"))
+        self.registry.register("rooms", {"id": "aurion_test", "obj": replacement})
+        self.assertEqual(self.registry.entities_by_category(CATEGORY_GATEKEEPER), [])
+        self.assertEqual([e.entity_id for e in self.registry.entities_by_script("s1")], ["giufa"])
+
+        replacement.entities.append(EntityDefinition("chest", "interactable", 0, 0))
+        self.registry.reindex("rooms", "aurion_test")
+        self.assertEqual([e.entity_id for e in self.registry.entities_by_category(CATEGORY_NPC)], ["giufa"])
+        self.assertEqual(len(self.registry.entities_by_type("interactable")), 1)
+
+    def test_items_by_tag(self):
+        self.registry.register("items", {"id": "item_fig", "display_name": "Fico", "tags": ["food", "viridor"]})
+        self.registry.register("items", {"id": "item_key", "display_name": "Chiave", "tags": ["key"]})
+        self.assertEqual([i["id"] for i in self.registry.items_with_tag("food")], ["item_fig"])
+        self.assertEqual(self.registry.items_with_tag("missing"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -69,9 +69,22 @@ class TestEpic15(unittest.TestCase):
         self.state.update(0.3) 
         self.assertEqual(self.game.gamestate.party_position[0], 160)
         
-        # Step 2: Try to move further into wall
+        # Step 2: Try to move further into wall -> stops flush against it (wall.left - 32)
         self.state.update(0.3)
-        self.assertEqual(self.game.gamestate.party_position[0], 160)
+        self.assertEqual(self.game.gamestate.party_position[0], 168)
+        self.state.update(0.3)
+        self.assertEqual(self.game.gamestate.party_position[0], 168)
+
+    def test_us58_slides_along_wall(self):
+        """Diagonal movement into a wall keeps the free axis."""
+        self.game.gamestate.party_position = [168, 100]
+        self.controller.input_manager.keys[Action.MOVE_RIGHT] = True
+        self.controller.input_manager.keys[Action.MOVE_DOWN] = True
+
+        self.state.update(0.1)
+        x, y = self.game.gamestate.party_position
+        self.assertEqual(x, 168)
+        self.assertGreater(y, 100)
 
     def test_us61_interaction_focus(self):
         """US 61: Detect closest interactable."""
@@ -5,7 +5,7 @@ Tests flag storage and condition evaluation.
 
 import unittest
 import logging
-from src.model.flag_manager import FlagManager
+from src.model.flag_manager import FlagManager, SOURCE_ACE, SOURCE_ITEM
 
 # Suppress logging during tests
 logging.disable(logging.WARNING)
@@ -119,5 +119,114 @@ class TestConditionEvaluation(unittest.TestCase):
         self.assertFalse(self.flag_manager.evaluate_condition(None))
 
 
+class TestCompiledConditions(unittest.TestCase):
+    """Conditions compiled once, memoized and invalidated by their inputs."""
+
+    def setUp(self):
+        self.flag_manager = FlagManager()
+        self.calls = 0
+        self.inventory = {}
+
+        def has_item(item_id):
+            self.calls += 1
+            return self.inventory.get(item_id, 0) > 0
+
+        self.flag_manager.set_item_checker(has_item)
+
+    def test_result_cached_until_flag_changes(self):
+        condition = {"type": "and", "conditions": [
+            {"type": "flag", "name": "a"},
+            {"type": "not", "condition": {"type": "flag", "name": "b"}},
+        ]}
+        compiled = self.flag_manager.compile(condition)
+        self.assertEqual(compiled.deps, {("flag", "a"), ("flag", "b")})
+        self.assertFalse(compiled())
+
+        self.flag_manager.set_flag("a")
+        self.assertTrue(compiled())
+        self.flag_manager.set_flag("b")
+        self.assertFalse(compiled())
+        self.flag_manager.clear_flag("b")
+        self.assertTrue(compiled())
+
+    def test_notified_source_is_memoized(self):
+        self.flag_manager.set_notified_sources(SOURCE_ITEM)
+        condition = {"type": "has_item", "item_id": "chiave"}
+        self.assertFalse(self.flag_manager.evaluate_condition(condition))
+        self.assertFalse(self.flag_manager.evaluate_condition(condition))
+        self.assertEqual(self.calls, 1)
+
+        self.inventory["chiave"] = 1
+        self.flag_manager.notify_changed(SOURCE_ITEM, "altro")
+        self.assertFalse(self.flag_manager.evaluate_condition(condition))
+        self.flag_manager.notify_changed(SOURCE_ITEM, "chiave")
+        self.assertTrue(self.flag_manager.evaluate_condition(condition))
+        self.assertEqual(self.calls, 2)
+
+    def test_unnotified_source_is_volatile(self):
+        compiled = self.flag_manager.compile({"type": "has_item", "item_id": "chiave"})
+        self.assertTrue(compiled.volatile)
+        self.assertFalse(compiled())
+        self.inventory["chiave"] = 1
+        self.assertTrue(compiled())
+
+    def test_ace_notification_and_rebind(self):
+        aces = []
+        self.flag_manager.set_ace_counter(lambda: len(aces))
+        self.flag_manager.set_notified_sources(SOURCE_ACE)
+        condition = {"type": "aces_count", "operator": ">=", "value": 1}
+        self.assertFalse(self.flag_manager.evaluate_condition(condition))
+        aces.append("ace_denari")
+        self.flag_manager.notify_changed(SOURCE_ACE)
+        self.assertTrue(self.flag_manager.evaluate_condition(condition))
+
+        flag_condition = {"type": "flag", "name": "x"}
+        self.assertFalse(self.flag_manager.evaluate_condition(flag_condition))
+        self.flag_manager.bind_flags({"x": True})
+        self.assertTrue(self.flag_manager.evaluate_condition(flag_condition))
+
+
+class TestFlagSubscriptions(unittest.TestCase):
+    """Listeners notified when a flag changes value."""
+
+    def setUp(self):
+        self.flag_manager = FlagManager()
+        self.events = []
+
+    def _listener(self, name, value):
+        self.events.append((name, value))
+
+    def test_notified_only_on_change(self):
+        self.flag_manager.subscribe('door_open', self._listener)
+        self.flag_manager.set_flag('door_open')
+        self.flag_manager.set_flag('door_open')
+        self.flag_manager.set_flag('other')
+        self.flag_manager.clear_flag('door_open')
+        self.assertEqual(self.events, [('door_open', True), ('door_open', None)])
+
+    def test_wildcard_and_unsubscribe(self):
+        handle = self.flag_manager.subscribe(None, self._listener)
+        self.flag_manager.set_flag('a')
+        self.flag_manager.unsubscribe(handle)
+        self.flag_manager.set_flag('b')
+        self.assertEqual(self.events, [('a', True)])
+
+    def test_rebind_notifies_differences(self):
+        self.flag_manager.set_flag('kept')
+        self.flag_manager.set_flag('dropped')
+        self.flag_manager.subscribe(['kept', 'dropped', 'added'], self._listener)
+        self.flag_manager.bind_flags({'kept': True, 'added': 1})
+        self.assertEqual(sorted(self.events), [('added', 1), ('dropped', None)])
+
+    def test_failing_listener_does_not_block_others(self):
+        def broken(name, value):
+            raise RuntimeError("boom")
+        self.flag_manager.subscribe('x', broken)
+        self.flag_manager.subscribe('x', self._listener)
+        self.flag_manager.set_flag('x')
+        self.assertEqual(self.events, [('x', True)])
+        self.assertTrue(self.flag_manager.has_flag('x'))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,118 @@
+"""
+Test per il FrameProfiler: fasi, contatori, export e integrazione con Renderer/DebugOverlay.
+"""
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+import pygame
+
+from src.model.render_system import Camera, DebugOverlay, DebugSettings, Renderer, RenderLayer
+from src.model.utils.frame_profiler import (
+    FrameProfiler, frame_profiler, PHASE_FLUSH_DRAW, PHASE_FLUSH_SORT, PHASE_PROCESS,
+    PHASE_RENDER, PHASE_SIM_OTHER, PHASE_STATE_UPDATE, PHASE_SUBMIT
+)
+
+pygame.init()
+
+
+class TestFrameProfiler(unittest.TestCase):
+
+    def test_phases_accumulate_and_derive(self):
+        prof = FrameProfiler()
+        prof.begin_frame()
+        prof.add_time(PHASE_PROCESS, 0.004)
+        prof.add_time(PHASE_PROCESS, 0.004)   # due passi di simulazione
+        prof.add_time(PHASE_STATE_UPDATE, 0.005)
+        prof.add_time(PHASE_RENDER, 0.010)
+        prof.add_time(PHASE_FLUSH_SORT, 0.001)
+        prof.add_time(PHASE_FLUSH_DRAW, 0.006)
+        rec = prof.end_frame()
+
+        self.assertAlmostEqual(rec.phases[PHASE_PROCESS], 8.0)
+        self.assertAlmostEqual(rec.phases[PHASE_SIM_OTHER], 3.0)
+        self.assertAlmostEqual(rec.phases[PHASE_SUBMIT], 3.0)
+        self.assertIs(prof.last, rec)
+
+    def test_watch_records_per_frame_delta(self):
+        prof = FrameProfiler()
+        total = [10]
+        prof.watch("misses", lambda: total[0])
+
+        prof.begin_frame()
+        total[0] += 3
+        self.assertEqual(prof.end_frame().counts["misses"], 3)
+
+        prof.begin_frame()
+        self.assertEqual(prof.end_frame().counts["misses"], 0)
+
+    def test_disabled_records_nothing(self):
+        prof = FrameProfiler()
+        prof.enabled = False
+        prof.begin_frame()
+        prof.add_time(PHASE_RENDER, 1.0)
+        self.assertIsNone(prof.end_frame())
+        self.assertEqual(len(prof.frames), 0)
+
+    def test_history_is_bounded_and_dumpable(self):
+        prof = FrameProfiler(history=5)
+        for i in range(8):
+            prof.begin_frame()
+            prof.count("render_commands", i)
+            prof.end_frame()
+        self.assertEqual(len(prof.frames), 5)
+
+        with tempfile.TemporaryDirectory() as td:
+            csv_path = os.path.join(td, "trace.csv")
+            self.assertEqual(prof.dump(csv_path), 5)
+            with open(csv_path, newline="") as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual([r["index"] for r in rows], ["3", "4", "5", "6", "7"])
+            self.assertEqual(rows[-1]["render_commands"], "7")
+
+            json_path = os.path.join(td, "trace.json")
+            prof.dump(json_path)
+            with open(json_path) as f:
+                self.assertEqual(len(json.load(f)["frames"]), 5)
+
+
+class TestProfilerIntegration(unittest.TestCase):
+
+    def tearDown(self):
+        frame_profiler.end_frame()
+
+    def test_renderer_flush_reports_sort_draw_and_commands(self):
+        renderer = Renderer()
+        screen = pygame.Surface((100, 100))
+        sprite = pygame.Surface((4, 4))
+        for i in range(10):
+            renderer.submit_sprite(sprite, pygame.Rect(i, i, 4, 4), RenderLayer.ACTORS)
+
+        frame_profiler.begin_frame()
+        renderer.flush(screen, Camera(100, 100))
+        rec = frame_profiler.end_frame()
+
+        self.assertEqual(rec.counts["render_commands"], 10)
+        self.assertGreaterEqual(rec.phases[PHASE_FLUSH_DRAW], 0.0)
+        self.assertIn(PHASE_FLUSH_SORT, rec.phases)
+
+    def test_debug_overlay_graph(self):
+        prof = FrameProfiler()
+        for _ in range(3):
+            prof.begin_frame()
+            prof.add_time(PHASE_RENDER, 0.050)  # oltre la scala del grafico: va tagliato
+            prof.end_frame()
+
+        settings = DebugSettings()
+        overlay = DebugOverlay(Renderer(settings), settings)
+        screen = pygame.Surface((800, 600))
+        area = overlay.draw_frame_profile(screen, prof, (550, 10))
+
+        self.assertTrue(screen.get_rect().contains(area))
+        self.assertEqual(area.topleft, (550, 10))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Test per resolve_movement: sweep per asse, scivolamento, tetto allo spostamento.
+"""
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from src.model.movement import resolve_movement, MAX_STEP_DISTANCE
+from src.model.room_data import RoomData, Collider
+
+pygame.init()
+
+
+def _room(*rects):
+    room = RoomData(room_id="movement_room", width=800, height=600)
+    for i, r in enumerate(rects):
+        room.colliders.append(Collider(f"c{i}", pygame.Rect(*r)))
+    room.build_spatial_index()
+    return room
+
+
+class TestResolveMovement(unittest.TestCase):
+
+    def test_free_movement(self):
+        result = resolve_movement(_room(), 100, 100, 10.5, -4)
+        self.assertEqual((result.x, result.y), (110.5, 96))
+        self.assertFalse(result.blocked)
+
+    def test_no_tunneling_through_thin_wall(self):
+        # Parete larga 2 px, passo da 90 px (dt enorme): la hitbox si ferma a filo
+        room = _room((200, 0, 2, 600))
+        result = resolve_movement(room, 150, 100, 90, 0)
+        self.assertEqual(result.x, 168)
+        self.assertTrue(result.blocked_x)
+
+        result = resolve_movement(room, 210, 100, -90, 0)
+        self.assertEqual(result.x, 202)
+
+    def test_slides_along_wall(self):
+        room = _room((0, 200, 800, 20))
+        result = resolve_movement(room, 100, 160, 12, 12)
+        self.assertEqual(result.y, 168)
+        self.assertEqual(result.x, 112)
+        self.assertTrue(result.blocked_y)
+        self.assertFalse(result.blocked_x)
+
+    def test_corner_blocks_both_axes(self):
+        room = _room((200, 0, 50, 600), (0, 200, 800, 50))
+        result = resolve_movement(room, 160, 160, 20, 20)
+        self.assertEqual((result.x, result.y), (168, 168))
+        self.assertTrue(result.blocked_x and result.blocked_y)
+
+    def test_can_leave_overlapping_collider(self):
+        room = _room((90, 90, 40, 40))
+        result = resolve_movement(room, 100, 100, -30, 0)
+        self.assertEqual(result.x, 70)
+
+    def test_step_distance_is_capped_and_substepped(self):
+        result = resolve_movement(_room(), 0, 0, 1000, 0)
+        self.assertAlmostEqual(result.x, MAX_STEP_DISTANCE)
+        self.assertGreater(result.substeps, 1)
+
+    def test_grid_and_linear_scan_agree(self):
+        walls = [(x, y, 8, 40) for x in range(40, 760, 60) for y in range(40, 560, 90)]
+        room = _room(*walls)
+        moves = [(100, 100, 50, 33), (300, 300, -70, 10), (500, 80, 5, 90), (20, 500, 80, -80)]
+        linear = [resolve_movement(room, *m) for m in moves]
+        with patch("src.model.room_data.LINEAR_SCAN_MAX_ITEMS", 0):
+            indexed = [resolve_movement(room, *m) for m in moves]
+        self.assertEqual(linear, indexed)
+
+
+if __name__ == "__main__":
+    unittest.main()
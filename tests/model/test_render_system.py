@@ -9,7 +9,7 @@ import pygame
 pygame.init()
 
 from src.model.render_system import (
-    Renderer, RenderCommand, RenderLayer, Camera, DebugSettings
+    Renderer, RenderCommand, RenderLayer, Camera, DebugSettings, make_sort_key, MAX_DIRTY_RECTS
 )
 
 
@@ -91,5 +91,125 @@ class TestRendererLayerOrdering(unittest.TestCase):
         self.assertEqual(applied_rect.y, 100)  # 150 - 50
 
 
+
+class _CountingSurface(pygame.Surface):
+    """Surface che conta le chiamate a blits() (batching degli sprite)"""
+    blits_calls = 0
+
+    def blits(self, *args, **kwargs):
+        type(self).blits_calls += 1
+        return super().blits(*args, **kwargs)
+
+
+class TestRendererCommandBuffer(unittest.TestCase):
+    """Command buffer ad array: chiavi intere e blit batch"""
+
+    def test_sort_key_matches_tuple_order(self):
+        keys = [(RenderLayer.UI, 0, 0), (RenderLayer.ACTORS, 300, 1), (RenderLayer.ACTORS, -20, 2),
+                (RenderLayer.ACTORS, 300, 3), (RenderLayer.BACKGROUND, 999, 4)]
+        by_int = sorted(keys, key=lambda k: make_sort_key(*k))
+        self.assertEqual(by_int, sorted(keys))
+
+    def test_sprites_depth_sorted_and_batched(self):
+        renderer = Renderer()
+        screen = _CountingSurface((50, 50))
+        red, green = pygame.Surface((20, 20)), pygame.Surface((20, 20))
+        red.fill((255, 0, 0))
+        green.fill((0, 255, 0))
+
+        renderer.begin_frame()
+        # Submit fuori ordine: green ha i piedi più in basso, va disegnato sopra
+        renderer.submit_sprite(green, pygame.Rect(10, 15, 20, 20))
+        renderer.submit_sprite(red, pygame.Rect(5, 5, 20, 20))
+        _CountingSurface.blits_calls = 0
+        renderer.flush(screen, Camera(50, 50))
+
+        self.assertEqual(_CountingSurface.blits_calls, 1)
+        self.assertEqual(tuple(screen.get_at((15, 20)))[:3], (0, 255, 0))
+        self.assertEqual(renderer.get_command_count(), 2)
+
+        renderer.begin_frame()
+        self.assertEqual(renderer.get_command_count(), 0)
+
+
+class TestRendererRetainedMode(unittest.TestCase):
+    """Retained mode: cache dei layer statici + dirty rects"""
+
+    def setUp(self):
+        self.renderer = Renderer()
+        self.camera = Camera(200, 100)
+        self.screen = pygame.Surface((200, 100))
+        self.bg_draws = 0
+        self.sprite = pygame.Surface((10, 10))
+        self.sprite.fill((255, 0, 0))
+
+    def _frame(self, sprite_pos=(20, 20)):
+        def draw_bg(screen, camera):
+            self.bg_draws += 1
+            screen.fill((0, 0, 255))
+
+        self.renderer.begin_frame()
+        self.renderer.submit(RenderCommand(layer=RenderLayer.BACKGROUND, sort_key=(0,),
+                                           space="world", draw_callable=draw_bg))
+        self.renderer.submit_sprite(self.sprite, pygame.Rect(sprite_pos, (10, 10)))
+        self.renderer.flush_retained(self.screen, self.camera)
+        return self.renderer.take_dirty_rects()
+
+    def test_static_layer_drawn_once(self):
+        """Con camera ferma lo sfondo viene composto una sola volta"""
+        for _ in range(5):
+            self._frame()
+        self.assertEqual(self.bg_draws, 1)
+
+        self.renderer.invalidate_static()
+        self._frame()
+        self.assertEqual(self.bg_draws, 2)
+
+    def test_dirty_rects_cover_old_and_new_position(self):
+        """Il primo frame è completo, poi si aggiornano solo le aree toccate"""
+        self.assertIsNone(self._frame((20, 20)))
+
+        dirty = self._frame((60, 20))
+        self.assertIsNotNone(dirty)
+        covered = dirty[0].unionall(dirty[1:]) if len(dirty) > 1 else dirty[0]
+        self.assertTrue(covered.contains(pygame.Rect(20, 20, 10, 10)))
+        self.assertTrue(covered.contains(pygame.Rect(60, 20, 10, 10)))
+
+        # La vecchia posizione è stata ripristinata dallo sfondo
+        self.assertEqual(tuple(self.screen.get_at((25, 25)))[:3], (0, 0, 255))
+        self.assertEqual(tuple(self.screen.get_at((65, 25)))[:3], (255, 0, 0))
+
+    def test_camera_move_redraws_static(self):
+        self._frame()
+        self.camera.snap_to_position(10, 0)
+        self.assertIsNone(self._frame())
+        self.assertEqual(self.bg_draws, 2)
+
+    def test_unbounded_command_forces_full_update(self):
+        self._frame()
+        self.renderer.begin_frame()
+        self.renderer.submit_ui(lambda s, c: None)
+        self.renderer.flush_retained(self.screen, self.camera)
+        self.assertIsNone(self.renderer.take_dirty_rects())
+
+    def test_too_many_dynamic_rects_forces_full_update(self):
+        """Oltre MAX_DIRTY_RECTS sprite visibili: niente fusione, update completo anche al frame dopo"""
+        self._frame()
+        self.renderer.begin_frame()
+        for i in range(MAX_DIRTY_RECTS + 1):
+            self.renderer.submit_sprite(self.sprite, pygame.Rect(i * 5 % 190, i // 38 * 20, 10, 10))
+        self.renderer.flush_retained(self.screen, self.camera)
+        self.assertIsNone(self.renderer.take_dirty_rects())
+
+        self.assertIsNone(self._frame((60, 60)))
+        self.assertEqual(tuple(self.screen.get_at((5, 5)))[:3], (0, 0, 255))
+        self.assertIsNotNone(self._frame((60, 60)))
+
+    def test_immediate_flush_invalidates_screen(self):
+        self._frame()
+        self.renderer.flush(self.screen, self.camera)
+        self.assertIsNone(self._frame())
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
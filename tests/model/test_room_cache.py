@@ -0,0 +1,90 @@
+"""
+Test per il room cache compilato: roundtrip, validazione dell'hash, fallback a WorldBuilder.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+import pygame
+
+from src.model.content.registry import ContentRegistry
+from src.model.content.room_cache import (
+    build_rooms, content_hash, load_rooms, read_room_cache, write_room_cache, HEADER
+)
+
+pygame.init()
+
+
+class TestRoomCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, "cache", "rooms.bin")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_roundtrip_matches_world_builder(self):
+        rooms = build_rooms()
+        write_room_cache(rooms, self.path)
+
+        loaded = read_room_cache(self.path)
+        self.assertEqual([r.room_id for r in loaded], [r.room_id for r in rooms])
+        for original, cached in zip(rooms, loaded):
+            self.assertEqual(original, cached)
+
+    def test_spatial_index_not_serialized(self):
+        rooms = build_rooms()
+        rooms[0].build_spatial_index()
+        write_room_cache(rooms, self.path)
+
+        cached = read_room_cache(self.path)[0]
+        self.assertIsNone(cached._collider_grid)
+        rect = pygame.Rect(400, 300, 32, 32)
+        self.assertEqual(cached.check_collision(rect), rooms[0].check_collision(rect))
+
+    def test_stale_hash_is_rejected(self):
+        write_room_cache(build_rooms(), self.path, digest=b"\0" * 32)
+        self.assertIsNone(read_room_cache(self.path))
+        self.assertIsNotNone(read_room_cache(self.path, digest=b"\0" * 32))
+
+    def test_corrupt_or_missing_file_is_rejected(self):
+        self.assertIsNone(read_room_cache(self.path))
+
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "wb") as f:
+            f.write(b"garbage")
+        self.assertIsNone(read_room_cache(self.path))
+
+        with open(self.path, "wb") as f:
+            f.write(HEADER.pack(b"SKRC", 1, content_hash()) + b"not a pickle")
+        self.assertIsNone(read_room_cache(self.path))
+
+    def test_load_rooms_prefers_cache_and_falls_back(self):
+        builder = Mock(side_effect=lambda registry: None)
+        registry = ContentRegistry()
+        self.assertFalse(load_rooms(registry, self.path, builder=builder))
+        builder.assert_called_once_with(registry)
+        self.assertFalse(os.path.exists(self.path))   # nessuna scrittura implicita
+
+        write_room_cache(build_rooms(), self.path)
+        builder.reset_mock()
+        registry = ContentRegistry()
+        self.assertTrue(load_rooms(registry, self.path, builder=builder))
+        builder.assert_not_called()
+        self.assertIsNotNone(registry.get("rooms", "hub"))
+        self.assertIsNotNone(registry.get("rooms", "viridor_boss_room"))
+
+    def test_cached_rooms_are_independent_per_load(self):
+        write_room_cache(build_rooms(), self.path)
+        a, b = ContentRegistry(), ContentRegistry()
+        load_rooms(a, self.path)
+        load_rooms(b, self.path)
+        a.get("rooms", "hub").entities.clear()
+        self.assertTrue(b.get("rooms", "hub").entities)
+
+
+if __name__ == "__main__":
+    unittest.main()
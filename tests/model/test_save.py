@@ -231,14 +231,18 @@ class TestSaveControllerIntegration(unittest.TestCase):
     
     def setUp(self):
         self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
         
         from src.controller.game_controller import GameController
-        self.controller = GameController()
+        self.controller = GameController(save_dir=self.temp_dir)
+        self.addCleanup(self._close, self.controller)
         self.controller.save_manager = SaveManager(save_dir=self.temp_dir, max_slots=3)
         self.controller.start_new_game(1)
     
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
+    @staticmethod
+    def _close(controller):
+        controller.autosave.close()
+        controller.save_service.shutdown()
     
     def test_controller_save_blocked_in_combat(self):
         """Controller correctly blocks save in combat."""
@@ -272,7 +276,8 @@ class TestSaveControllerIntegration(unittest.TestCase):
         
         # Load into new controller
         from src.controller.game_controller import GameController
-        new_controller = GameController()
+        new_controller = GameController(save_dir=self.temp_dir)
+        self.addCleanup(self._close, new_controller)
         new_controller.save_manager = SaveManager(save_dir=self.temp_dir, max_slots=3)
         
         load_result = new_controller.load_game(1)
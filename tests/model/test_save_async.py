@@ -0,0 +1,75 @@
+"""
+Test per AsyncSaveService: snapshot sul main thread, scrittura sul worker,
+callback consegnati da pump().
+"""
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from src.model.game import Game
+from src.model.save import AsyncSaveService, SaveManager, SAVE_STAGE_DONE, SAVE_STAGE_FAILED
+
+
+class TestAsyncSave(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.save_manager = SaveManager(save_dir=self.temp_dir, max_slots=3)
+        self.service = AsyncSaveService(self.save_manager)
+        self.game = Game()
+        self.game.start_new_game(1)
+        self.results = []
+
+    def tearDown(self):
+        self.service.shutdown()
+        shutil.rmtree(self.temp_dir)
+
+    def _on_complete(self, result):
+        self.results.append((result, threading.current_thread() is threading.main_thread()))
+
+    def test_save_written_by_worker_and_callback_on_pump(self):
+        job = self.service.save(1, self.game, "Async", on_complete=self._on_complete)
+        self.assertTrue(self.service.flush(5.0))
+        self.assertEqual(job.stage, SAVE_STAGE_DONE)
+        self.assertEqual(job.progress, 1.0)
+        self.assertEqual(self.results, [])
+
+        self.assertEqual(self.service.pump(), 1)
+        (result, on_main), = self.results
+        self.assertTrue(result.ok)
+        self.assertTrue(on_main)
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "slot_01.json.tmp")))
+
+        loaded = self.save_manager.load_from_slot(1)
+        self.assertTrue(loaded.ok)
+        self.assertEqual(loaded.save_data.meta.custom_name, "Async")
+
+    def test_snapshot_taken_at_request_time(self):
+        self.game.set_flag("before", True)
+        self.service.save(1, self.game)
+        self.game.set_flag("after", True)
+        self.service.flush(5.0)
+
+        flags = self.save_manager.load_from_slot(1).save_data.data.progression.flags
+        self.assertIn("before", flags)
+        self.assertNotIn("after", flags)
+
+    def test_second_save_keeps_backup(self):
+        self.service.save(1, self.game, "Primo")
+        self.service.save(1, self.game, "Secondo")
+        self.service.flush(5.0)
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, "slot_01.json.bak")))
+        self.assertEqual(self.save_manager.load_from_slot(1).save_data.meta.custom_name, "Secondo")
+
+    def test_invalid_slot_reported_through_callback(self):
+        job = self.service.save(99, self.game, on_complete=self._on_complete)
+        self.assertTrue(job.is_done)
+        self.assertEqual(job.stage, SAVE_STAGE_FAILED)
+        self.service.pump()
+        self.assertFalse(self.results[0][0].ok)
+
+
+if __name__ == "__main__":
+    unittest.main()
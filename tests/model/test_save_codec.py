@@ -0,0 +1,96 @@
+"""
+Test per il formato binario dei salvataggi (src/model/save/codec.py).
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.model.game import Game
+from src.model.save import (
+    SaveManager, GameSerializer, SaveFormatError, SlotStatus,
+    SAVE_FORMAT_BINARY, SAVE_FORMAT_JSON, encode_save, decode_save
+)
+from src.model.save.codec import detect_format
+from src.model.settings.settings_manager import SettingsManager
+
+
+class TestSaveCodec(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.game.start_new_game(1)
+        self.game.set_flag("met_giufa", True)
+        self.save_dict = GameSerializer.to_dict(self.game, custom_name="Codec è ok")
+
+    def test_binary_round_trip_matches_json(self):
+        via_json = decode_save(encode_save(self.save_dict, SAVE_FORMAT_JSON))
+        for compress in (False, True):
+            raw = encode_save(self.save_dict, SAVE_FORMAT_BINARY, compress)
+            self.assertEqual(detect_format(raw), SAVE_FORMAT_BINARY)
+            self.assertEqual(decode_save(raw), via_json)
+
+    def test_binary_is_smaller(self):
+        json_size = len(encode_save(self.save_dict, SAVE_FORMAT_JSON))
+        self.assertLess(len(encode_save(self.save_dict, SAVE_FORMAT_BINARY)), json_size)
+        self.assertLess(len(encode_save(self.save_dict, SAVE_FORMAT_BINARY, compress=True)), json_size)
+
+    def test_corruption_detected_by_checksum(self):
+        raw = bytearray(encode_save(self.save_dict, SAVE_FORMAT_BINARY, compress=True))
+        raw[-1] ^= 0xFF
+        with self.assertRaises(SaveFormatError):
+            decode_save(bytes(raw))
+        with self.assertRaises(SaveFormatError):
+            decode_save(bytes(raw[:10]))
+
+    def test_values_and_keys_follow_json_rules(self):
+        data = {"n": -5, "big": 2 ** 40, "f": 1.5, "none": None, "t": (1, 2), 3: "int key", "s": "x" * 300}
+        self.assertEqual(decode_save(encode_save(data, SAVE_FORMAT_BINARY)),
+                         decode_save(encode_save(data, SAVE_FORMAT_JSON)))
+
+
+class TestBinarySaveSlots(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.game = Game()
+        self.game.start_new_game(1)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_formats_auto_detected_on_load(self):
+        binary = SaveManager(save_dir=self.temp_dir, save_format=SAVE_FORMAT_BINARY, compress=True)
+        self.assertTrue(binary.save_to_slot(1, self.game, custom_name="Bin").ok)
+        json_manager = SaveManager(save_dir=self.temp_dir)
+        self.assertTrue(json_manager.save_to_slot(2, self.game, custom_name="Json").ok)
+
+        reader = SaveManager(save_dir=self.temp_dir)
+        self.assertEqual(reader.load_from_slot(1).save_data.meta.custom_name, "Bin")
+        self.assertEqual(binary.load_from_slot(2).save_data.meta.custom_name, "Json")
+        slots = SaveManager(save_dir=self.temp_dir).list_slots()
+        self.assertEqual([s.status for s in slots[:2]], [SlotStatus.OK, SlotStatus.OK])
+
+    def test_legacy_binary_save_is_migrated(self):
+        path = os.path.join(self.temp_dir, "slot_01.json")
+        with open(path, "wb") as f:
+            f.write(encode_save({"meta": {"room_id": "hub"}, "data": {}}, SAVE_FORMAT_BINARY))
+        result = SaveManager(save_dir=self.temp_dir).load_from_slot(1)
+        self.assertTrue(result.ok, result.message)
+        self.assertEqual(result.save_data.data.world.room_id, "hub")
+
+    def test_format_selected_in_settings(self):
+        path = os.path.join(self.temp_dir, "settings.json")
+        settings = SettingsManager(path=path)
+        settings.set_save_format(SAVE_FORMAT_BINARY, compress=True)
+        settings.save()
+
+        reloaded = SettingsManager(path=path)
+        reloaded.load()
+        self.assertEqual((reloaded.save_format, reloaded.save_compress), (SAVE_FORMAT_BINARY, True))
+        reloaded.set_save_format("xml")
+        self.assertEqual(reloaded.save_format, SAVE_FORMAT_JSON)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Test per gli slot senza limite e il browser paginato (SaveManager.list_page, SlotBrowser).
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.model.game import Game
+from src.model.save import SaveManager, SlotStatus, SORT_ACES, SORT_REGION, SORT_TIME
+from src.model.save import save_manager as save_manager_module
+from src.model.ui.slot_browser import SlotBrowser, ROW_SORT, ROW_NEW, ROW_BACK
+
+
+class TestUnlimitedSlots(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.save_manager = SaveManager(save_dir=self.temp_dir)
+        self.game = Game()
+        self.game.start_new_game(1)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _save(self, slot, room="hub", aces=()):
+        self.game.gamestate.current_room_id = room
+        self.game.gamestate.aces_collected = list(aces)
+        self.assertTrue(self.save_manager.save_to_slot(slot, self.game, custom_name=f"S{slot}").ok)
+
+    def test_slots_beyond_three_and_next_free_slot(self):
+        for slot in (1, 2, 3, 4, 12):
+            self._save(slot)
+        self.assertEqual(self.save_manager.next_free_slot(), 5)
+        self.assertEqual([s.slot_index for s in self.save_manager.list_slots()], [1, 2, 3, 4, 12])
+        self.assertEqual(self.save_manager.load_from_slot(12).save_data.meta.custom_name, "S12")
+        self.assertEqual(self.save_manager.slot_info(7).status, SlotStatus.EMPTY)
+
+        fixed = SaveManager(save_dir=self.temp_dir, max_slots=4)
+        self.assertIsNone(fixed.next_free_slot())
+        self.assertFalse(fixed.is_valid_slot(12))
+
+    def test_page_reads_no_unchanged_slots(self):
+        for slot in range(1, 8):
+            self._save(slot)
+        fresh = SaveManager(save_dir=self.temp_dir)
+        real_signature = save_manager_module.file_signature
+        with patch.object(save_manager_module, "file_signature", side_effect=real_signature) as sig, \
+                patch.object(SaveManager, "_read_save_file") as read:
+            page = fresh.list_page(page=1, page_size=3)
+        read.assert_not_called()
+        self.assertEqual(sig.call_count, 7)  # solo stat, una per slot
+        self.assertEqual((page.page, page.page_count, page.total), (1, 3, 7))
+        # Più recenti prima: 7 6 5 | 4 3 2 | 1
+        self.assertEqual([s.slot_index for s in page.slots], [4, 3, 2])
+        self.assertEqual([s.slot_index for s in fresh.list_page(page=9, page_size=3).slots], [1])
+
+    def test_sort_by_aces_and_region(self):
+        self._save(1, room="aurion_entry", aces=["ace_denari"])
+        self._save(2, room="hub")
+        self._save(3, room="etna_entry", aces=["ace_denari", "ace_spade"])
+        self._save(4, room="aurion_vault_monete")
+
+        by = lambda sort_by: [s.slot_index for s in self.save_manager.list_page(0, 10, sort_by).slots]
+        self.assertEqual(by(SORT_TIME), [4, 3, 2, 1])
+        self.assertEqual(by(SORT_ACES), [3, 1, 4, 2])
+        self.assertEqual(by(SORT_REGION), [4, 1, 3, 2])
+
+    def test_slot_changed_outside_game_sorted_by_new_metadata(self):
+        for slot in range(1, 5):
+            self._save(slot)
+        # Backup ripristinato a mano sopra lo slot 1: l'indice ha ancora i metadati vecchi
+        self._save(5, aces=["ace_denari", "ace_spade"])
+        shutil.copyfile(os.path.join(self.temp_dir, "slot_05.json"), os.path.join(self.temp_dir, "slot_01.json"))
+        os.remove(os.path.join(self.temp_dir, "slot_05.json"))
+
+        first = self.save_manager.list_page(0, 2, SORT_ACES).slots[0]
+        self.assertEqual((first.slot_index, first.meta.aces_count), (1, 2))
+
+
+class TestSlotBrowser(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.save_manager = SaveManager(save_dir=self.temp_dir)
+        game = Game()
+        game.start_new_game(1)
+        for slot in range(1, 5):
+            self.save_manager.save_to_slot(slot, game)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_rows_paging_and_sort(self):
+        browser = SlotBrowser(self.save_manager, allow_new=True, page_size=3)
+        browser.reset()
+        rows = browser.rows
+        self.assertEqual((rows[0], rows[1], rows[-1]), (ROW_SORT, ROW_NEW, ROW_BACK))
+        self.assertEqual(len(browser.slots), 3)
+
+        browser.move(-1)
+        self.assertEqual(browser.selected(), ROW_BACK)
+        browser.change_page(1)
+        self.assertEqual([s.slot_index for s in browser.slots], [1])
+        self.assertEqual(browser.selected(), ROW_BACK)  # cursore riportato dentro la pagina più corta
+        browser.change_page(1)
+        self.assertEqual(browser.page.page, 1)
+
+        browser.cursor_index = 0
+        browser.cycle_sort()
+        self.assertEqual((browser.sort_by, browser.page.page), (SORT_REGION, 0))
+        self.assertEqual(browser.page_label, "Pagina 1/2 (4)")
+
+
+if __name__ == "__main__":
+    unittest.main()
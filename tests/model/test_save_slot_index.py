@@ -0,0 +1,80 @@
+"""
+Test per l'indice dei metadati degli slot (slots_index.json).
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.model.game import Game
+from src.model.save import SaveManager, SlotStatus
+from src.model.save.slot_index import SLOT_INDEX_FILENAME, file_signature
+
+
+class TestSlotIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.save_manager = SaveManager(save_dir=self.temp_dir, max_slots=3)
+        self.game = Game()
+        self.game.start_new_game(1)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _slot_path(self, i):
+        return os.path.join(self.temp_dir, f"slot_{i:02d}.json")
+
+    def test_list_slots_served_from_index_after_save(self):
+        self.save_manager.save_to_slot(2, self.game, custom_name="Indicizzato")
+        self.assertTrue(os.path.exists(os.path.join(self.temp_dir, SLOT_INDEX_FILENAME)))
+
+        fresh = SaveManager(save_dir=self.temp_dir, max_slots=3)
+        with patch.object(SaveManager, "_scan_slot") as scan:
+            slots = fresh.list_slots()
+        scan.assert_not_called()
+        self.assertEqual([s.status for s in slots], [SlotStatus.EMPTY, SlotStatus.OK, SlotStatus.EMPTY])
+        self.assertEqual(slots[1].meta.custom_name, "Indicizzato")
+
+    def test_file_changed_outside_game_is_rescanned(self):
+        self.save_manager.save_to_slot(1, self.game, custom_name="Vecchio")
+        with open(self._slot_path(1), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data['meta']['custom_name'] = "Modificato a mano"
+        with open(self._slot_path(1), 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+        self.assertEqual(self.save_manager.list_slots()[0].meta.custom_name, "Modificato a mano")
+        with patch.object(SaveManager, "_scan_slot") as scan:
+            self.save_manager.list_slots()
+        scan.assert_not_called()
+
+    def test_corrupt_file_detected_on_load_updates_index(self):
+        self.save_manager.save_to_slot(1, self.game)
+        with open(self._slot_path(1), 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        del data['data']
+        with open(self._slot_path(1), 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        # Voce dell'indice ancora "ok" per questa firma: corruzione non rilevabile da mtime/size
+        self.save_manager._index.update("slot_01.json", file_signature(self._slot_path(1)), SlotStatus.OK, {})
+        self.assertEqual(self.save_manager.list_slots()[0].status, SlotStatus.OK)
+
+        self.assertFalse(self.save_manager.load_from_slot(1).ok)
+        self.assertEqual(self.save_manager.list_slots()[0].status, SlotStatus.CORRUPT)
+
+    def test_missing_or_broken_index_is_rebuilt(self):
+        self.save_manager.save_to_slot(1, self.game)
+        with open(os.path.join(self.temp_dir, SLOT_INDEX_FILENAME), 'w') as f:
+            f.write("{not json")
+        fresh = SaveManager(save_dir=self.temp_dir, max_slots=3)
+        self.assertEqual(fresh.list_slots()[0].status, SlotStatus.OK)
+
+        fresh.delete_slot(1)
+        self.assertEqual(fresh.list_slots()[0].status, SlotStatus.EMPTY)
+
+
+if __name__ == "__main__":
+    unittest.main()
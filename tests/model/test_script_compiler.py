@@ -0,0 +1,108 @@
+"""
+Test per la tabella degli script compilata (data/scripts + script_compiler).
+"""
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from src.model.game import Game
+from src.model.content.validators import ValidationError
+from src.model.script_actions import ActionType
+from src.model.scripting.script_compiler import compile_script, compile_script_table
+from src.model.scripting.scripts_registry import ScriptsRegistry
+from src.model.states.base_state import StateID
+
+
+class TestScriptTable(unittest.TestCase):
+
+    def setUp(self):
+        self.game = Game()
+        self.game.start_new_game(2)
+
+    def test_table_is_compiled_once(self):
+        self.assertIs(ScriptsRegistry.table(), ScriptsRegistry.table())
+        self.assertTrue(ScriptsRegistry.has_script("giufa_hub_talk"))
+
+    def test_static_bodies_are_reused(self):
+        a = ScriptsRegistry.get_script("start_boss_etna", self.game)
+        b = ScriptsRegistry.get_script("start_boss_etna", self.game)
+        self.assertEqual(a.script_id, "boss_oste_start")
+        self.assertIsNot(a.actions, b.actions)
+        self.assertIs(a.actions[0], b.actions[0])
+        self.assertEqual(a.actions[0].params["state_id"], StateID.BOSS_OSTE)
+
+    def test_flag_branches_and_set_flags(self):
+        first = ScriptsRegistry.get_script("giufa_hub_talk", self.game)
+        self.assertEqual(first.script_id, "giufa_intro")
+        self.assertTrue(self.game.get_flag("met_giufa"))
+
+        reminder = ScriptsRegistry.get_script("giufa_hub_talk", self.game)
+        self.assertEqual(reminder.script_id, "giufa_reminder")
+        self.assertIn("mancano 4 Assi", reminder.actions[0].params["text"])
+
+        for suit in ("Denari", "Bastoni", "Spade", "Coppe"):
+            self.game.collect_ace(suit)
+        final = ScriptsRegistry.get_script("giufa_hub_talk", self.game)
+        self.assertEqual(final.script_id, "giufa_final")
+        player = self.game.gamestate.get_active_player().name
+        self.assertIn(player, final.actions[0].params["text"])
+
+    def test_player_stat_and_ace_conditions(self):
+        self.assertEqual(ScriptsRegistry.get_script("interact_gate_aurion", self.game).script_id, "enter_aurion")
+        self.game.gamestate.get_active_player().regions_completed = 2
+        self.assertEqual(ScriptsRegistry.get_script("interact_gate_aurion", self.game).script_id, "locked_limit")
+        self.game.collect_ace("Denari")
+        self.assertEqual(ScriptsRegistry.get_script("interact_gate_aurion", self.game).script_id, "locked_global")
+
+    def test_call_result_branches(self):
+        game = Mock()
+        game.aurion.resolve_gatekeeper.return_value = {"outcome": "fight", "encounter_id": "guards", "msg": "Rissa!"}
+        game.gamestate.get_active_player.return_value.name = "Rosalia"
+        game.get_ace_count.return_value = 0
+
+        script = ScriptsRegistry.get_script("aurion_gate", game)
+        self.assertEqual(script.script_id, "aurion_gate_res")
+        self.assertEqual(script.actions[-2].params["text"], "Rissa!")
+        self.assertEqual(script.actions[-1].action_type, ActionType.START_COMBAT)
+        self.assertEqual(script.actions[-1].params["encounter_id"], "guards")
+        self.assertEqual(script.actions[2].params["speaker"], "Rosalia")
+
+        game.aurion.resolve_gatekeeper.return_value = {"outcome": "skip", "msg": "Passate"}
+        script = ScriptsRegistry.get_script("aurion_gate", game)
+        self.assertEqual(script.actions[-1].action_type, ActionType.CHANGE_ROOM)
+
+    def test_unknown_script_is_noop(self):
+        self.assertEqual(ScriptsRegistry.get_script("does_not_exist", self.game).script_id, "noop")
+
+
+class TestScriptCompiler(unittest.TestCase):
+
+    def test_invalid_entries_fail_at_compile_time(self):
+        with self.assertRaises(ValidationError):
+            compile_script("x", {"actions": [{"explode": 1}]})
+        with self.assertRaises(ValidationError):
+            compile_script("x", {"actions": [["Giufa", "Ciao {nome}"]]})
+        with self.assertRaises(ValidationError):
+            compile_script("x", {"actions": [{"change_state": "NOWHERE"}]})
+
+    def test_duplicate_ids_across_files(self):
+        files = [{"id": "a", "scripts": {"s": {"actions": []}}},
+                 {"id": "b", "scripts": {"s": {"actions": []}}}]
+        with self.assertRaises(ValidationError):
+            compile_script_table(files)
+
+    def test_load_from_directory(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "test.json"), "w", encoding="utf-8") as f:
+                json.dump({"id": "test", "scripts": {"hello": {"actions": [["Sistema", "Ciao"]]}}}, f)
+            try:
+                table = ScriptsRegistry.load(tmp)
+                self.assertEqual(list(table), ["hello"])
+            finally:
+                ScriptsRegistry.load()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+"""
+Test per SpatialGrid e per le query di RoomData che la usano come broadphase.
+"""
+import math
+import random
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from src.model.spatial_grid import SpatialGrid
+from src.model.room_data import RoomData, Collider, TriggerZone, EntityDefinition
+
+pygame.init()
+
+
+class _Item:
+    def __init__(self, name):
+        self.name = name
+
+
+class TestSpatialGrid(unittest.TestCase):
+
+    def test_query_returns_only_nearby_in_insertion_order(self):
+        grid = SpatialGrid(cell_size=64)
+        far = _Item("far")
+        a, b = _Item("a"), _Item("b")
+        grid.insert(b, pygame.Rect(10, 10, 20, 20))
+        grid.insert(far, pygame.Rect(700, 500, 20, 20))
+        grid.insert(a, pygame.Rect(40, 40, 100, 20))   # su più celle: nessun duplicato
+
+        self.assertEqual(grid.query(pygame.Rect(0, 0, 64, 64)), [b, a])
+        self.assertEqual(grid.query(pygame.Rect(650, 450, 100, 100)), [far])
+        self.assertEqual(grid.query(pygame.Rect(300, 300, 10, 10)), [])
+
+    def test_remove_is_incremental(self):
+        grid = SpatialGrid(cell_size=32)
+        a, b = _Item("a"), _Item("b")
+        grid.insert(a, pygame.Rect(0, 0, 100, 100))
+        grid.insert(b, pygame.Rect(10, 10, 5, 5))
+
+        self.assertTrue(grid.remove(a))
+        self.assertFalse(grid.remove(a))
+        self.assertNotIn(a, grid)
+        self.assertEqual(len(grid), 1)
+        self.assertEqual(grid.query(pygame.Rect(0, 0, 100, 100)), [b])
+
+    def test_query_radius_includes_boundary(self):
+        grid = SpatialGrid(cell_size=64)
+        item = _Item("edge")
+        grid.insert(item, pygame.Rect(128, 0, 1, 1))
+        self.assertEqual(grid.query_radius(64, 0, 64), [item])
+
+
+class TestRoomDataSpatialIndex(unittest.TestCase):
+
+    def _random_room(self, seed=3, n=150):
+        rng = random.Random(seed)
+        room = RoomData(room_id="dense_room", width=2000, height=2000)
+        for i in range(n):
+            rect = pygame.Rect(rng.randrange(0, 1950), rng.randrange(0, 1950), rng.randrange(1, 80), rng.randrange(1, 80))
+            room.colliders.append(Collider(f"c{i}", rect))
+            room.triggers.append(TriggerZone(f"t{i}", rect.move(5, 5), "script"))
+            room.entities.append(EntityDefinition(f"e{i}", "npc", rect.x, rect.y,
+                                                  script_id=f"s{i}" if i % 3 else None))
+        room.build_spatial_index()
+        return room, rng
+
+    def test_queries_match_linear_scan(self):
+        room, rng = self._random_room()
+        for _ in range(300):
+            px, py = rng.randrange(-50, 2050), rng.randrange(-50, 2050)
+            probe = pygame.Rect(px, py, 32, 32)
+
+            expected_hit = any(probe.colliderect(c.rect) for c in room.colliders)
+            self.assertEqual(room.check_collision(probe), expected_hit)
+
+            expected = [t for t in room.triggers if probe.colliderect(t.rect)]
+            self.assertEqual(room.check_triggers(probe), expected)
+
+            best, best_d = None, float("inf")
+            for e in room.entities:
+                if not e.script_id:
+                    continue
+                cx, cy = e.get_center()
+                d = math.hypot(px - cx, py - cy)
+                if d <= 140 and d < best_d:
+                    best, best_d = e, d
+            self.assertIs(room.get_closest_interactable(px, py, 140), best)
+
+    @patch("src.model.room_data.LINEAR_SCAN_MAX_ITEMS", 0)
+    def test_index_follows_list_changes_and_removal(self):
+        room = RoomData(room_id="r")
+        room.build_spatial_index()
+        probe = pygame.Rect(100, 100, 32, 32)
+        self.assertFalse(room.check_collision(probe))
+
+        # I builder aggiungono dopo la creazione: l'indice si riallinea da solo
+        room.colliders.append(Collider("wall", pygame.Rect(90, 90, 20, 20)))
+        self.assertTrue(room.check_collision(probe))
+
+        room.entities.append(EntityDefinition("npc", "npc", 100, 100, script_id="talk"))
+        self.assertEqual(room.get_closest_interactable(110, 110, 50).entity_id, "npc")
+
+        removed = room.remove_entity("npc")
+        self.assertEqual(removed.entity_id, "npc")
+        self.assertIsNone(room.get_closest_interactable(110, 110, 50))
+        self.assertIsNone(room.remove_entity("npc"))
+        self.assertEqual(len(room._entity_grid), 0)
+
+    def test_small_rooms_match_grid_results(self):
+        room, rng = self._random_room(seed=5, n=10)
+        probes = [pygame.Rect(rng.randrange(0, 2000), rng.randrange(0, 2000), 32, 32) for _ in range(100)]
+        linear = [(room.check_collision(p), room.check_triggers(p)) for p in probes]
+        with patch("src.model.room_data.LINEAR_SCAN_MAX_ITEMS", 0):
+            indexed = [(room.check_collision(p), room.check_triggers(p)) for p in probes]
+        self.assertEqual(linear, indexed)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Test per SurfaceCache: budget in byte, ordine LRU, pinning e contatori.
+"""
+import unittest
+
+import pygame
+
+from src.model.assets.surface_cache import SurfaceCache, surface_bytes
+from src.model.assets.asset_manager import AssetManager
+
+pygame.init()
+
+
+def _surf(w=10, h=10):
+    return pygame.Surface((w, h), pygame.SRCALPHA)
+
+
+class TestSurfaceCache(unittest.TestCase):
+
+    def test_size_accounting(self):
+        cache = SurfaceCache(budget_bytes=10_000)
+        s = _surf(10, 10)
+        cache.put("a", s)
+        self.assertEqual(cache.used_bytes, surface_bytes(s))
+        self.assertEqual(surface_bytes(s), 10 * 10 * 4)
+
+        cache.put("a", _surf(5, 5))
+        self.assertEqual(cache.used_bytes, 5 * 5 * 4)
+        cache.pop("a")
+        self.assertEqual(cache.used_bytes, 0)
+
+    def test_evicts_least_recently_used(self):
+        cache = SurfaceCache(budget_bytes=3 * 400)
+        for key in ("a", "b", "c"):
+            cache.put(key, _surf())
+
+        cache.get("a")              # "b" diventa la meno recente
+        cache.put("d", _surf())
+
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertIn("d", cache)
+        self.assertEqual(cache.stats.evictions, 1)
+        self.assertLessEqual(cache.used_bytes, cache.budget_bytes)
+
+    def test_pinned_entries_survive(self):
+        cache = SurfaceCache(budget_bytes=2 * 400)
+        cache.put("room_bg", _surf())
+        cache.set_pinned(["room_bg"])
+        cache.put("b", _surf())
+        cache.put("c", _surf())
+
+        self.assertIn("room_bg", cache)
+        self.assertNotIn("b", cache)
+
+    def test_hit_miss_counters(self):
+        cache = SurfaceCache()
+        self.assertIsNone(cache.get("x"))
+        cache.put("x", _surf())
+        cache.get("x")
+        cache.get("x")
+
+        stats = cache.stats
+        self.assertEqual((stats.hits, stats.misses), (2, 1))
+        self.assertAlmostEqual(stats.hit_rate, 2 / 3)
+
+    def test_shrinking_budget_evicts(self):
+        cache = SurfaceCache(budget_bytes=10_000)
+        for key in ("a", "b", "c"):
+            cache.put(key, _surf())
+        cache.set_budget(400)
+        self.assertEqual(len(cache), 1)
+        self.assertIn("c", cache)
+
+
+class TestAssetManagerBudget(unittest.TestCase):
+
+    def test_placeholders_are_bounded(self):
+        """Anche i placeholder (asset mancanti) rientrano nel budget."""
+        assets = AssetManager("assets_that_do_not_exist", cache_budget_bytes=64 * 64 * 4 * 2)
+        for size in range(40, 64):
+            assets.get_image("missing", size, size)
+
+        stats = assets.cache_stats()
+        self.assertLessEqual(stats.used_bytes, stats.budget_bytes)
+        self.assertGreater(stats.evictions, 0)
+
+    def test_repeat_lookup_is_a_hit(self):
+        assets = AssetManager("assets_that_do_not_exist")
+        first = assets.get_image("missing", 8, 8)
+        self.assertIs(assets.get_image("missing", 8, 8), first)
+        self.assertEqual(assets.cache_stats().hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
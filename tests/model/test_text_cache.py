@@ -0,0 +1,70 @@
+"""
+Test per il TextCache: font condivisi, superfici di testo e layout in cache.
+"""
+import unittest
+
+import pygame
+
+from src.model.assets.text_cache import TextCache, CachedFont
+
+pygame.init()
+
+
+class TestTextCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = TextCache()
+        self.font = self.cache.font(None, 20)
+
+    def test_font_instances_are_shared(self):
+        self.assertIs(self.cache.font(None, 20), self.font)
+        self.assertIsNot(self.cache.font(None, 20, bold=True), self.font)
+        self.assertIsInstance(self.font, CachedFont)
+        # API di pygame.font.Font delegata
+        self.assertGreater(self.font.get_height(), 0)
+
+    def test_render_hits_cache(self):
+        a = self.font.render("Turiddu", True, (255, 255, 0))
+        b = self.font.render("Turiddu", True, (255, 255, 0))
+        c = self.font.render("Turiddu", True, (255, 0, 0))
+
+        self.assertIs(a, b)
+        self.assertIsNot(a, c)
+        stats = self.cache.stats
+        self.assertEqual((stats.hits, stats.misses), (1, 2))
+
+    def test_color_types_share_entry(self):
+        a = self.font.render("HP", True, (10, 20, 30))
+        b = self.cache.render(self.font, "HP", pygame.Color(10, 20, 30), True)
+        self.assertIs(a, b)
+
+    def test_raw_font_supported(self):
+        raw = pygame.font.Font(None, 18)
+        self.assertIs(self.cache.render(raw, "x", (1, 1, 1)), self.cache.render(raw, "x", (1, 1, 1)))
+
+    def test_outlined_size(self):
+        plain = self.font.render("GAME OVER", True, (255, 0, 0))
+        outlined = self.cache.render_outlined(self.font, "GAME OVER", (255, 0, 0), thickness=2)
+        self.assertEqual(outlined.get_size(), (plain.get_width() + 4, plain.get_height() + 4))
+        self.assertIs(outlined, self.cache.render_outlined(self.font, "GAME OVER", (255, 0, 0), thickness=2))
+
+    def test_wrap_respects_width_and_is_cached(self):
+        text = "Picciò, sono le sette. Se non ci muoviamo ora, restiamo bloccati qui fino a ferragosto."
+        lines = self.cache.wrap(self.font, text, 150)
+
+        self.assertGreater(len(lines), 1)
+        self.assertEqual(" ".join(lines), text)
+        for line in lines:
+            self.assertLessEqual(self.font.size(line)[0], 150)
+        self.assertIs(self.cache.wrap(self.font, text, 150), lines)
+
+    def test_layout_lru_bounded(self):
+        cache = TextCache(max_layouts=3)
+        font = cache.font(None, 20)
+        for i in range(10):
+            cache.wrap(font, f"riga {i}", 100)
+        self.assertEqual(len(cache._layouts), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()